@@ -25,6 +25,7 @@ from lightrag.constants import (
     DEFAULT_MAX_RELATION_TOKENS,
     DEFAULT_MAX_TOTAL_TOKENS,
     DEFAULT_COSINE_THRESHOLD,
+    DEFAULT_VECTOR_PRECISION,
     DEFAULT_RELATED_CHUNK_NUMBER,
     DEFAULT_MIN_RERANK_SCORE,
     DEFAULT_FORCE_LLM_SUMMARY_ON_MERGE,
@@ -385,6 +386,9 @@ def parse_args() -> argparse.Namespace:
     args.cosine_threshold = get_env_value(
         "COSINE_THRESHOLD", DEFAULT_COSINE_THRESHOLD, float
     )
+    args.vector_precision = get_env_value(
+        "VECTOR_PRECISION", DEFAULT_VECTOR_PRECISION, str
+    )
     args.related_chunk_number = get_env_value(
         "RELATED_CHUNK_NUMBER", DEFAULT_RELATED_CHUNK_NUMBER, int
     )
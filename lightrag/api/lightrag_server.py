@@ -726,7 +726,8 @@ def create_app(args):
             vector_storage=args.vector_storage,
             doc_status_storage=args.doc_status_storage,
             vector_db_storage_cls_kwargs={
-                "cosine_better_than_threshold": args.cosine_threshold
+                "cosine_better_than_threshold": args.cosine_threshold,
+                "vector_precision": args.vector_precision,
             },
             enable_llm_cache_for_entity_extract=args.enable_llm_cache_for_extract,
             enable_llm_cache=args.enable_llm_cache,
@@ -901,6 +902,7 @@ def create_app(args):
                 "auth_mode": auth_mode,
                 "pipeline_busy": pipeline_status.get("busy", False),
                 "keyed_locks": keyed_lock_info,
+                "concurrency": rag.get_concurrency_status(),
                 "core_version": core_version,
                 "api_version": __api_version__,
                 "webui_title": webui_title,
@@ -833,6 +833,7 @@ class PipelineStatusResponse(BaseModel):
         latest_message: Latest message from pipeline processing
         history_messages: List of history messages
         update_status: Status of update flags for all namespaces
+        stage_queue_depths: Documents waiting in each insert pipeline stage queue
     """
 
     autoscanned: bool = False
@@ -846,6 +847,7 @@ class PipelineStatusResponse(BaseModel):
     latest_message: str = ""
     history_messages: Optional[List[str]] = None
     update_status: Optional[dict] = None
+    stage_queue_depths: Optional[dict] = None
 
     @field_validator("job_start", mode="before")
     @classmethod
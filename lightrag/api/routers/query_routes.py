@@ -108,6 +108,11 @@ class QueryRequest(BaseModel):
         description="If True, enables streaming output for real-time responses. Only affects /query/stream endpoint.",
     )
 
+    bypass_semantic_cache: Optional[bool] = Field(
+        default=None,
+        description="If True, skips the semantic query cache for this request. Only relevant when the server enables the semantic query cache.",
+    )
+
     @field_validator("query", mode="after")
     @classmethod
     def query_strip_after(cls, query: str) -> str:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 from enum import Enum
 import os
+import numpy as np
 from dotenv import load_dotenv
 from dataclasses import dataclass, field
 from typing import (
@@ -15,8 +17,9 @@ from typing import (
     Dict,
     List,
     AsyncIterator,
+    Collection,
 )
-from .utils import EmbeddingFunc
+from .utils import EmbeddingFunc, LLMCachePolicy, get_llm_cache_policies
 from .types import KnowledgeGraph
 from .constants import (
     GRAPH_FIELD_SEP,
@@ -31,6 +34,7 @@ from .constants import (
     DEFAULT_OLLAMA_MODEL_SIZE,
     DEFAULT_OLLAMA_CREATED_AT,
     DEFAULT_OLLAMA_DIGEST,
+    VECTOR_PRECOMPUTED_FIELD,
 )
 
 # use the .env that is inside the current folder
@@ -169,6 +173,11 @@ class QueryParam:
     containing citation information for the retrieved content.
     """
 
+    bypass_semantic_cache: bool = False
+    """If True, skips the semantic query cache for this request (no lookup and no store).
+    Has no effect unless the semantic query cache is enabled in LightRAG.
+    """
+
 
 @dataclass
 class StorageNameSpace(ABC):
@@ -223,7 +232,11 @@ class BaseVectorStorage(StorageNameSpace, ABC):
 
     @abstractmethod
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Query the vector storage and retrieve top_k results.
 
@@ -232,8 +245,21 @@ class BaseVectorStorage(StorageNameSpace, ABC):
             top_k: Number of top results to return
             query_embedding: Optional pre-computed embedding for the query.
                            If provided, skips embedding computation for better performance.
+            fields: Optional list of payload fields to return. When given, each
+                    result only carries these fields plus "id" and "distance",
+                    and backends fetch only those columns. None returns all
+                    metadata fields.
         """
 
+    @staticmethod
+    def _project_fields(
+        record: dict[str, Any], fields: list[str] | None
+    ) -> dict[str, Any]:
+        """Keep only the requested fields of a query result, plus id and distance"""
+        if fields is None:
+            return record
+        return {k: record[k] for k in ("id", "distance", *fields) if k in record}
+
     @abstractmethod
     async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
         """Insert or update vectors in the storage.
@@ -314,11 +340,81 @@ class BaseVectorStorage(StorageNameSpace, ABC):
         """
         pass
 
+    async def _embed_contents(
+        self, data: dict[str, dict[str, Any]], max_batch_size: int
+    ) -> np.ndarray:
+        """Embed the content of every record, in the order of data
+
+        Records carrying an embedding under VECTOR_PRECOMPUTED_FIELD keep it and are
+        not sent to the embedding function. On an embedding count mismatch the
+        embedding function's output is returned as is, for callers to report.
+        """
+        records = list(data.values())
+        pending = [
+            i for i, v in enumerate(records) if v.get(VECTOR_PRECOMPUTED_FIELD) is None
+        ]
+        contents = [records[i]["content"] for i in pending]
+        batches = [
+            contents[i : i + max_batch_size]
+            for i in range(0, len(contents), max_batch_size)
+        ]
+        embedding_tasks = [self.embedding_func(batch) for batch in batches]
+        embeddings_list = await asyncio.gather(*embedding_tasks)
+        if len(pending) == len(records):
+            return np.concatenate(embeddings_list)
+
+        embedded = (
+            np.concatenate(embeddings_list)
+            if embeddings_list
+            else np.empty((0, self.embedding_func.embedding_dim), np.float32)
+        )
+        if len(embedded) != len(pending):
+            return embedded
+        embeddings = np.empty((len(records), embedded.shape[1]), dtype=np.float32)
+        embeddings[pending] = embedded
+        for i, v in enumerate(records):
+            if v.get(VECTOR_PRECOMPUTED_FIELD) is not None:
+                embeddings[i] = np.asarray(v[VECTOR_PRECOMPUTED_FIELD], np.float32)
+        return embeddings
+
+    async def get_vector_matrix(self, ids: list[str]) -> tuple[list[str], np.ndarray]:
+        """Get vectors by their IDs as a single contiguous float32 matrix
+
+        Default implementation builds the matrix from get_vectors_by_ids.
+        Override this method for better performance in storage backends that
+        keep their vectors in NumPy/Faiss memory already.
+
+        Args:
+            ids: List of unique identifiers
+
+        Returns:
+            Tuple (found_ids, matrix): row i of matrix is the vector of
+            found_ids[i]; IDs without a vector are omitted
+        """
+        vectors = await self.get_vectors_by_ids(ids)
+        found_ids = [id for id in dict.fromkeys(ids) if id in vectors]
+        if not found_ids:
+            return [], np.empty((0, self.embedding_func.embedding_dim), np.float32)
+        return found_ids, np.asarray(
+            [vectors[id] for id in found_ids], dtype=np.float32
+        )
+
 
 @dataclass
 class BaseKVStorage(StorageNameSpace, ABC):
     embedding_func: EmbeddingFunc
 
+    @property
+    def llm_cache_policies(self) -> dict[str, LLMCachePolicy]:
+        """LLM cache policies by cache_type, parsed from global_config only once
+
+        Storages that enforce the policies set ``_cache_policies`` themselves.
+        """
+        policies = getattr(self, "_cache_policies", None)
+        if policies is None:
+            policies = self._cache_policies = get_llm_cache_policies(self.global_config)
+        return policies
+
     @abstractmethod
     async def get_by_id(self, id: str) -> dict[str, Any] | None:
         """Get value by id"""
@@ -340,6 +436,58 @@ class BaseKVStorage(StorageNameSpace, ABC):
         2. update flags to notify other processes that data persistence is needed
         """
 
+    async def update_fields(
+        self,
+        updates: dict[str, dict[str, Any]],
+        union_fields: Collection[str] = (),
+    ) -> None:
+        """Partially update existing records without rewriting the other fields
+
+        Fields listed in union_fields must hold lists: their values are appended
+        to the stored list, skipping values already present. All other fields
+        overwrite the stored value. IDs without a stored record are ignored.
+
+        Default implementation reads the records with get_by_ids and writes them
+        back with upsert. Override this method for better performance in storage
+        backends that support partial updates.
+
+        Args:
+            updates: {id: {field: value, ...}, ...}
+            union_fields: Names of list fields to merge instead of overwrite
+        """
+        if not updates:
+            return
+        ids = list(updates.keys())
+        records = await self.get_by_ids(ids)
+        merged: dict[str, dict[str, Any]] = {}
+        for id, record in zip(ids, records):
+            if not record:
+                continue
+            record = dict(record)
+            for field_name, value in updates[id].items():
+                if field_name in union_fields:
+                    current = list(record.get(field_name) or [])
+                    seen = set(current)
+                    for item in value:
+                        if item not in seen:
+                            current.append(item)
+                            seen.add(item)
+                    record[field_name] = current
+                else:
+                    record[field_name] = value
+            merged[id] = record
+        if merged:
+            await self.upsert(merged)
+
+    async def record_cache_access(self, ids: list[str]) -> None:
+        """Count accesses to LLM cache entries that were served without a storage read
+
+        In-process cache hits never reach get_by_id, so they are reported here to
+        keep LRU/LFU eviction of bounded cache types accurate. An id listed several
+        times counts as several accesses. Default implementation does nothing, for
+        backends without bounded cache policies.
+        """
+
     @abstractmethod
     async def delete(self, ids: list[str]) -> None:
         """Delete specific records from storage by their IDs
@@ -609,6 +757,34 @@ class BaseGraphStorage(StorageNameSpace, ABC):
             edge_data: A dictionary of edge properties
         """
 
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        """Insert or update multiple nodes
+
+        Default implementation upserts nodes one by one.
+        Override this method for better performance in storage backends
+        that support batch operations.
+
+        Args:
+            nodes: Mapping of node ID to node properties
+        """
+        for node_id, node_data in nodes.items():
+            await self.upsert_node(node_id, node_data)
+
+    async def upsert_edges_batch(
+        self, edges: list[tuple[str, str, dict[str, str]]]
+    ) -> None:
+        """Insert or update multiple edges
+
+        Default implementation upserts edges one by one.
+        Override this method for better performance in storage backends
+        that support batch operations.
+
+        Args:
+            edges: List of (source_node_id, target_node_id, edge_data) tuples
+        """
+        for source_node_id, target_node_id, edge_data in edges:
+            await self.upsert_edge(source_node_id, target_node_id, edge_data)
+
     @abstractmethod
     async def delete_node(self, node_id: str) -> None:
         """Delete a node from the graph.
@@ -691,6 +867,36 @@ class BaseGraphStorage(StorageNameSpace, ABC):
             A list of all edges, where each edge is a dictionary of its properties
         """
 
+    async def iter_all_nodes(
+        self, batch_size: int | None = None
+    ) -> AsyncIterator[dict]:
+        """Iterate over all nodes in the graph.
+
+        Default implementation yields from get_all_nodes.
+        Override this method in storage backends that can stream results
+        (e.g. server-side cursors) to keep memory bounded on large graphs.
+
+        Args:
+            batch_size: Number of records fetched per round-trip, backend specific
+        """
+        for node in await self.get_all_nodes():
+            yield node
+
+    async def iter_all_edges(
+        self, batch_size: int | None = None
+    ) -> AsyncIterator[dict]:
+        """Iterate over all edges in the graph.
+
+        Default implementation yields from get_all_edges.
+        Override this method in storage backends that can stream results
+        (e.g. server-side cursors) to keep memory bounded on large graphs.
+
+        Args:
+            batch_size: Number of records fetched per round-trip, backend specific
+        """
+        for edge in await self.get_all_edges():
+            yield edge
+
     @abstractmethod
     async def get_popular_labels(self, limit: int = 300) -> list[str]:
         """Get popular labels by node degree (most connected entities)
@@ -786,6 +992,17 @@ class DocStatusStorage(BaseKVStorage, ABC):
     ) -> dict[str, DocProcessingStatus]:
         """Get all documents with a specific status"""
 
+    async def iter_docs_by_status(
+        self, status: DocStatus, batch_size: int | None = None
+    ) -> AsyncIterator[tuple[str, DocProcessingStatus]]:
+        """Iterate over (doc_id, status) pairs of documents with a specific status
+
+        Default implementation yields from get_docs_by_status.
+        Override this method in storage backends that can stream results.
+        """
+        for doc_id, doc_status in (await self.get_docs_by_status(status)).items():
+            yield doc_id, doc_status
+
     @abstractmethod
     async def get_docs_by_track_id(
         self, track_id: str
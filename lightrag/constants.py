@@ -23,6 +23,18 @@ DEFAULT_SUMMARY_MAX_TOKENS = 1200
 DEFAULT_SUMMARY_LENGTH_RECOMMENDED = 600
 # Maximum token size sent to LLM for summary
 DEFAULT_SUMMARY_CONTEXT_SIZE = 12000
+# When entity/relation descriptions are summarized: "inline" during merge, or
+# "deferred" to a background worker that coalesces updates of the same entity
+SUMMARY_MODE_INLINE = "inline"
+SUMMARY_MODE_DEFERRED = "deferred"
+DEFAULT_SUMMARY_MODE = SUMMARY_MODE_INLINE
+# Seconds between runs of the deferred summary worker
+DEFAULT_DEFERRED_SUMMARY_INTERVAL = 60
+# Graph property marking an entity/relation whose description awaits the deferred
+# summary worker, so pending work survives a restart
+SUMMARY_PENDING_FIELD = "summary_pending"
+# Raw descriptions sampled per entity/relation in entity/relation chunks storage (0 disables)
+DEFAULT_DESCRIPTION_RESERVOIR_SIZE = 32
 # Default entities to extract if ENTITY_TYPES is not specified in .env
 DEFAULT_ENTITY_TYPES = [
     "Person",
@@ -71,6 +83,41 @@ VALID_SOURCE_IDS_LIMIT_METHODS = {
     SOURCE_IDS_LIMIT_METHOD_KEEP,
     SOURCE_IDS_LIMIT_METHOD_FIFO,
 }
+### LLM response cache eviction strategies (see LightRAG.llm_cache_policies)
+###    LRU: evict least recently used entries first
+###    LFU: evict least frequently used entries first
+LLM_CACHE_EVICTION_LRU = "lru"
+LLM_CACHE_EVICTION_LFU = "lfu"
+VALID_LLM_CACHE_EVICTIONS = {
+    LLM_CACHE_EVICTION_LRU,
+    LLM_CACHE_EVICTION_LFU,
+}
+# Per-process in-memory tier in front of the LLM response cache (0 disables it)
+DEFAULT_LLM_CACHE_L1_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_LLM_CACHE_L1_TTL = 60  # Seconds an entry is served without a storage read
+# Retrieval cache for query contexts (see LightRAG.retrieval_cache_max_entries)
+DEFAULT_RETRIEVAL_CACHE_MAX_ENTRIES = 256  # 0 disables the cache
+DEFAULT_RETRIEVAL_CACHE_TTL = 600  # Seconds, 0 keeps entries until evicted
+# Semantic query cache (see LightRAG.enable_semantic_query_cache)
+DEFAULT_SEMANTIC_QUERY_CACHE_THRESHOLD = 0.95  # Minimum cosine similarity for a hit
+DEFAULT_SEMANTIC_QUERY_CACHE_MAX_ENTRIES = 1000
+### Vector storage precision (vector_db_storage_cls_kwargs["vector_precision"])
+###    float32: full precision (default)
+###    float16: half precision, halves vector memory and disk usage
+###    int8: scalar quantization, roughly a quarter of float32 size
+###    float16/int8 are supported by Faiss, Qdrant and Milvus, not by NanoVectorDB
+VECTOR_PRECISION_FLOAT32 = "float32"
+VECTOR_PRECISION_FLOAT16 = "float16"
+VECTOR_PRECISION_INT8 = "int8"
+DEFAULT_VECTOR_PRECISION = VECTOR_PRECISION_FLOAT32
+VALID_VECTOR_PRECISIONS = {
+    VECTOR_PRECISION_FLOAT32,
+    VECTOR_PRECISION_FLOAT16,
+    VECTOR_PRECISION_INT8,
+}
+# Vector storage record field carrying an already computed embedding, so upsert
+# writes it instead of embedding the content again (e.g. metadata-only updates)
+VECTOR_PRECOMPUTED_FIELD = "__precomputed_vector__"
 # Maximum number of file paths stored in entity/relation file_path field (For displayed only, does not affect query performance)
 DEFAULT_MAX_FILE_PATHS = 100
 
@@ -86,17 +133,30 @@ DEFAULT_TEMPERATURE = 1.0
 # Async configuration defaults
 DEFAULT_MAX_ASYNC = 4  # Default maximum async operations
 DEFAULT_MAX_PARALLEL_INSERT = 2  # Default maximum parallel insert operations
+DEFAULT_CHUNKING_MAX_WORKERS = 0  # Chunking worker processes (0 = use a thread, -1 = one per available CPU core up to MAX_PARALLEL_INSERT)
+DEFAULT_MAX_PARALLEL_MERGE = 2  # Documents merged into the graph concurrently
+DEFAULT_PIPELINE_QUEUE_SIZE = 2  # Documents buffered between pipeline stages
+DEFAULT_MIN_ASYNC = 0  # Floor of the adaptive LLM concurrency limit (0 = fixed at MAX_ASYNC)
+DEFAULT_LLM_TOKENS_PER_MINUTE = 0  # LLM token budget per minute (0 = unlimited)
+DEFAULT_LLM_REQUESTS_PER_MINUTE = 0  # LLM request budget per minute (0 = unlimited)
+DEFAULT_LLM_RATE_LIMIT_RESERVED_RATIO = 0.2  # Budget share reserved for queries (priority <= 5)
 
 # Document processing batch configuration
 DEFAULT_DOCUMENT_PROCESSING_BATCH_SIZE = 10  # Default batch size for document processing pipeline
 
 # Embedding configuration defaults
 DEFAULT_EMBEDDING_FUNC_MAX_ASYNC = 8  # Default max async for embedding functions
+DEFAULT_EMBEDDING_FUNC_MIN_ASYNC = 0  # Floor of the adaptive embedding concurrency limit (0 = fixed)
 DEFAULT_EMBEDDING_BATCH_NUM = 10  # Default batch size for embedding computations
 
 # Gunicorn worker timeout
 DEFAULT_TIMEOUT = 300
 
+# Adaptive concurrency: latency increase over baseline treated as congestion, and
+# remaining share of a provider rate limit quota below which calls back off
+ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE = 2.0
+ADAPTIVE_CONCURRENCY_QUOTA_HEADROOM = 0.1
+
 # Default llm and embedding timeout
 DEFAULT_LLM_TIMEOUT = 180
 DEFAULT_EMBEDDING_TIMEOUT = 30
@@ -1,13 +1,19 @@
 import os
 import time
-import asyncio
 from typing import Any, final
 import json
 import numpy as np
 from dataclasses import dataclass
 
-from lightrag.utils import logger, compute_mdhash_id
+from lightrag.utils import (
+    logger,
+    compute_mdhash_id,
+    decode_vector,
+    encode_vector,
+    get_vector_precision,
+)
 from lightrag.base import BaseVectorStorage
+from lightrag.constants import VECTOR_PRECISION_FLOAT16, VECTOR_PRECISION_FLOAT32
 
 from .shared_storage import (
     get_storage_lock,
@@ -18,6 +24,12 @@ from .shared_storage import (
 # You must manually install faiss-cpu or faiss-gpu before using FAISS vector db
 import faiss  # type: ignore
 
+# Raw vector copy kept in metadata for index rebuilds, never returned to callers
+_VECTOR_FIELDS = ("__vector__", "__vector_scale__")
+# Fraction by which the trained int8 value range is widened, so vectors added
+# after training are not clipped
+_INT8_RANGE_MARGIN = 0.2
+
 
 @final
 @dataclass
@@ -36,6 +48,8 @@ class FaissVectorDBStorage(BaseVectorStorage):
                 "cosine_better_than_threshold must be specified in vector_db_storage_cls_kwargs"
             )
         self.cosine_better_than_threshold = cosine_threshold
+        # float32 uses IndexFlatIP, float16/int8 use IndexScalarQuantizer
+        self._vector_precision = get_vector_precision(kwargs)
 
         # Where to save index file if you want persistent storage
         working_dir = self.global_config["working_dir"]
@@ -62,14 +76,48 @@ class FaissVectorDBStorage(BaseVectorStorage):
 
         # Create an empty Faiss index for inner product (useful for normalized vectors = cosine similarity).
         # If you have a large number of vectors, you might want IVF or other indexes.
-        # For demonstration, we use a simple IndexFlatIP.
-        self._index = faiss.IndexFlatIP(self._dim)
+        self._index = self._new_index()
         # Keep a local store for metadata, IDs, etc.
         # Maps <int faiss_id> → metadata (including your original ID).
         self._id_to_meta = {}
 
         self._load_faiss_index()
 
+    def _new_index(self):
+        """Create an empty inner product index in the configured vector precision"""
+        if self._vector_precision == VECTOR_PRECISION_FLOAT32:
+            return faiss.IndexFlatIP(self._dim)
+        if self._vector_precision == VECTOR_PRECISION_FLOAT16:
+            qtype = faiss.ScalarQuantizer.QT_fp16
+        else:
+            qtype = faiss.ScalarQuantizer.QT_8bit_uniform
+        index = faiss.IndexScalarQuantizer(self._dim, qtype, faiss.METRIC_INNER_PRODUCT)
+        index.sq.rangestat_arg = _INT8_RANGE_MARGIN
+        return index
+
+    @staticmethod
+    def _train_if_needed(index, vectors: np.ndarray) -> None:
+        """int8 indexes learn their value range from the first vectors added"""
+        if not index.is_trained and len(vectors):
+            index.train(vectors)
+
+    def _encode_meta_vector(self, meta: dict[str, Any], vector: np.ndarray) -> None:
+        """Keep a copy of the vector in metadata, compressed unless float32"""
+        if self._vector_precision == VECTOR_PRECISION_FLOAT32:
+            meta["__vector__"] = vector.tolist()
+            return
+        meta["__vector__"], scale = encode_vector(vector, self._vector_precision)
+        if scale is not None:
+            meta["__vector_scale__"] = scale
+
+    @staticmethod
+    def _decode_meta_vector(meta: dict[str, Any]) -> np.ndarray:
+        """Read the vector copy from metadata (plain list or encoded string)"""
+        vector = meta["__vector__"]
+        if isinstance(vector, str):
+            return decode_vector(vector, meta.get("__vector_scale__"))
+        return np.asarray(vector, dtype=np.float32)
+
     async def initialize(self):
         """Initialize storage data"""
         # Get the update flag for cross-process update notification
@@ -87,7 +135,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
                     f"[{self.workspace}] Process {os.getpid()} FAISS reloading {self.namespace} due to update by another process"
                 )
                 # Reload data
-                self._index = faiss.IndexFlatIP(self._dim)
+                self._index = self._new_index()
                 self._id_to_meta = {}
                 self._load_faiss_index()
                 self.storage_updated.value = False
@@ -119,26 +167,15 @@ class FaissVectorDBStorage(BaseVectorStorage):
 
         # Prepare data for embedding
         list_data = []
-        contents = []
         for k, v in data.items():
             # Store only known meta fields if needed
             meta = {mf: v[mf] for mf in self.meta_fields if mf in v}
             meta["__id__"] = k
             meta["__created_at__"] = current_time
             list_data.append(meta)
-            contents.append(v["content"])
 
-        # Split into batches for embedding if needed
-        batches = [
-            contents[i : i + self._max_batch_size]
-            for i in range(0, len(contents), self._max_batch_size)
-        ]
-
-        embedding_tasks = [self.embedding_func(batch) for batch in batches]
-        embeddings_list = await asyncio.gather(*embedding_tasks)
-
-        # Flatten the list of arrays
-        embeddings = np.concatenate(embeddings_list, axis=0)
+        # Records with a precomputed vector are not embedded again
+        embeddings = await self._embed_contents(data, self._max_batch_size)
         if len(embeddings) != len(list_data):
             logger.error(
                 f"[{self.workspace}] Embedding size mismatch. Embeddings: {len(embeddings)}, Data: {len(list_data)}"
@@ -164,6 +201,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
 
         # Step 2: Add new vectors
         index = await self._get_index()
+        self._train_if_needed(index, embeddings)
         start_idx = index.ntotal
         index.add(embeddings)
 
@@ -171,7 +209,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
         for i, meta in enumerate(list_data):
             fid = start_idx + i
             # Store the raw vector so we can rebuild if something is removed
-            meta["__vector__"] = embeddings[i].tolist()
+            self._encode_meta_vector(meta, embeddings[i])
             self._id_to_meta.update({fid: meta})
 
         logger.debug(
@@ -180,7 +218,11 @@ class FaissVectorDBStorage(BaseVectorStorage):
         return [m["__id__"] for m in list_data]
 
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Search by a textual query; returns top_k results with their metadata + similarity distance.
@@ -215,14 +257,22 @@ class FaissVectorDBStorage(BaseVectorStorage):
 
             meta = self._id_to_meta.get(idx, {})
             # Filter out __vector__ from query results to avoid returning large vector data
-            filtered_meta = {k: v for k, v in meta.items() if k != "__vector__"}
-            results.append(
-                {
-                    **filtered_meta,
-                    "id": meta.get("__id__"),
-                    "distance": float(dist),
-                    "created_at": meta.get("__created_at__"),
+            if fields is not None:
+                filtered_meta = {f: meta[f] for f in fields if f in meta}
+            else:
+                filtered_meta = {
+                    k: v for k, v in meta.items() if k not in _VECTOR_FIELDS
                 }
+            results.append(
+                self._project_fields(
+                    {
+                        **filtered_meta,
+                        "id": meta.get("__id__"),
+                        "distance": float(dist),
+                        "created_at": meta.get("__created_at__"),
+                    },
+                    fields,
+                )
             )
 
         return results
@@ -307,7 +357,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
     async def _remove_faiss_ids(self, fid_list):
         """
         Remove a list of internal Faiss IDs from the index.
-        Because IndexFlatIP doesn't support 'removals',
+        Because IndexFlatIP/IndexScalarQuantizer don't support 'removals',
         we rebuild the index excluding those vectors.
         """
         keep_fids = [fid for fid in self._id_to_meta if fid not in fid_list]
@@ -317,14 +367,15 @@ class FaissVectorDBStorage(BaseVectorStorage):
         new_id_to_meta = {}
         for new_fid, old_fid in enumerate(keep_fids):
             vec_meta = self._id_to_meta[old_fid]
-            vectors_to_keep.append(vec_meta["__vector__"])  # stored as list
+            vectors_to_keep.append(self._decode_meta_vector(vec_meta))
             new_id_to_meta[new_fid] = vec_meta
 
         async with self._storage_lock:
             # Re-init index
-            self._index = faiss.IndexFlatIP(self._dim)
+            self._index = self._new_index()
             if vectors_to_keep:
                 arr = np.array(vectors_to_keep, dtype=np.float32)
+                self._train_if_needed(self._index, arr)
                 self._index.add(arr)
 
             self._id_to_meta = new_id_to_meta
@@ -336,7 +387,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
         faiss.write_index(self._index, self._faiss_index_file)
 
         # Save metadata dict to JSON. Convert all keys to strings for JSON storage.
-        # _id_to_meta is { int: { '__id__': doc_id, '__vector__': [float,...], ... } }
+        # _id_to_meta is { int: { '__id__': doc_id, '__vector__': [float,...] or encoded str, ... } }
         # We'll keep the int -> dict, but JSON requires string keys.
         serializable_dict = {}
         for fid, meta in self._id_to_meta.items():
@@ -377,7 +428,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
                 f"[{self.workspace}] Failed to load Faiss index or metadata: {e}"
             )
             logger.warning(f"[{self.workspace}] Starting with an empty Faiss index.")
-            self._index = faiss.IndexFlatIP(self._dim)
+            self._index = self._new_index()
             self._id_to_meta = {}
 
     async def index_done_callback(self) -> None:
@@ -388,7 +439,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
                 logger.warning(
                     f"[{self.workspace}] Storage for FAISS {self.namespace} was updated by another process, reloading..."
                 )
-                self._index = faiss.IndexFlatIP(self._dim)
+                self._index = self._new_index()
                 self._id_to_meta = {}
                 self._load_faiss_index()
                 self.storage_updated.value = False
@@ -431,7 +482,9 @@ class FaissVectorDBStorage(BaseVectorStorage):
             return None
 
         # Filter out __vector__ from metadata to avoid returning large vector data
-        filtered_metadata = {k: v for k, v in metadata.items() if k != "__vector__"}
+        filtered_metadata = {
+            k: v for k, v in metadata.items() if k not in _VECTOR_FIELDS
+        }
         return {
             **filtered_metadata,
             "id": metadata.get("__id__"),
@@ -459,7 +512,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
                 if metadata:
                     # Filter out __vector__ from metadata to avoid returning large vector data
                     filtered_metadata = {
-                        k: v for k, v in metadata.items() if k != "__vector__"
+                        k: v for k, v in metadata.items() if k not in _VECTOR_FIELDS
                     }
                     record = {
                         **filtered_metadata,
@@ -491,10 +544,30 @@ class FaissVectorDBStorage(BaseVectorStorage):
                 metadata = self._id_to_meta[fid]
                 # Get the stored vector from metadata
                 if "__vector__" in metadata:
-                    vectors_dict[id] = metadata["__vector__"]
+                    vectors_dict[id] = self._decode_meta_vector(metadata).tolist()
 
         return vectors_dict
 
+    async def get_vector_matrix(self, ids: list[str]) -> tuple[list[str], np.ndarray]:
+        """Get vectors by their IDs reconstructed straight from the Faiss index
+
+        Uses one reconstruct_batch call instead of decoding metadata copies.
+        """
+        wanted = set(ids)
+        if not wanted:
+            return [], np.empty((0, self._dim), np.float32)
+
+        index = await self._get_index()
+        fids: dict[str, int] = {}
+        for fid, meta in self._id_to_meta.items():
+            if meta.get("__id__") in wanted:
+                fids[meta["__id__"]] = fid
+        found_ids = [id for id in dict.fromkeys(ids) if id in fids]
+        if not found_ids:
+            return [], np.empty((0, self._dim), np.float32)
+        keys = np.asarray([fids[id] for id in found_ids], dtype=np.int64)
+        return found_ids, index.reconstruct_batch(keys)
+
     async def drop(self) -> dict[str, str]:
         """Drop all vector data from storage and clean up resources
 
@@ -514,7 +587,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
         try:
             async with self._storage_lock:
                 # Reset the index
-                self._index = faiss.IndexFlatIP(self._dim)
+                self._index = self._new_index()
                 self._id_to_meta = {}
 
                 # Remove storage files if they exist
@@ -1,4 +1,5 @@
 import os
+import time
 from dataclasses import dataclass
 from typing import Any, final
 
@@ -6,10 +7,15 @@ from lightrag.base import (
     BaseKVStorage,
 )
 from lightrag.utils import (
+    estimate_cache_entry_bytes,
+    get_cache_type_from_key,
+    get_llm_cache_policies,
     load_json,
     logger,
+    select_cache_evictions,
     write_json,
 )
+from lightrag.constants import LLM_CACHE_EVICTION_LFU
 from lightrag.exceptions import StorageNotInitializedError
 from .shared_storage import (
     get_namespace_data,
@@ -44,6 +50,14 @@ class JsonKVStorage(BaseKVStorage):
         self._storage_lock = None
         self.storage_updated = None
 
+        # LLM cache retention policies, access stats are kept per process only
+        self._cache_policies = (
+            get_llm_cache_policies(self.global_config)
+            if self.namespace.endswith("_cache")
+            else {}
+        )
+        self._cache_access: dict[str, list[float]] = {}
+
     async def initialize(self):
         """Initialize storage data"""
         self._storage_lock = get_storage_lock()
@@ -70,6 +84,8 @@ class JsonKVStorage(BaseKVStorage):
 
     async def index_done_callback(self) -> None:
         async with self._storage_lock:
+            if self._cache_policies:
+                await self._enforce_cache_policies()
             if self.storage_updated.value:
                 data_dict = (
                     dict(self._data) if hasattr(self._data, "_getvalue") else self._data
@@ -95,6 +111,8 @@ class JsonKVStorage(BaseKVStorage):
                 result.setdefault("update_time", 0)
                 # Ensure _id field contains the clean ID
                 result["_id"] = id
+                if self._cache_policies:
+                    self._record_cache_access(id)
             return result
 
     async def get_by_ids(self, ids: list[str]) -> list[dict[str, Any]]:
@@ -111,6 +129,8 @@ class JsonKVStorage(BaseKVStorage):
                     # Ensure _id field contains the clean ID
                     result["_id"] = id
                     results.append(result)
+                    if self._cache_policies:
+                        self._record_cache_access(id)
                 else:
                     results.append(None)
             return results
@@ -217,6 +237,64 @@ class JsonKVStorage(BaseKVStorage):
             logger.error(f"[{self.workspace}] Error dropping {self.namespace}: {e}")
             return {"status": "error", "message": str(e)}
 
+    async def record_cache_access(self, ids: list[str]) -> None:
+        if not self._cache_policies:
+            return
+        async with self._storage_lock:
+            for id in ids:
+                if id in self._data:
+                    self._record_cache_access(id)
+
+    def _record_cache_access(self, key: str) -> None:
+        """Track last access time and hit count of a cache entry for LRU/LFU"""
+        access = self._cache_access.get(key)
+        if access is None:
+            self._cache_access[key] = [time.time(), 1]
+        else:
+            access[0] = time.time()
+            access[1] += 1
+
+    async def _enforce_cache_policies(self) -> None:
+        """Drop expired cache entries and evict entries exceeding policy bounds
+
+        Caller must hold the storage lock. Entries never accessed by this
+        process are ranked by their update_time (LRU) or as unused (LFU).
+        """
+        now = time.time()
+        evicted: list[str] = []
+        candidates: dict[str, list[tuple[str, float, int]]] = {}
+
+        for key, entry in self._data.items():
+            cache_type = get_cache_type_from_key(key)
+            policy = self._cache_policies.get(cache_type)
+            if policy is None:
+                continue
+            if policy.is_expired(entry, now):
+                evicted.append(key)
+                continue
+            if policy.bounded:
+                access = self._cache_access.get(key)
+                if policy.eviction == LLM_CACHE_EVICTION_LFU:
+                    score = access[1] if access else 0
+                else:
+                    score = access[0] if access else entry.get("update_time", 0)
+                size = estimate_cache_entry_bytes(entry) if policy.max_bytes else 0
+                candidates.setdefault(cache_type, []).append((key, score, size))
+
+        for cache_type, items in candidates.items():
+            evicted.extend(
+                select_cache_evictions(items, self._cache_policies[cache_type])
+            )
+
+        if evicted:
+            for key in evicted:
+                self._data.pop(key, None)
+                self._cache_access.pop(key, None)
+            await set_all_update_flags(self.final_namespace)
+            logger.info(
+                f"[{self.workspace}] Evicted {len(evicted)} LLM cache entries from {self.namespace}"
+            )
+
     async def _migrate_legacy_cache_structure(self, data: dict) -> dict:
         """Migrate legacy nested cache structure to flattened structure
 
@@ -77,6 +77,12 @@ class MemgraphStorage(BaseGraphStorage):
                 auth=(USERNAME, PASSWORD),
             )
             self._DATABASE = DATABASE
+            self._write_batch_size = int(
+                os.environ.get(
+                    "MEMGRAPH_WRITE_BATCH_SIZE",
+                    config.get("memgraph", "write_batch_size", fallback=500),
+                )
+            )
             try:
                 async with self._driver.session(database=DATABASE) as session:
                     # Create index for base nodes on entity_id if it doesn't exist
@@ -677,8 +683,128 @@ class MemgraphStorage(BaseGraphStorage):
             logger.error(f"[{self.workspace}] Error during node deletion: {str(e)}")
             raise
 
+    async def _run_write_batches(
+        self, query: str, rows: list[dict], operation: str
+    ) -> None:
+        """Run an UNWIND $rows write query in batches of write_batch_size
+
+        Each batch is one write transaction, retried on transient errors
+        with the same backoff as the single-record upserts.
+        """
+        max_retries = 100
+        initial_wait_time = 0.2
+        backoff_factor = 1.1
+        jitter_factor = 0.1
+
+        async def execute_write(tx: AsyncManagedTransaction, batch: list[dict]):
+            result = await tx.run(query, rows=batch)
+            await result.consume()  # Ensure result is fully consumed
+
+        for i in range(0, len(rows), self._write_batch_size):
+            batch = rows[i : i + self._write_batch_size]
+            for attempt in range(max_retries):
+                try:
+                    async with self._driver.session(database=self._DATABASE) as session:
+                        await session.execute_write(execute_write, batch)
+                    break  # Success - exit retry loop
+                except (TransientError, ResultFailedError) as e:
+                    is_transient = (
+                        isinstance(e, TransientError)
+                        or isinstance(e.__cause__, TransientError)
+                        or "TransientError" in str(e)
+                        or "Cannot resolve conflicting transactions" in str(e)
+                    )
+                    if not is_transient:
+                        logger.error(
+                            f"[{self.workspace}] Non-transient error during {operation}: {str(e)}"
+                        )
+                        raise
+                    if attempt >= max_retries - 1:
+                        logger.error(
+                            f"[{self.workspace}] Memgraph transient error during {operation} after {max_retries} retries: {str(e)}"
+                        )
+                        raise
+                    jitter = random.uniform(0, jitter_factor) * initial_wait_time
+                    wait_time = initial_wait_time * (backoff_factor**attempt) + jitter
+                    logger.warning(
+                        f"[{self.workspace}] {operation} failed. Attempt #{attempt + 1} retrying in {wait_time:.3f} seconds... Error: {str(e)}"
+                    )
+                    await asyncio.sleep(wait_time)
+                except Exception as e:
+                    logger.error(
+                        f"[{self.workspace}] Unexpected error during {operation}: {str(e)}"
+                    )
+                    raise
+
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        """
+        Upsert multiple nodes with UNWIND, one write transaction per batch.
+
+        Nodes are grouped by entity_type because the type label cannot be
+        parameterized in Cypher.
+
+        Args:
+            nodes: Mapping of node ID to node properties
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not nodes:
+            return
+        workspace_label = self._get_workspace_label()
+
+        rows_by_type: dict[str, list[dict]] = {}
+        for node_id, properties in nodes.items():
+            if "entity_id" not in properties:
+                raise ValueError(
+                    "Memgraph: node properties must contain an 'entity_id' field"
+                )
+            rows_by_type.setdefault(properties["entity_type"], []).append(
+                {"entity_id": node_id, "properties": properties}
+            )
+
+        for entity_type, rows in rows_by_type.items():
+            query = f"""
+            UNWIND $rows AS row
+            MERGE (n:`{workspace_label}` {{entity_id: row.entity_id}})
+            SET n += row.properties
+            SET n:`{entity_type}`
+            """
+            await self._run_write_batches(query, rows, "batch node upsert")
+
+    async def upsert_edges_batch(
+        self, edges: list[tuple[str, str, dict[str, str]]]
+    ) -> None:
+        """
+        Upsert multiple edges with UNWIND, one write transaction per batch.
+        Edges whose endpoints do not exist are skipped, like upsert_edge.
+
+        Args:
+            edges: List of (source_node_id, target_node_id, edge_data) tuples
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not edges:
+            return
+        workspace_label = self._get_workspace_label()
+        rows = [
+            {"source_entity_id": src, "target_entity_id": tgt, "properties": data}
+            for src, tgt, data in edges
+        ]
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (source:`{workspace_label}` {{entity_id: row.source_entity_id}})
+        MATCH (target:`{workspace_label}` {{entity_id: row.target_entity_id}})
+        MERGE (source)-[r:DIRECTED]-(target)
+        SET r += row.properties
+        """
+        await self._run_write_batches(query, rows, "batch edge upsert")
+
     async def remove_nodes(self, nodes: list[str]):
-        """Delete multiple nodes
+        """Delete multiple nodes with UNWIND, one write transaction per batch
 
         Args:
             nodes: List of node labels to be deleted
@@ -687,11 +813,20 @@ class MemgraphStorage(BaseGraphStorage):
             raise RuntimeError(
                 "Memgraph driver is not initialized. Call 'await initialize()' first."
             )
-        for node in nodes:
-            await self.delete_node(node)
+        if not nodes:
+            return
+        workspace_label = self._get_workspace_label()
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (n:`{workspace_label}` {{entity_id: row.entity_id}})
+        DETACH DELETE n
+        """
+        rows = [{"entity_id": node} for node in nodes]
+        await self._run_write_batches(query, rows, "node deletion")
+        logger.debug(f"[{self.workspace}] Deleted {len(nodes)} nodes")
 
     async def remove_edges(self, edges: list[tuple[str, str]]):
-        """Delete multiple edges
+        """Delete multiple edges with UNWIND, one write transaction per batch
 
         Args:
             edges: List of edges to be deleted, each edge is a (source, target) tuple
@@ -703,28 +838,20 @@ class MemgraphStorage(BaseGraphStorage):
             raise RuntimeError(
                 "Memgraph driver is not initialized. Call 'await initialize()' first."
             )
-        for source, target in edges:
-
-            async def _do_delete_edge(tx: AsyncManagedTransaction):
-                workspace_label = self._get_workspace_label()
-                query = f"""
-                MATCH (source:`{workspace_label}` {{entity_id: $source_entity_id}})-[r]-(target:`{workspace_label}` {{entity_id: $target_entity_id}})
-                DELETE r
-                """
-                result = await tx.run(
-                    query, source_entity_id=source, target_entity_id=target
-                )
-                logger.debug(
-                    f"[{self.workspace}] Deleted edge from '{source}' to '{target}'"
-                )
-                await result.consume()  # Ensure result is fully consumed
-
-            try:
-                async with self._driver.session(database=self._DATABASE) as session:
-                    await session.execute_write(_do_delete_edge)
-            except Exception as e:
-                logger.error(f"[{self.workspace}] Error during edge deletion: {str(e)}")
-                raise
+        if not edges:
+            return
+        workspace_label = self._get_workspace_label()
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (source:`{workspace_label}` {{entity_id: row.source_entity_id}})-[r]-(target:`{workspace_label}` {{entity_id: row.target_entity_id}})
+        DELETE r
+        """
+        rows = [
+            {"source_entity_id": source, "target_entity_id": target}
+            for source, target in edges
+        ]
+        await self._run_write_batches(query, rows, "edge deletion")
+        logger.debug(f"[{self.workspace}] Deleted {len(edges)} edges")
 
     async def drop(self) -> dict[str, str]:
         """Drop all data from the current workspace and clean up resources
@@ -3,9 +3,13 @@ import os
 from typing import Any, final
 from dataclasses import dataclass
 import numpy as np
-from lightrag.utils import logger, compute_mdhash_id
+from lightrag.utils import logger, compute_mdhash_id, get_vector_precision
 from ..base import BaseVectorStorage
-from ..constants import DEFAULT_MAX_FILE_PATH_LENGTH
+from ..constants import (
+    DEFAULT_MAX_FILE_PATH_LENGTH,
+    VECTOR_PRECISION_FLOAT16,
+    VECTOR_PRECISION_INT8,
+)
 from ..kg.shared_storage import get_data_init_lock, get_storage_lock
 import pipmaster as pm
 
@@ -15,6 +19,11 @@ if not pm.is_installed("pymilvus"):
 import configparser
 from pymilvus import MilvusClient, DataType, CollectionSchema, FieldSchema  # type: ignore
 
+try:
+    from pymilvus import AsyncMilvusClient  # type: ignore
+except ImportError:  # pymilvus < 2.5.3
+    AsyncMilvusClient = None
+
 config = configparser.ConfigParser()
 config.read("config.ini", "utf-8")
 
@@ -144,16 +153,35 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         # If all else fails, return None to use fallback method
         return None
 
+    def _get_vector_index_config(self) -> tuple[str, dict[str, Any]]:
+        """Get vector index type and params for the configured vector precision
+
+        float16/int8 use HNSW_SQ so the graph index keeps quantized vectors in
+        memory; int8 refines candidates against the raw vectors to keep recall.
+        """
+        params: dict[str, Any] = {"M": 16, "efConstruction": 256}
+        if self._vector_precision == VECTOR_PRECISION_FLOAT16:
+            return "HNSW_SQ", {**params, "sq_type": "FP16"}
+        if self._vector_precision == VECTOR_PRECISION_INT8:
+            return "HNSW_SQ", {
+                **params,
+                "sq_type": "SQ8",
+                "refine": True,
+                "refine_type": "FP32",
+            }
+        return "HNSW", params
+
     def _create_vector_index_fallback(self):
         """Fallback method to create vector index using direct API"""
+        index_type, params = self._get_vector_index_config()
         try:
             self._client.create_index(
                 collection_name=self.final_namespace,
                 field_name="vector",
                 index_params={
-                    "index_type": "HNSW",
+                    "index_type": index_type,
                     "metric_type": "COSINE",
-                    "params": {"M": 16, "efConstruction": 256},
+                    "params": params,
                 },
             )
             logger.debug(
@@ -198,11 +226,12 @@ class MilvusVectorDBStorage(BaseVectorStorage):
                 try:
                     # Create vector index first (required for most operations)
                     vector_index = IndexParamsClass
+                    index_type, params = self._get_vector_index_config()
                     vector_index.add_index(
                         field_name="vector",
-                        index_type="HNSW",
+                        index_type=index_type,
                         metric_type="COSINE",
-                        params={"M": 16, "efConstruction": 256},
+                        params=params,
                     )
                     self._client.create_index(
                         collection_name=self.final_namespace, index_params=vector_index
@@ -812,6 +841,23 @@ class MilvusVectorDBStorage(BaseVectorStorage):
             )
             raise
 
+    async def _call(self, method: str, **kwargs) -> Any:
+        """Invoke a data-path client method without blocking the event loop
+
+        Uses AsyncMilvusClient when available, otherwise runs the method of
+        the synchronous MilvusClient in the default executor.
+        """
+        if self._async_client is not None:
+            return await getattr(self._async_client, method)(**kwargs)
+        return await asyncio.to_thread(getattr(self._client, method), **kwargs)
+
+    async def _aensure_collection_loaded(self):
+        """Load the collection once per storage instance, off the event loop"""
+        if self._collection_loaded:
+            return
+        await asyncio.to_thread(self._ensure_collection_loaded)
+        self._collection_loaded = True
+
     def _create_collection_if_not_exist(self):
         """Create collection if not exists and check existing collection compatibility"""
 
@@ -971,13 +1017,20 @@ class MilvusVectorDBStorage(BaseVectorStorage):
                 "cosine_better_than_threshold must be specified in vector_db_storage_cls_kwargs"
             )
         self.cosine_better_than_threshold = cosine_threshold
+        # Only applied when the vector index is created
+        self._vector_precision = get_vector_precision(kwargs)
 
         # Ensure created_at is in meta_fields
         if "created_at" not in self.meta_fields:
             self.meta_fields.add("created_at")
 
         # Initialize client as None - will be created in initialize() method
+        # The synchronous client handles schema management, the async client
+        # (when available) serves upsert/search/query/delete
         self._client = None
+        self._async_client = None
+        self._collection_loaded = False
+        self._needs_flush = False
         self._max_batch_size = self.global_config["embedding_batch_num"]
         self._initialized = False
 
@@ -990,7 +1043,7 @@ class MilvusVectorDBStorage(BaseVectorStorage):
             try:
                 # Create MilvusClient if not already created
                 if self._client is None:
-                    self._client = MilvusClient(
+                    client_kwargs = dict(
                         uri=os.environ.get(
                             "MILVUS_URI",
                             config.get(
@@ -1016,12 +1069,22 @@ class MilvusVectorDBStorage(BaseVectorStorage):
                             config.get("milvus", "db_name", fallback=None),
                         ),
                     )
+                    self._client = MilvusClient(**client_kwargs)
                     logger.debug(
                         f"[{self.workspace}] MilvusClient created successfully"
                     )
 
+                    # Milvus Lite (local .db file) has no async client support
+                    if AsyncMilvusClient is not None and not client_kwargs[
+                        "uri"
+                    ].endswith(".db"):
+                        self._async_client = AsyncMilvusClient(**client_kwargs)
+                        logger.debug(
+                            f"[{self.workspace}] AsyncMilvusClient created successfully"
+                        )
+
                 # Create collection and check compatibility
-                self._create_collection_if_not_exist()
+                await asyncio.to_thread(self._create_collection_if_not_exist)
                 self._initialized = True
                 logger.info(
                     f"[{self.workspace}] Milvus collection '{self.namespace}' initialized successfully"
@@ -1038,7 +1101,7 @@ class MilvusVectorDBStorage(BaseVectorStorage):
             return
 
         # Ensure collection is loaded before upserting
-        self._ensure_collection_loaded()
+        await self._aensure_collection_loaded()
 
         import time
 
@@ -1052,28 +1115,25 @@ class MilvusVectorDBStorage(BaseVectorStorage):
             }
             for k, v in data.items()
         ]
-        contents = [v["content"] for v in data.values()]
-        batches = [
-            contents[i : i + self._max_batch_size]
-            for i in range(0, len(contents), self._max_batch_size)
-        ]
-
-        embedding_tasks = [self.embedding_func(batch) for batch in batches]
-        embeddings_list = await asyncio.gather(*embedding_tasks)
-
-        embeddings = np.concatenate(embeddings_list)
+        # Records with a precomputed vector are not embedded again
+        embeddings = await self._embed_contents(data, self._max_batch_size)
         for i, d in enumerate(list_data):
             d["vector"] = embeddings[i]
-        results = self._client.upsert(
-            collection_name=self.final_namespace, data=list_data
+        results = await self._call(
+            "upsert", collection_name=self.final_namespace, data=list_data
         )
+        self._needs_flush = True
         return results
 
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         # Ensure collection is loaded before querying
-        self._ensure_collection_loaded()
+        await self._aensure_collection_loaded()
 
         # Use provided embedding or compute it
         if query_embedding is not None:
@@ -1083,10 +1143,15 @@ class MilvusVectorDBStorage(BaseVectorStorage):
                 [query], _priority=5
             )  # higher priority for query
 
-        # Include all meta_fields (created_at is now always included)
-        output_fields = list(self.meta_fields)
+        # Include all meta_fields (created_at is now always included), or only
+        # the requested ones that exist in the collection schema
+        if fields is None:
+            output_fields = list(self.meta_fields)
+        else:
+            output_fields = [f for f in fields if f in self.meta_fields]
 
-        results = self._client.search(
+        results = await self._call(
+            "search",
             collection_name=self.final_namespace,
             data=embedding,
             limit=top_k,
@@ -1097,18 +1162,29 @@ class MilvusVectorDBStorage(BaseVectorStorage):
             },
         )
         return [
-            {
-                **dp["entity"],
-                "id": dp["id"],
-                "distance": dp["distance"],
-                "created_at": dp.get("created_at"),
-            }
+            self._project_fields(
+                {
+                    **dp["entity"],
+                    "id": dp["id"],
+                    "distance": dp["distance"],
+                    "created_at": dp.get("created_at"),
+                },
+                fields,
+            )
             for dp in results[0]
         ]
 
     async def index_done_callback(self) -> None:
-        # Milvus handles persistence automatically
-        pass
+        """Flush upserted data into sealed segments once per indexing batch"""
+        if not self._needs_flush:
+            return
+        self._needs_flush = False
+        try:
+            await asyncio.to_thread(self._client.flush, self.final_namespace)
+        except Exception as e:
+            logger.warning(
+                f"[{self.workspace}] Failed to flush Milvus collection {self.namespace}: {e}"
+            )
 
     async def delete_entity(self, entity_name: str) -> None:
         """Delete an entity from the vector database
@@ -1124,8 +1200,8 @@ class MilvusVectorDBStorage(BaseVectorStorage):
             )
 
             # Delete the entity from Milvus collection
-            result = self._client.delete(
-                collection_name=self.final_namespace, pks=[entity_id]
+            result = await self._call(
+                "delete", collection_name=self.final_namespace, pks=[entity_id]
             )
 
             if result and result.get("delete_count", 0) > 0:
@@ -1148,14 +1224,17 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         """
         try:
             # Ensure collection is loaded before querying
-            self._ensure_collection_loaded()
+            await self._aensure_collection_loaded()
 
             # Search for relations where entity is either source or target
             expr = f'src_id == "{entity_name}" or tgt_id == "{entity_name}"'
 
             # Find all relations involving this entity
-            results = self._client.query(
-                collection_name=self.final_namespace, filter=expr, output_fields=["id"]
+            results = await self._call(
+                "query",
+                collection_name=self.final_namespace,
+                filter=expr,
+                output_fields=["id"],
             )
 
             if not results or len(results) == 0:
@@ -1172,8 +1251,8 @@ class MilvusVectorDBStorage(BaseVectorStorage):
 
             # Delete the relations
             if relation_ids:
-                delete_result = self._client.delete(
-                    collection_name=self.final_namespace, pks=relation_ids
+                delete_result = await self._call(
+                    "delete", collection_name=self.final_namespace, pks=relation_ids
                 )
 
                 logger.debug(
@@ -1193,10 +1272,12 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         """
         try:
             # Ensure collection is loaded before deleting
-            self._ensure_collection_loaded()
+            await self._aensure_collection_loaded()
 
             # Delete vectors by IDs
-            result = self._client.delete(collection_name=self.final_namespace, pks=ids)
+            result = await self._call(
+                "delete", collection_name=self.final_namespace, pks=ids
+            )
 
             if result and result.get("delete_count", 0) > 0:
                 logger.debug(
@@ -1223,13 +1304,14 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         """
         try:
             # Ensure collection is loaded before querying
-            self._ensure_collection_loaded()
+            await self._aensure_collection_loaded()
 
             # Include all meta_fields (created_at is now always included) plus id
             output_fields = list(self.meta_fields) + ["id"]
 
             # Query Milvus for a specific ID
-            result = self._client.query(
+            result = await self._call(
+                "query",
                 collection_name=self.final_namespace,
                 filter=f'id == "{id}"',
                 output_fields=output_fields,
@@ -1259,7 +1341,7 @@ class MilvusVectorDBStorage(BaseVectorStorage):
 
         try:
             # Ensure collection is loaded before querying
-            self._ensure_collection_loaded()
+            await self._aensure_collection_loaded()
 
             # Include all meta_fields (created_at is now always included) plus id
             output_fields = list(self.meta_fields) + ["id"]
@@ -1269,7 +1351,8 @@ class MilvusVectorDBStorage(BaseVectorStorage):
             filter_expr = f'id in ["{id_list}"]'
 
             # Query Milvus with the filter
-            result = self._client.query(
+            result = await self._call(
+                "query",
                 collection_name=self.final_namespace,
                 filter=filter_expr,
                 output_fields=output_fields,
@@ -1312,14 +1395,15 @@ class MilvusVectorDBStorage(BaseVectorStorage):
 
         try:
             # Ensure collection is loaded before querying
-            self._ensure_collection_loaded()
+            await self._aensure_collection_loaded()
 
             # Prepare the ID filter expression
             id_list = '", "'.join(ids)
             filter_expr = f'id in ["{id_list}"]'
 
             # Query Milvus with the filter, requesting only vector field
-            result = self._client.query(
+            result = await self._call(
+                "query",
                 collection_name=self.final_namespace,
                 filter=filter_expr,
                 output_fields=["vector"],
@@ -1354,11 +1438,17 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         async with get_storage_lock():
             try:
                 # Drop the collection and recreate it
-                if self._client.has_collection(self.final_namespace):
-                    self._client.drop_collection(self.final_namespace)
+                if await asyncio.to_thread(
+                    self._client.has_collection, self.final_namespace
+                ):
+                    await asyncio.to_thread(
+                        self._client.drop_collection, self.final_namespace
+                    )
+                self._collection_loaded = False
+                self._needs_flush = False
 
                 # Recreate the collection
-                self._create_collection_if_not_exist()
+                await asyncio.to_thread(self._create_collection_if_not_exist)
 
                 logger.info(
                     f"[{self.workspace}] Process {os.getpid()} drop Milvus collection {self.namespace}"
@@ -6,7 +6,7 @@ import numpy as np
 import configparser
 import asyncio
 
-from typing import Any, Union, final
+from typing import Any, Collection, Union, final
 
 from ..base import (
     BaseGraphStorage,
@@ -214,7 +214,35 @@ class MongoKVStorage(BaseKVStorage):
             )
 
         if operations:
-            await self._data.bulk_write(operations)
+            await self._data.bulk_write(operations, ordered=False)
+
+    async def update_fields(
+        self,
+        updates: dict[str, dict[str, Any]],
+        union_fields: Collection[str] = (),
+    ) -> None:
+        """Partially update existing documents with a single bulk write
+
+        List fields in union_fields are merged server side with $addToSet, so
+        no documents are read back.
+        """
+        if not updates:
+            return
+
+        operations = []
+        current_time = int(time.time())
+        for k, fields in updates.items():
+            set_fields = {f: v for f, v in fields.items() if f not in union_fields}
+            set_fields["update_time"] = current_time
+            update_doc: dict[str, Any] = {"$set": set_fields}
+            add_to_set = {
+                f: {"$each": list(v)} for f, v in fields.items() if f in union_fields
+            }
+            if add_to_set:
+                update_doc["$addToSet"] = add_to_set
+            operations.append(UpdateOne({"_id": k}, update_doc))
+
+        await self._data.bulk_write(operations, ordered=False)
 
     async def index_done_callback(self) -> None:
         # Mongo handles persistence automatically
@@ -403,16 +431,14 @@ class MongoDocStatusStorage(DocStatusStorage):
         logger.debug(f"[{self.workspace}] Inserting {len(data)} to {self.namespace}")
         if not data:
             return
-        update_tasks: list[Any] = []
+        operations = []
         for k, v in data.items():
             # Ensure chunks_list field exists and is an array
             if "chunks_list" not in v:
                 v["chunks_list"] = []
             data[k]["_id"] = k
-            update_tasks.append(
-                self._data.update_one({"_id": k}, {"$set": v}, upsert=True)
-            )
-        await asyncio.gather(*update_tasks)
+            operations.append(UpdateOne({"_id": k}, {"$set": v}, upsert=True))
+        await self._data.bulk_write(operations, ordered=False)
 
     async def get_status_counts(self) -> dict[str, int]:
         """Get counts of documents in each status"""
@@ -793,6 +819,9 @@ class MongoGraphStorage(BaseGraphStorage):
                 self.db, self._edge_collection_name
             )
 
+            # Create indexes backing edge lookups and chunk-based queries
+            await self.create_and_migrate_indexes_if_not_exists()
+
             # Create Atlas Search index for better search performance if possible
             await self.create_search_index_if_not_exists()
 
@@ -808,6 +837,65 @@ class MongoGraphStorage(BaseGraphStorage):
                 self.collection = None
                 self.edge_collection = None
 
+    async def create_and_migrate_indexes_if_not_exists(self):
+        """Create indexes for edge endpoint lookups and chunk id queries
+
+        Node and edge collections are already scoped to the workspace by name,
+        so the endpoint indexes pair source_node_id with target_node_id
+        instead of carrying a workspace key.
+        """
+        index_specs = [
+            (
+                self.edge_collection,
+                self._edge_collection_name,
+                "source_node_id_target_node_id",
+                [("source_node_id", 1), ("target_node_id", 1)],
+            ),
+            (
+                self.edge_collection,
+                self._edge_collection_name,
+                "target_node_id_source_node_id",
+                [("target_node_id", 1), ("source_node_id", 1)],
+            ),
+            (
+                self.edge_collection,
+                self._edge_collection_name,
+                "source_ids",
+                [("source_ids", 1)],
+            ),
+            (
+                self.collection,
+                self._collection_name,
+                "source_ids",
+                [("source_ids", 1)],
+            ),
+        ]
+
+        existing_index_names: dict[str, set[str]] = {}
+        for collection, collection_name, index_name, keys in index_specs:
+            try:
+                if collection_name not in existing_index_names:
+                    indexes_cursor = await collection.list_indexes()
+                    existing_indexes = await indexes_cursor.to_list(length=None)
+                    existing_index_names[collection_name] = {
+                        idx.get("name", "") for idx in existing_indexes
+                    }
+
+                if index_name in existing_index_names[collection_name]:
+                    logger.debug(
+                        f"[{self.workspace}] Index '{index_name}' already exists for collection {collection_name}"
+                    )
+                    continue
+
+                await collection.create_index(keys, name=index_name)
+                logger.debug(
+                    f"[{self.workspace}] Created index '{index_name}' for collection {collection_name}"
+                )
+            except PyMongoError as e:
+                logger.error(
+                    f"[{self.workspace}] Failed to create index '{index_name}' for collection {collection_name}: {e}"
+                )
+
     # Sample entity document
     # "source_ids" is Array representation of "source_id" split by GRAPH_FIELD_SEP
 
@@ -949,7 +1037,7 @@ class MongoGraphStorage(BaseGraphStorage):
                     {"target_node_id": source_node_id},
                 ]
             },
-            {"source_node_id": 1, "target_node_id": 1},
+            {"_id": 0, "source_node_id": 1, "target_node_id": 1},
         )
 
         return [
@@ -970,6 +1058,7 @@ class MongoGraphStorage(BaseGraphStorage):
         # Outbound degrees
         outbound_pipeline = [
             {"$match": {"source_node_id": {"$in": node_ids}}},
+            {"$project": {"_id": 0, "source_node_id": 1}},
             {"$group": {"_id": "$source_node_id", "degree": {"$sum": 1}}},
         ]
 
@@ -982,6 +1071,7 @@ class MongoGraphStorage(BaseGraphStorage):
         # Inbound degrees
         inbound_pipeline = [
             {"$match": {"target_node_id": {"$in": node_ids}}},
+            {"$project": {"_id": 0, "target_node_id": 1}},
             {"$group": {"_id": "$target_node_id", "degree": {"$sum": 1}}},
         ]
 
@@ -1014,10 +1104,13 @@ class MongoGraphStorage(BaseGraphStorage):
         """
         result = {node_id: [] for node_id in node_ids}
 
+        # Only endpoint ids are projected (no _id), so both queries are covered
+        # by the source/target compound indexes and never touch edge documents
+        edge_projection = {"_id": 0, "source_node_id": 1, "target_node_id": 1}
+
         # Query outgoing edges (where node is the source)
         outgoing_cursor = self.edge_collection.find(
-            {"source_node_id": {"$in": node_ids}},
-            {"source_node_id": 1, "target_node_id": 1},
+            {"source_node_id": {"$in": node_ids}}, edge_projection
         )
         async for edge in outgoing_cursor:
             source = edge["source_node_id"]
@@ -1026,8 +1119,7 @@ class MongoGraphStorage(BaseGraphStorage):
 
         # Query incoming edges (where node is the target)
         incoming_cursor = self.edge_collection.find(
-            {"target_node_id": {"$in": node_ids}},
-            {"source_node_id": 1, "target_node_id": 1},
+            {"target_node_id": {"$in": node_ids}}, edge_projection
         )
         async for edge in incoming_cursor:
             source = edge["source_node_id"]
@@ -1081,38 +1173,26 @@ class MongoGraphStorage(BaseGraphStorage):
     # -------------------------------------------------------------------------
     #
 
-    async def upsert_node(self, node_id: str, node_data: dict[str, str]) -> None:
-        """
-        Insert or update a node document.
-        """
+    def _node_upsert_op(self, node_id: str, node_data: dict[str, str]) -> UpdateOne:
         update_doc = {"$set": {**node_data}}
         if node_data.get("source_id", ""):
             update_doc["$set"]["source_ids"] = node_data["source_id"].split(
                 GRAPH_FIELD_SEP
             )
+        return UpdateOne({"_id": node_id}, update_doc, upsert=True)
 
-        await self.collection.update_one({"_id": node_id}, update_doc, upsert=True)
-
-    async def upsert_edge(
+    def _edge_upsert_op(
         self, source_node_id: str, target_node_id: str, edge_data: dict[str, str]
-    ) -> None:
-        """
-        Upsert an edge between source_node_id and target_node_id with optional 'relation'.
-        If an edge with the same target exists, we remove it and re-insert with updated data.
-        """
-        # Ensure source node exists
-        await self.upsert_node(source_node_id, {})
-
-        update_doc = {"$set": edge_data}
+    ) -> UpdateOne:
+        update_doc = {"$set": {**edge_data}}
         if edge_data.get("source_id", ""):
             update_doc["$set"]["source_ids"] = edge_data["source_id"].split(
                 GRAPH_FIELD_SEP
             )
+        update_doc["$set"]["source_node_id"] = source_node_id
+        update_doc["$set"]["target_node_id"] = target_node_id
 
-        edge_data["source_node_id"] = source_node_id
-        edge_data["target_node_id"] = target_node_id
-
-        await self.edge_collection.update_one(
+        return UpdateOne(
             {
                 "$or": [
                     {
@@ -1129,6 +1209,60 @@ class MongoGraphStorage(BaseGraphStorage):
             upsert=True,
         )
 
+    async def upsert_node(self, node_id: str, node_data: dict[str, str]) -> None:
+        """
+        Insert or update a node document.
+        """
+        await self.upsert_nodes_batch({node_id: node_data})
+
+    async def upsert_edge(
+        self, source_node_id: str, target_node_id: str, edge_data: dict[str, str]
+    ) -> None:
+        """
+        Upsert an edge between source_node_id and target_node_id with optional 'relation'.
+        If an edge with the same target exists, we remove it and re-insert with updated data.
+        """
+        await self.upsert_edges_batch([(source_node_id, target_node_id, edge_data)])
+
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        """Insert or update multiple node documents with one unordered bulk write"""
+        if not nodes:
+            return
+        operations = [
+            self._node_upsert_op(node_id, node_data)
+            for node_id, node_data in nodes.items()
+        ]
+        await self.collection.bulk_write(operations, ordered=False)
+
+    async def upsert_edges_batch(
+        self, edges: list[tuple[str, str, dict[str, str]]]
+    ) -> None:
+        """Insert or update multiple edges with one unordered bulk write per collection
+
+        Source nodes are created when missing. When the same undirected edge
+        appears more than once, the last occurrence wins.
+        """
+        if not edges:
+            return
+
+        latest_edges: dict[tuple[str, str], tuple[str, str, dict[str, str]]] = {}
+        for source_node_id, target_node_id, edge_data in edges:
+            edge_key = tuple(sorted((source_node_id, target_node_id)))
+            latest_edges[edge_key] = (source_node_id, target_node_id, edge_data)
+
+        # Ensure source nodes exist
+        source_node_ids = {src for src, _, _ in latest_edges.values()}
+        await self.collection.bulk_write(
+            [self._node_upsert_op(node_id, {}) for node_id in source_node_ids],
+            ordered=False,
+        )
+
+        operations = [
+            self._edge_upsert_op(src, tgt, edge_data)
+            for src, tgt, edge_data in latest_edges.values()
+        ]
+        await self.edge_collection.bulk_write(operations, ordered=False)
+
     #
     # -------------------------------------------------------------------------
     # DELETION
@@ -2225,29 +2359,25 @@ class MongoVectorDBStorage(BaseVectorStorage):
             }
             for k, v in data.items()
         ]
-        contents = [v["content"] for v in data.values()]
-        batches = [
-            contents[i : i + self._max_batch_size]
-            for i in range(0, len(contents), self._max_batch_size)
-        ]
-
-        embedding_tasks = [self.embedding_func(batch) for batch in batches]
-        embeddings_list = await asyncio.gather(*embedding_tasks)
-        embeddings = np.concatenate(embeddings_list)
+        # Records with a precomputed vector are not embedded again
+        embeddings = await self._embed_contents(data, self._max_batch_size)
         for i, d in enumerate(list_data):
             d["vector"] = np.array(embeddings[i], dtype=np.float32).tolist()
 
-        update_tasks = []
-        for doc in list_data:
-            update_tasks.append(
-                self._data.update_one({"_id": doc["_id"]}, {"$set": doc}, upsert=True)
-            )
-        await asyncio.gather(*update_tasks)
+        operations = [
+            UpdateOne({"_id": doc["_id"]}, {"$set": doc}, upsert=True)
+            for doc in list_data
+        ]
+        await self._data.bulk_write(operations, ordered=False)
 
         return list_data
 
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Queries the vector database using Atlas Vector Search."""
         if query_embedding is not None:
@@ -2277,7 +2407,11 @@ class MongoVectorDBStorage(BaseVectorStorage):
             },
             {"$addFields": {"score": {"$meta": "vectorSearchScore"}}},
             {"$match": {"score": {"$gte": self.cosine_better_than_threshold}}},
-            {"$project": {"vector": 0}},
+            {
+                "$project": {"vector": 0}
+                if fields is None
+                else {"score": 1, **{f: 1 for f in fields}}
+            },
         ]
 
         # Execute the aggregation pipeline
@@ -2286,12 +2420,15 @@ class MongoVectorDBStorage(BaseVectorStorage):
 
         # Format and return the results with created_at field
         return [
-            {
-                **doc,
-                "id": doc["_id"],
-                "distance": doc.get("score", None),
-                "created_at": doc.get("created_at"),  # Include created_at field
-            }
+            self._project_fields(
+                {
+                    **doc,
+                    "id": doc["_id"],
+                    "distance": doc.get("score", None),
+                    "created_at": doc.get("created_at"),  # Include created_at field
+                },
+                fields,
+            )
             for doc in results
         ]
 
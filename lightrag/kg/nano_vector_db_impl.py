@@ -1,7 +1,4 @@
-import asyncio
-import base64
 import os
-import zlib
 from typing import Any, final
 from dataclasses import dataclass
 import numpy as np
@@ -10,9 +7,13 @@ import time
 from lightrag.utils import (
     logger,
     compute_mdhash_id,
+    decode_vector,
+    encode_vector,
+    get_vector_precision,
 )
 
 from lightrag.base import BaseVectorStorage
+from lightrag.constants import VECTOR_PRECISION_FLOAT16, VECTOR_PRECISION_FLOAT32
 from nano_vectordb import NanoVectorDB
 from .shared_storage import (
     get_storage_lock,
@@ -20,6 +21,10 @@ from .shared_storage import (
     set_all_update_flags,
 )
 
+# Encoded vector copy kept on each record, never returned to callers
+# (vector_scale only exists on int8 records written by earlier versions)
+_VECTOR_FIELDS = ("vector", "vector_scale")
+
 
 @final
 @dataclass
@@ -38,6 +43,15 @@ class NanoVectorDBStorage(BaseVectorStorage):
                 "cosine_better_than_threshold must be specified in vector_db_storage_cls_kwargs"
             )
         self.cosine_better_than_threshold = cosine_threshold
+        # NanoVectorDB searches its own float32 matrix, so a lower precision would
+        # only shrink the per-record copy without saving any search memory
+        vector_precision = get_vector_precision(kwargs)
+        if vector_precision != VECTOR_PRECISION_FLOAT32:
+            raise ValueError(
+                f"vector_precision '{vector_precision}' is not supported by "
+                "NanoVectorDBStorage, use FaissVectorDBStorage, QdrantVectorDBStorage "
+                "or MilvusVectorDBStorage for float16/int8 vectors"
+            )
 
         working_dir = self.global_config["working_dir"]
         if self.workspace:
@@ -108,24 +122,12 @@ class NanoVectorDBStorage(BaseVectorStorage):
             }
             for k, v in data.items()
         ]
-        contents = [v["content"] for v in data.values()]
-        batches = [
-            contents[i : i + self._max_batch_size]
-            for i in range(0, len(contents), self._max_batch_size)
-        ]
-
-        # Execute embedding outside of lock to avoid long lock times
-        embedding_tasks = [self.embedding_func(batch) for batch in batches]
-        embeddings_list = await asyncio.gather(*embedding_tasks)
-
-        embeddings = np.concatenate(embeddings_list)
+        # Records with a precomputed vector are not embedded again
+        embeddings = await self._embed_contents(data, self._max_batch_size)
         if len(embeddings) == len(list_data):
             for i, d in enumerate(list_data):
                 # Compress vector using Float16 + zlib + Base64 for storage optimization
-                vector_f16 = embeddings[i].astype(np.float16)
-                compressed_vector = zlib.compress(vector_f16.tobytes())
-                encoded_vector = base64.b64encode(compressed_vector).decode("utf-8")
-                d["vector"] = encoded_vector
+                d["vector"], _ = encode_vector(embeddings[i], VECTOR_PRECISION_FLOAT16)
                 d["__vector__"] = embeddings[i]
             client = await self._get_client()
             results = client.upsert(datas=list_data)
@@ -137,7 +139,11 @@ class NanoVectorDBStorage(BaseVectorStorage):
             )
 
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         # Use provided embedding or compute it
         if query_embedding is not None:
@@ -155,9 +161,23 @@ class NanoVectorDBStorage(BaseVectorStorage):
             top_k=top_k,
             better_than_threshold=self.cosine_better_than_threshold,
         )
+        if fields is not None:
+            return [
+                {
+                    **{f: dp[f] for f in fields if f in dp},
+                    "id": dp["__id__"],
+                    "distance": dp["__metrics__"],
+                    **(
+                        {"created_at": dp.get("__created_at__")}
+                        if "created_at" in fields
+                        else {}
+                    ),
+                }
+                for dp in results
+            ]
         results = [
             {
-                **{k: v for k, v in dp.items() if k != "vector"},
+                **{k: v for k, v in dp.items() if k not in _VECTOR_FIELDS},
                 "id": dp["__id__"],
                 "distance": dp["__metrics__"],
                 "created_at": dp.get("__created_at__"),
@@ -314,7 +334,7 @@ class NanoVectorDBStorage(BaseVectorStorage):
         if result:
             dp = result[0]
             return {
-                **{k: v for k, v in dp.items() if k != "vector"},
+                **{k: v for k, v in dp.items() if k not in _VECTOR_FIELDS},
                 "id": dp.get("__id__"),
                 "created_at": dp.get("__created_at__"),
             }
@@ -340,7 +360,7 @@ class NanoVectorDBStorage(BaseVectorStorage):
             if not dp:
                 continue
             record = {
-                **{k: v for k, v in dp.items() if k != "vector"},
+                **{k: v for k, v in dp.items() if k not in _VECTOR_FIELDS},
                 "id": dp.get("__id__"),
                 "created_at": dp.get("__created_at__"),
             }
@@ -373,15 +393,32 @@ class NanoVectorDBStorage(BaseVectorStorage):
         vectors_dict = {}
         for result in results:
             if result and "vector" in result and "__id__" in result:
-                # Decompress vector data (Base64 + zlib + Float16 compressed)
-                decoded = base64.b64decode(result["vector"])
-                decompressed = zlib.decompress(decoded)
-                vector_f16 = np.frombuffer(decompressed, dtype=np.float16)
-                vector_f32 = vector_f16.astype(np.float32).tolist()
-                vectors_dict[result["__id__"]] = vector_f32
+                # Decompress vector data (Base64 + zlib + Float16/Int8 compressed)
+                vectors_dict[result["__id__"]] = decode_vector(
+                    result["vector"], result.get("vector_scale")
+                ).tolist()
 
         return vectors_dict
 
+    async def get_vector_matrix(self, ids: list[str]) -> tuple[list[str], np.ndarray]:
+        """Get vectors by their IDs as rows of the NanoVectorDB matrix
+
+        Rows are gathered from the in-memory (already normalized) float32 matrix
+        with one fancy-index operation, without decoding the per-record copy.
+        """
+        wanted = set(ids)
+        if not wanted:
+            return [], np.empty((0, self.embedding_func.embedding_dim), np.float32)
+
+        storage = await self.client_storage
+        rows: dict[str, int] = {}
+        for i, dp in enumerate(storage["data"]):
+            if dp["__id__"] in wanted:
+                rows[dp["__id__"]] = i
+        found_ids = [id for id in dict.fromkeys(ids) if id in rows]
+        matrix = storage["matrix"][[rows[id] for id in found_ids]]
+        return found_ids, matrix
+
     async def drop(self) -> dict[str, str]:
         """Drop all vector data from storage and clean up resources
 
@@ -130,6 +130,12 @@ class Neo4JStorage(BaseGraphStorage):
                 "NEO4J_DATABASE", re.sub(r"[^a-zA-Z0-9-]", "-", self.namespace)
             )
             """The default value approach for the DATABASE is only intended to maintain compatibility with legacy practices."""
+            self._write_batch_size = int(
+                os.environ.get(
+                    "NEO4J_WRITE_BATCH_SIZE",
+                    config.get("neo4j", "write_batch_size", fallback=500),
+                )
+            )
 
             self._driver: AsyncDriver = AsyncGraphDatabase.driver(
                 URI,
@@ -1056,6 +1062,122 @@ class Neo4JStorage(BaseGraphStorage):
             logger.error(f"[{self.workspace}] Error during edge upsert: {str(e)}")
             raise
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type(
+            (
+                neo4jExceptions.ServiceUnavailable,
+                neo4jExceptions.TransientError,
+                neo4jExceptions.WriteServiceUnavailable,
+                neo4jExceptions.ClientError,
+                neo4jExceptions.SessionExpired,
+                ConnectionResetError,
+                OSError,
+            )
+        ),
+    )
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        """
+        Upsert multiple nodes with UNWIND, one write transaction per batch.
+
+        Nodes are grouped by entity_type because the type label cannot be
+        parameterized in Cypher.
+
+        Args:
+            nodes: Mapping of node ID to node properties
+        """
+        if not nodes:
+            return
+        workspace_label = self._get_workspace_label()
+
+        rows_by_type: dict[str, list[dict]] = {}
+        for node_id, properties in nodes.items():
+            if "entity_id" not in properties:
+                raise ValueError(
+                    "Neo4j: node properties must contain an 'entity_id' field"
+                )
+            rows_by_type.setdefault(properties["entity_type"], []).append(
+                {"entity_id": node_id, "properties": properties}
+            )
+
+        try:
+            async with self._driver.session(database=self._DATABASE) as session:
+                for entity_type, rows in rows_by_type.items():
+                    query = f"""
+                    UNWIND $rows AS row
+                    MERGE (n:`{workspace_label}` {{entity_id: row.entity_id}})
+                    SET n += row.properties
+                    SET n:`{entity_type}`
+                    """
+                    for i in range(0, len(rows), self._write_batch_size):
+                        batch = rows[i : i + self._write_batch_size]
+
+                        async def execute_upsert(
+                            tx: AsyncManagedTransaction, batch=batch, query=query
+                        ):
+                            result = await tx.run(query, rows=batch)
+                            await result.consume()  # Ensure result is fully consumed
+
+                        await session.execute_write(execute_upsert)
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error during batch upsert: {str(e)}")
+            raise
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type(
+            (
+                neo4jExceptions.ServiceUnavailable,
+                neo4jExceptions.TransientError,
+                neo4jExceptions.WriteServiceUnavailable,
+                neo4jExceptions.ClientError,
+                neo4jExceptions.SessionExpired,
+                ConnectionResetError,
+                OSError,
+            )
+        ),
+    )
+    async def upsert_edges_batch(
+        self, edges: list[tuple[str, str, dict[str, str]]]
+    ) -> None:
+        """
+        Upsert multiple edges with UNWIND, one write transaction per batch.
+        Edges whose endpoints do not exist are skipped, like upsert_edge.
+
+        Args:
+            edges: List of (source_node_id, target_node_id, edge_data) tuples
+        """
+        if not edges:
+            return
+        workspace_label = self._get_workspace_label()
+        rows = [
+            {"source_entity_id": src, "target_entity_id": tgt, "properties": data}
+            for src, tgt, data in edges
+        ]
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (source:`{workspace_label}` {{entity_id: row.source_entity_id}})
+        MATCH (target:`{workspace_label}` {{entity_id: row.target_entity_id}})
+        MERGE (source)-[r:DIRECTED]-(target)
+        SET r += row.properties
+        """
+
+        try:
+            async with self._driver.session(database=self._DATABASE) as session:
+                for i in range(0, len(rows), self._write_batch_size):
+                    batch = rows[i : i + self._write_batch_size]
+
+                    async def execute_upsert(tx: AsyncManagedTransaction, batch=batch):
+                        result = await tx.run(query, rows=batch)
+                        await result.consume()  # Ensure result is fully consumed
+
+                    await session.execute_write(execute_upsert)
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error during batch edge upsert: {str(e)}")
+            raise
+
     async def get_knowledge_graph(
         self,
         node_label: str,
@@ -1522,13 +1644,34 @@ class Neo4JStorage(BaseGraphStorage):
         ),
     )
     async def remove_nodes(self, nodes: list[str]):
-        """Delete multiple nodes
+        """Delete multiple nodes with UNWIND, one write transaction per batch
 
         Args:
             nodes: List of node labels to be deleted
         """
-        for node in nodes:
-            await self.delete_node(node)
+        if not nodes:
+            return
+        workspace_label = self._get_workspace_label()
+        query = f"""
+        UNWIND $entity_ids AS entity_id
+        MATCH (n:`{workspace_label}` {{entity_id: entity_id}})
+        DETACH DELETE n
+        """
+
+        try:
+            async with self._driver.session(database=self._DATABASE) as session:
+                for i in range(0, len(nodes), self._write_batch_size):
+                    batch = list(nodes[i : i + self._write_batch_size])
+
+                    async def _do_delete(tx: AsyncManagedTransaction, batch=batch):
+                        result = await tx.run(query, entity_ids=batch)
+                        await result.consume()  # Ensure result is fully consumed
+
+                    await session.execute_write(_do_delete)
+            logger.debug(f"[{self.workspace}] Deleted {len(nodes)} nodes")
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error during node deletion: {str(e)}")
+            raise
 
     @retry(
         stop=stop_after_attempt(3),
@@ -1546,33 +1689,40 @@ class Neo4JStorage(BaseGraphStorage):
         ),
     )
     async def remove_edges(self, edges: list[tuple[str, str]]):
-        """Delete multiple edges
+        """Delete multiple edges with UNWIND, one write transaction per batch
 
         Args:
             edges: List of edges to be deleted, each edge is a (source, target) tuple
         """
-        for source, target in edges:
+        if not edges:
+            return
+        workspace_label = self._get_workspace_label()
+        pairs = [
+            {"source_entity_id": source, "target_entity_id": target}
+            for source, target in edges
+        ]
+        query = f"""
+        UNWIND $pairs AS pair
+        MATCH (source:`{workspace_label}` {{entity_id: pair.source_entity_id}})-[r]-(target:`{workspace_label}` {{entity_id: pair.target_entity_id}})
+        DELETE r
+        """
 
-            async def _do_delete_edge(tx: AsyncManagedTransaction):
-                workspace_label = self._get_workspace_label()
-                query = f"""
-                MATCH (source:`{workspace_label}` {{entity_id: $source_entity_id}})-[r]-(target:`{workspace_label}` {{entity_id: $target_entity_id}})
-                DELETE r
-                """
-                result = await tx.run(
-                    query, source_entity_id=source, target_entity_id=target
-                )
-                logger.debug(
-                    f"[{self.workspace}] Deleted edge from '{source}' to '{target}'"
-                )
-                await result.consume()  # Ensure result is fully consumed
+        try:
+            async with self._driver.session(database=self._DATABASE) as session:
+                for i in range(0, len(pairs), self._write_batch_size):
+                    batch = pairs[i : i + self._write_batch_size]
 
-            try:
-                async with self._driver.session(database=self._DATABASE) as session:
-                    await session.execute_write(_do_delete_edge)
-            except Exception as e:
-                logger.error(f"[{self.workspace}] Error during edge deletion: {str(e)}")
-                raise
+                    async def _do_delete_edges(
+                        tx: AsyncManagedTransaction, batch=batch
+                    ):
+                        result = await tx.run(query, pairs=batch)
+                        await result.consume()  # Ensure result is fully consumed
+
+                    await session.execute_write(_do_delete_edges)
+            logger.debug(f"[{self.workspace}] Deleted {len(edges)} edges")
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error during edge deletion: {str(e)}")
+            raise
 
     async def get_all_nodes(self) -> list[dict]:
         """Get all nodes in the graph.
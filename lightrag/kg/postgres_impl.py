@@ -5,8 +5,16 @@ import re
 import datetime
 from datetime import timezone
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, TypeVar, Union, final
-import numpy as np
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    TypeVar,
+    Union,
+    final,
+)
 import configparser
 import ssl
 import itertools
@@ -32,8 +40,13 @@ from ..base import (
     DocStatusStorage,
 )
 from ..namespace import NameSpace, is_namespace
-from ..utils import logger
-from ..constants import GRAPH_FIELD_SEP
+from ..utils import (
+    LLMCachePolicy,
+    get_cache_type_from_key,
+    get_llm_cache_policies,
+    logger,
+)
+from ..constants import GRAPH_FIELD_SEP, LLM_CACHE_EVICTION_LFU
 from ..kg.shared_storage import get_data_init_lock, get_graph_db_lock, get_storage_lock
 
 import pipmaster as pm
@@ -85,6 +98,9 @@ class PostgreSQLDB:
         # Statement LRU cache size (keep as-is, allow None for optional configuration)
         self.statement_cache_size = config.get("statement_cache_size")
 
+        # Number of rows prefetched per round-trip by server-side cursors
+        self.cursor_fetch_size = int(config.get("cursor_fetch_size") or 1000)
+
         if self.user is None or self.password is None or self.database is None:
             raise ValueError("Missing database user, password, or database")
 
@@ -417,7 +433,8 @@ class PostgreSQLDB:
             SELECT column_name
             FROM information_schema.columns
             WHERE table_name = 'lightrag_llm_cache'
-            AND column_name IN ('chunk_id', 'cache_type', 'queryparam', 'mode')
+            AND column_name IN ('chunk_id', 'cache_type', 'queryparam', 'mode',
+                                'access_time', 'access_count')
             """
 
             existing_columns = await self.query(check_columns_sql, multirows=True)
@@ -490,6 +507,22 @@ class PostgreSQLDB:
                     "queryparam column already exists in LIGHTRAG_LLM_CACHE table"
                 )
 
+            # Add access tracking columns used by LLM cache eviction policies
+            if "access_time" not in existing_column_names:
+                logger.info("Adding access_time column to LIGHTRAG_LLM_CACHE table")
+                add_access_time_sql = """
+                ALTER TABLE LIGHTRAG_LLM_CACHE
+                ADD COLUMN access_time TIMESTAMP NULL
+                """
+                await self.execute(add_access_time_sql)
+            if "access_count" not in existing_column_names:
+                logger.info("Adding access_count column to LIGHTRAG_LLM_CACHE table")
+                add_access_count_sql = """
+                ALTER TABLE LIGHTRAG_LLM_CACHE
+                ADD COLUMN access_count INTEGER NOT NULL DEFAULT 0
+                """
+                await self.execute(add_access_count_sql)
+
             # Remove deprecated mode field if it exists
             if "mode" in existing_column_names:
                 logger.info(
@@ -1240,6 +1273,40 @@ class PostgreSQLDB:
                 f"PostgreSQL, Failed to create full entities/relations tables: {e}"
             )
 
+        # Migrate entity/relation chunks tables to add the description reservoir
+        try:
+            await self._migrate_chunk_tracking_add_description_reservoir()
+        except Exception as e:
+            logger.error(
+                f"PostgreSQL, Failed to migrate chunk tracking description reservoir: {e}"
+            )
+
+    async def _migrate_chunk_tracking_add_description_reservoir(self):
+        """Add description reservoir columns to the entity/relation chunks tables if missing"""
+        for table_name in ("LIGHTRAG_ENTITY_CHUNKS", "LIGHTRAG_RELATION_CHUNKS"):
+            try:
+                check_column_sql = f"""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name = '{table_name.lower()}'
+                AND column_name = 'descriptions'
+                """
+                column_info = await self.query(check_column_sql)
+                if column_info:
+                    continue
+                logger.info(f"Adding description reservoir columns to {table_name}")
+                await self.execute(
+                    f"""
+                    ALTER TABLE {table_name}
+                    ADD COLUMN IF NOT EXISTS descriptions JSONB NULL DEFAULT '[]'::jsonb,
+                    ADD COLUMN IF NOT EXISTS description_count INTEGER NOT NULL DEFAULT 0
+                    """
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to add description reservoir columns to {table_name}: {e}"
+                )
+
     async def _migrate_create_full_entities_relations_tables(self):
         """Create LIGHTRAG_FULL_ENTITIES and LIGHTRAG_FULL_RELATIONS tables if they don't exist"""
         tables_to_check = [
@@ -1517,6 +1584,49 @@ class PostgreSQLDB:
             logger.error(f"PostgreSQL database,\nsql:{sql},\ndata:{data},\nerror:{e}")
             raise
 
+    async def iterate(
+        self,
+        sql: str,
+        params: list[Any] | None = None,
+        fetch_size: int | None = None,
+        with_age: bool = False,
+        graph_name: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream rows of a query through a server-side cursor.
+
+        Rows are fetched from PostgreSQL in batches of ``fetch_size`` inside a
+        read-only transaction, so full-table scans never materialize the whole
+        result set in memory. The connection is held until the iterator is
+        exhausted or closed; callers that may stop early should wrap it in
+        ``contextlib.aclosing``.
+
+        Each open iterator occupies one pool connection for the whole scan, and
+        writes issued while iterating need another one, so keep the pool at two
+        or more connections and the loop body short when the consumer writes.
+
+        Unlike ``query``, no retry is attempted once rows have been yielded.
+        """
+        if with_age and not graph_name:
+            raise ValueError("Graph name is required when with_age is True")
+
+        prefetch = max(1, int(fetch_size or self.cursor_fetch_size))
+        prepared_params = tuple(params) if params else ()
+
+        await self._ensure_pool()
+        assert self.pool is not None
+        try:
+            async with self.pool.acquire() as connection:  # type: ignore[arg-type]
+                if with_age:
+                    await self.configure_age(connection, graph_name)
+                async with connection.transaction(readonly=True):
+                    async for record in connection.cursor(
+                        sql, *prepared_params, prefetch=prefetch
+                    ):
+                        yield dict(record)
+        except Exception as e:
+            logger.error(f"PostgreSQL database, cursor error:{e}")
+            raise
+
 
 class ClientManager:
     _instances: dict[str, Any] = {"db": None, "ref_count": 0}
@@ -1606,6 +1716,12 @@ class ClientManager:
                 "POSTGRES_STATEMENT_CACHE_SIZE",
                 config.get("postgres", "statement_cache_size", fallback=None),
             ),
+            "cursor_fetch_size": int(
+                os.environ.get(
+                    "POSTGRES_CURSOR_FETCH_SIZE",
+                    config.get("postgres", "cursor_fetch_size", fallback="1000"),
+                )
+            ),
             # Connection retry configuration
             "connection_retry_attempts": min(
                 10,
@@ -1678,6 +1794,18 @@ class ClientManager:
                     await db.pool.close()
 
 
+def _parse_description_reservoir(record: dict[str, Any]) -> None:
+    """Decode the description reservoir of an entity/relation chunks row in place"""
+    descriptions = record.get("descriptions")
+    if isinstance(descriptions, str):
+        try:
+            descriptions = json.loads(descriptions)
+        except json.JSONDecodeError:
+            descriptions = []
+    record["descriptions"] = descriptions or []
+    record["description_count"] = record.get("description_count") or 0
+
+
 @final
 @dataclass
 class PGKVStorage(BaseKVStorage):
@@ -1685,6 +1813,12 @@ class PGKVStorage(BaseKVStorage):
 
     def __post_init__(self):
         self._max_batch_size = self.global_config["embedding_batch_num"]
+        self._cache_policies: dict[str, LLMCachePolicy] = {}
+        # Cache hits buffered in process, flushed to access_time/access_count
+        # in index_done_callback to avoid one UPDATE per cache lookup
+        self._cache_hits: dict[str, int] = {}
+        if is_namespace(self.namespace, NameSpace.KV_STORE_LLM_RESPONSE_CACHE):
+            self._cache_policies = get_llm_cache_policies(self.global_config)
 
     async def initialize(self):
         async with get_data_init_lock():
@@ -1753,6 +1887,7 @@ class PGKVStorage(BaseKVStorage):
                 "create_time": create_time,
                 "update_time": create_time if update_time == 0 else update_time,
             }
+            self._record_cache_hits([id])
 
         # Special handling for FULL_ENTITIES namespace
         if response and is_namespace(self.namespace, NameSpace.KV_STORE_FULL_ENTITIES):
@@ -1794,6 +1929,7 @@ class PGKVStorage(BaseKVStorage):
                 except json.JSONDecodeError:
                     chunk_ids = []
             response["chunk_ids"] = chunk_ids
+            _parse_description_reservoir(response)
             create_time = response.get("create_time", 0)
             update_time = response.get("update_time", 0)
             response["create_time"] = create_time
@@ -1811,6 +1947,7 @@ class PGKVStorage(BaseKVStorage):
                 except json.JSONDecodeError:
                     chunk_ids = []
             response["chunk_ids"] = chunk_ids
+            _parse_description_reservoir(response)
             create_time = response.get("create_time", 0)
             update_time = response.get("update_time", 0)
             response["create_time"] = create_time
@@ -1890,6 +2027,7 @@ class PGKVStorage(BaseKVStorage):
                     "update_time": create_time if update_time == 0 else update_time,
                 }
                 processed_results.append(processed_row)
+            self._record_cache_hits([row["id"] for row in results])
             return _order_results(processed_results)
 
         # Special handling for FULL_ENTITIES namespace
@@ -1935,6 +2073,7 @@ class PGKVStorage(BaseKVStorage):
                     except json.JSONDecodeError:
                         chunk_ids = []
                 result["chunk_ids"] = chunk_ids
+                _parse_description_reservoir(result)
                 create_time = result.get("create_time", 0)
                 update_time = result.get("update_time", 0)
                 result["create_time"] = create_time
@@ -1951,6 +2090,7 @@ class PGKVStorage(BaseKVStorage):
                     except json.JSONDecodeError:
                         chunk_ids = []
                 result["chunk_ids"] = chunk_ids
+                _parse_description_reservoir(result)
                 create_time = result.get("create_time", 0)
                 update_time = result.get("update_time", 0)
                 result["create_time"] = create_time
@@ -2072,6 +2212,11 @@ class PGKVStorage(BaseKVStorage):
                     "count": v["count"],
                     "create_time": current_time,
                     "update_time": current_time,
+                    # NULL keeps the stored description reservoir
+                    "descriptions": json.dumps(v["descriptions"])
+                    if "descriptions" in v
+                    else None,
+                    "description_count": v.get("description_count"),
                 }
                 await self.db.execute(upsert_sql, _data)
         elif is_namespace(self.namespace, NameSpace.KV_STORE_RELATION_CHUNKS):
@@ -2086,12 +2231,104 @@ class PGKVStorage(BaseKVStorage):
                     "count": v["count"],
                     "create_time": current_time,
                     "update_time": current_time,
+                    # NULL keeps the stored description reservoir
+                    "descriptions": json.dumps(v["descriptions"])
+                    if "descriptions" in v
+                    else None,
+                    "description_count": v.get("description_count"),
                 }
                 await self.db.execute(upsert_sql, _data)
 
+    async def update_fields(
+        self,
+        updates: dict[str, dict[str, Any]],
+        union_fields: Collection[str] = (),
+    ) -> None:
+        """Partially update records, merging text chunk llm_cache_list in SQL
+
+        Appending to llm_cache_list of text chunks is done with one jsonb UPDATE
+        for all chunks. Other updates use the read-modify-write default.
+        """
+        if not updates:
+            return
+        if not (
+            is_namespace(self.namespace, NameSpace.KV_STORE_TEXT_CHUNKS)
+            and "llm_cache_list" in union_fields
+            and all(fields.keys() == {"llm_cache_list"} for fields in updates.values())
+        ):
+            await super().update_fields(updates, union_fields)
+            return
+
+        await self.db.execute(
+            SQL_TEMPLATES["append_text_chunk_llm_cache_list"],
+            {
+                "workspace": self.workspace,
+                "ids": list(updates.keys()),
+                "cache_lists": [
+                    json.dumps(list(fields["llm_cache_list"]))
+                    for fields in updates.values()
+                ],
+            },
+        )
+
+    async def record_cache_access(self, ids: list[str]) -> None:
+        if self._cache_policies:
+            self._record_cache_hits(ids)
+
+    def _record_cache_hits(self, ids: list[str]) -> None:
+        """Buffer LLM cache hits for bounded cache types"""
+        for cache_id in ids:
+            policy = self._cache_policies.get(get_cache_type_from_key(cache_id))
+            if policy is not None and policy.bounded:
+                self._cache_hits[cache_id] = self._cache_hits.get(cache_id, 0) + 1
+
+    async def _enforce_cache_policies(self) -> None:
+        """Flush buffered cache hits, then apply TTL and size bounds per cache_type"""
+        if self._cache_hits:
+            hits, self._cache_hits = self._cache_hits, {}
+            await self.db.execute(
+                SQL_TEMPLATES["touch_llm_response_cache"],
+                {
+                    "workspace": self.workspace,
+                    "ids": list(hits.keys()),
+                    "hits": list(hits.values()),
+                },
+            )
+
+        for cache_type, policy in self._cache_policies.items():
+            if policy.ttl:
+                await self.db.execute(
+                    SQL_TEMPLATES["expire_llm_response_cache"],
+                    {
+                        "workspace": self.workspace,
+                        "cache_type": cache_type,
+                        "ttl": float(policy.ttl),
+                    },
+                )
+            if policy.bounded:
+                order_by = (
+                    "access_count DESC, COALESCE(access_time, update_time) DESC, id"
+                    if policy.eviction == LLM_CACHE_EVICTION_LFU
+                    else "COALESCE(access_time, update_time) DESC, id"
+                )
+                await self.db.execute(
+                    SQL_TEMPLATES["evict_llm_response_cache"].format(order_by=order_by),
+                    {
+                        "workspace": self.workspace,
+                        "cache_type": cache_type,
+                        "max_entries": policy.max_entries or 0,
+                        "max_bytes": policy.max_bytes or 0,
+                    },
+                )
+
     async def index_done_callback(self) -> None:
-        # PG handles persistence automatically
-        pass
+        # PG handles persistence automatically, only LLM cache policies need work here
+        if not self._cache_policies:
+            return
+        try:
+            await self._enforce_cache_policies()
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error enforcing LLM cache policies: {e}")
 
     async def is_empty(self) -> bool:
         """Check if the storage is empty for the current workspace and namespace
@@ -2289,16 +2526,8 @@ class PGVectorStorage(BaseVectorStorage):
             }
             for k, v in data.items()
         ]
-        contents = [v["content"] for v in data.values()]
-        batches = [
-            contents[i : i + self._max_batch_size]
-            for i in range(0, len(contents), self._max_batch_size)
-        ]
-
-        embedding_tasks = [self.embedding_func(batch) for batch in batches]
-        embeddings_list = await asyncio.gather(*embedding_tasks)
-
-        embeddings = np.concatenate(embeddings_list)
+        # Records with a precomputed vector are not embedded again
+        embeddings = await self._embed_contents(data, self._max_batch_size)
         for i, d in enumerate(list_data):
             d["__vector__"] = embeddings[i]
         for item in list_data:
@@ -2315,7 +2544,11 @@ class PGVectorStorage(BaseVectorStorage):
 
     #################### query method ###############
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         if query_embedding is not None:
             embedding = query_embedding
@@ -2327,7 +2560,23 @@ class PGVectorStorage(BaseVectorStorage):
 
         embedding_string = ",".join(map(str, embedding))
 
-        sql = SQL_TEMPLATES[self.namespace].format(embedding_string=embedding_string)
+        if fields is None:
+            sql = SQL_TEMPLATES[self.namespace].format(
+                embedding_string=embedding_string
+            )
+        else:
+            # Select only the requested columns, unknown fields are ignored
+            column_exprs = PG_VECTOR_QUERY_COLUMNS[self.namespace]
+            columns = [f"{column_exprs['id']} AS id"] + [
+                f"{column_exprs[f]} AS {f}"
+                for f in fields
+                if f in column_exprs and f != "id"
+            ]
+            sql = SQL_TEMPLATES["vector_query_projected"].format(
+                columns=", ".join(columns),
+                table_name=namespace_to_table_name(self.namespace),
+                embedding_string=embedding_string,
+            )
         params = {
             "workspace": self.workspace,
             "closer_than_threshold": 1 - self.cosine_better_than_threshold,
@@ -2776,6 +3025,50 @@ class PGDocStatusStorage(DocStatusStorage):
             counts[doc["status"]] = doc["count"]
         return counts
 
+    def _row_to_doc_status(self, element: dict[str, Any]) -> DocProcessingStatus:
+        """Convert a LIGHTRAG_DOC_STATUS row into a DocProcessingStatus"""
+        # Parse chunks_list JSON string back to list
+        chunks_list = element.get("chunks_list", [])
+        if isinstance(chunks_list, str):
+            try:
+                chunks_list = json.loads(chunks_list)
+            except json.JSONDecodeError:
+                chunks_list = []
+
+        # Parse metadata JSON string back to dict
+        metadata = element.get("metadata", {})
+        if isinstance(metadata, str):
+            try:
+                metadata = json.loads(metadata)
+            except json.JSONDecodeError:
+                metadata = {}
+        # Ensure metadata is a dict
+        if not isinstance(metadata, dict):
+            metadata = {}
+
+        # Safe handling for file_path
+        file_path = element.get("file_path")
+        if file_path is None:
+            file_path = "no-file-path"
+
+        # Convert datetime objects to ISO format strings with timezone info
+        created_at = self._format_datetime_with_timezone(element["created_at"])
+        updated_at = self._format_datetime_with_timezone(element["updated_at"])
+
+        return DocProcessingStatus(
+            content_summary=element["content_summary"],
+            content_length=element["content_length"],
+            status=element["status"],
+            created_at=created_at,
+            updated_at=updated_at,
+            chunks_count=element["chunks_count"],
+            file_path=file_path,
+            chunks_list=chunks_list,
+            metadata=metadata,
+            error_msg=element.get("error_msg"),
+            track_id=element.get("track_id"),
+        )
+
     async def get_docs_by_status(
         self, status: DocStatus
     ) -> dict[str, DocProcessingStatus]:
@@ -2784,51 +3077,18 @@ class PGDocStatusStorage(DocStatusStorage):
         params = {"workspace": self.workspace, "status": status.value}
         result = await self.db.query(sql, list(params.values()), True)
 
-        docs_by_status = {}
-        for element in result:
-            # Parse chunks_list JSON string back to list
-            chunks_list = element.get("chunks_list", [])
-            if isinstance(chunks_list, str):
-                try:
-                    chunks_list = json.loads(chunks_list)
-                except json.JSONDecodeError:
-                    chunks_list = []
-
-            # Parse metadata JSON string back to dict
-            metadata = element.get("metadata", {})
-            if isinstance(metadata, str):
-                try:
-                    metadata = json.loads(metadata)
-                except json.JSONDecodeError:
-                    metadata = {}
-            # Ensure metadata is a dict
-            if not isinstance(metadata, dict):
-                metadata = {}
-
-            # Safe handling for file_path
-            file_path = element.get("file_path")
-            if file_path is None:
-                file_path = "no-file-path"
-
-            # Convert datetime objects to ISO format strings with timezone info
-            created_at = self._format_datetime_with_timezone(element["created_at"])
-            updated_at = self._format_datetime_with_timezone(element["updated_at"])
-
-            docs_by_status[element["id"]] = DocProcessingStatus(
-                content_summary=element["content_summary"],
-                content_length=element["content_length"],
-                status=element["status"],
-                created_at=created_at,
-                updated_at=updated_at,
-                chunks_count=element["chunks_count"],
-                file_path=file_path,
-                chunks_list=chunks_list,
-                metadata=metadata,
-                error_msg=element.get("error_msg"),
-                track_id=element.get("track_id"),
-            )
+        return {element["id"]: self._row_to_doc_status(element) for element in result}
 
-        return docs_by_status
+    async def iter_docs_by_status(
+        self, status: DocStatus, batch_size: int | None = None
+    ) -> AsyncIterator[tuple[str, DocProcessingStatus]]:
+        """Stream documents with a specific status through a server-side cursor"""
+        sql = "select * from LIGHTRAG_DOC_STATUS where workspace=$1 and status=$2"
+        params = {"workspace": self.workspace, "status": status.value}
+        async for element in self.db.iterate(
+            sql, list(params.values()), fetch_size=batch_size
+        ):
+            yield element["id"], self._row_to_doc_status(element)
 
     async def get_docs_by_track_id(
         self, track_id: str
@@ -4607,53 +4867,21 @@ class PGGraphStorage(BaseGraphStorage):
 
         return kg
 
-    async def get_all_nodes(self) -> list[dict]:
-        """Get all nodes in the graph.
-
-        Returns:
-            A list of all nodes, where each node is a dictionary of its properties
-        """
+    def _all_nodes_sql(self) -> str:
         # Use native SQL to avoid Cypher wrapper overhead
         # Original: SELECT * FROM cypher(...) with MATCH (n:base)
         # Optimized: Direct table access for better performance
-        query = f"""
+        return f"""
             SELECT properties
             FROM {self.graph_name}.base
         """
 
-        results = await self._query(query)
-        nodes = []
-        for result in results:
-            if result.get("properties"):
-                node_dict = result["properties"]
-
-                # Process string result, parse it to JSON dictionary
-                if isinstance(node_dict, str):
-                    try:
-                        node_dict = json.loads(node_dict)
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            f"[{self.workspace}] Failed to parse node string: {node_dict}"
-                        )
-                        continue
-
-                # Add node id (entity_id) to the dictionary for easier access
-                node_dict["id"] = node_dict.get("entity_id")
-                nodes.append(node_dict)
-        return nodes
-
-    async def get_all_edges(self) -> list[dict]:
-        """Get all edges in the graph.
-
-        Returns:
-            A list of all edges, where each edge is a dictionary of its properties
-            (If 2 directional edges exist between the same pair of nodes, deduplication must be handled by the caller)
-        """
+    def _all_edges_sql(self) -> str:
         # Use native SQL to avoid Cartesian product (N×N) in Cypher MATCH
         # Original Cypher: MATCH (a:base)-[r]-(b:base) creates ~50 billion row combinations
         # Optimized: Start from edges table, join to nodes only to get entity_id
         # Performance: O(E) instead of O(N²), ~50,000x faster for large graphs
-        query = f"""
+        return f"""
             SELECT DISTINCT
                 (ag_catalog.agtype_access_operator(VARIADIC ARRAY[a.properties, '"entity_id"'::agtype]))::text AS source,
                 (ag_catalog.agtype_access_operator(VARIADIC ARRAY[b.properties, '"entity_id"'::agtype]))::text AS target,
@@ -4663,25 +4891,111 @@ class PGGraphStorage(BaseGraphStorage):
             JOIN {self.graph_name}.base b ON r.end_id = b.id
         """
 
-        results = await self._query(query)
-        edges = []
+    def _parse_node_row(self, result: dict[str, Any]) -> dict | None:
+        if not result.get("properties"):
+            return None
+        node_dict = result["properties"]
+
+        # Process string result, parse it to JSON dictionary
+        if isinstance(node_dict, str):
+            try:
+                node_dict = json.loads(node_dict)
+            except json.JSONDecodeError:
+                logger.warning(
+                    f"[{self.workspace}] Failed to parse node string: {node_dict}"
+                )
+                return None
+
+        # Add node id (entity_id) to the dictionary for easier access
+        node_dict["id"] = node_dict.get("entity_id")
+        return node_dict
+
+    def _parse_edge_row(self, result: dict[str, Any]) -> dict:
+        edge_properties = result["properties"]
+
+        # Process string result, parse it to JSON dictionary
+        if isinstance(edge_properties, str):
+            try:
+                edge_properties = json.loads(edge_properties)
+            except json.JSONDecodeError:
+                logger.warning(
+                    f"[{self.workspace}] Failed to parse edge properties string: {edge_properties}"
+                )
+                edge_properties = {}
+
+        edge_properties["source"] = result["source"]
+        edge_properties["target"] = result["target"]
+        return edge_properties
+
+    async def _iterate(
+        self, query: str, batch_size: int | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a read-only graph query through a server-side cursor"""
+        try:
+            async for record in self.db.iterate(
+                query,
+                fetch_size=batch_size,
+                with_age=True,
+                graph_name=self.graph_name,
+            ):
+                yield self._record_to_dict(record)
+        except Exception as e:
+            raise PGGraphQueryException(
+                {
+                    "message": f"Error streaming graph query: {query}",
+                    "wrapped": query,
+                    "detail": repr(e),
+                    "error_type": e.__class__.__name__,
+                }
+            ) from e
+
+    async def get_all_nodes(self) -> list[dict]:
+        """Get all nodes in the graph.
+
+        Returns:
+            A list of all nodes, where each node is a dictionary of its properties
+        """
+        results = await self._query(self._all_nodes_sql())
+        nodes = []
         for result in results:
-            edge_properties = result["properties"]
+            node_dict = self._parse_node_row(result)
+            if node_dict is not None:
+                nodes.append(node_dict)
+        return nodes
 
-            # Process string result, parse it to JSON dictionary
-            if isinstance(edge_properties, str):
-                try:
-                    edge_properties = json.loads(edge_properties)
-                except json.JSONDecodeError:
-                    logger.warning(
-                        f"[{self.workspace}] Failed to parse edge properties string: {edge_properties}"
-                    )
-                    edge_properties = {}
+    async def get_all_edges(self) -> list[dict]:
+        """Get all edges in the graph.
 
-            edge_properties["source"] = result["source"]
-            edge_properties["target"] = result["target"]
-            edges.append(edge_properties)
-        return edges
+        Returns:
+            A list of all edges, where each edge is a dictionary of its properties
+            (If 2 directional edges exist between the same pair of nodes, deduplication must be handled by the caller)
+        """
+        results = await self._query(self._all_edges_sql())
+        return [self._parse_edge_row(result) for result in results]
+
+    async def iter_all_nodes(
+        self, batch_size: int | None = None
+    ) -> AsyncIterator[dict]:
+        """Stream all nodes through a server-side cursor.
+
+        Args:
+            batch_size: Rows fetched per round-trip, defaults to POSTGRES_CURSOR_FETCH_SIZE
+        """
+        async for result in self._iterate(self._all_nodes_sql(), batch_size):
+            node_dict = self._parse_node_row(result)
+            if node_dict is not None:
+                yield node_dict
+
+    async def iter_all_edges(
+        self, batch_size: int | None = None
+    ) -> AsyncIterator[dict]:
+        """Stream all edges through a server-side cursor.
+
+        Args:
+            batch_size: Rows fetched per round-trip, defaults to POSTGRES_CURSOR_FETCH_SIZE
+        """
+        async for result in self._iterate(self._all_edges_sql(), batch_size):
+            yield self._parse_edge_row(result)
 
     async def get_popular_labels(self, limit: int = 300) -> list[str]:
         """Get popular labels by node degree (most connected entities) using native SQL for performance."""
@@ -4913,6 +5227,8 @@ TABLES = {
                     chunk_id VARCHAR(255) NULL,
                     cache_type VARCHAR(32),
                     queryparam JSONB NULL,
+                    access_time TIMESTAMP NULL,
+                    access_count INTEGER NOT NULL DEFAULT 0,
                     create_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     update_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 	                CONSTRAINT LIGHTRAG_LLM_CACHE_PK PRIMARY KEY (workspace, id)
@@ -4966,6 +5282,8 @@ TABLES = {
                     count INTEGER,
                     create_time TIMESTAMP(0) DEFAULT CURRENT_TIMESTAMP,
                     update_time TIMESTAMP(0) DEFAULT CURRENT_TIMESTAMP,
+                    descriptions JSONB NULL DEFAULT '[]'::jsonb,
+                    description_count INTEGER NOT NULL DEFAULT 0,
                     CONSTRAINT LIGHTRAG_ENTITY_CHUNKS_PK PRIMARY KEY (workspace, id)
                     )"""
     },
@@ -4977,12 +5295,44 @@ TABLES = {
                     count INTEGER,
                     create_time TIMESTAMP(0) DEFAULT CURRENT_TIMESTAMP,
                     update_time TIMESTAMP(0) DEFAULT CURRENT_TIMESTAMP,
+                    descriptions JSONB NULL DEFAULT '[]'::jsonb,
+                    description_count INTEGER NOT NULL DEFAULT 0,
                     CONSTRAINT LIGHTRAG_RELATION_CHUNKS_PK PRIMARY KEY (workspace, id)
                     )"""
     },
 }
 
 
+# Query result field -> column expression of the vector tables, used by
+# PGVectorStorage.query to select only the fields a caller asks for
+_PG_VECTOR_CREATED_AT = "EXTRACT(EPOCH FROM t.create_time)::BIGINT"
+PG_VECTOR_QUERY_COLUMNS = {
+    NameSpace.VECTOR_STORE_ENTITIES: {
+        "id": "t.id",
+        "entity_name": "t.entity_name",
+        "content": "t.content",
+        "file_path": "t.file_path",
+        "created_at": _PG_VECTOR_CREATED_AT,
+    },
+    NameSpace.VECTOR_STORE_RELATIONSHIPS: {
+        "id": "t.id",
+        "src_id": "t.source_id",
+        "tgt_id": "t.target_id",
+        "content": "t.content",
+        "file_path": "t.file_path",
+        "created_at": _PG_VECTOR_CREATED_AT,
+    },
+    NameSpace.VECTOR_STORE_CHUNKS: {
+        "id": "t.id",
+        "full_doc_id": "t.full_doc_id",
+        "chunk_order_index": "t.chunk_order_index",
+        "tokens": "t.tokens",
+        "content": "t.content",
+        "file_path": "t.file_path",
+        "created_at": _PG_VECTOR_CREATED_AT,
+    },
+}
+
 SQL_TEMPLATES = {
     # SQL for KVStorage
     "get_by_id_full_docs": """SELECT id, COALESCE(content, '') as content,
@@ -5037,22 +5387,22 @@ SQL_TEMPLATES = {
                                  EXTRACT(EPOCH FROM update_time)::BIGINT as update_time
                                  FROM LIGHTRAG_FULL_RELATIONS WHERE workspace=$1 AND id = ANY($2)
                                 """,
-    "get_by_id_entity_chunks": """SELECT id, chunk_ids, count,
+    "get_by_id_entity_chunks": """SELECT id, chunk_ids, count, descriptions, description_count,
                                 EXTRACT(EPOCH FROM create_time)::BIGINT as create_time,
                                 EXTRACT(EPOCH FROM update_time)::BIGINT as update_time
                                 FROM LIGHTRAG_ENTITY_CHUNKS WHERE workspace=$1 AND id=$2
                                """,
-    "get_by_id_relation_chunks": """SELECT id, chunk_ids, count,
+    "get_by_id_relation_chunks": """SELECT id, chunk_ids, count, descriptions, description_count,
                                 EXTRACT(EPOCH FROM create_time)::BIGINT as create_time,
                                 EXTRACT(EPOCH FROM update_time)::BIGINT as update_time
                                 FROM LIGHTRAG_RELATION_CHUNKS WHERE workspace=$1 AND id=$2
                                """,
-    "get_by_ids_entity_chunks": """SELECT id, chunk_ids, count,
+    "get_by_ids_entity_chunks": """SELECT id, chunk_ids, count, descriptions, description_count,
                                  EXTRACT(EPOCH FROM create_time)::BIGINT as create_time,
                                  EXTRACT(EPOCH FROM update_time)::BIGINT as update_time
                                  FROM LIGHTRAG_ENTITY_CHUNKS WHERE workspace=$1 AND id = ANY($2)
                                 """,
-    "get_by_ids_relation_chunks": """SELECT id, chunk_ids, count,
+    "get_by_ids_relation_chunks": """SELECT id, chunk_ids, count, descriptions, description_count,
                                  EXTRACT(EPOCH FROM create_time)::BIGINT as create_time,
                                  EXTRACT(EPOCH FROM update_time)::BIGINT as update_time
                                  FROM LIGHTRAG_RELATION_CHUNKS WHERE workspace=$1 AND id = ANY($2)
@@ -5075,6 +5425,30 @@ SQL_TEMPLATES = {
                                       queryparam=EXCLUDED.queryparam,
                                       update_time = CURRENT_TIMESTAMP
                                      """,
+    "touch_llm_response_cache": """UPDATE LIGHTRAG_LLM_CACHE AS c
+                                      SET access_time = CURRENT_TIMESTAMP,
+                                      access_count = c.access_count + a.hits
+                                      FROM unnest($2::varchar[], $3::int[]) AS a(id, hits)
+                                      WHERE c.workspace = $1 AND c.id = a.id
+                                     """,
+    "expire_llm_response_cache": """DELETE FROM LIGHTRAG_LLM_CACHE
+                                       WHERE workspace = $1 AND cache_type = $2
+                                       AND update_time < CURRENT_TIMESTAMP - make_interval(secs => $3)
+                                      """,
+    "evict_llm_response_cache": """DELETE FROM LIGHTRAG_LLM_CACHE AS c
+                                      USING (
+                                        SELECT id,
+                                          ROW_NUMBER() OVER w AS rn,
+                                          SUM(COALESCE(octet_length(return_value), 0)
+                                              + COALESCE(octet_length(original_prompt), 0)) OVER w AS running_bytes
+                                        FROM LIGHTRAG_LLM_CACHE
+                                        WHERE workspace = $1 AND cache_type = $2
+                                        WINDOW w AS (ORDER BY {order_by}
+                                                     ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+                                      ) AS ranked
+                                      WHERE c.workspace = $1 AND c.id = ranked.id
+                                      AND (($3 > 0 AND ranked.rn > $3) OR ($4 > 0 AND ranked.running_bytes > $4))
+                                     """,
     "upsert_text_chunk": """INSERT INTO LIGHTRAG_DOC_CHUNKS (workspace, id, tokens,
                       chunk_order_index, full_doc_id, content, file_path, llm_cache_list,
                       create_time, update_time)
@@ -5088,6 +5462,21 @@ SQL_TEMPLATES = {
                       llm_cache_list=EXCLUDED.llm_cache_list,
                       update_time = EXCLUDED.update_time
                      """,
+    "append_text_chunk_llm_cache_list": """UPDATE LIGHTRAG_DOC_CHUNKS AS t
+                      SET llm_cache_list = (
+                          SELECT COALESCE(jsonb_agg(d.elem ORDER BY d.ord), '[]'::jsonb)
+                          FROM (
+                              SELECT a.elem, MIN(a.ord) AS ord
+                              FROM jsonb_array_elements(
+                                  COALESCE(t.llm_cache_list, '[]'::jsonb) || u.cache_list::jsonb
+                              ) WITH ORDINALITY AS a(elem, ord)
+                              GROUP BY a.elem
+                          ) d
+                      ),
+                      update_time = CURRENT_TIMESTAMP
+                      FROM UNNEST($2::varchar[], $3::text[]) AS u(id, cache_list)
+                      WHERE t.workspace = $1 AND t.id = u.id
+                     """,
     "upsert_full_entities": """INSERT INTO LIGHTRAG_FULL_ENTITIES (workspace, id, entity_names, count,
                       create_time, update_time)
                       VALUES ($1, $2, $3, $4, $5, $6)
@@ -5105,20 +5494,26 @@ SQL_TEMPLATES = {
                       update_time = EXCLUDED.update_time
                      """,
     "upsert_entity_chunks": """INSERT INTO LIGHTRAG_ENTITY_CHUNKS (workspace, id, chunk_ids, count,
-                      create_time, update_time)
-                      VALUES ($1, $2, $3, $4, $5, $6)
+                      create_time, update_time, descriptions, description_count)
+                      VALUES ($1, $2, $3, $4, $5, $6,
+                              COALESCE($7::jsonb, '[]'::jsonb), COALESCE($8::integer, 0))
                       ON CONFLICT (workspace,id) DO UPDATE
                       SET chunk_ids=EXCLUDED.chunk_ids,
                       count=EXCLUDED.count,
-                      update_time = EXCLUDED.update_time
+                      update_time = EXCLUDED.update_time,
+                      descriptions = COALESCE($7::jsonb, LIGHTRAG_ENTITY_CHUNKS.descriptions),
+                      description_count = COALESCE($8::integer, LIGHTRAG_ENTITY_CHUNKS.description_count)
                      """,
     "upsert_relation_chunks": """INSERT INTO LIGHTRAG_RELATION_CHUNKS (workspace, id, chunk_ids, count,
-                      create_time, update_time)
-                      VALUES ($1, $2, $3, $4, $5, $6)
+                      create_time, update_time, descriptions, description_count)
+                      VALUES ($1, $2, $3, $4, $5, $6,
+                              COALESCE($7::jsonb, '[]'::jsonb), COALESCE($8::integer, 0))
                       ON CONFLICT (workspace,id) DO UPDATE
                       SET chunk_ids=EXCLUDED.chunk_ids,
                       count=EXCLUDED.count,
-                      update_time = EXCLUDED.update_time
+                      update_time = EXCLUDED.update_time,
+                      descriptions = COALESCE($7::jsonb, LIGHTRAG_RELATION_CHUNKS.descriptions),
+                      description_count = COALESCE($8::integer, LIGHTRAG_RELATION_CHUNKS.description_count)
                      """,
     # SQL for VectorStorage
     "upsert_chunk": """INSERT INTO LIGHTRAG_VDB_CHUNKS (workspace, id, tokens,
@@ -5176,6 +5571,15 @@ SQL_TEMPLATES = {
                 ORDER BY e.content_vector <=> '[{embedding_string}]'::vector
                 LIMIT $3;
                 """,
+    "vector_query_projected": """
+              SELECT {columns},
+                     1 - (t.content_vector <=> '[{embedding_string}]'::vector) AS distance
+              FROM {table_name} t
+              WHERE t.workspace = $1
+                AND t.content_vector <=> '[{embedding_string}]'::vector < $2
+              ORDER BY t.content_vector <=> '[{embedding_string}]'::vector
+              LIMIT $3;
+              """,
     "chunks": """
               SELECT c.id,
                      c.content,
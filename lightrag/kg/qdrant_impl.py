@@ -5,7 +5,8 @@ from dataclasses import dataclass
 import numpy as np
 import hashlib
 import uuid
-from ..utils import logger
+from ..utils import logger, get_vector_precision
+from ..constants import VECTOR_PRECISION_FLOAT16, VECTOR_PRECISION_INT8
 from ..base import BaseVectorStorage
 from ..kg.shared_storage import get_data_init_lock, get_storage_lock
 import configparser
@@ -16,9 +17,18 @@ if not pm.is_installed("qdrant-client"):
 
 from qdrant_client import QdrantClient, models  # type: ignore
 
+try:
+    from qdrant_client import AsyncQdrantClient  # type: ignore
+except ImportError:  # qdrant-client < 1.6
+    AsyncQdrantClient = None
+
 config = configparser.ConfigParser()
 config.read("config.ini", "utf-8")
 
+# Nil UUID, never produced by compute_mdhash_id_for_qdrant (version 4 UUIDs), used
+# as the target of the wait=True barrier in index_done_callback
+_FLUSH_BARRIER_POINT_ID = uuid.UUID(int=0).hex
+
 
 def compute_mdhash_id_for_qdrant(
     content: str, prefix: str = "", style: str = "simple"
@@ -83,6 +93,62 @@ class QdrantVectorDBStorage(BaseVectorStorage):
         if not exists:
             client.create_collection(collection_name, **kwargs)
 
+    async def _call(self, method: str, **kwargs) -> Any:
+        """Invoke a client method without blocking the event loop
+
+        Uses the native coroutine of AsyncQdrantClient, or runs the method of
+        the synchronous client in the default executor.
+        """
+        if self._is_async_client:
+            return await getattr(self._client, method)(**kwargs)
+        return await asyncio.to_thread(getattr(self._client, method), **kwargs)
+
+    async def _collection_exists(self) -> bool:
+        if hasattr(self._client, "collection_exists"):
+            try:
+                return await self._call(
+                    "collection_exists", collection_name=self.final_namespace
+                )
+            except Exception:
+                return False
+        try:
+            await self._call("get_collection", collection_name=self.final_namespace)
+            return True
+        except Exception:
+            return False
+
+    def _collection_precision_kwargs(self) -> dict[str, Any]:
+        """Vector datatype / quantization settings for the configured precision"""
+        vector_params: dict[str, Any] = {}
+        collection_kwargs: dict[str, Any] = {}
+        if self._vector_precision == VECTOR_PRECISION_FLOAT16:
+            vector_params["datatype"] = models.Datatype.FLOAT16
+        elif self._vector_precision == VECTOR_PRECISION_INT8:
+            # Keep int8 codes in RAM for search, originals on disk for rescoring
+            collection_kwargs["quantization_config"] = models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    always_ram=True,
+                )
+            )
+            vector_params["on_disk"] = True
+        return {
+            "vectors_config": models.VectorParams(
+                size=self.embedding_func.embedding_dim,
+                distance=models.Distance.COSINE,
+                **vector_params,
+            ),
+            **collection_kwargs,
+        }
+
+    async def _ensure_collection(self):
+        if not await self._collection_exists():
+            await self._call(
+                "create_collection",
+                collection_name=self.final_namespace,
+                **self._collection_precision_kwargs(),
+            )
+
     def __post_init__(self):
         # Check for QDRANT_WORKSPACE environment variable first (higher priority)
         # This allows administrators to force a specific workspace for all Qdrant storage instances
@@ -121,11 +187,17 @@ class QdrantVectorDBStorage(BaseVectorStorage):
                 "cosine_better_than_threshold must be specified in vector_db_storage_cls_kwargs"
             )
         self.cosine_better_than_threshold = cosine_threshold
+        # Only applied when the collection is created
+        self._vector_precision = get_vector_precision(kwargs)
 
         # Initialize client as None - will be created in initialize() method
         self._client = None
+        self._is_async_client = False
         self._max_batch_size = self.global_config["embedding_batch_num"]
         self._initialized = False
+        # Point ids upserted with wait=False, awaited in index_done_callback
+        self._pending_point_ids: set[str] = set()
+        self._flush_timeout = float(os.environ.get("QDRANT_FLUSH_TIMEOUT", 60))
 
     async def initialize(self):
         """Initialize Qdrant collection"""
@@ -134,9 +206,10 @@ class QdrantVectorDBStorage(BaseVectorStorage):
                 return
 
             try:
-                # Create QdrantClient if not already created
+                # Create the Qdrant client if not already created, preferring
+                # the async client so vector calls never block the event loop
                 if self._client is None:
-                    self._client = QdrantClient(
+                    client_kwargs = dict(
                         url=os.environ.get(
                             "QDRANT_URL", config.get("qdrant", "uri", fallback=None)
                         ),
@@ -145,19 +218,18 @@ class QdrantVectorDBStorage(BaseVectorStorage):
                             config.get("qdrant", "apikey", fallback=None),
                         ),
                     )
+                    if AsyncQdrantClient is not None:
+                        self._client = AsyncQdrantClient(**client_kwargs)
+                        self._is_async_client = True
+                    else:
+                        self._client = QdrantClient(**client_kwargs)
+                        self._is_async_client = False
                     logger.debug(
-                        f"[{self.workspace}] QdrantClient created successfully"
+                        f"[{self.workspace}] {type(self._client).__name__} created successfully"
                     )
 
                 # Create collection if not exists
-                QdrantVectorDBStorage.create_collection_if_not_exist(
-                    self._client,
-                    self.final_namespace,
-                    vectors_config=models.VectorParams(
-                        size=self.embedding_func.embedding_dim,
-                        distance=models.Distance.COSINE,
-                    ),
-                )
+                await self._ensure_collection()
                 self._initialized = True
                 logger.info(
                     f"[{self.workspace}] Qdrant collection '{self.namespace}' initialized successfully"
@@ -185,16 +257,8 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             }
             for k, v in data.items()
         ]
-        contents = [v["content"] for v in data.values()]
-        batches = [
-            contents[i : i + self._max_batch_size]
-            for i in range(0, len(contents), self._max_batch_size)
-        ]
-
-        embedding_tasks = [self.embedding_func(batch) for batch in batches]
-        embeddings_list = await asyncio.gather(*embedding_tasks)
-
-        embeddings = np.concatenate(embeddings_list)
+        # Records with a precomputed vector are not embedded again
+        embeddings = await self._embed_contents(data, self._max_batch_size)
 
         list_points = []
         for i, d in enumerate(list_data):
@@ -206,13 +270,23 @@ class QdrantVectorDBStorage(BaseVectorStorage):
                 )
             )
 
-        results = self._client.upsert(
-            collection_name=self.final_namespace, points=list_points, wait=True
+        # Don't wait for the update to be applied; index_done_callback waits
+        # for all pending points before the batch is reported as persisted
+        results = await self._call(
+            "upsert",
+            collection_name=self.final_namespace,
+            points=list_points,
+            wait=False,
         )
+        self._pending_point_ids.update(point.id for point in list_points)
         return results
 
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         if query_embedding is not None:
             embedding = query_embedding
@@ -222,28 +296,62 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             )  # higher priority for query
             embedding = embedding_result[0]
 
-        results = self._client.search(
+        results = await self._call(
+            "search",
             collection_name=self.final_namespace,
             query_vector=embedding,
             limit=top_k,
-            with_payload=True,
+            with_payload=True if fields is None else ["id", *fields],
             score_threshold=self.cosine_better_than_threshold,
         )
 
         # logger.debug(f"[{self.workspace}] query result: {results}")
 
         return [
-            {
-                **dp.payload,
-                "distance": dp.score,
-                "created_at": dp.payload.get("created_at"),
-            }
+            self._project_fields(
+                {
+                    **dp.payload,
+                    "distance": dp.score,
+                    "created_at": dp.payload.get("created_at"),
+                },
+                fields,
+            )
             for dp in results
         ]
 
     async def index_done_callback(self) -> None:
-        # Qdrant handles persistence automatically
-        pass
+        """Wait until all points upserted with wait=False are applied
+
+        Qdrant applies the updates of a shard in order, so an operation sent with
+        wait=True returns only once every earlier upsert is applied, including
+        updates of points that already existed. A filter-based delete matching no
+        point reaches every shard and serves as that barrier.
+        """
+        if not self._pending_point_ids:
+            return
+
+        try:
+            await asyncio.wait_for(
+                self._call(
+                    "delete",
+                    collection_name=self.final_namespace,
+                    points_selector=models.FilterSelector(
+                        filter=models.Filter(
+                            must=[
+                                models.HasIdCondition(has_id=[_FLUSH_BARRIER_POINT_ID])
+                            ]
+                        )
+                    ),
+                    wait=True,
+                ),
+                timeout=self._flush_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"[{self.workspace}] {len(self._pending_point_ids)} points of {self.namespace} not confirmed after {self._flush_timeout}s"
+            )
+
+        self._pending_point_ids.clear()
 
     async def delete(self, ids: List[str]) -> None:
         """Delete vectors with specified IDs
@@ -254,8 +362,10 @@ class QdrantVectorDBStorage(BaseVectorStorage):
         try:
             # Convert regular ids to Qdrant compatible ids
             qdrant_ids = [compute_mdhash_id_for_qdrant(id) for id in ids]
+            self._pending_point_ids.difference_update(qdrant_ids)
             # Delete points from the collection
-            self._client.delete(
+            await self._call(
+                "delete",
                 collection_name=self.final_namespace,
                 points_selector=models.PointIdsList(
                     points=qdrant_ids,
@@ -283,8 +393,11 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             #     f"[{self.workspace}] Attempting to delete entity {entity_name} with ID {entity_id}"
             # )
 
+            self._pending_point_ids.discard(entity_id)
+
             # Delete the entity point from the collection
-            self._client.delete(
+            await self._call(
+                "delete",
                 collection_name=self.final_namespace,
                 points_selector=models.PointIdsList(
                     points=[entity_id],
@@ -305,7 +418,8 @@ class QdrantVectorDBStorage(BaseVectorStorage):
         """
         try:
             # Find relations where the entity is either source or target
-            results = self._client.scroll(
+            results = await self._call(
+                "scroll",
                 collection_name=self.final_namespace,
                 scroll_filter=models.Filter(
                     should=[
@@ -326,8 +440,12 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             ids_to_delete = [point.id for point in relation_points]
 
             if ids_to_delete:
+                self._pending_point_ids.difference_update(
+                    str(point_id).replace("-", "") for point_id in ids_to_delete
+                )
                 # Delete the relations
-                self._client.delete(
+                await self._call(
+                    "delete",
                     collection_name=self.final_namespace,
                     points_selector=models.PointIdsList(
                         points=ids_to_delete,
@@ -360,7 +478,8 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             qdrant_id = compute_mdhash_id_for_qdrant(id)
 
             # Retrieve the point by ID
-            result = self._client.retrieve(
+            result = await self._call(
+                "retrieve",
                 collection_name=self.final_namespace,
                 ids=[qdrant_id],
                 with_payload=True,
@@ -398,7 +517,8 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             qdrant_ids = [compute_mdhash_id_for_qdrant(id) for id in ids]
 
             # Retrieve the points by IDs
-            results = self._client.retrieve(
+            results = await self._call(
+                "retrieve",
                 collection_name=self.final_namespace,
                 ids=qdrant_ids,
                 with_payload=True,
@@ -453,7 +573,8 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             qdrant_ids = [compute_mdhash_id_for_qdrant(id) for id in ids]
 
             # Retrieve the points by IDs with vectors
-            results = self._client.retrieve(
+            results = await self._call(
+                "retrieve",
                 collection_name=self.final_namespace,
                 ids=qdrant_ids,
                 with_vectors=True,  # Important: request vectors
@@ -492,31 +613,14 @@ class QdrantVectorDBStorage(BaseVectorStorage):
         async with get_storage_lock():
             try:
                 # Delete the collection and recreate it
-                exists = False
-                if hasattr(self._client, "collection_exists"):
-                    try:
-                        exists = self._client.collection_exists(self.final_namespace)
-                    except Exception:
-                        exists = False
-                else:
-                    try:
-                        self._client.get_collection(self.final_namespace)
-                        exists = True
-                    except Exception:
-                        exists = False
-
-                if exists:
-                    self._client.delete_collection(self.final_namespace)
+                if await self._collection_exists():
+                    await self._call(
+                        "delete_collection", collection_name=self.final_namespace
+                    )
+                self._pending_point_ids.clear()
 
                 # Recreate the collection
-                QdrantVectorDBStorage.create_collection_if_not_exist(
-                    self._client,
-                    self.final_namespace,
-                    vectors_config=models.VectorParams(
-                        size=self.embedding_func.embedding_dim,
-                        distance=models.Distance.COSINE,
-                    ),
-                )
+                await self._ensure_collection()
 
                 logger.info(
                     f"[{self.workspace}] Process {os.getpid()} drop Qdrant collection {self.namespace}"
@@ -1,10 +1,13 @@
+import asyncio
 import os
+import time
 import logging
-from typing import Any, final, Union
+from typing import Any, Callable, Collection, final, Union
 from dataclasses import dataclass
 import pipmaster as pm
 import configparser
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 import threading
 
 if not pm.is_installed("redis"):
@@ -12,8 +15,21 @@ if not pm.is_installed("redis"):
 
 # aioredis is a depricated library, replaced with redis
 from redis.asyncio import Redis, ConnectionPool  # type: ignore
-from redis.exceptions import RedisError, ConnectionError, TimeoutError  # type: ignore
-from lightrag.utils import logger, get_pinyin_sort_key
+from redis.exceptions import (  # type: ignore
+    RedisError,
+    ConnectionError,
+    ResponseError,
+    TimeoutError,
+    WatchError,
+)
+from lightrag.utils import (
+    logger,
+    get_pinyin_sort_key,
+    get_cache_type_from_key,
+    get_llm_cache_policies,
+    LLMCachePolicy,
+)
+from lightrag.constants import LLM_CACHE_EVICTION_LFU
 
 from lightrag.base import (
     BaseKVStorage,
@@ -41,6 +57,140 @@ MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "200"))
 SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "30.0"))
 SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "10.0"))
 RETRY_ATTEMPTS = int(os.getenv("REDIS_RETRY_ATTEMPTS", "3"))
+# COUNT hint for SCAN; large values keep full-keyspace scans to few round-trips
+SCAN_COUNT = int(os.getenv("REDIS_SCAN_COUNT", "1000"))
+
+# Bump to force a rebuild of RedisDocStatusStorage secondary indexes on startup
+REDIS_DOC_STATUS_INDEX_VERSION = "1"
+# Seconds one worker may hold the index rebuild lock before another takes over
+REDIS_DOC_STATUS_INDEX_LOCK_TTL = 600
+# Attempts of an optimistic (WATCH/MULTI) doc status write before giving up
+REDIS_DOC_STATUS_WATCH_RETRIES = 20
+
+# Lua scripts maintaining LLM cache access/size bookkeeping server-side.
+# KEYS: [access sorted set, size hash, total bytes counter, expiry sorted set],
+# hash-tagged into one slot. Data keys are never touched from Lua (they are not
+# declared in KEYS, which Redis Cluster requires); the client deletes them.
+# ARGV: [member, size, access score, "1" for LFU, expire_at (0 = no TTL)]
+_CACHE_TRACK_SCRIPT = """
+local old = redis.call('HGET', KEYS[2], ARGV[1])
+if old then redis.call('DECRBY', KEYS[3], old) end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+redis.call('INCRBY', KEYS[3], ARGV[2])
+if ARGV[4] == '1' then
+  redis.call('ZADD', KEYS[1], 'NX', 1, ARGV[1])
+else
+  redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+end
+if tonumber(ARGV[5]) > 0 then
+  redis.call('ZADD', KEYS[4], ARGV[5], ARGV[1])
+else
+  redis.call('ZREM', KEYS[4], ARGV[1])
+end
+return 1
+"""
+
+# ARGV: [member...]
+_CACHE_FORGET_SCRIPT = """
+for i = 1, #ARGV do
+  local member = ARGV[i]
+  local size = redis.call('HGET', KEYS[2], member)
+  if size then
+    redis.call('HDEL', KEYS[2], member)
+    redis.call('DECRBY', KEYS[3], size)
+  end
+  redis.call('ZREM', KEYS[1], member)
+  redis.call('ZREM', KEYS[4], member)
+end
+return #ARGV
+"""
+
+# ARGV: [max_entries, max_bytes, now] (0 disables a bound)
+# Forgets members whose data key expired natively first, so their bytes don't
+# count against the budget, then evicts by access score.
+# Returns {expired count, evicted member...}; the caller deletes evicted data keys.
+_CACHE_EVICT_SCRIPT = """
+local evicted = {0}
+local function forget(member)
+  local size = redis.call('HGET', KEYS[2], member)
+  if size then
+    redis.call('HDEL', KEYS[2], member)
+    redis.call('DECRBY', KEYS[3], size)
+  end
+  redis.call('ZREM', KEYS[1], member)
+  redis.call('ZREM', KEYS[4], member)
+end
+local function drop(member)
+  forget(member)
+  evicted[#evicted + 1] = member
+end
+local max_entries = tonumber(ARGV[1])
+local max_bytes = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+for _, member in ipairs(redis.call('ZRANGEBYSCORE', KEYS[4], '-inf', now)) do
+  forget(member)
+  evicted[1] = evicted[1] + 1
+end
+if max_entries > 0 then
+  local excess = redis.call('ZCARD', KEYS[1]) - max_entries
+  if excess > 0 then
+    for _, member in ipairs(redis.call('ZRANGE', KEYS[1], 0, excess - 1)) do
+      drop(member)
+    end
+  end
+end
+if max_bytes > 0 then
+  while tonumber(redis.call('GET', KEYS[3]) or '0') > max_bytes do
+    local batch = redis.call('ZRANGE', KEYS[1], 0, 99)
+    if #batch == 0 then break end
+    for _, member in ipairs(batch) do
+      drop(member)
+      if tonumber(redis.call('GET', KEYS[3]) or '0') <= max_bytes then break end
+    end
+  end
+end
+return evicted
+"""
+
+# Partial record update; needs cjson array_mt support (Redis 7+) so that empty
+# JSON arrays survive the decode/encode round trip.
+# KEYS: data keys; ARGV: [update_time, {"set": {...}, "union": {...}}...]
+_UPDATE_FIELDS_SCRIPT = """
+if not cjson.decode_array_with_array_mt then
+  return redis.error_reply('LIGHTRAG_NO_ARRAY_MT')
+end
+cjson.decode_array_with_array_mt(true)
+local updated = 0
+for i, key in ipairs(KEYS) do
+  local raw = redis.call('GET', key)
+  if raw then
+    local record = cjson.decode(raw)
+    local update = cjson.decode(ARGV[i + 1])
+    for field, value in pairs(update['set']) do
+      record[field] = value
+    end
+    for field, values in pairs(update['union']) do
+      local merged = record[field]
+      if type(merged) ~= 'table' then
+        merged = setmetatable({}, cjson.array_mt)
+      end
+      local seen = {}
+      for _, v in ipairs(merged) do seen[v] = true end
+      for _, v in ipairs(values) do
+        if not seen[v] then
+          table.insert(merged, v)
+          seen[v] = true
+        end
+      end
+      record[field] = merged
+    end
+    record['update_time'] = tonumber(ARGV[1])
+    redis.call('SET', key, cjson.encode(record), 'KEEPTTL')
+    updated = updated + 1
+  end
+end
+return updated
+"""
 
 # Tenacity retry decorator for Redis operations
 redis_retry = retry(
@@ -163,10 +313,25 @@ class RedisKVStorage(BaseKVStorage):
         self._redis = None
         self._initialized = False
 
+        # LLM cache retention policies (TTL via EXPIRE, bounds via access sorted sets)
+        self._cache_policies = (
+            get_llm_cache_policies(self.global_config)
+            if self.namespace.endswith("_cache")
+            else {}
+        )
+
         try:
             # Use shared connection pool
             self._pool = RedisConnectionManager.get_pool(self._redis_url)
             self._redis = Redis(connection_pool=self._pool)
+            self._cache_forget_script = self._redis.register_script(
+                _CACHE_FORGET_SCRIPT
+            )
+            self._cache_evict_script = self._redis.register_script(_CACHE_EVICT_SCRIPT)
+            self._update_fields_script = self._redis.register_script(
+                _UPDATE_FIELDS_SCRIPT
+            )
+            self._update_fields_native = True
             logger.info(
                 f"[{self.workspace}] Initialized Redis KV storage for {self.namespace} using shared connection pool"
             )
@@ -263,17 +428,115 @@ class RedisKVStorage(BaseKVStorage):
         """Ensure Redis resources are cleaned up when exiting context."""
         await self.close()
 
+    def _cache_index_keys(self, cache_type: str) -> list[str]:
+        """Keys of the access sorted set, size hash, byte counter and expiry sorted
+        set of a cache_type
+
+        The ``@cache`` suffix keeps them out of the ``{final_namespace}:*`` pattern;
+        the hash tag puts them in one cluster slot so the Lua scripts can use them.
+        """
+        prefix = f"{{{self.final_namespace}@cache:{cache_type}}}"
+        return [
+            f"{prefix}:access",
+            f"{prefix}:size",
+            f"{prefix}:bytes",
+            f"{prefix}:expire",
+        ]
+
+    def _get_bounded_cache_policy(
+        self, id: str
+    ) -> tuple[str, LLMCachePolicy] | tuple[None, None]:
+        if not self._cache_policies:
+            return None, None
+        cache_type = get_cache_type_from_key(id)
+        policy = self._cache_policies.get(cache_type)
+        if policy is None or not policy.bounded:
+            return None, None
+        return cache_type, policy
+
+    def _queue_cache_access(self, pipe, id: str) -> None:
+        """Queue an access-score update for a bounded cache entry (LRU or LFU)"""
+        cache_type, policy = self._get_bounded_cache_policy(id)
+        if policy is None:
+            return
+        access_key = self._cache_index_keys(cache_type)[0]
+        if policy.eviction == LLM_CACHE_EVICTION_LFU:
+            pipe.zadd(access_key, {id: 1}, xx=True, incr=True)
+        else:
+            pipe.zadd(access_key, {id: time.time()}, xx=True)
+
+    async def _forget_cache_entries(self, ids: list[str]) -> None:
+        """Remove bookkeeping of cache entries that were deleted or expired"""
+        by_type: dict[str, list[str]] = {}
+        for id in ids:
+            cache_type, policy = self._get_bounded_cache_policy(id)
+            if policy is not None:
+                by_type.setdefault(cache_type, []).append(id)
+        for cache_type, members in by_type.items():
+            await self._cache_forget_script(
+                keys=self._cache_index_keys(cache_type), args=members
+            )
+
+    async def _enforce_cache_policy(self, cache_type: str) -> None:
+        """Evict entries of a cache_type until it fits its policy bounds"""
+        policy = self._cache_policies[cache_type]
+        result = await self._cache_evict_script(
+            keys=self._cache_index_keys(cache_type),
+            args=[policy.max_entries or 0, policy.max_bytes or 0, time.time()],
+        )
+        expired, evicted = int(result[0]), result[1:]
+        if expired:
+            logger.debug(
+                f"[{self.workspace}] Forgot {expired} expired '{cache_type}' entries in {self.namespace}"
+            )
+        if evicted:
+            async with self._get_redis_connection() as redis:
+                pipe = redis.pipeline()
+                for member in evicted:
+                    if isinstance(member, bytes):
+                        member = member.decode("utf-8")
+                    pipe.delete(f"{self.final_namespace}:{member}")
+                await pipe.execute()
+            logger.info(
+                f"[{self.workspace}] Evicted {len(evicted)} '{cache_type}' entries from {self.namespace}"
+            )
+
+    @redis_retry
+    async def record_cache_access(self, ids: list[str]) -> None:
+        if not self._cache_policies:
+            return
+        async with self._get_redis_connection() as redis:
+            pipe = redis.pipeline()
+            for id in ids:
+                self._queue_cache_access(pipe, id)
+            await pipe.execute()
+
     @redis_retry
     async def get_by_id(self, id: str) -> dict[str, Any] | None:
         async with self._get_redis_connection() as redis:
             try:
-                data = await redis.get(f"{self.final_namespace}:{id}")
+                cache_type, policy = self._get_bounded_cache_policy(id)
+                tracked = False
+                if policy is None:
+                    data = await redis.get(f"{self.final_namespace}:{id}")
+                else:
+                    # Fetch, check the bookkeeping and bump the LRU/LFU score
+                    # in one round-trip
+                    pipe = redis.pipeline()
+                    pipe.get(f"{self.final_namespace}:{id}")
+                    pipe.zscore(self._cache_index_keys(cache_type)[0], id)
+                    self._queue_cache_access(pipe, id)
+                    data, score = (await pipe.execute())[:2]
+                    tracked = score is not None
                 if data:
                     result = json.loads(data)
                     # Ensure time fields are present, provide default values for old data
                     result.setdefault("create_time", 0)
                     result.setdefault("update_time", 0)
                     return result
+                if tracked:
+                    # Expired natively, drop its leftover bookkeeping
+                    await self._forget_cache_entries([id])
                 return None
             except json.JSONDecodeError as e:
                 logger.error(f"[{self.workspace}] JSON decode error for id {id}: {e}")
@@ -288,6 +551,13 @@ class RedisKVStorage(BaseKVStorage):
                     pipe.get(f"{self.final_namespace}:{id}")
                 results = await pipe.execute()
 
+                if self._cache_policies:
+                    pipe = redis.pipeline()
+                    for id, result in zip(ids, results):
+                        if result:
+                            self._queue_cache_access(pipe, id)
+                    await pipe.execute()
+
                 processed_results = []
                 for result in results:
                     if result:
@@ -315,13 +585,58 @@ class RedisKVStorage(BaseKVStorage):
             existing_ids = {keys_list[i] for i, exists in enumerate(results) if exists}
             return set(keys) - existing_ids
 
+    @redis_retry
+    async def update_fields(
+        self,
+        updates: dict[str, dict[str, Any]],
+        union_fields: Collection[str] = (),
+    ) -> None:
+        """Partially update existing records server side with a Lua script
+
+        Falls back to the read-modify-write default when the server's cjson
+        cannot preserve empty arrays (Redis < 7).
+        """
+        if not updates:
+            return
+        if not self._update_fields_native:
+            await super().update_fields(updates, union_fields)
+            return
+
+        keys = [f"{self.final_namespace}:{k}" for k in updates]
+        args: list[Any] = [int(time.time())]
+        for fields in updates.values():
+            args.append(
+                json.dumps(
+                    {
+                        "set": {
+                            f: v for f, v in fields.items() if f not in union_fields
+                        },
+                        "union": {
+                            f: list(v) for f, v in fields.items() if f in union_fields
+                        },
+                    }
+                )
+            )
+
+        async with self._get_redis_connection() as redis:
+            try:
+                await self._update_fields_script(keys=keys, args=args, client=redis)
+            except ResponseError as e:
+                if "LIGHTRAG_NO_ARRAY_MT" not in str(e):
+                    raise
+                logger.warning(
+                    f"[{self.workspace}] Redis cjson lacks array_mt support, "
+                    "using read-modify-write for partial updates"
+                )
+                self._update_fields_native = False
+        if not self._update_fields_native:
+            await super().update_fields(updates, union_fields)
+
     @redis_retry
     async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
         if not data:
             return
 
-        import time
-
         current_time = int(time.time())  # Get current Unix timestamp
 
         async with self._get_redis_connection() as redis:
@@ -350,10 +665,38 @@ class RedisKVStorage(BaseKVStorage):
 
                 # Store the data
                 pipe = redis.pipeline()
+                touched_cache_types = set()
+                now = time.time()
                 for k, v in data.items():
-                    pipe.set(f"{self.final_namespace}:{k}", json.dumps(v))
+                    value = json.dumps(v)
+                    policy = None
+                    if self._cache_policies:
+                        cache_type = get_cache_type_from_key(k)
+                        policy = self._cache_policies.get(cache_type)
+                    # Expire cache entries natively when the policy has a TTL
+                    pipe.set(
+                        f"{self.final_namespace}:{k}",
+                        value,
+                        ex=policy.ttl if policy and policy.ttl else None,
+                    )
+                    if policy and policy.bounded:
+                        # Plain EVAL so the call is queued on the pipeline itself
+                        pipe.eval(
+                            _CACHE_TRACK_SCRIPT,
+                            4,
+                            *self._cache_index_keys(cache_type),
+                            k,
+                            len(value.encode("utf-8")),
+                            now,
+                            "1" if policy.eviction == LLM_CACHE_EVICTION_LFU else "0",
+                            now + policy.ttl if policy.ttl else 0,
+                        )
+                        touched_cache_types.add(cache_type)
                 await pipe.execute()
 
+                for cache_type in touched_cache_types:
+                    await self._enforce_cache_policy(cache_type)
+
             except json.JSONDecodeError as e:
                 logger.error(f"[{self.workspace}] JSON decode error during upsert: {e}")
                 raise
@@ -371,10 +714,16 @@ class RedisKVStorage(BaseKVStorage):
         pattern = f"{self.final_namespace}:*"
         try:
             async with self._get_redis_connection() as redis:
-                # Use scan to check if any keys exist
-                async for key in redis.scan_iter(match=pattern, count=1):
-                    return False  # Found at least one key
-                return True  # No keys found
+                # Scan with a large COUNT so sparse namespaces need few round-trips
+                cursor = 0
+                while True:
+                    cursor, keys = await redis.scan(
+                        cursor, match=pattern, count=SCAN_COUNT
+                    )
+                    if keys:
+                        return False  # Found at least one key
+                    if cursor == 0:
+                        return True  # No keys found
         except Exception as e:
             logger.error(f"[{self.workspace}] Error checking if storage is empty: {e}")
             return True
@@ -390,6 +739,7 @@ class RedisKVStorage(BaseKVStorage):
                 pipe.delete(f"{self.final_namespace}:{id}")
 
             results = await pipe.execute()
+            await self._forget_cache_entries(ids)
             deleted_count = sum(results)
             logger.info(
                 f"[{self.workspace}] Deleted {deleted_count} of {len(ids)} entries from {self.namespace}"
@@ -411,7 +761,7 @@ class RedisKVStorage(BaseKVStorage):
 
                     while True:
                         cursor, keys = await redis.scan(
-                            cursor, match=pattern, count=1000
+                            cursor, match=pattern, count=SCAN_COUNT
                         )
                         if keys:
                             # Delete keys in batches
@@ -424,6 +774,17 @@ class RedisKVStorage(BaseKVStorage):
                         if cursor == 0:
                             break
 
+                    # Remove LLM cache bookkeeping keys as well: the hash-tagged
+                    # keys of _cache_index_keys and untagged ones written before
+                    for bookkeeping_pattern in (
+                        f"{{{self.final_namespace}@cache:*",
+                        f"{self.final_namespace}@cache:*",
+                    ):
+                        async for key in redis.scan_iter(
+                            match=bookkeeping_pattern, count=SCAN_COUNT
+                        ):
+                            await redis.delete(key)
+
                     logger.info(
                         f"[{self.workspace}] Dropped {deleted_count} keys from {self.namespace}"
                     )
@@ -449,17 +810,14 @@ class RedisKVStorage(BaseKVStorage):
         from lightrag.utils import generate_cache_key
 
         async with self._get_redis_connection() as redis:
-            # Get all keys for this namespace
-            keys = await redis.keys(f"{self.final_namespace}:*")
-
-            if not keys:
-                return
-
             # Check if we have any flattened keys already - if so, skip migration
             has_flattened_keys = False
             keys_to_migrate = []
 
-            for key in keys:
+            # Iterate keys incrementally with SCAN instead of a blocking KEYS call
+            async for key in redis.scan_iter(
+                match=f"{self.final_namespace}:*", count=SCAN_COUNT
+            ):
                 # Extract the ID part (after namespace:)
                 key_id = key.split(":", 1)[1]
 
@@ -598,6 +956,9 @@ class RedisDocStatusStorage(DocStatusStorage):
                 await self.close()
                 raise
 
+            # Build secondary indexes for data written before they existed
+            await self._ensure_indexes()
+
     @asynccontextmanager
     async def _get_redis_connection(self):
         """Safe context manager for Redis operations."""
@@ -688,37 +1049,229 @@ class RedisDocStatusStorage(DocStatusStorage):
                 logger.error(f"[{self.workspace}] Error in get_by_ids: {e}")
         return ordered_results
 
+    def _index_key(self, *parts: str) -> str:
+        """Build the key of a secondary index for this namespace.
+
+        Index keys use an ``@idx`` suffix instead of ``:`` so that they never
+        match the ``{final_namespace}:*`` pattern used for document keys.
+        """
+        return ":".join((f"{self.final_namespace}@idx",) + parts)
+
+    @staticmethod
+    def _timestamp_score(value: Any) -> float:
+        """Convert an ISO timestamp into a sorted set score"""
+        if not value:
+            return 0.0
+        try:
+            dt = datetime.fromisoformat(str(value))
+        except ValueError:
+            return 0.0
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+
+    def _queue_index_add(self, pipe, doc_id: str, doc_data: dict[str, Any]) -> None:
+        """Queue commands adding a document to the secondary indexes.
+
+        Indexes maintained per namespace:
+        - status:<status>: sorted set of doc ids in that status, scored by updated_at
+        - track:<track_id>: set of doc ids sharing a track_id
+        - updated_at / created_at: sorted sets of all doc ids scored by timestamp
+        """
+        updated_score = self._timestamp_score(doc_data.get("updated_at"))
+        created_score = self._timestamp_score(doc_data.get("created_at"))
+        status = doc_data.get("status")
+        if status:
+            pipe.zadd(self._index_key("status", status), {doc_id: updated_score})
+        track_id = doc_data.get("track_id")
+        if track_id:
+            pipe.sadd(self._index_key("track", track_id), doc_id)
+        pipe.zadd(self._index_key("updated_at"), {doc_id: updated_score})
+        pipe.zadd(self._index_key("created_at"), {doc_id: created_score})
+
+    def _queue_index_remove(
+        self, pipe, doc_id: str, doc_data: dict[str, Any] | None
+    ) -> None:
+        """Queue commands removing a document from the secondary indexes"""
+        if doc_data:
+            status = doc_data.get("status")
+            if status:
+                pipe.zrem(self._index_key("status", status), doc_id)
+            track_id = doc_data.get("track_id")
+            if track_id:
+                pipe.srem(self._index_key("track", track_id), doc_id)
+        pipe.zrem(self._index_key("updated_at"), doc_id)
+        pipe.zrem(self._index_key("created_at"), doc_id)
+
+    @staticmethod
+    def _load_doc(value: str | None) -> dict[str, Any] | None:
+        if not value:
+            return None
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return None
+
+    @staticmethod
+    def _to_doc_status(doc_data: dict[str, Any]) -> DocProcessingStatus:
+        """Build a DocProcessingStatus from a stored document"""
+        # Make a copy of the data to avoid modifying the original
+        data = doc_data.copy()
+        # Remove deprecated content field if it exists
+        data.pop("content", None)
+        # If file_path is not in data, use document id as file path
+        if "file_path" not in data:
+            data["file_path"] = "no-file-path"
+        # Ensure new fields exist with default values
+        if "metadata" not in data:
+            data["metadata"] = {}
+        if "error_msg" not in data:
+            data["error_msg"] = None
+        return DocProcessingStatus(**data)
+
+    async def _update_docs(
+        self,
+        redis,
+        doc_ids: list[str],
+        queue_writes: Callable[[Any, str, dict[str, Any] | None], None],
+    ) -> list[dict[str, Any] | None]:
+        """Read documents and apply the writes derived from them atomically.
+
+        The document keys are WATCHed while read, so EXEC fails and the update is
+        retried if another writer changed one of them in between. Index entries
+        are therefore always removed for the value actually being replaced.
+
+        Returns:
+            The documents as they were before the writes (None if missing)
+        """
+        doc_keys = [f"{self.final_namespace}:{doc_id}" for doc_id in doc_ids]
+        for _ in range(REDIS_DOC_STATUS_WATCH_RETRIES):
+            async with redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(*doc_keys)
+                    old_docs = [
+                        self._load_doc(value) for value in await pipe.mget(doc_keys)
+                    ]
+                    pipe.multi()
+                    for doc_id, old_doc in zip(doc_ids, old_docs):
+                        queue_writes(pipe, doc_id, old_doc)
+                    await pipe.execute()
+                    return old_docs
+                except WatchError:
+                    continue
+        raise WatchError(
+            f"[{self.workspace}] Doc status update kept conflicting with concurrent writers"
+        )
+
+    async def _ensure_indexes(self) -> None:
+        """Rebuild the secondary indexes if they predate the current version.
+
+        A SET NX lock lets a single worker rebuild; the others wait for the
+        version marker instead of clearing the indexes while it is rebuilding.
+        """
+        version_key = self._index_key("version")
+        # Outside the @idx: key space, which the rebuild clears
+        lock_key = f"{self.final_namespace}@idx_rebuild_lock"
+        deadline = time.monotonic() + REDIS_DOC_STATUS_INDEX_LOCK_TTL
+        async with self._get_redis_connection() as redis:
+            while await redis.get(version_key) != REDIS_DOC_STATUS_INDEX_VERSION:
+                if await redis.set(
+                    lock_key, os.getpid(), nx=True, ex=REDIS_DOC_STATUS_INDEX_LOCK_TTL
+                ):
+                    try:
+                        await self._rebuild_indexes()
+                    finally:
+                        await redis.delete(lock_key)
+                    return
+                if time.monotonic() > deadline:
+                    logger.warning(
+                        f"[{self.workspace}] Timed out waiting for the doc status index rebuild of {self.namespace}"
+                    )
+                    return
+                await asyncio.sleep(1)
+
+    async def _rebuild_indexes(self) -> None:
+        """Build secondary indexes from the stored documents.
+
+        Runs once per namespace (guarded by a version marker and a rebuild lock)
+        so data written before the indexes existed becomes visible to index-based
+        queries. Each batch is indexed from the value it reads atomically, so
+        documents updated concurrently are not indexed with a stale status.
+        """
+        indexed = 0
+
+        def queue_index(pipe, doc_id: str, doc_data: dict[str, Any] | None) -> None:
+            if doc_data is not None:
+                self._queue_index_add(pipe, doc_id, doc_data)
+
+        async with self._get_redis_connection() as redis:
+            # Clear stale index keys before rebuilding
+            async for key in redis.scan_iter(
+                match=f"{self.final_namespace}@idx:*", count=SCAN_COUNT
+            ):
+                await redis.delete(key)
+
+            cursor = 0
+            while True:
+                cursor, keys = await redis.scan(
+                    cursor, match=f"{self.final_namespace}:*", count=SCAN_COUNT
+                )
+                if keys:
+                    docs = await self._update_docs(
+                        redis, [key.split(":", 1)[1] for key in keys], queue_index
+                    )
+                    indexed += sum(1 for doc in docs if doc is not None)
+
+                if cursor == 0:
+                    break
+
+            await redis.set(self._index_key("version"), REDIS_DOC_STATUS_INDEX_VERSION)
+
+        logger.info(
+            f"[{self.workspace}] Built doc status indexes for {indexed} documents in {self.namespace}"
+        )
+
+    async def _fetch_docs(self, doc_ids: list[str]) -> list[tuple[str, dict[str, Any]]]:
+        """Fetch documents by id, preserving order and skipping missing ones"""
+        if not doc_ids:
+            return []
+        async with self._get_redis_connection() as redis:
+            pipe = redis.pipeline()
+            for doc_id in doc_ids:
+                pipe.get(f"{self.final_namespace}:{doc_id}")
+            values = await pipe.execute()
+
+        docs = []
+        for doc_id, value in zip(doc_ids, values):
+            doc_data = self._load_doc(value)
+            if doc_data is not None:
+                docs.append((doc_id, doc_data))
+        return docs
+
+    async def _fetch_doc_statuses(
+        self, doc_ids: list[str]
+    ) -> list[tuple[str, DocProcessingStatus]]:
+        result = []
+        for doc_id, doc_data in await self._fetch_docs(doc_ids):
+            try:
+                result.append((doc_id, self._to_doc_status(doc_data)))
+            except (TypeError, KeyError) as e:
+                logger.error(
+                    f"[{self.workspace}] Error processing document {doc_id}: {e}"
+                )
+        return result
+
     async def get_status_counts(self) -> dict[str, int]:
         """Get counts of documents in each status"""
         counts = {status.value: 0 for status in DocStatus}
         async with self._get_redis_connection() as redis:
             try:
-                # Use SCAN to iterate through all keys in the namespace
-                cursor = 0
-                while True:
-                    cursor, keys = await redis.scan(
-                        cursor, match=f"{self.final_namespace}:*", count=1000
-                    )
-                    if keys:
-                        # Get all values in batch
-                        pipe = redis.pipeline()
-                        for key in keys:
-                            pipe.get(key)
-                        values = await pipe.execute()
-
-                        # Count statuses
-                        for value in values:
-                            if value:
-                                try:
-                                    doc_data = json.loads(value)
-                                    status = doc_data.get("status")
-                                    if status in counts:
-                                        counts[status] += 1
-                                except json.JSONDecodeError:
-                                    continue
-
-                    if cursor == 0:
-                        break
+                # Status indexes make this O(number of statuses)
+                pipe = redis.pipeline()
+                for status in counts:
+                    pipe.zcard(self._index_key("status", status))
+                results = await pipe.execute()
+                counts = dict(zip(counts, results))
             except Exception as e:
                 logger.error(f"[{self.workspace}] Error getting status counts: {e}")
 
@@ -728,113 +1281,38 @@ class RedisDocStatusStorage(DocStatusStorage):
         self, status: DocStatus
     ) -> dict[str, DocProcessingStatus]:
         """Get all documents with a specific status"""
-        result = {}
-        async with self._get_redis_connection() as redis:
-            try:
-                # Use SCAN to iterate through all keys in the namespace
-                cursor = 0
-                while True:
-                    cursor, keys = await redis.scan(
-                        cursor, match=f"{self.final_namespace}:*", count=1000
-                    )
-                    if keys:
-                        # Get all values in batch
-                        pipe = redis.pipeline()
-                        for key in keys:
-                            pipe.get(key)
-                        values = await pipe.execute()
-
-                        # Filter by status and create DocProcessingStatus objects
-                        for key, value in zip(keys, values):
-                            if value:
-                                try:
-                                    doc_data = json.loads(value)
-                                    if doc_data.get("status") == status.value:
-                                        # Extract document ID from key
-                                        doc_id = key.split(":", 1)[1]
-
-                                        # Make a copy of the data to avoid modifying the original
-                                        data = doc_data.copy()
-                                        # Remove deprecated content field if it exists
-                                        data.pop("content", None)
-                                        # If file_path is not in data, use document id as file path
-                                        if "file_path" not in data:
-                                            data["file_path"] = "no-file-path"
-                                        # Ensure new fields exist with default values
-                                        if "metadata" not in data:
-                                            data["metadata"] = {}
-                                        if "error_msg" not in data:
-                                            data["error_msg"] = None
-
-                                        result[doc_id] = DocProcessingStatus(**data)
-                                except (json.JSONDecodeError, KeyError) as e:
-                                    logger.error(
-                                        f"[{self.workspace}] Error processing document {key}: {e}"
-                                    )
-                                    continue
-
-                    if cursor == 0:
-                        break
-            except Exception as e:
-                logger.error(f"[{self.workspace}] Error getting docs by status: {e}")
-
-        return result
+        try:
+            async with self._get_redis_connection() as redis:
+                doc_ids = await redis.zrange(
+                    self._index_key("status", status.value), 0, -1
+                )
+            docs = await self._fetch_doc_statuses(doc_ids)
+            # Guard against index entries that lag behind the stored status
+            return {
+                doc_id: doc_status
+                for doc_id, doc_status in docs
+                if doc_status.status == status.value
+            }
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error getting docs by status: {e}")
+            return {}
 
     async def get_docs_by_track_id(
         self, track_id: str
     ) -> dict[str, DocProcessingStatus]:
         """Get all documents with a specific track_id"""
-        result = {}
-        async with self._get_redis_connection() as redis:
-            try:
-                # Use SCAN to iterate through all keys in the namespace
-                cursor = 0
-                while True:
-                    cursor, keys = await redis.scan(
-                        cursor, match=f"{self.final_namespace}:*", count=1000
-                    )
-                    if keys:
-                        # Get all values in batch
-                        pipe = redis.pipeline()
-                        for key in keys:
-                            pipe.get(key)
-                        values = await pipe.execute()
-
-                        # Filter by track_id and create DocProcessingStatus objects
-                        for key, value in zip(keys, values):
-                            if value:
-                                try:
-                                    doc_data = json.loads(value)
-                                    if doc_data.get("track_id") == track_id:
-                                        # Extract document ID from key
-                                        doc_id = key.split(":", 1)[1]
-
-                                        # Make a copy of the data to avoid modifying the original
-                                        data = doc_data.copy()
-                                        # Remove deprecated content field if it exists
-                                        data.pop("content", None)
-                                        # If file_path is not in data, use document id as file path
-                                        if "file_path" not in data:
-                                            data["file_path"] = "no-file-path"
-                                        # Ensure new fields exist with default values
-                                        if "metadata" not in data:
-                                            data["metadata"] = {}
-                                        if "error_msg" not in data:
-                                            data["error_msg"] = None
-
-                                        result[doc_id] = DocProcessingStatus(**data)
-                                except (json.JSONDecodeError, KeyError) as e:
-                                    logger.error(
-                                        f"[{self.workspace}] Error processing document {key}: {e}"
-                                    )
-                                    continue
-
-                    if cursor == 0:
-                        break
-            except Exception as e:
-                logger.error(f"[{self.workspace}] Error getting docs by track_id: {e}")
-
-        return result
+        try:
+            async with self._get_redis_connection() as redis:
+                doc_ids = await redis.smembers(self._index_key("track", track_id))
+            docs = await self._fetch_doc_statuses(sorted(doc_ids))
+            return {
+                doc_id: doc_status
+                for doc_id, doc_status in docs
+                if doc_status.track_id == track_id
+            }
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error getting docs by track_id: {e}")
+            return {}
 
     async def index_done_callback(self) -> None:
         """Redis handles persistence automatically"""
@@ -846,13 +1324,10 @@ class RedisDocStatusStorage(DocStatusStorage):
         Returns:
             bool: True if storage is empty, False otherwise
         """
-        pattern = f"{self.final_namespace}:*"
         try:
             async with self._get_redis_connection() as redis:
-                # Use scan to check if any keys exist
-                async for key in redis.scan_iter(match=pattern, count=1):
-                    return False  # Found at least one key
-                return True  # No keys found
+                # Every stored document is a member of the updated_at index
+                return await redis.zcard(self._index_key("updated_at")) == 0
         except Exception as e:
             logger.error(f"[{self.workspace}] Error checking if storage is empty: {e}")
             return True
@@ -873,10 +1348,15 @@ class RedisDocStatusStorage(DocStatusStorage):
                     if "chunks_list" not in doc_data:
                         doc_data["chunks_list"] = []
 
-                pipe = redis.pipeline()
-                for k, v in data.items():
-                    pipe.set(f"{self.final_namespace}:{k}", json.dumps(v))
-                await pipe.execute()
+                # Replace documents and move their index entries from the previous
+                # version in one transaction
+                def queue_upsert(pipe, doc_id: str, old_doc: dict | None) -> None:
+                    doc_data = data[doc_id]
+                    pipe.set(f"{self.final_namespace}:{doc_id}", json.dumps(doc_data))
+                    self._queue_index_remove(pipe, doc_id, old_doc)
+                    self._queue_index_add(pipe, doc_id, doc_data)
+
+                await self._update_docs(redis, list(data.keys()), queue_upsert)
             except json.JSONDecodeError as e:
                 logger.error(f"[{self.workspace}] JSON decode error during upsert: {e}")
                 raise
@@ -896,13 +1376,13 @@ class RedisDocStatusStorage(DocStatusStorage):
         if not doc_ids:
             return
 
-        async with self._get_redis_connection() as redis:
-            pipe = redis.pipeline()
-            for doc_id in doc_ids:
-                pipe.delete(f"{self.final_namespace}:{doc_id}")
+        def queue_delete(pipe, doc_id: str, old_doc: dict | None) -> None:
+            pipe.delete(f"{self.final_namespace}:{doc_id}")
+            self._queue_index_remove(pipe, doc_id, old_doc)
 
-            results = await pipe.execute()
-            deleted_count = sum(results)
+        async with self._get_redis_connection() as redis:
+            old_docs = await self._update_docs(redis, doc_ids, queue_delete)
+            deleted_count = sum(1 for doc in old_docs if doc)
             logger.info(
                 f"[{self.workspace}] Deleted {deleted_count} of {len(doc_ids)} doc status entries from {self.namespace}"
             )
@@ -941,77 +1421,108 @@ class RedisDocStatusStorage(DocStatusStorage):
         if sort_direction.lower() not in ["asc", "desc"]:
             sort_direction = "desc"
 
-        # For Redis, we need to load all data and sort/filter in memory
-        all_docs = []
-        total_count = 0
+        # file_path uses pinyin ordering, which cannot be expressed as an index
+        if sort_field == "file_path":
+            return await self._get_docs_paginated_by_scan(
+                status_filter, page, page_size, sort_field, sort_direction
+            )
 
-        async with self._get_redis_connection() as redis:
-            try:
-                # Use SCAN to iterate through all keys in the namespace
+        reverse_sort = sort_direction.lower() == "desc"
+        start_idx = (page - 1) * page_size
+        end_idx = start_idx + page_size
+
+        if status_filter is not None:
+            index_key = self._index_key("status", status_filter.value)
+        elif sort_field == "created_at":
+            index_key = self._index_key("created_at")
+        else:
+            index_key = self._index_key("updated_at")
+
+        try:
+            async with self._get_redis_connection() as redis:
+                total_count = await redis.zcard(index_key)
+
+                if sort_field == "updated_at" or (
+                    sort_field == "created_at" and status_filter is None
+                ):
+                    # The index is already ordered by the sort field: O(log N + page)
+                    page_ids = await redis.zrange(
+                        index_key, start_idx, end_idx - 1, desc=reverse_sort
+                    )
+                else:
+                    # Order the (id-only) members of the status index in memory
+                    doc_ids = await redis.zrange(index_key, 0, -1)
+                    if sort_field == "id":
+                        doc_ids.sort(reverse=reverse_sort)
+                    else:
+                        pipe = redis.pipeline()
+                        for doc_id in doc_ids:
+                            pipe.zscore(self._index_key(sort_field), doc_id)
+                        scores = await pipe.execute()
+                        doc_ids = [
+                            doc_id
+                            for doc_id, _ in sorted(
+                                zip(doc_ids, scores),
+                                key=lambda x: x[1] or 0.0,
+                                reverse=reverse_sort,
+                            )
+                        ]
+                    page_ids = doc_ids[start_idx:end_idx]
+
+            paginated_docs = await self._fetch_doc_statuses(page_ids)
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error getting paginated docs: {e}")
+            return [], 0
+
+        return paginated_docs, total_count
+
+    async def _get_docs_paginated_by_scan(
+        self,
+        status_filter: DocStatus | None,
+        page: int,
+        page_size: int,
+        sort_field: str,
+        sort_direction: str,
+    ) -> tuple[list[tuple[str, DocProcessingStatus]], int]:
+        """Paginate by loading documents in memory, for sort orders without an index"""
+        if status_filter is not None:
+            async with self._get_redis_connection() as redis:
+                doc_ids = await redis.zrange(
+                    self._index_key("status", status_filter.value), 0, -1
+                )
+            docs = await self._fetch_docs(doc_ids)
+        else:
+            docs = []
+            async with self._get_redis_connection() as redis:
                 cursor = 0
                 while True:
                     cursor, keys = await redis.scan(
-                        cursor, match=f"{self.final_namespace}:*", count=1000
+                        cursor, match=f"{self.final_namespace}:*", count=SCAN_COUNT
                     )
                     if keys:
-                        # Get all values in batch
                         pipe = redis.pipeline()
                         for key in keys:
                             pipe.get(key)
                         values = await pipe.execute()
-
-                        # Process documents
                         for key, value in zip(keys, values):
-                            if value:
-                                try:
-                                    doc_data = json.loads(value)
-
-                                    # Apply status filter
-                                    if (
-                                        status_filter is not None
-                                        and doc_data.get("status")
-                                        != status_filter.value
-                                    ):
-                                        continue
-
-                                    # Extract document ID from key
-                                    doc_id = key.split(":", 1)[1]
-
-                                    # Prepare document data
-                                    data = doc_data.copy()
-                                    data.pop("content", None)
-                                    if "file_path" not in data:
-                                        data["file_path"] = "no-file-path"
-                                    if "metadata" not in data:
-                                        data["metadata"] = {}
-                                    if "error_msg" not in data:
-                                        data["error_msg"] = None
-
-                                    # Calculate sort key for sorting (but don't add to data)
-                                    if sort_field == "id":
-                                        sort_key = doc_id
-                                    elif sort_field == "file_path":
-                                        # Use pinyin sorting for file_path field to support Chinese characters
-                                        file_path_value = data.get(sort_field, "")
-                                        sort_key = get_pinyin_sort_key(file_path_value)
-                                    else:
-                                        sort_key = data.get(sort_field, "")
-
-                                    doc_status = DocProcessingStatus(**data)
-                                    all_docs.append((doc_id, doc_status, sort_key))
-
-                                except (json.JSONDecodeError, KeyError) as e:
-                                    logger.error(
-                                        f"[{self.workspace}] Error processing document {key}: {e}"
-                                    )
-                                    continue
-
+                            doc_data = self._load_doc(value)
+                            if doc_data is not None:
+                                docs.append((key.split(":", 1)[1], doc_data))
                     if cursor == 0:
                         break
 
-            except Exception as e:
-                logger.error(f"[{self.workspace}] Error getting paginated docs: {e}")
-                return [], 0
+        all_docs = []
+        for doc_id, doc_data in docs:
+            try:
+                doc_status = self._to_doc_status(doc_data)
+            except (TypeError, KeyError) as e:
+                logger.error(
+                    f"[{self.workspace}] Error processing document {doc_id}: {e}"
+                )
+                continue
+            # Use pinyin sorting for file_path field to support Chinese characters
+            sort_key = get_pinyin_sort_key(doc_status.file_path or "")
+            all_docs.append((doc_id, doc_status, sort_key))
 
         # Sort documents using the separate sort key
         reverse_sort = sort_direction.lower() == "desc"
@@ -1059,7 +1570,7 @@ class RedisDocStatusStorage(DocStatusStorage):
                 cursor = 0
                 while True:
                     cursor, keys = await redis.scan(
-                        cursor, match=f"{self.final_namespace}:*", count=1000
+                        cursor, match=f"{self.final_namespace}:*", count=SCAN_COUNT
                     )
                     if keys:
                         # Get all values in batch
@@ -1101,7 +1612,7 @@ class RedisDocStatusStorage(DocStatusStorage):
 
                     while True:
                         cursor, keys = await redis.scan(
-                            cursor, match=pattern, count=1000
+                            cursor, match=pattern, count=SCAN_COUNT
                         )
                         if keys:
                             # Delete keys in batches
@@ -1114,6 +1625,12 @@ class RedisDocStatusStorage(DocStatusStorage):
                         if cursor == 0:
                             break
 
+                    # Remove secondary index keys as well
+                    async for key in redis.scan_iter(
+                        match=f"{self.final_namespace}@idx:*", count=SCAN_COUNT
+                    ):
+                        await redis.delete(key)
+
                     logger.info(
                         f"[{self.workspace}] Dropped {deleted_count} doc status keys from {self.namespace}"
                     )
@@ -1295,12 +1295,18 @@ async def initialize_pipeline_status():
                 "cur_batch": 0,  # Current processing batch
                 "request_pending": False,  # Flag for pending request for processing
                 "latest_message": "",  # Latest message from pipeline processing
+                "stage_queue_depths": {},  # Documents waiting per pipeline stage
                 "history_messages": history_messages,  # 使用共享列表对象
             }
         )
         direct_log(f"Process {os.getpid()} Pipeline namespace initialized")
 
 
+def is_multiprocess() -> bool:
+    """Whether shared data is kept in a Manager for several worker processes"""
+    return bool(_is_multiprocess)
+
+
 async def get_update_flag(namespace: str):
     """
     Create a namespace's update flag for a workers.
@@ -1444,6 +1450,25 @@ async def get_namespace_data(
     return _shared_dicts[namespace]
 
 
+async def get_data_version(workspace: str = "") -> int:
+    """Get the data version of a workspace, bumped whenever its indexed data changes"""
+    versions = await get_namespace_data("data_version")
+    return versions.get(workspace, 0)
+
+
+async def bump_data_version(workspace: str = "") -> int:
+    """Increase the data version of a workspace so derived caches become stale
+
+    Called after documents are inserted or deleted and after graph edits.
+    Returns the new version.
+    """
+    versions = await get_namespace_data("data_version")
+    async with get_internal_lock():
+        new_version = versions.get(workspace, 0) + 1
+        versions[workspace] = new_version
+    return new_version
+
+
 def finalize_share_data():
     """
     Release shared resources and clean up.
@@ -3,11 +3,16 @@ from __future__ import annotations
 import traceback
 import asyncio
 import configparser
+import multiprocessing
 import os
 import time
+import pickle
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
+from contextlib import aclosing
 from functools import partial
 from typing import (
     Any,
@@ -26,6 +31,10 @@ from lightrag.exceptions import PipelineCancelledException
 from lightrag.constants import (
     DEFAULT_MAX_GLEANING,
     DEFAULT_FORCE_LLM_SUMMARY_ON_MERGE,
+    DEFAULT_SUMMARY_MODE,
+    DEFAULT_DEFERRED_SUMMARY_INTERVAL,
+    DEFAULT_DESCRIPTION_RESERVOIR_SIZE,
+    SUMMARY_MODE_DEFERRED,
     DEFAULT_TOP_K,
     DEFAULT_CHUNK_TOP_K,
     DEFAULT_MAX_ENTITY_TOKENS,
@@ -40,6 +49,14 @@ from lightrag.constants import (
     DEFAULT_SUMMARY_LENGTH_RECOMMENDED,
     DEFAULT_MAX_ASYNC,
     DEFAULT_MAX_PARALLEL_INSERT,
+    DEFAULT_CHUNKING_MAX_WORKERS,
+    DEFAULT_MAX_PARALLEL_MERGE,
+    DEFAULT_PIPELINE_QUEUE_SIZE,
+    DEFAULT_MIN_ASYNC,
+    DEFAULT_LLM_TOKENS_PER_MINUTE,
+    DEFAULT_LLM_REQUESTS_PER_MINUTE,
+    DEFAULT_LLM_RATE_LIMIT_RESERVED_RATIO,
+    DEFAULT_EMBEDDING_FUNC_MIN_ASYNC,
     DEFAULT_DOCUMENT_PROCESSING_BATCH_SIZE,
     DEFAULT_MAX_GRAPH_NODES,
     DEFAULT_MAX_SOURCE_IDS_PER_ENTITY,
@@ -51,6 +68,12 @@ from lightrag.constants import (
     DEFAULT_SOURCE_IDS_LIMIT_METHOD,
     DEFAULT_MAX_FILE_PATHS,
     DEFAULT_FILE_PATH_MORE_PLACEHOLDER,
+    DEFAULT_LLM_CACHE_L1_MAX_BYTES,
+    DEFAULT_LLM_CACHE_L1_TTL,
+    DEFAULT_RETRIEVAL_CACHE_MAX_ENTRIES,
+    DEFAULT_RETRIEVAL_CACHE_TTL,
+    DEFAULT_SEMANTIC_QUERY_CACHE_THRESHOLD,
+    DEFAULT_SEMANTIC_QUERY_CACHE_MAX_ENTRIES,
 )
 from lightrag.utils import get_env_value
 
@@ -65,6 +88,7 @@ from lightrag.kg.shared_storage import (
     get_pipeline_status_lock,
     get_graph_db_lock,
     get_data_init_lock,
+    bump_data_version,
 )
 
 from lightrag.base import (
@@ -84,6 +108,12 @@ from lightrag.base import (
 from lightrag.namespace import NameSpace
 from lightrag.operate import (
     chunking_by_token_size,
+    build_document_chunks,
+    build_document_chunks_in_worker,
+    init_chunking_worker,
+    count_deferred_summaries,
+    load_deferred_summaries,
+    summarize_deferred_descriptions,
     extract_entities,
     merge_nodes_and_edges,
     kg_query,
@@ -99,6 +129,8 @@ from lightrag.utils import (
     compute_mdhash_id,
     lazy_external_import,
     priority_limit_async_func_call,
+    TokenBucketRateLimiter,
+    estimate_llm_request_tokens,
     get_content_summary,
     sanitize_text_for_encoding,
     check_storage_env_vars,
@@ -108,6 +140,8 @@ from lightrag.utils import (
     subtract_source_ids,
     make_relation_chunk_key,
     normalize_source_ids_limit_method,
+    preserve_description_reservoirs,
+    llm_cache_l1,
 )
 from lightrag.types import KnowledgeGraph
 from dotenv import load_dotenv
@@ -214,6 +248,25 @@ class LightRAG:
         )
     )
 
+    summary_mode: str = field(
+        default=get_env_value("SUMMARY_MODE", DEFAULT_SUMMARY_MODE, str)
+    )
+    """'inline' summarizes descriptions during merge. 'deferred' stores the merged descriptions and lets a background worker summarize each changed entity or relation once per interval."""
+
+    deferred_summary_interval: float = field(
+        default=get_env_value(
+            "DEFERRED_SUMMARY_INTERVAL", DEFAULT_DEFERRED_SUMMARY_INTERVAL, float
+        )
+    )
+    """Seconds the deferred summary worker waits to coalesce updates before summarizing."""
+
+    description_reservoir_size: int = field(
+        default=get_env_value(
+            "DESCRIPTION_RESERVOIR_SIZE", DEFAULT_DESCRIPTION_RESERVOIR_SIZE, int
+        )
+    )
+    """Raw descriptions kept per entity/relation (uniform sample) in entity/relation chunks storage, so summaries can be rebuilt from source text. 0 disables."""
+
     # Text chunking
     # ---
 
@@ -261,6 +314,7 @@ class LightRAG:
     The function should return a list of dictionaries, where each dictionary contains the following keys:
         - `tokens`: The number of tokens in the chunk.
         - `content`: The text content of the chunk.
+        - `start_offset` / `end_offset` (optional): Character offsets of the chunk content in the source text.
 
     Defaults to `chunking_by_token_size` if not specified.
     """
@@ -279,6 +333,13 @@ class LightRAG:
     )
     """Maximum number of concurrent embedding function calls."""
 
+    embedding_func_min_async: int = field(
+        default=get_env_value(
+            "EMBEDDING_FUNC_MIN_ASYNC", DEFAULT_EMBEDDING_FUNC_MIN_ASYNC, int
+        )
+    )
+    """Floor of the adaptive embedding concurrency limit. When set below embedding_func_max_async, the limit moves between the two based on latency and rate limit feedback; 0 keeps it fixed."""
+
     embedding_cache_config: dict[str, Any] = field(
         default_factory=lambda: {
             "enabled": False,
@@ -327,6 +388,34 @@ class LightRAG:
     )
     """Maximum number of concurrent LLM calls."""
 
+    llm_model_min_async: int = field(
+        default=get_env_value("MIN_ASYNC", DEFAULT_MIN_ASYNC, int)
+    )
+    """Floor of the adaptive LLM concurrency limit. When set below llm_model_max_async, the limit moves between the two based on latency and rate limit feedback; 0 keeps it fixed."""
+
+    llm_tokens_per_minute: int = field(
+        default=get_env_value(
+            "LLM_TOKENS_PER_MINUTE", DEFAULT_LLM_TOKENS_PER_MINUTE, int
+        )
+    )
+    """Token budget per minute for LLM calls, counting prompt tokens plus max_tokens. 0 disables it."""
+
+    llm_requests_per_minute: int = field(
+        default=get_env_value(
+            "LLM_REQUESTS_PER_MINUTE", DEFAULT_LLM_REQUESTS_PER_MINUTE, int
+        )
+    )
+    """Request budget per minute for LLM calls. 0 disables it."""
+
+    llm_rate_limit_reserved_ratio: float = field(
+        default=get_env_value(
+            "LLM_RATE_LIMIT_RESERVED_RATIO",
+            DEFAULT_LLM_RATE_LIMIT_RESERVED_RATIO,
+            float,
+        )
+    )
+    """Share of the LLM token and request budgets only queries (priority 5 or better) may use."""
+
     llm_model_kwargs: dict[str, Any] = field(default_factory=dict)
     """Additional keyword arguments passed to the LLM model function."""
 
@@ -357,13 +446,101 @@ class LightRAG:
     enable_llm_cache_for_entity_extract: bool = field(default=True)
     """If True, enables caching for entity extraction steps to reduce LLM costs."""
 
+    llm_cache_policies: dict[str, dict[str, Any]] = field(
+        default_factory=lambda: get_env_value("LLM_CACHE_POLICIES", {}, dict)
+    )
+    """Retention policies for the LLM response cache, keyed by cache_type
+    ('extract', 'keywords', 'query', 'summary'). Each policy accepts:
+    - ttl: seconds an entry stays valid after it was written
+    - max_entries: maximum number of entries kept for the cache_type
+    - max_bytes: maximum serialized size of the entries of the cache_type
+    - eviction: 'lru' or 'lfu', which entries to drop first when a bound is exceeded
+    Cache types without a policy are kept forever. Note that evicted 'extract'
+    entries can no longer be used to rebuild the graph after document deletion.
+    """
+
+    llm_cache_l1_max_bytes: int = field(
+        default=get_env_value(
+            "LLM_CACHE_L1_MAX_BYTES", DEFAULT_LLM_CACHE_L1_MAX_BYTES, int
+        )
+    )
+    """Size limit in bytes of the per-process LRU kept in front of llm_response_cache.
+    Hot cache entries are served from memory without a storage round-trip. Set to 0
+    to disable the in-memory tier."""
+
+    llm_cache_l1_ttl: int = field(
+        default=get_env_value("LLM_CACHE_L1_TTL", DEFAULT_LLM_CACHE_L1_TTL, int)
+    )
+    """Seconds an entry stays in the in-memory tier before it is read from storage
+    again. Deletions through LightRAG reach the in-memory tier of every worker
+    process, but entries the storage drops on its own (TTL or LRU/LFU eviction) or
+    that are removed behind LightRAG's back are served until this expires."""
+
+    retrieval_cache_max_entries: int = field(
+        default=get_env_value(
+            "RETRIEVAL_CACHE_MAX_ENTRIES", DEFAULT_RETRIEVAL_CACHE_MAX_ENTRIES, int
+        )
+    )
+    """Maximum number of query contexts (retrieval results before the LLM call) kept
+    per workspace and shared across workers. Least recently used entries are evicted
+    first. Entries are invalidated whenever documents are inserted or deleted or the
+    graph is edited. Set to 0 to disable the retrieval cache."""
+
+    retrieval_cache_ttl: int = field(
+        default=get_env_value("RETRIEVAL_CACHE_TTL", DEFAULT_RETRIEVAL_CACHE_TTL, int)
+    )
+    """Seconds a cached query context stays valid; 0 keeps it until evicted or invalidated."""
+
+    enable_semantic_query_cache: bool = field(
+        default=get_env_value("ENABLE_SEMANTIC_QUERY_CACHE", False, bool)
+    )
+    """If True, answers of kg_query/naive_query are also cached by query embedding, so
+    paraphrased questions with the same query parameters can reuse a cached answer.
+    Entries are invalidated whenever the workspace data changes. Can be skipped per
+    request with QueryParam.bypass_semantic_cache."""
+
+    semantic_query_cache_threshold: float = field(
+        default=get_env_value(
+            "SEMANTIC_QUERY_CACHE_THRESHOLD",
+            DEFAULT_SEMANTIC_QUERY_CACHE_THRESHOLD,
+            float,
+        )
+    )
+    """Minimum cosine similarity between query embeddings to serve a cached answer."""
+
+    semantic_query_cache_max_entries: int = field(
+        default=get_env_value(
+            "SEMANTIC_QUERY_CACHE_MAX_ENTRIES",
+            DEFAULT_SEMANTIC_QUERY_CACHE_MAX_ENTRIES,
+            int,
+        )
+    )
+    """Maximum number of answers kept in the semantic query cache per workspace."""
+
     # Extensions
     # ---
 
     max_parallel_insert: int = field(
         default=int(os.getenv("MAX_PARALLEL_INSERT", DEFAULT_MAX_PARALLEL_INSERT))
     )
-    """Maximum number of parallel insert operations."""
+    """Maximum number of documents chunked and extracted concurrently by the insert pipeline."""
+
+    max_parallel_merge: int = field(
+        default=get_env_value("MAX_PARALLEL_MERGE", DEFAULT_MAX_PARALLEL_MERGE, int)
+    )
+    """Maximum number of documents merged into the knowledge graph concurrently by the insert pipeline."""
+
+    pipeline_queue_size: int = field(
+        default=get_env_value("PIPELINE_QUEUE_SIZE", DEFAULT_PIPELINE_QUEUE_SIZE, int)
+    )
+    """Maximum number of documents waiting between two insert pipeline stages."""
+
+    chunking_max_workers: int = field(
+        default=get_env_value(
+            "CHUNKING_MAX_WORKERS", DEFAULT_CHUNKING_MAX_WORKERS, int
+        )
+    )
+    """Worker processes used to chunk documents off the event loop. 0 (default) chunks in a worker thread, -1 uses one per available CPU core, capped by max_parallel_insert. Worker processes are spawned, so scripts using them need an `if __name__ == "__main__":` guard."""
 
     document_processing_batch_size: int = field(
         default=get_env_value("DOCUMENT_PROCESSING_BATCH_SIZE", DEFAULT_DOCUMENT_PROCESSING_BATCH_SIZE, int)
@@ -440,6 +617,13 @@ class LightRAG:
             initialize_share_data,
         )
 
+        # Chunking process pool, created on first use; kept out of the dataclass
+        # fields so asdict(self) never copies it
+        self._chunking_executor: ProcessPoolExecutor | None = None
+        self._chunking_executor_disabled = False
+        # Background task running deferred description summaries (summary_mode="deferred")
+        self._deferred_summary_task: asyncio.Task | None = None
+
         # Handle deprecated parameters
         if self.log_level is not None:
             warnings.warn(
@@ -522,6 +706,7 @@ class LightRAG:
         self.embedding_func = priority_limit_async_func_call(
             self.embedding_func_max_async,
             llm_timeout=self.default_embedding_timeout,
+            min_size=self.embedding_func_min_async,
             queue_name="Embedding func",
         )(self.embedding_func)
 
@@ -631,6 +816,17 @@ class LightRAG:
         self.llm_model_func = priority_limit_async_func_call(
             self.llm_model_max_async,
             llm_timeout=self.default_llm_timeout,
+            min_size=self.llm_model_min_async,
+            rate_limiter=TokenBucketRateLimiter(
+                self.llm_tokens_per_minute,
+                self.llm_requests_per_minute,
+                reserved_ratio=self.llm_rate_limit_reserved_ratio,
+            ),
+            estimate_tokens=partial(
+                estimate_llm_request_tokens,
+                self.tokenizer,
+                max_tokens=self.llm_model_kwargs.get("max_tokens"),
+            ),
             queue_name="LLM func",
         )(
             partial(
@@ -666,9 +862,34 @@ class LightRAG:
             self._storages_status = StoragesStatus.INITIALIZED
             logger.debug("All storage types initialized")
 
+            if self.summary_mode == SUMMARY_MODE_DEFERRED:
+                # Resume deferred summaries left pending by a previous run
+                try:
+                    await load_deferred_summaries(
+                        self.chunk_entity_relation_graph, asdict(self)
+                    )
+                    self._schedule_deferred_summaries()
+                except Exception as e:
+                    logger.error(f"Failed to load pending deferred summaries: {e}")
+
     async def finalize_storages(self):
         """Asynchronously finalize the storages with improved error handling"""
         if self._storages_status == StoragesStatus.INITIALIZED:
+            # Summarize what the deferred summary worker has not reached yet
+            if self._deferred_summary_task is not None:
+                task = self._deferred_summary_task
+                self._deferred_summary_task = None
+                task.cancel()
+                # A cancelled run marks its unfinished items dirty again
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            try:
+                await self.aflush_deferred_summaries()
+            except Exception as e:
+                logger.error(f"Failed to flush deferred summaries: {e}")
+
             storages = [
                 ("full_docs", self.full_docs),
                 ("text_chunks", self.text_chunks),
@@ -714,6 +935,134 @@ class LightRAG:
 
             self._storages_status = StoragesStatus.FINALIZED
 
+        if self._chunking_executor is not None:
+            self._chunking_executor.shutdown(wait=False, cancel_futures=True)
+            self._chunking_executor = None
+
+    async def aflush_deferred_summaries(self) -> int:
+        """Summarize all entities and relations waiting for deferred summarization now
+
+        Returns:
+            Number of entities and relations whose description was rewritten
+        """
+        summarized = await summarize_deferred_descriptions(
+            self.chunk_entity_relation_graph,
+            self.entities_vdb,
+            self.relationships_vdb,
+            asdict(self),
+            self.llm_response_cache,
+        )
+        if summarized:
+            await self._insert_done()
+        return summarized
+
+    def _schedule_deferred_summaries(self) -> None:
+        """Start the deferred summary worker if there is pending work and none is running"""
+        if self.summary_mode != SUMMARY_MODE_DEFERRED:
+            return
+        task = self._deferred_summary_task
+        if task is not None and not task.done():
+            return
+        if not count_deferred_summaries(self.workspace):
+            return
+
+        async def _worker() -> None:
+            # Wait for the interval so that updates from many documents coalesce
+            while count_deferred_summaries(self.workspace):
+                await asyncio.sleep(self.deferred_summary_interval)
+                try:
+                    await self.aflush_deferred_summaries()
+                except Exception as e:
+                    logger.error(f"Deferred summary worker failed: {e}")
+
+        self._deferred_summary_task = asyncio.create_task(_worker())
+
+    def _get_chunking_executor(self) -> ProcessPoolExecutor | None:
+        """Lazily create the chunking process pool, or return None to chunk in a thread"""
+        if self._chunking_executor is not None or self._chunking_executor_disabled:
+            return self._chunking_executor
+
+        max_workers = self.chunking_max_workers
+        if max_workers < 0:
+            try:
+                # Honours CPU affinity (e.g. taskset, container cpusets)
+                cpu_count = len(os.sched_getaffinity(0))
+            except AttributeError:
+                cpu_count = os.cpu_count() or 1
+            # No more processes than documents chunked concurrently
+            max_workers = max(1, min(cpu_count, self.max_parallel_insert))
+        if max_workers == 0:
+            self._chunking_executor_disabled = True
+            return None
+        try:
+            # Worker processes receive the chunking function and tokenizer by pickle
+            pickle.dumps((self.chunking_func, self.tokenizer))
+        except Exception as e:
+            logger.warning(
+                f"Chunking function or tokenizer cannot be sent to worker processes, chunking in a thread instead: {e}"
+            )
+            self._chunking_executor_disabled = True
+            return None
+
+        try:
+            # Spawn rather than fork: the parent runs an event loop and helper threads
+            self._chunking_executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_chunking_worker,
+                initargs=(self.chunking_func, self.tokenizer),
+            )
+        except Exception as e:
+            logger.warning(
+                f"Cannot start chunking worker processes, chunking in a thread instead: {e}"
+            )
+            self._chunking_executor_disabled = True
+            return None
+        logger.info(f"Started {max_workers} chunking worker processes")
+        return self._chunking_executor
+
+    async def _chunk_document(
+        self,
+        content: str,
+        doc_id: str,
+        file_path: str,
+        split_by_character: str | None,
+        split_by_character_only: bool,
+    ) -> dict[str, Any]:
+        """Chunk a document in the chunking process pool, or a worker thread, without blocking the event loop
+
+        Returns:
+            Text chunk records keyed by chunk ID, ready to be stored.
+        """
+        args = (
+            content,
+            doc_id,
+            file_path,
+            split_by_character,
+            split_by_character_only,
+            self.chunk_overlap_token_size,
+            self.chunk_token_size,
+        )
+        executor = self._get_chunking_executor()
+        if executor is not None:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    executor, build_document_chunks_in_worker, *args
+                )
+            except BrokenProcessPool as e:
+                # A worker died or could not start (e.g. a script without a
+                # __main__ guard); chunk in a thread from now on
+                logger.warning(
+                    f"Chunking worker processes failed, chunking in a thread instead: {e}"
+                )
+                if self._chunking_executor is executor:
+                    self._chunking_executor = None
+                    self._chunking_executor_disabled = True
+                executor.shutdown(wait=False, cancel_futures=True)
+        return await asyncio.to_thread(
+            build_document_chunks, self.chunking_func, self.tokenizer, *args
+        )
+
     async def check_and_migrate_data(self):
         """Check if data migration is needed and perform migration if necessary"""
         async with get_data_init_lock():
@@ -741,27 +1090,29 @@ class LightRAG:
                 # Check if full_entities and full_relations are empty
                 # Get all processed documents to check their entity/relation data
                 try:
-                    processed_docs = await self.doc_status.get_docs_by_status(
-                        DocStatus.PROCESSED
-                    )
-
-                    if not processed_docs:
-                        logger.debug("No processed documents found, skipping migration")
-                        return
-
-                    # Check first few documents to see if they have full_entities/full_relations data
+                    # Stream processed documents and check the first few to see
+                    # if they have full_entities/full_relations data
                     migration_needed = True
                     checked_count = 0
-                    max_check = min(5, len(processed_docs))  # Check up to 5 documents
-
-                    for doc_id in list(processed_docs.keys())[:max_check]:
-                        checked_count += 1
-                        entity_data = await self.full_entities.get_by_id(doc_id)
-                        relation_data = await self.full_relations.get_by_id(doc_id)
-
-                        if entity_data or relation_data:
-                            migration_needed = False
-                            break
+                    max_check = 5  # Check up to 5 documents
+
+                    async with aclosing(
+                        self.doc_status.iter_docs_by_status(DocStatus.PROCESSED)
+                    ) as processed_docs:
+                        async for doc_id, _ in processed_docs:
+                            checked_count += 1
+                            entity_data = await self.full_entities.get_by_id(doc_id)
+                            relation_data = await self.full_relations.get_by_id(doc_id)
+
+                            if entity_data or relation_data:
+                                migration_needed = False
+                                break
+                            if checked_count >= max_check:
+                                break
+
+                    if not checked_count:
+                        logger.debug("No processed documents found, skipping migration")
+                        return
 
                     if not migration_needed:
                         logger.debug(
@@ -774,7 +1125,7 @@ class LightRAG:
                     )
 
                     # Perform migration
-                    await self._migrate_entity_relation_data(processed_docs)
+                    await self._migrate_entity_relation_data()
 
                 except Exception as e:
                     logger.error(f"Error during migration check: {e}")
@@ -784,13 +1135,16 @@ class LightRAG:
                 logger.error(f"Error in data migration check: {e}")
                 raise e
 
-    async def _migrate_entity_relation_data(self, processed_docs: dict):
+    async def _migrate_entity_relation_data(self):
         """Migrate existing entity and relation data to full_entities and full_relations storage"""
-        logger.info(f"Starting data migration for {len(processed_docs)} documents")
-
-        # Create mapping from chunk_id to doc_id
+        # Create mapping from chunk_id to doc_id, streaming processed documents
+        # so that only the chunk ids are kept in memory
         chunk_to_doc = {}
-        for doc_id, doc_status in processed_docs.items():
+        doc_count = 0
+        async for doc_id, doc_status in self.doc_status.iter_docs_by_status(
+            DocStatus.PROCESSED
+        ):
+            doc_count += 1
             chunk_ids = (
                 doc_status.chunks_list
                 if hasattr(doc_status, "chunks_list") and doc_status.chunks_list
@@ -799,16 +1153,14 @@ class LightRAG:
             for chunk_id in chunk_ids:
                 chunk_to_doc[chunk_id] = doc_id
 
+        logger.info(f"Starting data migration for {doc_count} documents")
+
         # Initialize document entity and relation mappings
         doc_entities = {}  # doc_id -> set of entity_names
         doc_relations = {}  # doc_id -> set of relation_pairs (as tuples)
 
-        # Get all nodes and edges from graph
-        all_nodes = await self.chunk_entity_relation_graph.get_all_nodes()
-        all_edges = await self.chunk_entity_relation_graph.get_all_edges()
-
-        # Process all nodes once
-        for node in all_nodes:
+        # Stream all nodes and edges from graph, processing each once
+        async for node in self.chunk_entity_relation_graph.iter_all_nodes():
             if "source_id" in node:
                 entity_id = node.get("entity_id") or node.get("id")
                 if not entity_id:
@@ -825,8 +1177,7 @@ class LightRAG:
                             doc_entities[doc_id] = set()
                         doc_entities[doc_id].add(entity_id)
 
-        # Process all edges once
-        for edge in all_edges:
+        async for edge in self.chunk_entity_relation_graph.iter_all_edges():
             if "source_id" in edge:
                 src = edge.get("source")
                 tgt = edge.get("target")
@@ -907,113 +1258,108 @@ class LightRAG:
 
         BATCH_SIZE = 500  # Process 500 records per batch
 
-        if need_entity_migration:
-            try:
-                nodes = await self.chunk_entity_relation_graph.get_all_nodes()
-            except Exception as exc:
-                logger.error(f"Failed to fetch nodes for chunk migration: {exc}")
-                nodes = []
-
-            logger.info(f"Starting chunk_tracking data migration: {len(nodes)} nodes")
-
-            # Process nodes in batches
-            total_nodes = len(nodes)
-            total_batches = (total_nodes + BATCH_SIZE - 1) // BATCH_SIZE
-            total_migrated = 0
-
-            for batch_idx in range(total_batches):
-                start_idx = batch_idx * BATCH_SIZE
-                end_idx = min((batch_idx + 1) * BATCH_SIZE, total_nodes)
-                batch_nodes = nodes[start_idx:end_idx]
-
-                upsert_payload: dict[str, dict[str, object]] = {}
-                for node in batch_nodes:
-                    entity_id = node.get("entity_id") or node.get("id")
-                    if not entity_id:
-                        continue
-
-                    raw_source = node.get("source_id") or ""
-                    chunk_ids = [
-                        chunk_id
-                        for chunk_id in raw_source.split(GRAPH_FIELD_SEP)
-                        if chunk_id
-                    ]
-                    if not chunk_ids:
-                        continue
-
-                    upsert_payload[entity_id] = {
-                        "chunk_ids": chunk_ids,
-                        "count": len(chunk_ids),
-                    }
-
-                if upsert_payload:
-                    await self.entity_chunks.upsert(upsert_payload)
-                    total_migrated += len(upsert_payload)
-                    logger.info(
-                        f"Processed entity batch {batch_idx + 1}/{total_batches}: {len(upsert_payload)} records (total: {total_migrated}/{total_nodes})"
+        async def entity_records() -> AsyncIterator[tuple[str, dict[str, Any]]]:
+            async for node in self.chunk_entity_relation_graph.iter_all_nodes(
+                batch_size=BATCH_SIZE
+            ):
+                entity_id = node.get("entity_id") or node.get("id")
+                raw_source = node.get("source_id") or ""
+                chunk_ids = [
+                    chunk_id
+                    for chunk_id in raw_source.split(GRAPH_FIELD_SEP)
+                    if chunk_id
+                ]
+                if entity_id and chunk_ids:
+                    yield entity_id, {"chunk_ids": chunk_ids, "count": len(chunk_ids)}
+
+        async def relation_records() -> AsyncIterator[tuple[str, dict[str, Any]]]:
+            async for edge in self.chunk_entity_relation_graph.iter_all_edges(
+                batch_size=BATCH_SIZE
+            ):
+                src = edge.get("source") or edge.get("src_id") or edge.get("src")
+                tgt = edge.get("target") or edge.get("tgt_id") or edge.get("tgt")
+                raw_source = edge.get("source_id") or ""
+                chunk_ids = [
+                    chunk_id
+                    for chunk_id in raw_source.split(GRAPH_FIELD_SEP)
+                    if chunk_id
+                ]
+                if src and tgt and chunk_ids:
+                    yield (
+                        make_relation_chunk_key(src, tgt),
+                        {"chunk_ids": chunk_ids, "count": len(chunk_ids)},
                     )
 
-            if total_migrated > 0:
-                # Persist entity_chunks data to disk
-                await self.entity_chunks.index_done_callback()
-                logger.info(
-                    f"Entity chunk_tracking migration completed: {total_migrated} records persisted"
-                )
+        if need_entity_migration:
+            logger.info("Starting chunk_tracking data migration for nodes")
+            await self._seed_chunk_tracking(
+                self.entity_chunks, entity_records(), "Entity", BATCH_SIZE
+            )
 
         if need_relation_migration:
-            try:
-                edges = await self.chunk_entity_relation_graph.get_all_edges()
-            except Exception as exc:
-                logger.error(f"Failed to fetch edges for chunk migration: {exc}")
-                edges = []
-
-            logger.info(f"Starting chunk_tracking data migration: {len(edges)} edges")
-
-            # Process edges in batches
-            total_edges = len(edges)
-            total_batches = (total_edges + BATCH_SIZE - 1) // BATCH_SIZE
-            total_migrated = 0
-
-            for batch_idx in range(total_batches):
-                start_idx = batch_idx * BATCH_SIZE
-                end_idx = min((batch_idx + 1) * BATCH_SIZE, total_edges)
-                batch_edges = edges[start_idx:end_idx]
-
-                upsert_payload: dict[str, dict[str, object]] = {}
-                for edge in batch_edges:
-                    src = edge.get("source") or edge.get("src_id") or edge.get("src")
-                    tgt = edge.get("target") or edge.get("tgt_id") or edge.get("tgt")
-                    if not src or not tgt:
-                        continue
+            logger.info("Starting chunk_tracking data migration for edges")
+            await self._seed_chunk_tracking(
+                self.relation_chunks, relation_records(), "Relation", BATCH_SIZE
+            )
 
-                    raw_source = edge.get("source_id") or ""
-                    chunk_ids = [
-                        chunk_id
-                        for chunk_id in raw_source.split(GRAPH_FIELD_SEP)
-                        if chunk_id
-                    ]
-                    if not chunk_ids:
-                        continue
+    async def _seed_chunk_tracking(
+        self,
+        storage: BaseKVStorage,
+        records: AsyncIterator[tuple[str, dict[str, Any]]],
+        label: str,
+        batch_size: int,
+    ) -> None:
+        """Stream chunk-tracking records from the graph into an empty storage
 
-                    storage_key = make_relation_chunk_key(src, tgt)
-                    upsert_payload[storage_key] = {
-                        "chunk_ids": chunk_ids,
-                        "count": len(chunk_ids),
-                    }
+        Records are upserted in batches while the graph is still being read. The
+        migration only runs while the storage is empty, so on any failure the
+        records written so far are deleted again before the error is re-raised,
+        letting the next start redo the migration from scratch.
 
-                if upsert_payload:
-                    await self.relation_chunks.upsert(upsert_payload)
-                    total_migrated += len(upsert_payload)
-                    logger.info(
-                        f"Processed relation batch {batch_idx + 1}/{total_batches}: {len(upsert_payload)} records (total: {total_migrated}/{total_edges})"
+        Graph backends reading through PostgreSQLDB.iterate hold one pool
+        connection until the iteration ends, while the upserts take another.
+        """
+        written: list[str] = []
+        upsert_payload: dict[str, dict[str, Any]] = {}
+
+        async def flush() -> None:
+            nonlocal upsert_payload
+            if not upsert_payload:
+                return
+            await storage.upsert(upsert_payload)
+            written.extend(upsert_payload)
+            logger.info(
+                f"Processed {label.lower()} batch: {len(upsert_payload)} records (total: {len(written)})"
+            )
+            upsert_payload = {}
+
+        try:
+            async with aclosing(records):
+                async for key, record in records:
+                    upsert_payload[key] = record
+                    if len(upsert_payload) >= batch_size:
+                        await flush()
+            await flush()
+        except Exception as exc:
+            logger.error(
+                f"{label} chunk_tracking migration failed after {len(written)} records, rolling back: {exc}"
+            )
+            if written:
+                try:
+                    await storage.delete(written)
+                    await storage.index_done_callback()
+                except Exception as rollback_exc:
+                    logger.error(
+                        f"Failed to roll back partial {label.lower()} chunk_tracking migration: {rollback_exc}"
                     )
+            raise
 
-            if total_migrated > 0:
-                # Persist relation_chunks data to disk
-                await self.relation_chunks.index_done_callback()
-                logger.info(
-                    f"Relation chunk_tracking migration completed: {total_migrated} records persisted"
-                )
+        if written:
+            # Persist chunk tracking data to disk
+            await storage.index_done_callback()
+            logger.info(
+                f"{label} chunk_tracking migration completed: {len(written)} records persisted"
+            )
 
     async def get_graph_labels(self):
         text = await self.chunk_entity_relation_graph.get_all_labels()
@@ -1612,6 +1958,7 @@ class LightRAG:
                         "request_pending": False,  # Clear any previous request
                         "cancellation_requested": False,  # Initialize cancellation flag
                         "latest_message": "",
+                        "stage_queue_depths": {},
                     }
                 )
                 # Cleaning history_messages without breaking it as a shared list object
@@ -1692,401 +2039,378 @@ class LightRAG:
 
                 # Create a counter to track the number of processed files
                 processed_count = 0
-                # Create a semaphore to limit the number of concurrent file processing
-                semaphore = asyncio.Semaphore(self.max_parallel_insert)
-
-                async def process_document(
-                    doc_id: str,
-                    status_doc: DocProcessingStatus,
-                    split_by_character: str | None,
-                    split_by_character_only: bool,
-                    pipeline_status: dict,
-                    pipeline_status_lock: asyncio.Lock,
-                    semaphore: asyncio.Semaphore,
+
+                # Staged pipeline: chunk -> extract -> merge -> persist, connected
+                # by bounded queues so extraction of the next documents overlaps
+                # with merging and persisting of earlier ones
+                stage_queues: dict[str, asyncio.Queue] = {
+                    stage: asyncio.Queue(maxsize=self.pipeline_queue_size)
+                    for stage in ("chunk", "extract", "merge", "persist")
+                }
+
+                def report_queue_depths() -> None:
+                    pipeline_status["stage_queue_depths"] = {
+                        stage: queue.qsize() for stage, queue in stage_queues.items()
+                    }
+
+                async def check_cancellation() -> None:
+                    async with pipeline_status_lock:
+                        if pipeline_status.get("cancellation_requested", False):
+                            raise PipelineCancelledException("User cancelled")
+
+                async def mark_document_failed(
+                    doc: dict[str, Any], e: Exception, stage: str
                 ) -> None:
-                    """Process single document"""
-                    # Initialize variables at the start to prevent UnboundLocalError in error handling
-                    file_path = "unknown_source"
-                    current_file_number = 0
-                    file_extraction_stage_ok = False
-                    processing_start_time = int(time.time())
-                    first_stage_tasks = []
-                    entity_relation_task = None
-
-                    async with semaphore:
-                        nonlocal processed_count
-                        # Initialize to prevent UnboundLocalError in error handling
-                        first_stage_tasks = []
-                        entity_relation_task = None
+                    """Log a failed document and set its status to FAILED"""
+                    current_file_number = doc["current_file_number"]
+                    file_path = doc["file_path"]
+                    status_doc = doc["status_doc"]
+                    if isinstance(e, PipelineCancelledException):
+                        # User cancellation - log brief message only, no traceback
+                        if stage == "merge":
+                            error_msg = f"User cancelled during merge {current_file_number}/{total_files}: {file_path}"
+                        else:
+                            error_msg = f"User cancelled {current_file_number}/{total_files}: {file_path}"
+                        logger.warning(error_msg)
+                        async with pipeline_status_lock:
+                            pipeline_status["latest_message"] = error_msg
+                            pipeline_status["history_messages"].append(error_msg)
+                    else:
+                        # Other exceptions - log with traceback
+                        logger.error(traceback.format_exc())
+                        if stage == "merge":
+                            error_msg = f"Merging stage failed in document {current_file_number}/{total_files}: {file_path}"
+                        else:
+                            error_msg = f"Failed to extract document {current_file_number}/{total_files}: {file_path}"
+                        logger.error(error_msg)
+                        async with pipeline_status_lock:
+                            pipeline_status["latest_message"] = error_msg
+                            pipeline_status["history_messages"].append(
+                                traceback.format_exc()
+                            )
+                            pipeline_status["history_messages"].append(error_msg)
+
+                    # Persistent llm cache with error handling
+                    if self.llm_response_cache:
                         try:
-                            # Check for cancellation before starting document processing
-                            async with pipeline_status_lock:
-                                if pipeline_status.get("cancellation_requested", False):
-                                    raise PipelineCancelledException("User cancelled")
-
-                            # Get file path from status document
-                            file_path = getattr(
-                                status_doc, "file_path", "unknown_source"
+                            await self.llm_response_cache.index_done_callback()
+                        except Exception as persist_error:
+                            logger.error(
+                                f"Failed to persist LLM cache: {persist_error}"
                             )
 
-                            async with pipeline_status_lock:
-                                # Update processed file count and save current file number
-                                processed_count += 1
-                                current_file_number = (
-                                    processed_count  # Save the current file number
-                                )
-                                pipeline_status["cur_batch"] = processed_count
-
-                                log_message = f"Extracting stage {current_file_number}/{total_files}: {file_path}"
-                                logger.info(log_message)
-                                pipeline_status["history_messages"].append(log_message)
-                                log_message = f"Processing d-id: {doc_id}"
-                                logger.info(log_message)
-                                pipeline_status["latest_message"] = log_message
-                                pipeline_status["history_messages"].append(log_message)
-
-                                # Prevent memory growth: keep only latest 5000 messages when exceeding 10000
-                                if len(pipeline_status["history_messages"]) > 10000:
-                                    logger.info(
-                                        f"Trimming pipeline history from {len(pipeline_status['history_messages'])} to 5000 messages"
-                                    )
-                                    pipeline_status["history_messages"] = (
-                                        pipeline_status["history_messages"][-5000:]
-                                    )
-
-                            # Get document content from full_docs
-                            content_data = await self.full_docs.get_by_id(doc_id)
-                            if not content_data:
-                                raise Exception(
-                                    f"Document content not found in full_docs for doc_id: {doc_id}"
-                                )
-                            content = content_data["content"]
-
-                            # Generate chunks from document
-                            chunks: dict[str, Any] = {
-                                compute_mdhash_id(dp["content"], prefix="chunk-"): {
-                                    **dp,
-                                    "full_doc_id": doc_id,
-                                    "file_path": file_path,  # Add file path to each chunk
-                                    "llm_cache_list": [],  # Initialize empty LLM cache list for each chunk
-                                }
-                                for dp in self.chunking_func(
-                                    self.tokenizer,
-                                    content,
-                                    split_by_character,
-                                    split_by_character_only,
-                                    self.chunk_overlap_token_size,
-                                    self.chunk_token_size,
-                                )
+                    # Record processing end time for failed case
+                    processing_end_time = int(time.time())
+
+                    # Update document status to failed
+                    await self.doc_status.upsert(
+                        {
+                            doc["doc_id"]: {
+                                "status": DocStatus.FAILED,
+                                "error_msg": str(e),
+                                "content_summary": status_doc.content_summary,
+                                "content_length": status_doc.content_length,
+                                "created_at": status_doc.created_at,
+                                "updated_at": datetime.now(timezone.utc).isoformat(),
+                                "file_path": file_path,
+                                "track_id": status_doc.track_id,  # Preserve existing track_id
+                                "metadata": {
+                                    "processing_start_time": doc[
+                                        "processing_start_time"
+                                    ],
+                                    "processing_end_time": processing_end_time,
+                                },
                             }
+                        }
+                    )
 
-                            if not chunks:
-                                logger.warning("No document chunks to process")
-
-                            # Record processing start time
-                            processing_start_time = int(time.time())
-
-                            # Check for cancellation before entity extraction
-                            async with pipeline_status_lock:
-                                if pipeline_status.get("cancellation_requested", False):
-                                    raise PipelineCancelledException("User cancelled")
-
-                            # Process document in two stages
-                            # Stage 1: Process text chunks and docs (parallel execution)
-                            doc_status_task = asyncio.create_task(
-                                self.doc_status.upsert(
-                                    {
-                                        doc_id: {
-                                            "status": DocStatus.PROCESSING,
-                                            "chunks_count": len(chunks),
-                                            "chunks_list": list(
-                                                chunks.keys()
-                                            ),  # Save chunks list
-                                            "content_summary": status_doc.content_summary,
-                                            "content_length": status_doc.content_length,
-                                            "created_at": status_doc.created_at,
-                                            "updated_at": datetime.now(
-                                                timezone.utc
-                                            ).isoformat(),
-                                            "file_path": file_path,
-                                            "track_id": status_doc.track_id,  # Preserve existing track_id
-                                            "metadata": {
-                                                "processing_start_time": processing_start_time
-                                            },
-                                        }
-                                    }
-                                )
-                            )
-                            chunks_vdb_task = asyncio.create_task(
-                                self.chunks_vdb.upsert(chunks)
-                            )
-                            text_chunks_task = asyncio.create_task(
-                                self.text_chunks.upsert(chunks)
-                            )
+                async def chunk_document(doc: dict[str, Any]) -> dict[str, Any]:
+                    """Stage 1: chunk the document and store chunks and PROCESSING status"""
+                    nonlocal processed_count
+                    doc_id = doc["doc_id"]
+                    status_doc = doc["status_doc"]
 
-                            # First stage tasks (parallel execution)
-                            first_stage_tasks = [
-                                doc_status_task,
-                                chunks_vdb_task,
-                                text_chunks_task,
-                            ]
-                            entity_relation_task = None
+                    # Check for cancellation before starting document processing
+                    await check_cancellation()
 
-                            # Execute first stage tasks
-                            await asyncio.gather(*first_stage_tasks)
+                    async with pipeline_status_lock:
+                        # Update processed file count and save current file number
+                        processed_count += 1
+                        doc["current_file_number"] = processed_count
+                        pipeline_status["cur_batch"] = processed_count
 
-                            # Stage 2: Process entity relation graph (after text_chunks are saved)
-                            entity_relation_task = asyncio.create_task(
-                                self._process_extract_entities(
-                                    chunks, pipeline_status, pipeline_status_lock
-                                )
-                            )
-                            await entity_relation_task
-                            file_extraction_stage_ok = True
+                        log_message = f"Extracting stage {processed_count}/{total_files}: {doc['file_path']}"
+                        logger.info(log_message)
+                        pipeline_status["history_messages"].append(log_message)
+                        log_message = f"Processing d-id: {doc_id}"
+                        logger.info(log_message)
+                        pipeline_status["latest_message"] = log_message
+                        pipeline_status["history_messages"].append(log_message)
 
-                        except Exception as e:
-                            # Check if this is a user cancellation
-                            if isinstance(e, PipelineCancelledException):
-                                # User cancellation - log brief message only, no traceback
-                                error_msg = f"User cancelled {current_file_number}/{total_files}: {file_path}"
-                                logger.warning(error_msg)
-                                async with pipeline_status_lock:
-                                    pipeline_status["latest_message"] = error_msg
-                                    pipeline_status["history_messages"].append(
-                                        error_msg
-                                    )
-                            else:
-                                # Other exceptions - log with traceback
-                                logger.error(traceback.format_exc())
-                                error_msg = f"Failed to extract document {current_file_number}/{total_files}: {file_path}"
-                                logger.error(error_msg)
-                                async with pipeline_status_lock:
-                                    pipeline_status["latest_message"] = error_msg
-                                    pipeline_status["history_messages"].append(
-                                        traceback.format_exc()
-                                    )
-                                    pipeline_status["history_messages"].append(
-                                        error_msg
-                                    )
-
-                            # Cancel tasks that are not yet completed
-                            all_tasks = first_stage_tasks + (
-                                [entity_relation_task] if entity_relation_task else []
+                        # Prevent memory growth: keep only latest 5000 messages when exceeding 10000
+                        if len(pipeline_status["history_messages"]) > 10000:
+                            logger.info(
+                                f"Trimming pipeline history from {len(pipeline_status['history_messages'])} to 5000 messages"
                             )
-                            for task in all_tasks:
-                                if task and not task.done():
-                                    task.cancel()
-
-                            # Persistent llm cache with error handling
-                            if self.llm_response_cache:
-                                try:
-                                    await self.llm_response_cache.index_done_callback()
-                                except Exception as persist_error:
-                                    logger.error(
-                                        f"Failed to persist LLM cache: {persist_error}"
-                                    )
-
-                            # Record processing end time for failed case
-                            processing_end_time = int(time.time())
-
-                            # Update document status to failed
-                            await self.doc_status.upsert(
+                            pipeline_status["history_messages"] = pipeline_status[
+                                "history_messages"
+                            ][-5000:]
+
+                    # Get document content from full_docs
+                    content_data = await self.full_docs.get_by_id(doc_id)
+                    if not content_data:
+                        raise Exception(
+                            f"Document content not found in full_docs for doc_id: {doc_id}"
+                        )
+
+                    # Generate chunks from document in the chunking worker pool
+                    chunks = await self._chunk_document(
+                        content_data["content"],
+                        doc_id,
+                        doc["file_path"],
+                        split_by_character,
+                        split_by_character_only,
+                    )
+                    if not chunks:
+                        logger.warning("No document chunks to process")
+                    doc["chunks"] = chunks
+
+                    # Record processing start time
+                    doc["processing_start_time"] = int(time.time())
+
+                    # Check for cancellation before entity extraction
+                    await check_cancellation()
+
+                    # Store text chunks and docs (parallel execution)
+                    first_stage_tasks = [
+                        asyncio.create_task(
+                            self.doc_status.upsert(
                                 {
                                     doc_id: {
-                                        "status": DocStatus.FAILED,
-                                        "error_msg": str(e),
+                                        "status": DocStatus.PROCESSING,
+                                        "chunks_count": len(chunks),
+                                        "chunks_list": list(
+                                            chunks.keys()
+                                        ),  # Save chunks list
                                         "content_summary": status_doc.content_summary,
                                         "content_length": status_doc.content_length,
                                         "created_at": status_doc.created_at,
                                         "updated_at": datetime.now(
                                             timezone.utc
                                         ).isoformat(),
-                                        "file_path": file_path,
+                                        "file_path": doc["file_path"],
                                         "track_id": status_doc.track_id,  # Preserve existing track_id
                                         "metadata": {
-                                            "processing_start_time": processing_start_time,
-                                            "processing_end_time": processing_end_time,
+                                            "processing_start_time": doc[
+                                                "processing_start_time"
+                                            ]
                                         },
                                     }
                                 }
                             )
+                        ),
+                        asyncio.create_task(self.chunks_vdb.upsert(chunks)),
+                        asyncio.create_task(self.text_chunks.upsert(chunks)),
+                    ]
+                    try:
+                        await asyncio.gather(*first_stage_tasks)
+                    except BaseException:
+                        # Cancel tasks that are not yet completed
+                        for task in first_stage_tasks:
+                            if not task.done():
+                                task.cancel()
+                        raise
+                    return doc
+
+                async def extract_document(doc: dict[str, Any]) -> dict[str, Any]:
+                    """Stage 2: extract entities and relations (after text_chunks are saved)"""
+                    doc["chunk_results"] = await self._process_extract_entities(
+                        doc["chunks"], pipeline_status, pipeline_status_lock
+                    )
+                    return doc
 
-                        # Concurrency is controlled by keyed lock for individual entities and relationships
-                        if file_extraction_stage_ok:
-                            try:
-                                # Check for cancellation before merge
-                                async with pipeline_status_lock:
-                                    if pipeline_status.get(
-                                        "cancellation_requested", False
-                                    ):
-                                        raise PipelineCancelledException(
-                                            "User cancelled"
-                                        )
+                async def merge_document(doc: dict[str, Any]) -> dict[str, Any]:
+                    """Stage 3: merge extraction results into the graph and vector storages"""
+                    # Check for cancellation before merge
+                    await check_cancellation()
 
-                                # Get chunk_results from entity_relation_task
-                                chunk_results = await entity_relation_task
-                                await merge_nodes_and_edges(
-                                    chunk_results=chunk_results,  # result collected from entity_relation_task
-                                    knowledge_graph_inst=self.chunk_entity_relation_graph,
-                                    entity_vdb=self.entities_vdb,
-                                    relationships_vdb=self.relationships_vdb,
-                                    global_config=asdict(self),
-                                    full_entities_storage=self.full_entities,
-                                    full_relations_storage=self.full_relations,
-                                    doc_id=doc_id,
-                                    pipeline_status=pipeline_status,
-                                    pipeline_status_lock=pipeline_status_lock,
-                                    llm_response_cache=self.llm_response_cache,
-                                    entity_chunks_storage=self.entity_chunks,
-                                    relation_chunks_storage=self.relation_chunks,
-                                    current_file_number=current_file_number,
-                                    total_files=total_files,
-                                    file_path=file_path,
-                                )
+                    # Concurrency is controlled by keyed lock for individual entities and relationships
+                    await merge_nodes_and_edges(
+                        chunk_results=doc["chunk_results"],
+                        knowledge_graph_inst=self.chunk_entity_relation_graph,
+                        entity_vdb=self.entities_vdb,
+                        relationships_vdb=self.relationships_vdb,
+                        global_config=asdict(self),
+                        full_entities_storage=self.full_entities,
+                        full_relations_storage=self.full_relations,
+                        doc_id=doc["doc_id"],
+                        pipeline_status=pipeline_status,
+                        pipeline_status_lock=pipeline_status_lock,
+                        llm_response_cache=self.llm_response_cache,
+                        entity_chunks_storage=self.entity_chunks,
+                        relation_chunks_storage=self.relation_chunks,
+                        current_file_number=doc["current_file_number"],
+                        total_files=total_files,
+                        file_path=doc["file_path"],
+                    )
+                    return doc
 
-                                # Record processing end time
-                                processing_end_time = int(time.time())
-
-                                await self.doc_status.upsert(
-                                    {
-                                        doc_id: {
-                                            "status": DocStatus.PROCESSED,
-                                            "chunks_count": len(chunks),
-                                            "chunks_list": list(chunks.keys()),
-                                            "content_summary": status_doc.content_summary,
-                                            "content_length": status_doc.content_length,
-                                            "created_at": status_doc.created_at,
-                                            "updated_at": datetime.now(
-                                                timezone.utc
-                                            ).isoformat(),
-                                            "file_path": file_path,
-                                            "track_id": status_doc.track_id,  # Preserve existing track_id
-                                            "metadata": {
-                                                "processing_start_time": processing_start_time,
-                                                "processing_end_time": processing_end_time,
-                                            },
-                                        }
-                                    }
-                                )
+                async def persist_document(doc: dict[str, Any]) -> None:
+                    """Stage 4: mark the document PROCESSED and persist all storages"""
+                    status_doc = doc["status_doc"]
+                    chunks = doc["chunks"]
 
-                                # Call _insert_done after processing each file
-                                await self._insert_done()
-
-                                async with pipeline_status_lock:
-                                    log_message = f"Completed processing file {current_file_number}/{total_files}: {file_path}"
-                                    logger.info(log_message)
-                                    pipeline_status["latest_message"] = log_message
-                                    pipeline_status["history_messages"].append(
-                                        log_message
-                                    )
-
-                            except Exception as e:
-                                # Check if this is a user cancellation
-                                if isinstance(e, PipelineCancelledException):
-                                    # User cancellation - log brief message only, no traceback
-                                    error_msg = f"User cancelled during merge {current_file_number}/{total_files}: {file_path}"
-                                    logger.warning(error_msg)
-                                    async with pipeline_status_lock:
-                                        pipeline_status["latest_message"] = error_msg
-                                        pipeline_status["history_messages"].append(
-                                            error_msg
-                                        )
-                                else:
-                                    # Other exceptions - log with traceback
-                                    logger.error(traceback.format_exc())
-                                    error_msg = f"Merging stage failed in document {current_file_number}/{total_files}: {file_path}"
-                                    logger.error(error_msg)
-                                    async with pipeline_status_lock:
-                                        pipeline_status["latest_message"] = error_msg
-                                        pipeline_status["history_messages"].append(
-                                            traceback.format_exc()
-                                        )
-                                        pipeline_status["history_messages"].append(
-                                            error_msg
-                                        )
+                    # Record processing end time
+                    processing_end_time = int(time.time())
 
-                                # Persistent llm cache with error handling
-                                if self.llm_response_cache:
-                                    try:
-                                        await self.llm_response_cache.index_done_callback()
-                                    except Exception as persist_error:
-                                        logger.error(
-                                            f"Failed to persist LLM cache: {persist_error}"
-                                        )
+                    await self.doc_status.upsert(
+                        {
+                            doc["doc_id"]: {
+                                "status": DocStatus.PROCESSED,
+                                "chunks_count": len(chunks),
+                                "chunks_list": list(chunks.keys()),
+                                "content_summary": status_doc.content_summary,
+                                "content_length": status_doc.content_length,
+                                "created_at": status_doc.created_at,
+                                "updated_at": datetime.now(timezone.utc).isoformat(),
+                                "file_path": doc["file_path"],
+                                "track_id": status_doc.track_id,  # Preserve existing track_id
+                                "metadata": {
+                                    "processing_start_time": doc[
+                                        "processing_start_time"
+                                    ],
+                                    "processing_end_time": processing_end_time,
+                                },
+                            }
+                        }
+                    )
 
-                                # Record processing end time for failed case
-                                processing_end_time = int(time.time())
-
-                                # Update document status to failed
-                                await self.doc_status.upsert(
-                                    {
-                                        doc_id: {
-                                            "status": DocStatus.FAILED,
-                                            "error_msg": str(e),
-                                            "content_summary": status_doc.content_summary,
-                                            "content_length": status_doc.content_length,
-                                            "created_at": status_doc.created_at,
-                                            "updated_at": datetime.now().isoformat(),
-                                            "file_path": file_path,
-                                            "track_id": status_doc.track_id,  # Preserve existing track_id
-                                            "metadata": {
-                                                "processing_start_time": processing_start_time,
-                                                "processing_end_time": processing_end_time,
-                                            },
-                                        }
-                                    }
+                    # Call _insert_done after processing each file
+                    await self._insert_done()
+                    self._schedule_deferred_summaries()
+
+                    async with pipeline_status_lock:
+                        log_message = f"Completed processing file {doc['current_file_number']}/{total_files}: {doc['file_path']}"
+                        logger.info(log_message)
+                        pipeline_status["latest_message"] = log_message
+                        pipeline_status["history_messages"].append(log_message)
+
+                # (stage, handler, next stage, failure message kind, worker count)
+                stages = [
+                    (
+                        "chunk",
+                        chunk_document,
+                        "extract",
+                        "extract",
+                        self.max_parallel_insert,
+                    ),
+                    (
+                        "extract",
+                        extract_document,
+                        "merge",
+                        "extract",
+                        self.max_parallel_insert,
+                    ),
+                    (
+                        "merge",
+                        merge_document,
+                        "persist",
+                        "merge",
+                        self.max_parallel_merge,
+                    ),
+                    ("persist", persist_document, None, "merge", 1),
+                ]
+
+                async def run_stage_worker(
+                    stage: str, handler, next_stage: str | None, failure_kind: str
+                ) -> None:
+                    queue = stage_queues[stage]
+                    while True:
+                        doc = await queue.get()
+                        report_queue_depths()
+                        if doc is None:
+                            # Sentinel: upstream stages are drained
+                            return
+                        try:
+                            result = await handler(doc)
+                        except Exception as e:
+                            try:
+                                await mark_document_failed(doc, e, failure_kind)
+                            except Exception as status_error:
+                                logger.error(
+                                    f"Failed to record failure of document {doc['doc_id']}: {status_error}"
                                 )
+                            continue
+                        if next_stage is not None:
+                            await stage_queues[next_stage].put(result)
+                            report_queue_depths()
+
+                stage_workers = [
+                    [
+                        asyncio.create_task(
+                            run_stage_worker(stage, handler, next_stage, failure_kind)
+                        )
+                        for _ in range(max(1, worker_count))
+                    ]
+                    for stage, handler, next_stage, failure_kind, worker_count in stages
+                ]
 
-                # Process documents in iterative batches
+                # Feed documents into the pipeline in batches of document_processing_batch_size
                 doc_items = list(to_process_docs.items())
                 batch_size = self.document_processing_batch_size
                 total_batches = (len(doc_items) + batch_size - 1) // batch_size
-                
+
                 log_message = f"Processing {len(doc_items)} documents in {total_batches} batches of {batch_size}"
                 logger.info(log_message)
                 pipeline_status["latest_message"] = log_message
                 pipeline_status["history_messages"].append(log_message)
 
+                cancelled = False
                 try:
-                    # Process documents in batches
-                    for batch_idx in range(0, len(doc_items), batch_size):
-                        batch_docs = doc_items[batch_idx:batch_idx + batch_size]
-                        current_batch_num = (batch_idx // batch_size) + 1
-                        
-                        # Check for cancellation before starting each batch
-                        async with pipeline_status_lock:
-                            if pipeline_status.get("cancellation_requested", False):
-                                raise PipelineCancelledException("User cancelled")
-                        
-                        batch_log_message = f"Processing batch {current_batch_num}/{total_batches} ({len(batch_docs)} documents)"
-                        logger.info(batch_log_message)
-                        pipeline_status["latest_message"] = batch_log_message
-                        pipeline_status["history_messages"].append(batch_log_message)
-                        
-                        # Create tasks for current batch
-                        batch_tasks = []
-                        for doc_id, status_doc in batch_docs:
-                            batch_tasks.append(
-                                process_document(
-                                    doc_id,
-                                    status_doc,
-                                    split_by_character,
-                                    split_by_character_only,
-                                    pipeline_status,
-                                    pipeline_status_lock,
-                                    semaphore,
-                                )
+                    for index, (doc_id, status_doc) in enumerate(doc_items):
+                        if index % batch_size == 0:
+                            # Check for cancellation before starting each batch
+                            try:
+                                await check_cancellation()
+                            except PipelineCancelledException:
+                                cancelled = True
+                                break
+
+                            batch_log_message = f"Processing batch {index // batch_size + 1}/{total_batches} ({len(doc_items[index : index + batch_size])} documents)"
+                            logger.info(batch_log_message)
+                            pipeline_status["latest_message"] = batch_log_message
+                            pipeline_status["history_messages"].append(
+                                batch_log_message
                             )
-                        
-                        # Process current batch in parallel
-                        await asyncio.gather(*batch_tasks)
-                        
-                        batch_complete_message = f"Completed batch {current_batch_num}/{total_batches}"
-                        logger.info(batch_complete_message)
-                        pipeline_status["history_messages"].append(batch_complete_message)
-                except PipelineCancelledException:
-                    # Cancellation is handled within each batch processing loop
-                    # Document statuses are already updated in process_document
+
+                        await stage_queues["chunk"].put(
+                            {
+                                "doc_id": doc_id,
+                                "status_doc": status_doc,
+                                "file_path": getattr(
+                                    status_doc, "file_path", "unknown_source"
+                                ),
+                                "current_file_number": 0,
+                                "processing_start_time": int(time.time()),
+                            }
+                        )
+                        report_queue_depths()
+                except BaseException:
+                    for workers in stage_workers:
+                        for worker in workers:
+                            worker.cancel()
+                    raise
+
+                # Drain the stages in order: each stage's workers finish before
+                # the next stage is told that no more documents will arrive
+                for (stage, *_), workers in zip(stages, stage_workers):
+                    for _ in workers:
+                        await stage_queues[stage].put(None)
+                    await asyncio.gather(*workers)
+                report_queue_depths()
+
+                if cancelled:
+                    # Document statuses of in-flight documents are updated by the stages
                     log_message = "Document processing cancelled by user"
                     logger.info(log_message)
                     pipeline_status["latest_message"] = log_message
@@ -2176,6 +2500,8 @@ class LightRAG:
             if storage_inst is not None
         ]
         await asyncio.gather(*tasks)
+        # Invalidate cached retrieval results of this workspace
+        await bump_data_version(self.workspace)
 
         log_message = "In memory DB persist to disk"
         logger.info(log_message)
@@ -2828,6 +3154,7 @@ class LightRAG:
 
         try:
             # Clear all cache using drop method
+            await llm_cache_l1.invalidate(self.llm_response_cache)
             success = await self.llm_response_cache.drop()
             if success:
                 logger.info("Cleared all cache")
@@ -3282,7 +3609,11 @@ class LightRAG:
                     if entity_delete_ids:
                         await self.entity_chunks.delete(list(entity_delete_ids))
                     if entity_upsert_payload:
-                        await self.entity_chunks.upsert(entity_upsert_payload)
+                        await self.entity_chunks.upsert(
+                            await preserve_description_reservoirs(
+                                self.entity_chunks, entity_upsert_payload
+                            )
+                        )
 
                 if relation_chunk_updates and self.relation_chunks:
                     relation_upsert_payload = {}
@@ -3301,7 +3632,11 @@ class LightRAG:
                     if relation_delete_ids:
                         await self.relation_chunks.delete(list(relation_delete_ids))
                     if relation_upsert_payload:
-                        await self.relation_chunks.upsert(relation_upsert_payload)
+                        await self.relation_chunks.upsert(
+                            await preserve_description_reservoirs(
+                                self.relation_chunks, relation_upsert_payload
+                            )
+                        )
 
             except Exception as e:
                 logger.error(f"Failed to process graph analysis results: {e}")
@@ -3368,12 +3703,10 @@ class LightRAG:
                     try:
                         # Debug: Check and log all edges before deleting nodes
                         edges_still_exist = 0
-                        for entity in entities_to_delete:
-                            edges = (
-                                await self.chunk_entity_relation_graph.get_node_edges(
-                                    entity
-                                )
-                            )
+                        remaining_edges = await self.chunk_entity_relation_graph.get_nodes_edges_batch(
+                            list(entities_to_delete)
+                        )
+                        for edges in remaining_edges.values():
                             if edges:
                                 for src, tgt in edges:
                                     if (
@@ -3468,6 +3801,9 @@ class LightRAG:
 
             if delete_llm_cache and doc_llm_cache_ids and self.llm_response_cache:
                 try:
+                    await llm_cache_l1.invalidate(
+                        self.llm_response_cache, doc_llm_cache_ids
+                    )
                     await self.llm_response_cache.delete(doc_llm_cache_ids)
                     cache_log_message = f"Successfully deleted {len(doc_llm_cache_ids)} LLM cache entries for document {doc_id}"
                     logger.info(cache_log_message)
@@ -3606,6 +3942,25 @@ class LightRAG:
         """
         return await self.doc_status.get_status_counts()
 
+    def get_concurrency_status(self) -> dict[str, dict[str, Any] | None]:
+        """Get current concurrency limits and queue depths of LLM and embedding calls
+
+        Returns:
+            Dict with the stats of the "llm" and "embedding" call queues
+        """
+        return {
+            "llm": (
+                self.llm_model_func.get_stats()
+                if hasattr(self.llm_model_func, "get_stats")
+                else None
+            ),
+            "embedding": (
+                self.embedding_func.get_stats()
+                if hasattr(self.embedding_func, "get_stats")
+                else None
+            ),
+        }
+
     async def aget_docs_by_track_id(
         self, track_id: str
     ) -> dict[str, DocProcessingStatus]:
@@ -26,6 +26,8 @@ from lightrag.utils import (
     wrap_embedding_func_with_attrs,
     safe_unicode_decode,
     logger,
+    report_rate_limit_headers,
+    report_rate_limited,
 )
 from lightrag.types import GPTKeywordExtractionFormat
 from lightrag.api import __api_version__
@@ -205,19 +207,26 @@ async def openai_complete_if_cache(
                 model=model, messages=messages, **kwargs
             )
         else:
-            response = await openai_async_client.chat.completions.create(
-                model=model, messages=messages, **kwargs
+            # Raw response exposes the x-ratelimit-* headers for concurrency control
+            raw_response = (
+                await openai_async_client.chat.completions.with_raw_response.create(
+                    model=model, messages=messages, **kwargs
+                )
             )
+            report_rate_limit_headers(raw_response.headers)
+            response = raw_response.parse()
     except APIConnectionError as e:
         logger.error(f"OpenAI API Connection Error: {e}")
         await openai_async_client.close()  # Ensure client is closed
         raise
     except RateLimitError as e:
         logger.error(f"OpenAI API Rate Limit Error: {e}")
+        report_rate_limited("RateLimitError")
         await openai_async_client.close()  # Ensure client is closed
         raise
     except APITimeoutError as e:
         logger.error(f"OpenAI API Timeout Error: {e}")
+        report_rate_limited("APITimeoutError")
         await openai_async_client.close()  # Ensure client is closed
         raise
     except Exception as e:
@@ -607,9 +616,17 @@ async def openai_embed(
     )
 
     async with openai_async_client:
-        response = await openai_async_client.embeddings.create(
-            model=model, input=texts, encoding_format="base64"
-        )
+        try:
+            raw_response = (
+                await openai_async_client.embeddings.with_raw_response.create(
+                    model=model, input=texts, encoding_format="base64"
+                )
+            )
+        except (RateLimitError, APITimeoutError) as e:
+            report_rate_limited(type(e).__name__)
+            raise
+        report_rate_limit_headers(raw_response.headers)
+        response = raw_response.parse()
 
         if token_tracker and hasattr(response, "usage"):
             token_counts = {
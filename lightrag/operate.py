@@ -3,15 +3,26 @@ from functools import partial
 from pathlib import Path
 
 import asyncio
+import copy
 import json
 import json_repair
-from typing import Any, AsyncIterator, overload, Literal
+import numpy as np
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    overload,
+    Literal,
+)
 from collections import Counter, defaultdict
 
 from lightrag.exceptions import PipelineCancelledException
 from lightrag.utils import (
     logger,
     compute_mdhash_id,
+    sanitize_text_for_encoding,
     Tokenizer,
     is_float_regex,
     sanitize_and_normalize_extracted_text,
@@ -23,7 +34,7 @@ from lightrag.utils import (
     save_to_cache,
     CacheData,
     use_llm_func_with_cache,
-    update_chunk_cache_list,
+    update_chunks_cache_lists,
     remove_think_tags,
     pick_by_weighted_polling,
     pick_by_vector_similarity,
@@ -36,6 +47,13 @@ from lightrag.utils import (
     apply_source_ids_limit,
     merge_source_ids,
     make_relation_chunk_key,
+    update_description_reservoir,
+    preserve_description_reservoirs,
+    GraphUpsertBatcher,
+    RoundRobinSemaphore,
+    statistic_data,
+    top_k_cosine,
+    get_llm_cache_hit_rates,
 )
 from lightrag.base import (
     BaseGraphStorage,
@@ -61,8 +79,18 @@ from lightrag.constants import (
     DEFAULT_FILE_PATH_MORE_PLACEHOLDER,
     DEFAULT_MAX_FILE_PATHS,
     DEFAULT_ENTITY_NAME_MAX_LENGTH,
+    DEFAULT_SEMANTIC_QUERY_CACHE_THRESHOLD,
+    DEFAULT_SEMANTIC_QUERY_CACHE_MAX_ENTRIES,
+    SUMMARY_MODE_DEFERRED,
+    SUMMARY_PENDING_FIELD,
+    VECTOR_PRECOMPUTED_FIELD,
+)
+from lightrag.kg.shared_storage import (
+    get_storage_keyed_lock,
+    get_namespace_data,
+    get_data_version,
+    is_multiprocess,
 )
-from lightrag.kg.shared_storage import get_storage_keyed_lock
 import time
 from dotenv import load_dotenv
 
@@ -93,6 +121,149 @@ def _truncate_entity_identifier(
     return display_value
 
 
+# Characters tokenized per call when streaming a document through the chunker
+_CHUNK_SEGMENT_CHARS = 64 * 1024
+
+
+def _find_segment_cut(content: str, start: int, end: int) -> int:
+    """Last position in (start, end) holding a single space or newline between two
+    non-whitespace characters, or -1 if there is none. A newline must follow a
+    letter or digit, as punctuation absorbs the newlines after it into one piece."""
+    space = content.rfind(" ", start + 1, end)
+    newline = content.rfind("\n", start + 1, end)
+    while max(space, newline) > start:
+        pos = max(space, newline)
+        before = content[pos - 1]
+        if (
+            not before.isspace()
+            and not content[pos + 1].isspace()
+            and (pos == space or before.isalnum())
+        ):
+            return pos
+        if pos == space:
+            space = content.rfind(" ", start + 1, pos)
+        else:
+            newline = content.rfind("\n", start + 1, pos)
+    return -1
+
+
+def _iter_text_segments(
+    content: str, segment_size: int = _CHUNK_SEGMENT_CHARS
+) -> Iterator[str]:
+    """Split content into consecutive segments of up to segment_size characters
+
+    Segments are cut before a single space between two non-whitespace characters,
+    or before a single newline between a letter or digit and a non-whitespace
+    character. The pre-tokenizers of BPE tokenizers (tiktoken, GPT-2 style) always
+    start a new piece there, so the segments tokenize exactly like the whole text. Whitespace runs are never split. Only when the second
+    half of a segment has no such position (e.g. long text without spaces) is it
+    cut hard, where the token count at that boundary may differ slightly.
+    """
+    start = 0
+    length = len(content)
+    while start < length:
+        end = start + segment_size
+        if end >= length:
+            yield content[start:]
+            return
+        cut = _find_segment_cut(content, max(start, end - segment_size // 2), end)
+        if cut < 0:
+            cut = end
+        yield content[start:cut]
+        start = cut
+
+
+def iter_chunks_by_token_size(
+    tokenizer: Tokenizer,
+    segments: Iterable[str],
+    overlap_token_size: int = 128,
+    max_token_size: int = 1024,
+    base_offset: int = 0,
+    whole_if_fits: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Stream token windows over a sequence of text segments
+
+    Each segment is tokenized once with character offsets, and chunk content is
+    sliced from the source text instead of being decoded from tokens, so chunks
+    never contain broken multi-byte characters. Only the tokens and text of the
+    window being built are kept in memory.
+
+    Args:
+        tokenizer: Tokenizer used to count tokens
+        segments: Consecutive pieces of the text to chunk
+        overlap_token_size: Number of tokens shared by consecutive chunks
+        max_token_size: Maximum number of tokens per chunk
+        base_offset: Character offset of the first segment in the document
+        whole_if_fits: Yield a single chunk when the whole text fits in
+            max_token_size, instead of also yielding the overlapping tail window
+
+    Yields:
+        Chunk dicts with tokens, content, start_offset and end_offset. Offsets are
+        None when the tokenizer cannot map tokens back to the text, in which case
+        content is decoded from the tokens.
+    """
+    step = max_token_size - overlap_token_size
+    if step <= 0:
+        raise ValueError(
+            f"overlap_token_size ({overlap_token_size}) must be smaller than "
+            f"max_token_size ({max_token_size})"
+        )
+    tokens: list[int] = []
+    offsets: list[int | None] = []
+    text = ""
+    text_base = base_offset
+    text_end = base_offset
+    windowed = False
+
+    def make_chunk(start: int, end: int) -> dict[str, Any]:
+        start_offset = offsets[start]
+        end_offset = offsets[end] if end < len(tokens) else text_end
+        if start_offset is None or end_offset is None:
+            return {
+                "tokens": end - start,
+                "content": tokenizer.decode(tokens[start:end]).strip(),
+                "start_offset": None,
+                "end_offset": None,
+            }
+        raw = text[start_offset - text_base : end_offset - text_base]
+        content = raw.lstrip()
+        start_offset += len(raw) - len(content)
+        content = content.rstrip()
+        return {
+            "tokens": end - start,
+            "content": content,
+            "start_offset": start_offset,
+            "end_offset": start_offset + len(content),
+        }
+
+    for segment in segments:
+        segment_tokens, segment_offsets = tokenizer.encode_with_offsets(segment)
+        tokens.extend(segment_tokens)
+        if segment_offsets is None:
+            offsets.extend([None] * len(segment_tokens))
+        else:
+            offsets.extend(text_end + offset for offset in segment_offsets)
+        text += segment
+        text_end += len(segment)
+
+        # A window is final once the token following it is known
+        while len(tokens) > max_token_size:
+            windowed = True
+            yield make_chunk(0, max_token_size)
+            del tokens[:step]
+            del offsets[:step]
+            if offsets[0] is not None:
+                text = text[offsets[0] - text_base :]
+                text_base = offsets[0]
+
+    if whole_if_fits and not windowed:
+        if tokens:
+            yield make_chunk(0, len(tokens))
+        return
+    for start in range(0, len(tokens), step):
+        yield make_chunk(start, min(start + max_token_size, len(tokens)))
+
+
 def chunking_by_token_size(
     tokenizer: Tokenizer,
     content: str,
@@ -101,53 +272,113 @@ def chunking_by_token_size(
     overlap_token_size: int = 128,
     max_token_size: int = 1024,
 ) -> list[dict[str, Any]]:
-    tokens = tokenizer.encode(content)
     results: list[dict[str, Any]] = []
     if split_by_character:
-        raw_chunks = content.split(split_by_character)
-        new_chunks = []
-        if split_by_character_only:
-            for chunk in raw_chunks:
-                _tokens = tokenizer.encode(chunk)
-                new_chunks.append((len(_tokens), chunk))
-        else:
-            for chunk in raw_chunks:
-                _tokens = tokenizer.encode(chunk)
-                if len(_tokens) > max_token_size:
-                    for start in range(
-                        0, len(_tokens), max_token_size - overlap_token_size
-                    ):
-                        chunk_content = tokenizer.decode(
-                            _tokens[start : start + max_token_size]
-                        )
-                        new_chunks.append(
-                            (min(max_token_size, len(_tokens) - start), chunk_content)
-                        )
-                else:
-                    new_chunks.append((len(_tokens), chunk))
-        for index, (_len, chunk) in enumerate(new_chunks):
-            results.append(
-                {
-                    "tokens": _len,
-                    "content": chunk.strip(),
-                    "chunk_order_index": index,
-                }
-            )
+        piece_offset = 0
+        for piece in content.split(split_by_character):
+            if split_by_character_only:
+                content_start = piece_offset + len(piece) - len(piece.lstrip())
+                chunk_content = piece.strip()
+                piece_chunks = [
+                    {
+                        "tokens": len(tokenizer.encode(piece)),
+                        "content": chunk_content,
+                        "start_offset": content_start,
+                        "end_offset": content_start + len(chunk_content),
+                    }
+                ]
+            else:
+                piece_chunks = list(
+                    iter_chunks_by_token_size(
+                        tokenizer,
+                        _iter_text_segments(piece),
+                        overlap_token_size,
+                        max_token_size,
+                        base_offset=piece_offset,
+                        # A piece that fits is kept as one chunk
+                        whole_if_fits=True,
+                    )
+                ) or [
+                    {
+                        "tokens": 0,
+                        "content": "",
+                        "start_offset": piece_offset,
+                        "end_offset": piece_offset,
+                    }
+                ]
+            results.extend(piece_chunks)
+            piece_offset += len(piece) + len(split_by_character)
     else:
-        for index, start in enumerate(
-            range(0, len(tokens), max_token_size - overlap_token_size)
-        ):
-            chunk_content = tokenizer.decode(tokens[start : start + max_token_size])
-            results.append(
-                {
-                    "tokens": min(max_token_size, len(tokens) - start),
-                    "content": chunk_content.strip(),
-                    "chunk_order_index": index,
-                }
+        results.extend(
+            iter_chunks_by_token_size(
+                tokenizer,
+                _iter_text_segments(content),
+                overlap_token_size,
+                max_token_size,
             )
+        )
+    for index, chunk in enumerate(results):
+        chunk["chunk_order_index"] = index
     return results
 
 
+def build_document_chunks(
+    chunking_func: Callable[..., list[dict[str, Any]]],
+    tokenizer: Tokenizer,
+    content: str,
+    doc_id: str,
+    file_path: str,
+    split_by_character: str | None,
+    split_by_character_only: bool,
+    overlap_token_size: int,
+    max_token_size: int,
+) -> dict[str, dict[str, Any]]:
+    """Chunk a document and build the text chunk records keyed by chunk ID
+
+    Pure CPU work (chunking, sanitization, hashing) so it can run in a worker
+    thread or process.
+    """
+    chunks: dict[str, dict[str, Any]] = {}
+    for dp in chunking_func(
+        tokenizer,
+        content,
+        split_by_character,
+        split_by_character_only,
+        overlap_token_size,
+        max_token_size,
+    ):
+        dp["content"] = sanitize_text_for_encoding(dp["content"])
+        chunks[compute_mdhash_id(dp["content"], prefix="chunk-")] = {
+            **dp,
+            "full_doc_id": doc_id,
+            "file_path": file_path,  # Add file path to each chunk
+            "llm_cache_list": [],  # Initialize empty LLM cache list for each chunk
+        }
+    return chunks
+
+
+# Chunking function and tokenizer of a chunking worker process, set once by
+# init_chunking_worker so they are not pickled with every document
+_chunking_worker_state: dict[str, Any] = {}
+
+
+def init_chunking_worker(
+    chunking_func: Callable[..., list[dict[str, Any]]], tokenizer: Tokenizer
+) -> None:
+    """ProcessPoolExecutor initializer for chunking workers"""
+    _chunking_worker_state["chunking_func"] = chunking_func
+    _chunking_worker_state["tokenizer"] = tokenizer
+
+
+def build_document_chunks_in_worker(*args: Any) -> dict[str, dict[str, Any]]:
+    """Run build_document_chunks with the state of init_chunking_worker"""
+    return build_document_chunks(
+        _chunking_worker_state["chunking_func"],
+        _chunking_worker_state["tokenizer"],
+        *args,
+    )
+
+
 async def _handle_entity_relation_summary(
     description_type: str,
     entity_or_relation_name: str,
@@ -191,10 +422,18 @@ async def _handle_entity_relation_summary(
     current_list = description_list[:]  # Copy the list to avoid modifying original
     llm_was_used = False  # Track whether LLM was used during the entire process
 
+    # Token count of every description seen, so each string is encoded only once
+    token_counts: dict[str, int] = {}
+
+    def count_tokens(desc: str) -> int:
+        if desc not in token_counts:
+            token_counts[desc] = len(tokenizer.encode(desc))
+        return token_counts[desc]
+
     # Iterative map-reduce process
     while True:
         # Calculate total tokens in current list
-        total_tokens = sum(len(tokenizer.encode(desc)) for desc in current_list)
+        total_tokens = sum(count_tokens(desc) for desc in current_list)
 
         # If total length is within limits, perform final summarization
         if total_tokens <= summary_context_size or len(current_list) <= 2:
@@ -228,7 +467,7 @@ async def _handle_entity_relation_summary(
 
         # Currently least 3 descriptions in current_list
         for i, desc in enumerate(current_list):
-            desc_tokens = len(tokenizer.encode(desc))
+            desc_tokens = count_tokens(desc)
 
             # If adding current description would exceed limit, finalize current chunk
             if current_tokens + desc_tokens > summary_context_size and current_chunk:
@@ -258,23 +497,34 @@ async def _handle_entity_relation_summary(
             f"   Summarizing {entity_or_relation_name}: Map {len(current_list)} descriptions into {len(chunks)} groups"
         )
 
-        # Reduce phase: summarize each group from chunks
-        new_summaries = []
-        for chunk in chunks:
-            if len(chunk) == 1:
-                # Optimization: single description chunks don't need LLM summarization
-                new_summaries.append(chunk[0])
-            else:
-                # Multiple descriptions need LLM summarization
-                summary = await _summarize_descriptions(
+        # Reduce phase: summarize all groups concurrently; the number of LLM
+        # calls in flight is bounded by the shared LLM function limiter
+        summary_tasks = {
+            index: asyncio.create_task(
+                _summarize_descriptions(
                     description_type,
                     entity_or_relation_name,
                     chunk,
                     global_config,
                     llm_response_cache,
                 )
-                new_summaries.append(summary)
-                llm_was_used = True  # Mark that LLM was used in reduce phase
+            )
+            for index, chunk in enumerate(chunks)
+            # Optimization: single description chunks don't need LLM summarization
+            if len(chunk) > 1
+        }
+        try:
+            await asyncio.gather(*summary_tasks.values())
+        except BaseException:
+            for task in summary_tasks.values():
+                task.cancel()
+            raise
+        if summary_tasks:
+            llm_was_used = True  # Mark that LLM was used in reduce phase
+        new_summaries = [
+            summary_tasks[index].result() if index in summary_tasks else chunk[0]
+            for index, chunk in enumerate(chunks)
+        ]
 
         # Update current list with new summaries for next iteration
         current_list = new_summaries
@@ -1116,12 +1366,15 @@ async def _rebuild_single_entity(
 
     if entity_chunks_storage is not None and normalized_chunk_ids:
         await entity_chunks_storage.upsert(
-            {
-                entity_name: {
-                    "chunk_ids": normalized_chunk_ids,
-                    "count": len(normalized_chunk_ids),
-                }
-            }
+            await preserve_description_reservoirs(
+                entity_chunks_storage,
+                {
+                    entity_name: {
+                        "chunk_ids": normalized_chunk_ids,
+                        "count": len(normalized_chunk_ids),
+                    }
+                },
+            )
         )
 
     limit_method = (
@@ -1315,12 +1568,15 @@ async def _rebuild_single_relationship(
     if relation_chunks_storage is not None and normalized_chunk_ids:
         storage_key = make_relation_chunk_key(src, tgt)
         await relation_chunks_storage.upsert(
-            {
-                storage_key: {
-                    "chunk_ids": normalized_chunk_ids,
-                    "count": len(normalized_chunk_ids),
-                }
-            }
+            await preserve_description_reservoirs(
+                relation_chunks_storage,
+                {
+                    storage_key: {
+                        "chunk_ids": normalized_chunk_ids,
+                        "count": len(normalized_chunk_ids),
+                    }
+                },
+            )
         )
 
     limit_method = (
@@ -1562,6 +1818,592 @@ async def _rebuild_single_relationship(
             pipeline_status["history_messages"].append(status_message)
 
 
+# Entities/relations whose merged descriptions await deferred summarization,
+# per workspace. Keys: ("entity", name) or ("relation", src_id, tgt_id)
+_summary_dirty: dict[str, dict[tuple[str, ...], None]] = {}
+
+
+def _defer_description_summary(
+    global_config: dict, description_list: list[str]
+) -> bool:
+    """Whether summarizing description_list is left to the deferred summary worker"""
+    return (
+        global_config.get("summary_mode") == SUMMARY_MODE_DEFERRED
+        and len(description_list) > 1
+    )
+
+
+def _summary_pending_fields(global_config: dict, summary_deferred: bool) -> dict:
+    """Graph properties persisting whether a merged item awaits deferred summarization"""
+    if global_config.get("summary_mode") != SUMMARY_MODE_DEFERRED:
+        return {}
+    return {SUMMARY_PENDING_FIELD: "1" if summary_deferred else ""}
+
+
+def _mark_summary_dirty(global_config: dict, key: tuple[str, ...]) -> None:
+    workspace = global_config.get("workspace", "")
+    _summary_dirty.setdefault(workspace, {})[key] = None
+
+
+async def load_deferred_summaries(
+    knowledge_graph_inst: BaseGraphStorage, global_config: dict
+) -> int:
+    """Mark entities and relations left pending by a previous run as dirty again
+
+    Returns:
+        Number of entities and relations found waiting for deferred summarization
+    """
+    found = 0
+    async for node in knowledge_graph_inst.iter_all_nodes():
+        entity_name = node.get("entity_id") or node.get("id")
+        if entity_name and node.get(SUMMARY_PENDING_FIELD):
+            _mark_summary_dirty(global_config, ("entity", entity_name))
+            found += 1
+    async for edge in knowledge_graph_inst.iter_all_edges():
+        src = edge.get("source") or edge.get("src_id") or edge.get("src")
+        tgt = edge.get("target") or edge.get("tgt_id") or edge.get("tgt")
+        if src and tgt and edge.get(SUMMARY_PENDING_FIELD):
+            _mark_summary_dirty(global_config, ("relation", src, tgt))
+            found += 1
+    if found:
+        logger.info(
+            f"Deferred summary: {found} entities/relations pending from last run"
+        )
+    return found
+
+
+def count_deferred_summaries(workspace: str = "") -> int:
+    """Number of entities and relations waiting for deferred summarization"""
+    return len(_summary_dirty.get(workspace, {}))
+
+
+async def _summarize_deferred_item(
+    key: tuple[str, ...],
+    knowledge_graph_inst: BaseGraphStorage,
+    entity_vdb: BaseVectorStorage | None,
+    relationships_vdb: BaseVectorStorage | None,
+    global_config: dict,
+    llm_response_cache: BaseKVStorage | None,
+) -> bool:
+    """Summarize the stored description of one entity or relation and embed it
+
+    The LLM call runs without the keyed lock; the result is only written if the
+    description did not change meanwhile (a newer merge marks the item dirty again).
+    Merges skip the VDB write while an item is pending, so it is always written here.
+    """
+    is_entity = key[0] == "entity"
+    if is_entity:
+        record = await knowledge_graph_inst.get_node(key[1])
+        description_name = key[1]
+    else:
+        record = await knowledge_graph_inst.get_edge(key[1], key[2])
+        description_name = f"({key[1]}, {key[2]})"
+    if not record or not record.get("description"):
+        return False
+
+    stored_description = record["description"]
+    description, _ = await _handle_entity_relation_summary(
+        "Entity" if is_entity else "Relation",
+        description_name,
+        stored_description.split(GRAPH_FIELD_SEP),
+        GRAPH_FIELD_SEP,
+        global_config,
+        llm_response_cache,
+    )
+
+    workspace = global_config.get("workspace", "")
+    namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
+    async with get_storage_keyed_lock(
+        sorted(key[1:]), namespace=namespace, enable_logging=False
+    ):
+        if is_entity:
+            current = await knowledge_graph_inst.get_node(key[1])
+        else:
+            current = await knowledge_graph_inst.get_edge(key[1], key[2])
+        if not current or current.get("description") != stored_description:
+            return False
+
+        updated = {**current, "description": description, SUMMARY_PENDING_FIELD: ""}
+        if is_entity:
+            entity_name = key[1]
+            await knowledge_graph_inst.upsert_node(entity_name, node_data=updated)
+            _get_merge_write_log(workspace).mark_written(_node_write_key(entity_name))
+            if entity_vdb is not None:
+                data_for_vdb = {
+                    compute_mdhash_id(str(entity_name), prefix="ent-"): {
+                        "entity_name": entity_name,
+                        "entity_type": updated.get("entity_type", "UNKNOWN"),
+                        "content": f"{entity_name}\n{description}",
+                        "source_id": updated.get("source_id", ""),
+                        "file_path": updated.get("file_path", "unknown_source"),
+                    }
+                }
+                await safe_vdb_operation_with_exception(
+                    operation=lambda payload=data_for_vdb: entity_vdb.upsert(payload),
+                    operation_name="deferred_entity_summary",
+                    entity_name=entity_name,
+                    max_retries=3,
+                    retry_delay=0.1,
+                )
+        else:
+            await knowledge_graph_inst.upsert_edge(key[1], key[2], edge_data=updated)
+            _get_merge_write_log(workspace).mark_written(
+                _edge_write_key(key[1], key[2])
+            )
+            if relationships_vdb is not None:
+                src_id, tgt_id = sorted(key[1:])
+                keywords = updated.get("keywords", "")
+                data_for_vdb = {
+                    compute_mdhash_id(src_id + tgt_id, prefix="rel-"): {
+                        "src_id": src_id,
+                        "tgt_id": tgt_id,
+                        "source_id": updated.get("source_id", ""),
+                        "content": f"{keywords}\t{src_id}\n{tgt_id}\n{description}",
+                        "keywords": keywords,
+                        "description": description,
+                        "weight": updated.get("weight", 1.0),
+                        "file_path": updated.get("file_path", "unknown_source"),
+                    }
+                }
+                await safe_vdb_operation_with_exception(
+                    operation=lambda payload=data_for_vdb: relationships_vdb.upsert(
+                        payload
+                    ),
+                    operation_name="deferred_relation_summary",
+                    entity_name=f"{src_id}-{tgt_id}",
+                    max_retries=3,
+                    retry_delay=0.2,
+                )
+    return description != stored_description
+
+
+async def summarize_deferred_descriptions(
+    knowledge_graph_inst: BaseGraphStorage,
+    entity_vdb: BaseVectorStorage | None,
+    relationships_vdb: BaseVectorStorage | None,
+    global_config: dict,
+    llm_response_cache: BaseKVStorage | None = None,
+) -> int:
+    """Summarize every entity and relation marked dirty by deferred-mode merges
+
+    Updates of the same entity or relation by any number of documents since the
+    last run are coalesced into one summary and one re-embedding.
+
+    Returns:
+        Number of entities and relations whose description was rewritten
+    """
+    workspace = global_config.get("workspace", "")
+    dirty = _summary_dirty.pop(workspace, None)
+    if not dirty:
+        return 0
+
+    logger.info(f"Deferred summary: {len(dirty)} entities/relations to summarize")
+    semaphore = asyncio.Semaphore(global_config.get("llm_model_max_async", 4) * 2)
+
+    finished: set[tuple[str, ...]] = set()
+
+    async def _run(key: tuple[str, ...]) -> bool:
+        async with semaphore:
+            try:
+                summarized = await _summarize_deferred_item(
+                    key,
+                    knowledge_graph_inst,
+                    entity_vdb,
+                    relationships_vdb,
+                    global_config,
+                    llm_response_cache,
+                )
+            except Exception as e:
+                logger.error(f"Deferred summary failed for {key[1:]}: {e}")
+                # Retry on the next run
+                _mark_summary_dirty(global_config, key)
+                summarized = False
+            finished.add(key)
+            return summarized
+
+    try:
+        results = await asyncio.gather(*(_run(key) for key in dirty))
+    except asyncio.CancelledError:
+        # Keep the items this run did not finish for the next run
+        for key in dirty:
+            if key not in finished:
+                _mark_summary_dirty(global_config, key)
+        raise
+    summarized = sum(results)
+    logger.info(f"Deferred summary: rewrote {summarized} descriptions")
+    return summarized
+
+
+async def _get_vdb_record(vdb: BaseVectorStorage, record_id: str) -> dict | None:
+    try:
+        return await vdb.get_by_id(record_id)
+    except Exception:
+        return None
+
+
+async def _reuse_stored_embedding(
+    vdb: BaseVectorStorage,
+    record_id: str,
+    record: dict[str, Any],
+    stored: dict | None,
+    merge_stats: dict[str, int] | None = None,
+) -> bool:
+    """Avoid embedding a VDB record whose embedded content is already stored
+
+    The embedded text is kept in the "content" meta field of every backend, so it
+    is compared directly. Returns True when the stored record is unchanged and needs
+    no write. When only other meta fields changed (e.g. source_id gained a chunk),
+    the stored vector is attached to record under VECTOR_PRECOMPUTED_FIELD so the
+    upsert writes the new metadata without calling the embedding function.
+    """
+    if not stored or stored.get("content") != record.get("content"):
+        return False
+    unchanged = all(
+        stored[field_name] == value
+        for field_name, value in record.items()
+        if field_name in vdb.meta_fields and field_name in stored
+    )
+    if not unchanged:
+        try:
+            vector = (await vdb.get_vectors_by_ids([record_id])).get(record_id)
+        except Exception:
+            vector = None
+        if vector is None:
+            return False
+        record[VECTOR_PRECOMPUTED_FIELD] = vector
+    if merge_stats is not None:
+        merge_stats["embedding_skipped"] += 1
+    return unchanged
+
+
+def _add_descriptions_to_reservoir(
+    chunks_record: dict[str, Any],
+    stored_chunks: dict[str, Any] | None,
+    items_data: list[dict],
+    global_config: dict,
+) -> None:
+    """Sample the new raw descriptions into the record's bounded description reservoir
+
+    Summaries replace raw descriptions in the graph, and each merge only feeds the
+    previous summary plus the new descriptions to the LLM. The reservoir keeps a
+    uniform sample of raw descriptions so a summary can still be rebuilt from them.
+    """
+    reservoir_size = global_config.get("description_reservoir_size", 0)
+    if reservoir_size <= 0:
+        return
+    stored_chunks = stored_chunks if isinstance(stored_chunks, dict) else {}
+    reservoir, seen_count = update_description_reservoir(
+        stored_chunks.get("descriptions"),
+        stored_chunks.get("description_count") or 0,
+        (dp.get("description") for dp in items_data),
+        reservoir_size,
+    )
+    chunks_record["descriptions"] = reservoir
+    chunks_record["description_count"] = seen_count
+
+
+class _MergeWriteLog:
+    """Sequence of graph keys written by merges and deferred summaries in a workspace
+
+    Merge phases load existing data in bulk before taking the per-key locks, so a
+    document merged concurrently may rewrite a key in between. A prefetched value is
+    only used if its key was not written after the prefetch snapshot. Chunk-tracking
+    records staged by merges but not flushed yet are kept in ``pending_chunks``.
+    """
+
+    def __init__(self) -> None:
+        self._seq = 0
+        self._last_write: dict[tuple[str, ...], int] = {}
+        self._snapshots: Counter[int] = Counter()
+        self.pending_chunks: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def snapshot(self) -> int:
+        self._snapshots[self._seq] += 1
+        return self._seq
+
+    def release(self, snapshot: int) -> None:
+        self._snapshots[snapshot] -= 1
+        if self._snapshots[snapshot] <= 0:
+            del self._snapshots[snapshot]
+        if not self._snapshots:
+            self._last_write.clear()
+            return
+        oldest = min(self._snapshots)
+        self._last_write = {
+            key: seq for key, seq in self._last_write.items() if seq > oldest
+        }
+
+    def mark_written(self, key: tuple[str, ...]) -> None:
+        # Nothing to invalidate while no prefetch is in flight
+        if self._snapshots:
+            self._seq += 1
+            self._last_write[key] = self._seq
+
+    def written_since(self, key: tuple[str, ...], snapshot: int) -> bool:
+        return self._last_write.get(key, 0) > snapshot
+
+
+_merge_write_logs: dict[str, _MergeWriteLog] = {}
+
+
+def _get_merge_write_log(workspace: str) -> _MergeWriteLog:
+    write_log = _merge_write_logs.get(workspace)
+    if write_log is None:
+        write_log = _merge_write_logs[workspace] = _MergeWriteLog()
+    return write_log
+
+
+def _node_write_key(entity_name: str) -> tuple[str, ...]:
+    return ("node", entity_name)
+
+
+def _edge_write_key(src_id: str, tgt_id: str) -> tuple[str, ...]:
+    return ("edge", *sorted((src_id, tgt_id)))
+
+
+def mark_graph_written(
+    workspace: str,
+    entity_names: Iterable[str] = (),
+    edge_pairs: Iterable[tuple[str, str]] = (),
+) -> None:
+    """Record nodes and edges written outside of merges, e.g. by the graph-edit APIs
+
+    Call it after the writes, while still holding their keyed locks. Merge phases
+    that prefetched these keys earlier then read them again under their lock.
+    """
+    write_log = _get_merge_write_log(workspace)
+    for entity_name in entity_names:
+        write_log.mark_written(_node_write_key(entity_name))
+    for src_id, tgt_id in edge_pairs:
+        write_log.mark_written(_edge_write_key(src_id, tgt_id))
+
+
+class _MergePrefetch:
+    """Existing nodes, edges and chunk-tracking records loaded for one merge phase
+
+    Lookups fall back to point reads for keys that were not prefetched or were
+    written since. Chunk-tracking writes are staged and written in bulk by flush().
+
+    The write log and the staged records live in one process, so load() returns
+    None when several worker processes share the storages. Merges then read and
+    write every key under its keyed lock.
+    """
+
+    def __init__(
+        self,
+        write_log: _MergeWriteLog,
+        snapshot: int,
+        nodes: dict[str, dict | None],
+        edges: dict[tuple[str, str], dict | None],
+        entity_chunks: dict[str, dict | None],
+        relation_chunks: dict[str, dict | None],
+        vdb_records: dict[str, dict | None],
+    ) -> None:
+        self._write_log = write_log
+        self._snapshot = snapshot
+        self._nodes = nodes
+        self._edges = edges
+        self._entity_chunks = entity_chunks
+        self._relation_chunks = relation_chunks
+        self._vdb_records = vdb_records
+        self._staged: dict[str, tuple[BaseKVStorage, set[str]]] = {}
+
+    @classmethod
+    async def load(
+        cls,
+        global_config: dict,
+        knowledge_graph_inst: BaseGraphStorage,
+        node_names: list[str],
+        edge_pairs: list[tuple[str, str]],
+        entity_chunks_storage: BaseKVStorage | None,
+        relation_chunks_storage: BaseKVStorage | None,
+        entity_vdb: BaseVectorStorage | None = None,
+        relationships_vdb: BaseVectorStorage | None = None,
+    ) -> "_MergePrefetch | None":
+        if is_multiprocess():
+            # Writes of other processes would not invalidate prefetched values
+            return None
+        write_log = _get_merge_write_log(global_config.get("workspace", ""))
+        # Snapshot before reading so writes racing with the reads are detected
+        snapshot = write_log.snapshot()
+        try:
+            nodes: dict[str, dict | None] = dict.fromkeys(node_names)
+            if node_names:
+                nodes.update(await knowledge_graph_inst.get_nodes_batch(node_names))
+            edges: dict[tuple[str, str], dict | None] = dict.fromkeys(edge_pairs)
+            if edge_pairs:
+                edges.update(
+                    await knowledge_graph_inst.get_edges_batch(
+                        [{"src": src, "tgt": tgt} for src, tgt in edge_pairs]
+                    )
+                )
+            entity_chunks: dict[str, dict | None] = {}
+            if entity_chunks_storage is not None and node_names:
+                records = await entity_chunks_storage.get_by_ids(node_names)
+                entity_chunks = dict(zip(node_names, records))
+            relation_chunks: dict[str, dict | None] = {}
+            if relation_chunks_storage is not None and edge_pairs:
+                relation_keys = [
+                    make_relation_chunk_key(src, tgt) for src, tgt in edge_pairs
+                ]
+                records = await relation_chunks_storage.get_by_ids(relation_keys)
+                relation_chunks = dict(zip(relation_keys, records))
+            vdb_records: dict[str, dict | None] = {}
+            if entity_vdb is not None and node_names:
+                vdb_records.update(
+                    await cls._load_vdb_records(
+                        entity_vdb,
+                        [
+                            compute_mdhash_id(str(name), prefix="ent-")
+                            for name in node_names
+                        ],
+                    )
+                )
+            if relationships_vdb is not None and edge_pairs:
+                vdb_records.update(
+                    await cls._load_vdb_records(
+                        relationships_vdb,
+                        [
+                            compute_mdhash_id(src + tgt, prefix="rel-")
+                            for src, tgt in (sorted(pair) for pair in edge_pairs)
+                        ],
+                    )
+                )
+        except BaseException:
+            write_log.release(snapshot)
+            raise
+        return cls(
+            write_log,
+            snapshot,
+            nodes,
+            edges,
+            entity_chunks,
+            relation_chunks,
+            vdb_records,
+        )
+
+    @staticmethod
+    async def _load_vdb_records(
+        vdb: BaseVectorStorage, record_ids: list[str]
+    ) -> dict[str, dict | None]:
+        try:
+            records = await vdb.get_by_ids(record_ids)
+        except Exception:
+            return {}
+        # Some backends return an empty list instead of None placeholders
+        if records and len(records) != len(record_ids):
+            return {}
+        return dict.fromkeys(record_ids) | dict(zip(record_ids, records))
+
+    def _is_fresh(self, key: tuple[str, ...]) -> bool:
+        return not self._write_log.written_since(key, self._snapshot)
+
+    async def get_node(
+        self, knowledge_graph_inst: BaseGraphStorage, entity_name: str
+    ) -> dict | None:
+        if entity_name in self._nodes and self._is_fresh(_node_write_key(entity_name)):
+            return self._nodes[entity_name]
+        return await knowledge_graph_inst.get_node(entity_name)
+
+    async def get_edge(
+        self, knowledge_graph_inst: BaseGraphStorage, src_id: str, tgt_id: str
+    ) -> dict | None:
+        if (src_id, tgt_id) in self._edges and self._is_fresh(
+            _edge_write_key(src_id, tgt_id)
+        ):
+            return self._edges[(src_id, tgt_id)]
+        if await knowledge_graph_inst.has_edge(src_id, tgt_id):
+            return await knowledge_graph_inst.get_edge(src_id, tgt_id)
+        return None
+
+    async def get_vdb_record(
+        self, vdb: BaseVectorStorage, record_id: str, write_key: tuple[str, ...]
+    ) -> dict | None:
+        if record_id in self._vdb_records and self._is_fresh(write_key):
+            return self._vdb_records[record_id]
+        return await _get_vdb_record(vdb, record_id)
+
+    async def _get_chunks(
+        self,
+        storage: BaseKVStorage,
+        storage_key: str,
+        prefetched: dict[str, dict | None],
+        write_key: tuple[str, ...],
+    ) -> dict | None:
+        pending = self._write_log.pending_chunks.get((storage.namespace, storage_key))
+        if pending is not None:
+            return pending
+        if storage_key in prefetched and self._is_fresh(write_key):
+            return prefetched[storage_key]
+        return await storage.get_by_id(storage_key)
+
+    async def get_entity_chunks(
+        self, storage: BaseKVStorage, entity_name: str
+    ) -> dict | None:
+        return await self._get_chunks(
+            storage, entity_name, self._entity_chunks, _node_write_key(entity_name)
+        )
+
+    async def get_relation_chunks(
+        self, storage: BaseKVStorage, src_id: str, tgt_id: str
+    ) -> dict | None:
+        return await self._get_chunks(
+            storage,
+            make_relation_chunk_key(src_id, tgt_id),
+            self._relation_chunks,
+            _edge_write_key(src_id, tgt_id),
+        )
+
+    def _stage_chunks(
+        self, storage: BaseKVStorage, storage_key: str, record: dict[str, Any]
+    ) -> None:
+        self._write_log.pending_chunks[(storage.namespace, storage_key)] = record
+        self._staged.setdefault(storage.namespace, (storage, set()))[1].add(storage_key)
+
+    def stage_entity_chunks(
+        self, storage: BaseKVStorage, entity_name: str, record: dict[str, Any]
+    ) -> None:
+        self._stage_chunks(storage, entity_name, record)
+        self.node_written(entity_name)
+
+    def stage_relation_chunks(
+        self, storage: BaseKVStorage, src_id: str, tgt_id: str, record: dict[str, Any]
+    ) -> None:
+        self._stage_chunks(storage, make_relation_chunk_key(src_id, tgt_id), record)
+        self.edge_written(src_id, tgt_id)
+
+    def node_written(self, entity_name: str) -> None:
+        self._write_log.mark_written(_node_write_key(entity_name))
+
+    def edge_written(self, src_id: str, tgt_id: str) -> None:
+        self._write_log.mark_written(_edge_write_key(src_id, tgt_id))
+
+    async def flush(self) -> None:
+        """Write the staged chunk-tracking records with one upsert per storage"""
+        pending = self._write_log.pending_chunks
+        staged, self._staged = self._staged, {}
+        for namespace, (storage, storage_keys) in staged.items():
+            # A concurrent merge may have staged a newer record for the same key
+            batch = {
+                key: pending[(namespace, key)]
+                for key in storage_keys
+                if (namespace, key) in pending
+            }
+            if not batch:
+                continue
+            await storage.upsert(batch)
+            for key, record in batch.items():
+                if pending.get((namespace, key)) is record:
+                    del pending[(namespace, key)]
+
+    async def close(self) -> None:
+        """Flush staged chunk-tracking records and release the snapshot"""
+        try:
+            await self.flush()
+        finally:
+            self._write_log.release(self._snapshot)
+
+
 async def _merge_nodes_then_upsert(
     entity_name: str,
     nodes_data: list[dict],
@@ -1572,15 +2414,22 @@ async def _merge_nodes_then_upsert(
     pipeline_status_lock=None,
     llm_response_cache: BaseKVStorage | None = None,
     entity_chunks_storage: BaseKVStorage | None = None,
+    graph_writer: GraphUpsertBatcher | None = None,
+    merge_stats: dict[str, int] | None = None,
+    prefetch: _MergePrefetch | None = None,
 ):
     """Get existing nodes from knowledge graph use name,if exists, merge data, else create, then upsert."""
+    graph_writer = graph_writer or knowledge_graph_inst
     already_entity_types = []
     already_source_ids = []
     already_description = []
     already_file_paths = []
 
     # 1. Get existing node data from knowledge graph
-    already_node = await knowledge_graph_inst.get_node(entity_name)
+    if prefetch is not None:
+        already_node = await prefetch.get_node(knowledge_graph_inst, entity_name)
+    else:
+        already_node = await knowledge_graph_inst.get_node(entity_name)
     if already_node:
         already_entity_types.append(already_node["entity_type"])
         already_source_ids.extend(already_node["source_id"].split(GRAPH_FIELD_SEP))
@@ -1590,8 +2439,14 @@ async def _merge_nodes_then_upsert(
     new_source_ids = [dp["source_id"] for dp in nodes_data if dp.get("source_id")]
 
     existing_full_source_ids = []
+    stored_chunks = None
     if entity_chunks_storage is not None:
-        stored_chunks = await entity_chunks_storage.get_by_id(entity_name)
+        if prefetch is not None:
+            stored_chunks = await prefetch.get_entity_chunks(
+                entity_chunks_storage, entity_name
+            )
+        else:
+            stored_chunks = await entity_chunks_storage.get_by_id(entity_name)
         if stored_chunks and isinstance(stored_chunks, dict):
             existing_full_source_ids = [
                 chunk_id for chunk_id in stored_chunks.get("chunk_ids", []) if chunk_id
@@ -1606,14 +2461,19 @@ async def _merge_nodes_then_upsert(
     full_source_ids = merge_source_ids(existing_full_source_ids, new_source_ids)
 
     if entity_chunks_storage is not None and full_source_ids:
-        await entity_chunks_storage.upsert(
-            {
-                entity_name: {
-                    "chunk_ids": full_source_ids,
-                    "count": len(full_source_ids),
-                }
-            }
+        chunks_record = {
+            "chunk_ids": full_source_ids,
+            "count": len(full_source_ids),
+        }
+        _add_descriptions_to_reservoir(
+            chunks_record, stored_chunks, nodes_data, global_config
         )
+        if prefetch is not None:
+            prefetch.stage_entity_chunks(
+                entity_chunks_storage, entity_name, chunks_record
+            )
+        else:
+            await entity_chunks_storage.upsert({entity_name: chunks_record})
 
     # 3. Finalize source_id by applying source ids limit
     limit_method = global_config.get("source_ids_limit_method")
@@ -1702,14 +2562,19 @@ async def _merge_nodes_then_upsert(
                 raise PipelineCancelledException("User cancelled during entity summary")
 
     # 8. Get summary description an LLM usage status
-    description, llm_was_used = await _handle_entity_relation_summary(
-        "Entity",
-        entity_name,
-        description_list,
-        GRAPH_FIELD_SEP,
-        global_config,
-        llm_response_cache,
-    )
+    summary_deferred = _defer_description_summary(global_config, description_list)
+    if summary_deferred:
+        # Store the merged fragments now; the deferred worker summarizes later
+        description, llm_was_used = GRAPH_FIELD_SEP.join(description_list), False
+    else:
+        description, llm_was_used = await _handle_entity_relation_summary(
+            "Entity",
+            entity_name,
+            description_list,
+            GRAPH_FIELD_SEP,
+            global_config,
+            llm_response_cache,
+        )
 
     # 9. Build file_path within MAX_FILE_PATHS
     file_paths_list = []
@@ -1812,13 +2677,19 @@ async def _merge_nodes_then_upsert(
         file_path=file_path,
         created_at=int(time.time()),
         truncate=truncation_info,
+        **_summary_pending_fields(global_config, summary_deferred),
     )
-    await knowledge_graph_inst.upsert_node(
+    await graph_writer.upsert_node(
         entity_name,
         node_data=node_data,
     )
+    if prefetch is not None:
+        prefetch.node_written(entity_name)
     node_data["entity_name"] = entity_name
-    if entity_vdb is not None:
+    if summary_deferred:
+        # Embedded once by the deferred worker after summarization
+        _mark_summary_dirty(global_config, ("entity", entity_name))
+    elif entity_vdb is not None:
         entity_vdb_id = compute_mdhash_id(str(entity_name), prefix="ent-")
         entity_content = f"{entity_name}\n{description}"
         data_for_vdb = {
@@ -1830,13 +2701,27 @@ async def _merge_nodes_then_upsert(
                 "file_path": file_path,
             }
         }
-        await safe_vdb_operation_with_exception(
-            operation=lambda payload=data_for_vdb: entity_vdb.upsert(payload),
-            operation_name="entity_upsert",
-            entity_name=entity_name,
-            max_retries=3,
-            retry_delay=0.1,
-        )
+        if prefetch is not None:
+            stored = await prefetch.get_vdb_record(
+                entity_vdb, entity_vdb_id, _node_write_key(entity_name)
+            )
+        else:
+            stored = await _get_vdb_record(entity_vdb, entity_vdb_id)
+        # Same embedded text: skip the embedding call, and the write if nothing changed
+        if not await _reuse_stored_embedding(
+            entity_vdb,
+            entity_vdb_id,
+            data_for_vdb[entity_vdb_id],
+            stored,
+            merge_stats,
+        ):
+            await safe_vdb_operation_with_exception(
+                operation=lambda payload=data_for_vdb: entity_vdb.upsert(payload),
+                operation_name="entity_upsert",
+                entity_name=entity_name,
+                max_retries=3,
+                retry_delay=0.1,
+            )
     return node_data
 
 
@@ -1854,9 +2739,13 @@ async def _merge_edges_then_upsert(
     added_entities: list = None,  # New parameter to track entities added during edge processing
     relation_chunks_storage: BaseKVStorage | None = None,
     entity_chunks_storage: BaseKVStorage | None = None,
+    graph_writer: GraphUpsertBatcher | None = None,
+    merge_stats: dict[str, int] | None = None,
+    prefetch: _MergePrefetch | None = None,
 ):
     if src_id == tgt_id:
         return None
+    graph_writer = graph_writer or knowledge_graph_inst
 
     already_edge = None
     already_weights = []
@@ -1866,8 +2755,11 @@ async def _merge_edges_then_upsert(
     already_file_paths = []
 
     # 1. Get existing edge data from graph storage
-    if await knowledge_graph_inst.has_edge(src_id, tgt_id):
-        already_edge = await knowledge_graph_inst.get_edge(src_id, tgt_id)
+    if prefetch is not None or await knowledge_graph_inst.has_edge(src_id, tgt_id):
+        if prefetch is not None:
+            already_edge = await prefetch.get_edge(knowledge_graph_inst, src_id, tgt_id)
+        else:
+            already_edge = await knowledge_graph_inst.get_edge(src_id, tgt_id)
         # Handle the case where get_edge returns None or missing fields
         if already_edge:
             # Get weight with default 1.0 if missing
@@ -1903,8 +2795,14 @@ async def _merge_edges_then_upsert(
 
     storage_key = make_relation_chunk_key(src_id, tgt_id)
     existing_full_source_ids = []
+    stored_chunks = None
     if relation_chunks_storage is not None:
-        stored_chunks = await relation_chunks_storage.get_by_id(storage_key)
+        if prefetch is not None:
+            stored_chunks = await prefetch.get_relation_chunks(
+                relation_chunks_storage, src_id, tgt_id
+            )
+        else:
+            stored_chunks = await relation_chunks_storage.get_by_id(storage_key)
         if stored_chunks and isinstance(stored_chunks, dict):
             existing_full_source_ids = [
                 chunk_id for chunk_id in stored_chunks.get("chunk_ids", []) if chunk_id
@@ -1919,14 +2817,19 @@ async def _merge_edges_then_upsert(
     full_source_ids = merge_source_ids(existing_full_source_ids, new_source_ids)
 
     if relation_chunks_storage is not None and full_source_ids:
-        await relation_chunks_storage.upsert(
-            {
-                storage_key: {
-                    "chunk_ids": full_source_ids,
-                    "count": len(full_source_ids),
-                }
-            }
+        chunks_record = {
+            "chunk_ids": full_source_ids,
+            "count": len(full_source_ids),
+        }
+        _add_descriptions_to_reservoir(
+            chunks_record, stored_chunks, edges_data, global_config
         )
+        if prefetch is not None:
+            prefetch.stage_relation_chunks(
+                relation_chunks_storage, src_id, tgt_id, chunks_record
+            )
+        else:
+            await relation_chunks_storage.upsert({storage_key: chunks_record})
 
     # 3. Finalize source_id by applying source ids limit
     limit_method = global_config.get("source_ids_limit_method")
@@ -2031,14 +2934,19 @@ async def _merge_edges_then_upsert(
                 )
 
     # 8. Get summary description an LLM usage status
-    description, llm_was_used = await _handle_entity_relation_summary(
-        "Relation",
-        f"({src_id}, {tgt_id})",
-        description_list,
-        GRAPH_FIELD_SEP,
-        global_config,
-        llm_response_cache,
-    )
+    summary_deferred = _defer_description_summary(global_config, description_list)
+    if summary_deferred:
+        # Store the merged fragments now; the deferred worker summarizes later
+        description, llm_was_used = GRAPH_FIELD_SEP.join(description_list), False
+    else:
+        description, llm_was_used = await _handle_entity_relation_summary(
+            "Relation",
+            f"({src_id}, {tgt_id})",
+            description_list,
+            GRAPH_FIELD_SEP,
+            global_config,
+            llm_response_cache,
+        )
 
     # 9. Build file_path within MAX_FILE_PATHS limit
     file_paths_list = []
@@ -2139,7 +3047,12 @@ async def _merge_edges_then_upsert(
     # 11. Update both graph and vector db
     for need_insert_id in [src_id, tgt_id]:
         # Optimization: Use get_node instead of has_node + get_node
-        existing_node = await knowledge_graph_inst.get_node(need_insert_id)
+        if prefetch is not None:
+            existing_node = await prefetch.get_node(
+                knowledge_graph_inst, need_insert_id
+            )
+        else:
+            existing_node = await knowledge_graph_inst.get_node(need_insert_id)
 
         if existing_node is None:
             # Node doesn't exist - create new node
@@ -2153,20 +3066,23 @@ async def _merge_edges_then_upsert(
                 "created_at": node_created_at,
                 "truncate": "",
             }
-            await knowledge_graph_inst.upsert_node(need_insert_id, node_data=node_data)
+            await graph_writer.upsert_node(need_insert_id, node_data=node_data)
+            if prefetch is not None:
+                prefetch.node_written(need_insert_id)
 
             # Update entity_chunks_storage for the newly created entity
             if entity_chunks_storage is not None:
                 chunk_ids = [chunk_id for chunk_id in full_source_ids if chunk_id]
                 if chunk_ids:
-                    await entity_chunks_storage.upsert(
-                        {
-                            need_insert_id: {
-                                "chunk_ids": chunk_ids,
-                                "count": len(chunk_ids),
-                            }
-                        }
-                    )
+                    chunks_record = {"chunk_ids": chunk_ids, "count": len(chunk_ids)}
+                    if prefetch is not None:
+                        prefetch.stage_entity_chunks(
+                            entity_chunks_storage, need_insert_id, chunks_record
+                        )
+                    else:
+                        await entity_chunks_storage.upsert(
+                            {need_insert_id: chunks_record}
+                        )
 
             if entity_vdb is not None:
                 entity_vdb_id = compute_mdhash_id(need_insert_id, prefix="ent-")
@@ -2206,7 +3122,14 @@ async def _merge_edges_then_upsert(
             # 1. Get existing full source_ids from entity_chunks_storage
             existing_full_source_ids = []
             if entity_chunks_storage is not None:
-                stored_chunks = await entity_chunks_storage.get_by_id(need_insert_id)
+                if prefetch is not None:
+                    stored_chunks = await prefetch.get_entity_chunks(
+                        entity_chunks_storage, need_insert_id
+                    )
+                else:
+                    stored_chunks = await entity_chunks_storage.get_by_id(
+                        need_insert_id
+                    )
                 if stored_chunks and isinstance(stored_chunks, dict):
                     existing_full_source_ids = [
                         chunk_id
@@ -2235,14 +3158,16 @@ async def _merge_edges_then_upsert(
                 and merged_full_source_ids != existing_full_source_ids
             ):
                 updated = True
-                await entity_chunks_storage.upsert(
-                    {
-                        need_insert_id: {
-                            "chunk_ids": merged_full_source_ids,
-                            "count": len(merged_full_source_ids),
-                        }
-                    }
-                )
+                chunks_record = {
+                    "chunk_ids": merged_full_source_ids,
+                    "count": len(merged_full_source_ids),
+                }
+                if prefetch is not None:
+                    prefetch.stage_entity_chunks(
+                        entity_chunks_storage, need_insert_id, chunks_record
+                    )
+                else:
+                    await entity_chunks_storage.upsert({need_insert_id: chunks_record})
 
             # 4. Apply source_ids limit for graph and vector db
             limit_method = global_config.get(
@@ -2265,9 +3190,11 @@ async def _merge_edges_then_upsert(
                     **existing_node,
                     "source_id": limited_source_id_str,
                 }
-                await knowledge_graph_inst.upsert_node(
+                await graph_writer.upsert_node(
                     need_insert_id, node_data=updated_node_data
                 )
+                if prefetch is not None:
+                    prefetch.node_written(need_insert_id)
 
                 # Update vector database
                 if entity_vdb is not None:
@@ -2304,7 +3231,7 @@ async def _merge_edges_then_upsert(
                         pipeline_status["history_messages"].append(status_message)
 
     edge_created_at = int(time.time())
-    await knowledge_graph_inst.upsert_edge(
+    await graph_writer.upsert_edge(
         src_id,
         tgt_id,
         edge_data=dict(
@@ -2315,8 +3242,13 @@ async def _merge_edges_then_upsert(
             file_path=file_path,
             created_at=edge_created_at,
             truncate=truncation_info,
+            **_summary_pending_fields(global_config, summary_deferred),
         ),
     )
+    if prefetch is not None:
+        prefetch.edge_written(src_id, tgt_id)
+    if summary_deferred:
+        _mark_summary_dirty(global_config, ("relation", src_id, tgt_id))
 
     edge_data = dict(
         src_id=src_id,
@@ -2334,15 +3266,10 @@ async def _merge_edges_then_upsert(
     if src_id > tgt_id:
         src_id, tgt_id = tgt_id, src_id
 
-    if relationships_vdb is not None:
+    if relationships_vdb is not None and not summary_deferred:
+        # Pending relations are embedded by the deferred worker after summarization
         rel_vdb_id = compute_mdhash_id(src_id + tgt_id, prefix="rel-")
         rel_vdb_id_reverse = compute_mdhash_id(tgt_id + src_id, prefix="rel-")
-        try:
-            await relationships_vdb.delete([rel_vdb_id, rel_vdb_id_reverse])
-        except Exception as e:
-            logger.debug(
-                f"Could not delete old relationship vector records {rel_vdb_id}, {rel_vdb_id_reverse}: {e}"
-            )
         rel_content = f"{keywords}\t{src_id}\n{tgt_id}\n{description}"
         vdb_data = {
             rel_vdb_id: {
@@ -2356,6 +3283,24 @@ async def _merge_edges_then_upsert(
                 "file_path": file_path,
             }
         }
+        if prefetch is not None:
+            stored = await prefetch.get_vdb_record(
+                relationships_vdb, rel_vdb_id, _edge_write_key(src_id, tgt_id)
+            )
+        else:
+            stored = await _get_vdb_record(relationships_vdb, rel_vdb_id)
+        # Same embedded text: skip the embedding call, and the write if nothing changed
+        if await _reuse_stored_embedding(
+            relationships_vdb, rel_vdb_id, vdb_data[rel_vdb_id], stored, merge_stats
+        ):
+            return edge_data
+
+        try:
+            await relationships_vdb.delete([rel_vdb_id, rel_vdb_id_reverse])
+        except Exception as e:
+            logger.debug(
+                f"Could not delete old relationship vector records {rel_vdb_id}, {rel_vdb_id_reverse}: {e}"
+            )
         await safe_vdb_operation_with_exception(
             operation=lambda payload=vdb_data: relationships_vdb.upsert(payload),
             operation_name="relationship_upsert",
@@ -2444,6 +3389,16 @@ async def merge_nodes_and_edges(
     graph_max_async = global_config.get("llm_model_max_async", 4) * 2
     semaphore = asyncio.Semaphore(graph_max_async)
 
+    # Entities/relations whose VDB record was left as is (no re-embedding)
+    merge_stats = {"embedding_skipped": 0}
+
+    # Coalesce graph writes of concurrent merges into batch upserts when supported
+    graph_writer = (
+        GraphUpsertBatcher(knowledge_graph_inst)
+        if GraphUpsertBatcher.is_supported(knowledge_graph_inst)
+        else None
+    )
+
     # ===== Phase 1: Process all entities concurrently =====
     log_message = f"Phase 1: Processing {total_entities_count} entities from {doc_id} (async: {graph_max_async})"
     logger.info(log_message)
@@ -2478,6 +3433,9 @@ async def merge_nodes_and_edges(
                         pipeline_status_lock,
                         llm_response_cache,
                         entity_chunks_storage,
+                        graph_writer,
+                        merge_stats,
+                        entity_prefetch,
                     )
 
                     return entity_data
@@ -2506,6 +3464,17 @@ async def merge_nodes_and_edges(
                     )
                     raise prefixed_exception from e
 
+    # Load existing nodes, chunk-tracking and VDB records in bulk instead of per entity
+    entity_prefetch = await _MergePrefetch.load(
+        global_config,
+        knowledge_graph_inst,
+        list(all_nodes),
+        [],
+        entity_chunks_storage,
+        None,
+        entity_vdb=entity_vdb,
+    )
+
     # Create entity processing tasks
     entity_tasks = []
     for entity_name, entities in all_nodes.items():
@@ -2513,37 +3482,42 @@ async def merge_nodes_and_edges(
         entity_tasks.append(task)
 
     # Execute entity tasks with error handling
-    processed_entities = []
-    if entity_tasks:
-        done, pending = await asyncio.wait(
-            entity_tasks, return_when=asyncio.FIRST_EXCEPTION
-        )
-
-        first_exception = None
+    try:
         processed_entities = []
+        if entity_tasks:
+            done, pending = await asyncio.wait(
+                entity_tasks, return_when=asyncio.FIRST_EXCEPTION
+            )
 
-        for task in done:
-            try:
-                result = task.result()
-            except BaseException as e:
-                if first_exception is None:
-                    first_exception = e
-            else:
-                processed_entities.append(result)
+            first_exception = None
+            processed_entities = []
 
-        if pending:
-            for task in pending:
-                task.cancel()
-            pending_results = await asyncio.gather(*pending, return_exceptions=True)
-            for result in pending_results:
-                if isinstance(result, BaseException):
+            for task in done:
+                try:
+                    result = task.result()
+                except BaseException as e:
                     if first_exception is None:
-                        first_exception = result
+                        first_exception = e
                 else:
                     processed_entities.append(result)
 
-        if first_exception is not None:
-            raise first_exception
+            if pending:
+                for task in pending:
+                    task.cancel()
+                pending_results = await asyncio.gather(*pending, return_exceptions=True)
+                for result in pending_results:
+                    if isinstance(result, BaseException):
+                        if first_exception is None:
+                            first_exception = result
+                    else:
+                        processed_entities.append(result)
+
+            if first_exception is not None:
+                raise first_exception
+    finally:
+        # Entity chunk-tracking records are read again by the relation phase
+        if entity_prefetch is not None:
+            await entity_prefetch.close()
 
     # ===== Phase 2: Process all relationships concurrently =====
     log_message = f"Phase 2: Processing {total_relations_count} relations from {doc_id} (async: {graph_max_async})"
@@ -2589,6 +3563,9 @@ async def merge_nodes_and_edges(
                         added_entities,  # Pass list to collect added entities
                         relation_chunks_storage,
                         entity_chunks_storage,  # Add entity_chunks_storage parameter
+                        graph_writer,
+                        merge_stats,
+                        edge_prefetch,
                     )
 
                     if edge_data is None:
@@ -2620,6 +3597,18 @@ async def merge_nodes_and_edges(
                     )
                     raise prefixed_exception from e
 
+    # Load existing edges, endpoint nodes, chunk-tracking and VDB records in bulk
+    edge_pairs = [edge_key for edge_key in all_edges if edge_key[0] != edge_key[1]]
+    edge_prefetch = await _MergePrefetch.load(
+        global_config,
+        knowledge_graph_inst,
+        list(dict.fromkeys(name for edge_key in edge_pairs for name in edge_key)),
+        edge_pairs,
+        entity_chunks_storage,
+        relation_chunks_storage,
+        relationships_vdb=relationships_vdb,
+    )
+
     # Create relationship processing tasks
     edge_tasks = []
     for edge_key, edges in all_edges.items():
@@ -2630,40 +3619,44 @@ async def merge_nodes_and_edges(
     processed_edges = []
     all_added_entities = []
 
-    if edge_tasks:
-        done, pending = await asyncio.wait(
-            edge_tasks, return_when=asyncio.FIRST_EXCEPTION
-        )
+    try:
+        if edge_tasks:
+            done, pending = await asyncio.wait(
+                edge_tasks, return_when=asyncio.FIRST_EXCEPTION
+            )
 
-        first_exception = None
+            first_exception = None
 
-        for task in done:
-            try:
-                edge_data, added_entities = task.result()
-            except BaseException as e:
-                if first_exception is None:
-                    first_exception = e
-            else:
-                if edge_data is not None:
-                    processed_edges.append(edge_data)
-                all_added_entities.extend(added_entities)
-
-        if pending:
-            for task in pending:
-                task.cancel()
-            pending_results = await asyncio.gather(*pending, return_exceptions=True)
-            for result in pending_results:
-                if isinstance(result, BaseException):
+            for task in done:
+                try:
+                    edge_data, added_entities = task.result()
+                except BaseException as e:
                     if first_exception is None:
-                        first_exception = result
+                        first_exception = e
                 else:
-                    edge_data, added_entities = result
                     if edge_data is not None:
                         processed_edges.append(edge_data)
                     all_added_entities.extend(added_entities)
 
-        if first_exception is not None:
-            raise first_exception
+            if pending:
+                for task in pending:
+                    task.cancel()
+                pending_results = await asyncio.gather(*pending, return_exceptions=True)
+                for result in pending_results:
+                    if isinstance(result, BaseException):
+                        if first_exception is None:
+                            first_exception = result
+                    else:
+                        edge_data, added_entities = result
+                        if edge_data is not None:
+                            processed_edges.append(edge_data)
+                        all_added_entities.extend(added_entities)
+
+            if first_exception is not None:
+                raise first_exception
+    finally:
+        if edge_prefetch is not None:
+            await edge_prefetch.close()
 
     # ===== Phase 3: Update full_entities and full_relations storage =====
     if full_entities_storage and full_relations_storage and doc_id:
@@ -2730,13 +3723,56 @@ async def merge_nodes_and_edges(
             )
             # Don't raise exception to avoid affecting main flow
 
-    log_message = f"Completed merging: {len(processed_entities)} entities, {len(all_added_entities)} extra entities, {len(processed_edges)} relations"
+    log_message = f"Completed merging: {len(processed_entities)} entities, {len(all_added_entities)} extra entities, {len(processed_edges)} relations, {merge_stats['embedding_skipped']} unchanged embeddings skipped"
     logger.info(log_message)
     async with pipeline_status_lock:
         pipeline_status["latest_message"] = log_message
         pipeline_status["history_messages"].append(log_message)
 
 
+async def _flush_extraction_cache(
+    llm_response_cache: BaseKVStorage | None,
+    cache_write_buffer: dict[str, dict[str, Any]],
+    text_chunks_storage: BaseKVStorage | None = None,
+    chunk_cache_keys: dict[str, list[str]] | None = None,
+) -> None:
+    """Write the buffered extraction cache entries of a document in one upsert
+    and record the used cache keys in the chunks' llm_cache_list in one update
+    """
+    if cache_write_buffer and llm_response_cache is not None:
+        try:
+            await llm_response_cache.upsert(dict(cache_write_buffer))
+            logger.debug(
+                f" == LLM cache == saved {len(cache_write_buffer)} extraction entries, "
+                f"hit rates: {get_llm_cache_hit_rates()}"
+            )
+        except Exception as e:
+            logger.error(f"Failed to save extraction results to LLM cache: {e}")
+        cache_write_buffer.clear()
+
+    if chunk_cache_keys and text_chunks_storage is not None:
+        await update_chunks_cache_lists(
+            text_chunks_storage, chunk_cache_keys, "entity_extraction"
+        )
+        chunk_cache_keys.clear()
+
+
+# Workspace-wide chunk extraction schedulers keyed by (workspace, max_async)
+_extraction_schedulers: dict[tuple[str, int], RoundRobinSemaphore] = {}
+
+
+def _get_extraction_scheduler(global_config: dict[str, Any]) -> RoundRobinSemaphore:
+    """Get the chunk extraction scheduler shared by all documents of a workspace"""
+    key = (
+        global_config.get("workspace", ""),
+        global_config.get("llm_model_max_async", 4),
+    )
+    scheduler = _extraction_schedulers.get(key)
+    if scheduler is None:
+        scheduler = _extraction_schedulers[key] = RoundRobinSemaphore(key[1])
+    return scheduler
+
+
 async def extract_entities(
     chunks: dict[str, TextChunkSchema],
     global_config: dict[str, str],
@@ -2784,6 +3820,10 @@ async def extract_entities(
 
     processed_chunks = 0
     total_chunks = len(ordered_chunks)
+    # New extraction cache entries of this document, written with one upsert
+    cache_write_buffer: dict[str, dict[str, Any]] = {}
+    # Cache keys used per chunk, appended to llm_cache_list with one partial update
+    chunk_cache_keys: dict[str, list[str]] = {}
 
     async def _process_single_content(chunk_key_dp: tuple[str, TextChunkSchema]):
         """Process a single chunk
@@ -2822,6 +3862,7 @@ async def extract_entities(
             cache_type="extract",
             chunk_id=chunk_key,
             cache_keys_collector=cache_keys_collector,
+            cache_write_buffer=cache_write_buffer,
         )
 
         history = pack_user_ass_to_openai_messages(
@@ -2849,6 +3890,7 @@ async def extract_entities(
                 cache_type="extract",
                 chunk_id=chunk_key,
                 cache_keys_collector=cache_keys_collector,
+                cache_write_buffer=cache_write_buffer,
             )
 
             # Process gleaning result separately with file path
@@ -2892,14 +3934,9 @@ async def extract_entities(
                     # New edge from gleaning stage
                     maybe_edges[edge_key] = list(glean_edges)
 
-        # Batch update chunk's llm_cache_list with all collected cache keys
-        if cache_keys_collector and text_chunks_storage:
-            await update_chunk_cache_list(
-                chunk_key,
-                text_chunks_storage,
-                cache_keys_collector,
-                "entity_extraction",
-            )
+        # Chunk's llm_cache_list is updated for the whole document at the end
+        if cache_keys_collector:
+            chunk_cache_keys[chunk_key] = cache_keys_collector
 
         processed_chunks += 1
         entities_count = len(maybe_nodes)
@@ -2914,12 +3951,13 @@ async def extract_entities(
         # Return the extracted nodes and edges for centralized processing
         return maybe_nodes, maybe_edges
 
-    # Get max async tasks limit from global_config
-    chunk_max_async = global_config.get("llm_model_max_async", 4)
-    semaphore = asyncio.Semaphore(chunk_max_async)
+    # Chunks of all documents being extracted in this workspace share one
+    # llm_model_max_async budget, handed out round-robin across documents
+    scheduler = _get_extraction_scheduler(global_config)
+    doc_group = object()
 
     async def _process_with_semaphore(chunk):
-        async with semaphore:
+        async with scheduler.slot(doc_group):
             # Check for cancellation before processing chunk
             if pipeline_status is not None and pipeline_status_lock is not None:
                 async with pipeline_status_lock:
@@ -2970,6 +4008,14 @@ async def extract_entities(
         if pending:
             await asyncio.wait(pending)
 
+        # Keep the results of finished chunks so a retry hits the cache
+        await _flush_extraction_cache(
+            llm_response_cache,
+            cache_write_buffer,
+            text_chunks_storage,
+            chunk_cache_keys,
+        )
+
         # Add progress prefix to the exception message
         progress_prefix = f"C[{processed_chunks + 1}/{total_chunks}]"
 
@@ -2977,6 +4023,10 @@ async def extract_entities(
         prefixed_exception = create_prefixed_exception(first_exception, progress_prefix)
         raise prefixed_exception from first_exception
 
+    await _flush_extraction_cache(
+        llm_response_cache, cache_write_buffer, text_chunks_storage, chunk_cache_keys
+    )
+
     # If all tasks completed successfully, chunk_results already contains the results
     # Return the chunk_results for later processing in merge_nodes_and_edges
     return chunk_results
@@ -3034,6 +4084,23 @@ async def kg_query(
         # Apply higher priority (5) to query relation LLM function
         use_model_func = partial(use_model_func, _priority=5)
 
+    # Semantic cache: reuse the answer of a paraphrased query before any retrieval
+    use_semantic_cache = _is_semantic_cache_applicable(query_param, global_config)
+    query_embedding = None
+    if use_semantic_cache:
+        semantic_params_hash = _compute_semantic_cache_params_hash(
+            query_param, system_prompt
+        )
+        (
+            semantic_cached,
+            query_embedding,
+            semantic_data_version,
+        ) = await _lookup_semantic_query_cache(
+            query, semantic_params_hash, global_config
+        )
+        if semantic_cached is not None:
+            return semantic_cached
+
     hl_keywords, ll_keywords = await get_keywords_from_query(
         query, query_param, global_config, hashing_kv
     )
@@ -3067,6 +4134,7 @@ async def kg_query(
         text_chunks_db,
         query_param,
         chunks_vdb,
+        query_embedding=query_embedding,
     )
 
     if context_result is None:
@@ -3182,6 +4250,17 @@ async def kg_query(
                 .strip()
             )
 
+        if use_semantic_cache:
+            await _save_semantic_query_cache(
+                query,
+                query_embedding,
+                semantic_params_hash,
+                semantic_data_version,
+                response,
+                context_result.raw_data,
+                global_config,
+            )
+
         return QueryResult(content=response, raw_data=context_result.raw_data)
     else:
         # Streaming response (AsyncIterator)
@@ -3400,6 +4479,7 @@ async def _perform_kg_search(
     text_chunks_db: BaseKVStorage,
     query_param: QueryParam,
     chunks_vdb: BaseVectorStorage = None,
+    query_embedding: list[float] | None = None,
 ) -> dict[str, Any]:
     """
     Pure search logic that retrieves raw entities, relations, and vector chunks.
@@ -3423,8 +4503,9 @@ async def _perform_kg_search(
     kg_chunk_pick_method = text_chunks_db.global_config.get(
         "kg_chunk_pick_method", DEFAULT_KG_CHUNK_PICK_METHOD
     )
-    query_embedding = None
-    if query and (kg_chunk_pick_method == "VECTOR" or chunks_vdb):
+    if query_embedding is None and (
+        query and (kg_chunk_pick_method == "VECTOR" or chunks_vdb)
+    ):
         embedding_func_config = text_chunks_db.embedding_func
         if embedding_func_config and embedding_func_config.func:
             try:
@@ -4015,6 +5096,279 @@ async def _build_llm_context(
 
 
 # Now let's update the old _build_query_context to use the new architecture
+def _retrieval_cache_namespaces(workspace: str) -> tuple[str, str]:
+    """Shared namespaces holding cached query contexts and their bookkeeping
+
+    Bookkeeping (data version, creation and access time) is kept apart from the
+    cached contexts so expiry and LRU checks never have to load the contexts.
+    """
+    prefix = f"{workspace}_" if workspace else ""
+    return f"{prefix}retrieval_cache", f"{prefix}retrieval_cache_meta"
+
+
+def _compute_retrieval_cache_key(
+    query: str, ll_keywords: str, hl_keywords: str, query_param: QueryParam
+) -> str:
+    """Hash every input that changes the context built by _build_query_context"""
+    return compute_args_hash(
+        query_param.mode,
+        query,
+        ll_keywords,
+        hl_keywords,
+        query_param.top_k,
+        query_param.chunk_top_k,
+        query_param.max_entity_tokens,
+        query_param.max_relation_tokens,
+        query_param.max_total_tokens,
+        query_param.enable_rerank,
+        query_param.response_type,
+        query_param.user_prompt or "",
+    )
+
+
+def _is_retrieval_cache_entry_valid(
+    meta: tuple[int, float, float], data_version: int, ttl: int, now: float
+) -> bool:
+    version, created_at, _ = meta
+    return version == data_version and (ttl <= 0 or now - created_at <= ttl)
+
+
+async def _get_cached_query_context(
+    cache_key: str, global_config: dict[str, Any]
+) -> tuple[QueryContextResult | None, int | None]:
+    """Look up a cached query context
+
+    Returns (cached_result, data_version). data_version is None when the
+    retrieval cache is disabled, otherwise it must be passed to
+    _save_query_context_to_cache so results built while the data changed
+    are never served.
+    """
+    if global_config.get("retrieval_cache_max_entries", 0) <= 0:
+        return None, None
+
+    workspace = global_config.get("workspace", "")
+    data_version = await get_data_version(workspace)
+    entries_ns, meta_ns = _retrieval_cache_namespaces(workspace)
+    entries = await get_namespace_data(entries_ns)
+    metas = await get_namespace_data(meta_ns)
+
+    meta = metas.get(cache_key)
+    if meta is None:
+        return None, data_version
+
+    now = time.time()
+    ttl = global_config.get("retrieval_cache_ttl", 0)
+    if not _is_retrieval_cache_entry_valid(meta, data_version, ttl, now):
+        metas.pop(cache_key, None)
+        entries.pop(cache_key, None)
+        return None, data_version
+
+    result = entries.get(cache_key)
+    if result is None:
+        return None, data_version
+    metas[cache_key] = (meta[0], meta[1], now)
+    # Callers may mutate raw_data, never hand out the cached object itself
+    return copy.deepcopy(result), data_version
+
+
+async def _save_query_context_to_cache(
+    cache_key: str,
+    result: QueryContextResult,
+    data_version: int | None,
+    global_config: dict[str, Any],
+) -> None:
+    """Store a query context and evict stale, expired or least recently used entries"""
+    max_entries = global_config.get("retrieval_cache_max_entries", 0)
+    if data_version is None or max_entries <= 0:
+        return
+
+    workspace = global_config.get("workspace", "")
+    entries_ns, meta_ns = _retrieval_cache_namespaces(workspace)
+    entries = await get_namespace_data(entries_ns)
+    metas = await get_namespace_data(meta_ns)
+
+    now = time.time()
+    entries[cache_key] = copy.deepcopy(result)
+    metas[cache_key] = (data_version, now, now)
+
+    if len(metas) <= max_entries:
+        return
+
+    current_version = await get_data_version(workspace)
+    ttl = global_config.get("retrieval_cache_ttl", 0)
+    all_metas = dict(metas.items())
+    evict = [
+        key
+        for key, meta in all_metas.items()
+        if not _is_retrieval_cache_entry_valid(meta, current_version, ttl, now)
+    ]
+    overflow = len(all_metas) - len(evict) - max_entries
+    if overflow > 0:
+        evicted = set(evict)
+        lru_order = sorted(
+            (key for key in all_metas if key not in evicted),
+            key=lambda key: all_metas[key][2],
+        )
+        evict.extend(lru_order[:overflow])
+    for key in evict:
+        metas.pop(key, None)
+        entries.pop(key, None)
+
+
+def _is_semantic_cache_applicable(
+    query_param: QueryParam, global_config: dict[str, Any]
+) -> bool:
+    """Only plain answers without per-request history or model overrides are cached"""
+    return bool(
+        global_config.get("enable_semantic_query_cache")
+        and not query_param.bypass_semantic_cache
+        and not query_param.only_need_context
+        and not query_param.only_need_prompt
+        and not query_param.conversation_history
+        and query_param.model_func is None
+    )
+
+
+def _compute_semantic_cache_params_hash(
+    query_param: QueryParam, system_prompt: str | None
+) -> str:
+    """Hash of everything besides the query text that shapes the answer
+
+    Covers every QueryParam field affecting retrieval or rendering; conversation
+    history and model overrides are excluded by _is_semantic_cache_applicable.
+    """
+    return compute_args_hash(
+        query_param.mode,
+        query_param.response_type,
+        query_param.top_k,
+        query_param.chunk_top_k,
+        query_param.max_entity_tokens,
+        query_param.max_relation_tokens,
+        query_param.max_total_tokens,
+        ", ".join(query_param.hl_keywords or []),
+        ", ".join(query_param.ll_keywords or []),
+        query_param.user_prompt or "",
+        query_param.enable_rerank,
+        query_param.include_references,
+        system_prompt or "",
+    )
+
+
+async def _lookup_semantic_query_cache(
+    query: str, params_hash: str, global_config: dict[str, Any]
+) -> tuple[QueryResult | None, list[float] | None, int]:
+    """Find a cached answer for a semantically similar query
+
+    The semantic cache is a small per-workspace vector index: the
+    ``semantic_query_cache_index`` namespace maps an entry key to
+    (params_hash, data_version, created_at, normalized query embedding) and
+    ``semantic_query_cache`` holds the cached answers.
+
+    Returns (cached_result, query_embedding, data_version). The query embedding
+    is returned so the caller can reuse it for retrieval.
+    """
+    workspace = global_config.get("workspace", "")
+    data_version = await get_data_version(workspace)
+    embedding_func = global_config["embedding_func"]
+    try:
+        query_embedding = (await embedding_func([query], _priority=5))[0]
+    except Exception as e:
+        logger.warning(f"Semantic query cache: failed to embed query: {e}")
+        return None, None, data_version
+
+    prefix = f"{workspace}_" if workspace else ""
+    index = await get_namespace_data(f"{prefix}semantic_query_cache_index")
+    candidates = [
+        (key, entry[3])
+        for key, entry in list(index.items())
+        if entry[0] == params_hash and entry[1] == data_version
+    ]
+
+    best_key, best_score = None, -1.0
+    if candidates:
+        keys = [key for key, _ in candidates]
+        top_rows, scores = top_k_cosine(
+            query_embedding, np.stack([vector for _, vector in candidates]), 1
+        )
+        best_key, best_score = keys[top_rows[0]], float(scores[0])
+
+    threshold = global_config.get(
+        "semantic_query_cache_threshold", DEFAULT_SEMANTIC_QUERY_CACHE_THRESHOLD
+    )
+    cached = None
+    if best_key is not None and best_score >= threshold:
+        answers = await get_namespace_data(f"{prefix}semantic_query_cache")
+        cached = answers.get(best_key)
+
+    if cached is None:
+        statistic_data["semantic_cache_miss"] += 1
+        return None, query_embedding, data_version
+
+    statistic_data["semantic_cache_hit"] += 1
+    lookups = (
+        statistic_data["semantic_cache_hit"] + statistic_data["semantic_cache_miss"]
+    )
+    logger.info(
+        f" == Semantic cache == hit (similarity {best_score:.3f}), "
+        f"hit rate {statistic_data['semantic_cache_hit'] / lookups:.1%}"
+    )
+    return (
+        QueryResult(
+            content=cached["response"], raw_data=copy.deepcopy(cached["raw_data"])
+        ),
+        query_embedding,
+        data_version,
+    )
+
+
+async def _save_semantic_query_cache(
+    query: str,
+    query_embedding: list[float] | None,
+    params_hash: str,
+    data_version: int,
+    response: str,
+    raw_data: dict[str, Any] | None,
+    global_config: dict[str, Any],
+) -> None:
+    """Store an answer in the semantic query cache, evicting stale and oldest entries"""
+    if query_embedding is None:
+        return
+
+    vector = np.asarray(query_embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        return
+
+    workspace = global_config.get("workspace", "")
+    prefix = f"{workspace}_" if workspace else ""
+    index = await get_namespace_data(f"{prefix}semantic_query_cache_index")
+    answers = await get_namespace_data(f"{prefix}semantic_query_cache")
+
+    key = compute_args_hash(params_hash, query)
+    answers[key] = {"response": response, "raw_data": copy.deepcopy(raw_data)}
+    index[key] = (params_hash, data_version, time.time(), vector / norm)
+
+    max_entries = global_config.get(
+        "semantic_query_cache_max_entries", DEFAULT_SEMANTIC_QUERY_CACHE_MAX_ENTRIES
+    )
+    if len(index) <= max_entries:
+        return
+
+    current_version = await get_data_version(workspace)
+    entries = dict(index.items())
+    evict = [k for k, entry in entries.items() if entry[1] != current_version]
+    overflow = len(entries) - len(evict) - max_entries
+    if overflow > 0:
+        evicted = set(evict)
+        oldest = sorted(
+            (k for k in entries if k not in evicted), key=lambda k: entries[k][2]
+        )
+        evict.extend(oldest[:overflow])
+    for k in evict:
+        index.pop(k, None)
+        answers.pop(k, None)
+
+
 async def _build_query_context(
     query: str,
     ll_keywords: str,
@@ -4025,18 +5379,31 @@ async def _build_query_context(
     text_chunks_db: BaseKVStorage,
     query_param: QueryParam,
     chunks_vdb: BaseVectorStorage = None,
+    query_embedding: list[float] | None = None,
 ) -> QueryContextResult | None:
     """
     Main query context building function using the new 4-stage architecture:
     1. Search -> 2. Truncate -> 3. Merge chunks -> 4. Build LLM context
 
     Returns unified QueryContextResult containing both context and raw_data.
+    query_embedding: Optional pre-computed query embedding reused by the search stage
     """
 
     if not query:
         logger.warning("Query is empty, skipping context building")
         return None
 
+    global_config = text_chunks_db.global_config
+    cache_key = _compute_retrieval_cache_key(
+        query, ll_keywords, hl_keywords, query_param
+    )
+    cached_context, data_version = await _get_cached_query_context(
+        cache_key, global_config
+    )
+    if cached_context is not None:
+        logger.info(" == Retrieval cache == hit, reusing query context")
+        return cached_context
+
     # Stage 1: Pure search
     search_result = await _perform_kg_search(
         query,
@@ -4048,6 +5415,7 @@ async def _build_query_context(
         text_chunks_db,
         query_param,
         chunks_vdb,
+        query_embedding=query_embedding,
     )
 
     if not search_result["final_entities"] and not search_result["final_relations"]:
@@ -4132,7 +5500,11 @@ async def _build_query_context(
         f"[_build_query_context] Raw data entities: {len(raw_data.get('data', {}).get('entities', []))}, relationships: {len(raw_data.get('data', {}).get('relationships', []))}, chunks: {len(raw_data.get('data', {}).get('chunks', []))}"
     )
 
-    return QueryContextResult(context=context, raw_data=raw_data)
+    context_result = QueryContextResult(context=context, raw_data=raw_data)
+    await _save_query_context_to_cache(
+        cache_key, context_result, data_version, global_config
+    )
+    return context_result
 
 
 async def _get_node_data(
@@ -4146,7 +5518,10 @@ async def _get_node_data(
         f"Query nodes: {query} (top_k:{query_param.top_k}, cosine:{entities_vdb.cosine_better_than_threshold})"
     )
 
-    results = await entities_vdb.query(query, top_k=query_param.top_k)
+    # Only names are needed here, node properties come from the graph batch fetch
+    results = await entities_vdb.query(
+        query, top_k=query_param.top_k, fields=["entity_name", "created_at"]
+    )
 
     if not len(results):
         return [], []
@@ -4422,7 +5797,10 @@ async def _get_edge_data(
         f"Query edges: {keywords} (top_k:{query_param.top_k}, cosine:{relationships_vdb.cosine_better_than_threshold})"
     )
 
-    results = await relationships_vdb.query(keywords, top_k=query_param.top_k)
+    # Only endpoints are needed here, edge properties come from the graph batch fetch
+    results = await relationships_vdb.query(
+        keywords, top_k=query_param.top_k, fields=["src_id", "tgt_id", "created_at"]
+    )
 
     if not len(results):
         return [], []
@@ -4775,7 +6153,24 @@ async def naive_query(
         logger.error("Tokenizer not found in global configuration.")
         return QueryResult(content=PROMPTS["fail_response"])
 
-    chunks = await _get_vector_context(query, chunks_vdb, query_param, None)
+    # Semantic cache: reuse the answer of a paraphrased query before any retrieval
+    use_semantic_cache = _is_semantic_cache_applicable(query_param, global_config)
+    query_embedding = None
+    if use_semantic_cache:
+        semantic_params_hash = _compute_semantic_cache_params_hash(
+            query_param, system_prompt
+        )
+        (
+            semantic_cached,
+            query_embedding,
+            semantic_data_version,
+        ) = await _lookup_semantic_query_cache(
+            query, semantic_params_hash, global_config
+        )
+        if semantic_cached is not None:
+            return semantic_cached
+
+    chunks = await _get_vector_context(query, chunks_vdb, query_param, query_embedding)
 
     if chunks is None or len(chunks) == 0:
         logger.info(
@@ -4970,6 +6365,17 @@ async def naive_query(
                 .strip()
             )
 
+        if use_semantic_cache:
+            await _save_semantic_query_cache(
+                query,
+                query_embedding,
+                semantic_params_hash,
+                semantic_data_version,
+                response,
+                raw_data,
+                global_config,
+            )
+
         return QueryResult(content=response, raw_data=raw_data)
     else:
         # Streaming response (AsyncIterator)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark for streaming token-size chunking.
+
+Chunks a large synthetic document with chunking_by_token_size, which tokenizes
+the text segment by segment, and with the previous implementation that encoded
+the whole document at once and decoded every window from its tokens. Reports
+wall time and peak traced memory of both, and checks that segmenting the text
+does not change its token count.
+
+Usage:
+    python -m lightrag.tools.chunking_benchmark
+    python -m lightrag.tools.chunking_benchmark --size-mb 50 --model gpt-4o-mini
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lightrag.operate import _iter_text_segments, chunking_by_token_size
+from lightrag.utils import TiktokenTokenizer, Tokenizer
+
+WORDS = (
+    "the graph stores entities and relations extracted from every chunk of text "
+    "while vector indexes keep embeddings for retrieval; numbers like 2024 or 3.14 "
+    "and names such as LightRAG, PostgreSQL, Neo4j (and Qdrant) appear as well"
+).split()
+
+
+def make_document(size: int, rng: random.Random) -> str:
+    """Plain text with sentences, paragraphs and some whitespace runs"""
+    parts: list[str] = []
+    length = 0
+    while length < size:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30)))
+        sentence = sentence.capitalize() + rng.choice([". ", ".\n", ".\n\n", ".  "])
+        parts.append(sentence)
+        length += len(sentence)
+    return "".join(parts)[:size]
+
+
+def baseline_chunking(
+    tokenizer: Tokenizer,
+    content: str,
+    overlap_token_size: int,
+    max_token_size: int,
+) -> list[dict[str, Any]]:
+    """Previous implementation: encode the whole document, decode every window"""
+    tokens = tokenizer.encode(content)
+    results: list[dict[str, Any]] = []
+    for index, start in enumerate(
+        range(0, len(tokens), max_token_size - overlap_token_size)
+    ):
+        chunk_content = tokenizer.decode(tokens[start : start + max_token_size])
+        results.append(
+            {
+                "tokens": min(max_token_size, len(tokens) - start),
+                "content": chunk_content.strip(),
+                "chunk_order_index": index,
+            }
+        )
+    return results
+
+
+def measure(func: Callable[[], list[dict[str, Any]]]) -> tuple[list, float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    chunks = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return chunks, elapsed, peak
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compare streaming chunking with whole-document tokenization"
+    )
+    parser.add_argument("--size-mb", type=float, default=20, help="Document size")
+    parser.add_argument("--model", default="gpt-4o-mini", help="tiktoken model name")
+    parser.add_argument("--max-tokens", type=int, default=1200, help="Chunk size")
+    parser.add_argument("--overlap", type=int, default=100, help="Chunk overlap")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    tokenizer = TiktokenTokenizer(args.model)
+    content = make_document(int(args.size_mb * 1024 * 1024), random.Random(args.seed))
+    print(f"Document: {len(content):,} characters, model {args.model}\n")
+
+    whole_tokens = len(tokenizer.encode(content))
+    segment_tokens = sum(
+        len(tokenizer.encode(segment)) for segment in _iter_text_segments(content)
+    )
+    print(f"tokens (whole document) {whole_tokens:>14,}")
+    print(f"tokens (segmented)      {segment_tokens:>14,}\n")
+
+    runs = {
+        "whole-document": lambda: baseline_chunking(
+            tokenizer, content, args.overlap, args.max_tokens
+        ),
+        "streaming": lambda: chunking_by_token_size(
+            tokenizer,
+            content,
+            overlap_token_size=args.overlap,
+            max_token_size=args.max_tokens,
+        ),
+    }
+    for name, func in runs.items():
+        chunks, elapsed, peak = measure(func)
+        print(
+            f"{name:15} chunks={len(chunks):>7,}  time={elapsed:7.2f}s  "
+            f"peak={peak / 1024 / 1024:8.1f} MiB"
+        )
+
+    if segment_tokens != whole_tokens:
+        print("\nSegmenting changed the token count")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Recall regression check for reduced vector precision.
+
+Compares the top-k neighbours of float32 exact search with the neighbours found
+over float16 and int8 vectors on synthetic, clustered embeddings. The encoded
+copies use the same encode_vector/decode_vector as the vector storages; when
+faiss is installed the IndexScalarQuantizer indexes used by FaissVectorDBStorage
+are measured as well.
+
+Usage:
+    python -m lightrag.tools.vector_precision_recall
+    python -m lightrag.tools.vector_precision_recall --count 50000 --dim 1024 --min-recall 0.95
+
+Exits with status 1 when any precision falls below --min-recall.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lightrag.constants import (
+    VECTOR_PRECISION_FLOAT16,
+    VECTOR_PRECISION_INT8,
+)
+from lightrag.utils import decode_vector, encode_vector
+
+
+def make_embeddings(
+    count: int, dim: int, clusters: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Unit vectors grouped around random centroids, like real text embeddings"""
+    centroids = rng.standard_normal((clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=count)
+    vectors = centroids[labels] + 0.6 * rng.standard_normal((count, dim)).astype(
+        np.float32
+    )
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def top_k(matrix: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    scores = queries @ matrix.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def recall_at_k(expected: np.ndarray, found: np.ndarray) -> float:
+    """Mean fraction of the exact top-k that was also returned"""
+    hits = sum(len(set(e) & set(f)) for e, f in zip(expected, found))
+    return hits / expected.size
+
+
+def roundtrip(vectors: np.ndarray, precision: str) -> np.ndarray:
+    """Encode and decode every vector as the vector storages persist them"""
+    decoded = []
+    for vector in vectors:
+        encoded, scale = encode_vector(vector, precision)
+        decoded.append(decode_vector(encoded, scale))
+    return np.stack(decoded)
+
+
+def faiss_top_k(
+    vectors: np.ndarray, queries: np.ndarray, k: int, precision: str
+) -> np.ndarray | None:
+    """Search a faiss IndexScalarQuantizer built like FaissVectorDBStorage does"""
+    try:
+        import faiss  # type: ignore
+    except ImportError:
+        return None
+
+    if precision == VECTOR_PRECISION_FLOAT16:
+        qtype = faiss.ScalarQuantizer.QT_fp16
+    else:
+        qtype = faiss.ScalarQuantizer.QT_8bit_uniform
+    index = faiss.IndexScalarQuantizer(
+        vectors.shape[1], qtype, faiss.METRIC_INNER_PRODUCT
+    )
+    index.train(vectors)
+    index.add(vectors)
+    _, found = index.search(queries, k)
+    return found
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Measure top-k recall of float16/int8 vectors against float32"
+    )
+    parser.add_argument("--count", type=int, default=20000, help="Stored vectors")
+    parser.add_argument("--dim", type=int, default=768, help="Vector dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Query vectors")
+    parser.add_argument("--clusters", type=int, default=64, help="Topic clusters")
+    parser.add_argument("--top-k", type=int, default=40, help="Neighbours compared")
+    parser.add_argument(
+        "--min-recall",
+        type=float,
+        default=0.95,
+        help="Fail when recall@k of any precision is below this value",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    vectors = make_embeddings(args.count, args.dim, args.clusters, rng)
+    queries = make_embeddings(args.queries, args.dim, args.clusters, rng)
+    expected = top_k(vectors, queries, args.top_k)
+
+    print(
+        f"{args.count} vectors x {args.dim} dims, {args.queries} queries, "
+        f"recall@{args.top_k} against float32 exact search\n"
+    )
+    failed = False
+    for precision in (VECTOR_PRECISION_FLOAT16, VECTOR_PRECISION_INT8):
+        start = time.perf_counter()
+        decoded = roundtrip(vectors, precision)
+        elapsed = time.perf_counter() - start
+        results = [
+            (
+                "encode_vector",
+                recall_at_k(expected, top_k(decoded, queries, args.top_k)),
+            )
+        ]
+        found = faiss_top_k(vectors, queries, args.top_k, precision)
+        if found is not None:
+            results.append(("faiss", recall_at_k(expected, found)))
+
+        for source, recall in results:
+            status = "ok" if recall >= args.min_recall else "FAIL"
+            failed |= recall < args.min_recall
+            print(f"{precision:8} {source:14} recall={recall:.4f}  [{status}]")
+        print(f"{precision:8} encode+decode  {elapsed / args.count * 1e6:.1f}us/vector")
+
+    if failed:
+        print(f"\nRecall below {args.min_recall}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
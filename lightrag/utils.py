@@ -1,22 +1,30 @@
 from __future__ import annotations
-import weakref
 
 import asyncio
+import base64
+import heapq
 import html
+import itertools
 import csv
 import json
 import logging
 import logging.handlers
 import os
+import random
 import re
 import time
 import uuid
+import zlib
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
 from functools import wraps
 from hashlib import md5
 from typing import (
     Any,
+    Awaitable,
     Protocol,
     Callable,
     TYPE_CHECKING,
@@ -25,6 +33,8 @@ from typing import (
     Iterable,
     Sequence,
     Collection,
+    Hashable,
+    Mapping,
 )
 import numpy as np
 from dotenv import load_dotenv
@@ -38,6 +48,20 @@ from lightrag.constants import (
     DEFAULT_SOURCE_IDS_LIMIT_METHOD,
     VALID_SOURCE_IDS_LIMIT_METHODS,
     SOURCE_IDS_LIMIT_METHOD_FIFO,
+    LLM_CACHE_EVICTION_LRU,
+    VALID_LLM_CACHE_EVICTIONS,
+    DEFAULT_LLM_CACHE_L1_MAX_BYTES,
+    DEFAULT_LLM_CACHE_L1_TTL,
+    DEFAULT_VECTOR_PRECISION,
+    VALID_VECTOR_PRECISIONS,
+    VECTOR_PRECISION_INT8,
+    ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE,
+    ADAPTIVE_CONCURRENCY_QUOTA_HEADROOM,
+)
+from lightrag.kg.shared_storage import (
+    get_update_flag,
+    is_multiprocess,
+    set_all_update_flags,
 )
 
 # Initialize logger with basic configuration
@@ -140,6 +164,24 @@ def get_env_value(
     if value_type is bool:
         return value.lower() in ("true", "1", "yes", "t", "on")
 
+    # Handle dict type with JSON parsing
+    if value_type is dict:
+        try:
+            import json
+
+            parsed_value = json.loads(value)
+            if isinstance(parsed_value, dict):
+                return parsed_value
+            logger.warning(
+                f"Environment variable {env_key} is not a valid JSON object, using default"
+            )
+            return default
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.warning(
+                f"Failed to parse {env_key} as JSON object: {e}, using default"
+            )
+            return default
+
     # Handle list type with JSON parsing
     if value_type is list:
         try:
@@ -168,7 +210,12 @@ def get_env_value(
 
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
-    from lightrag.base import BaseKVStorage, BaseVectorStorage, QueryParam
+    from lightrag.base import (
+        BaseGraphStorage,
+        BaseKVStorage,
+        BaseVectorStorage,
+        QueryParam,
+    )
 
 # use the .env that is inside the current folder
 # allows to use different .env file for each lightrag instance
@@ -211,7 +258,16 @@ def set_verbose_debug(enabled: bool):
     VERBOSE_DEBUG = enabled
 
 
-statistic_data = {"llm_call": 0, "llm_cache": 0, "embed_call": 0}
+statistic_data = {
+    "llm_call": 0,
+    "llm_cache": 0,
+    "embed_call": 0,
+    "semantic_cache_hit": 0,
+    "semantic_cache_miss": 0,
+    "llm_cache_lookup": 0,  # handle_cache lookups
+    "llm_cache_l1_hit": 0,  # served from the in-process LRU
+    "llm_cache_l2_hit": 0,  # served from llm_response_cache storage
+}
 
 
 class LightragPathFilter(logging.Filter):
@@ -336,6 +392,365 @@ class UnlimitedSemaphore:
         pass
 
 
+class RoundRobinSemaphore:
+    """A semaphore that hands free slots to groups of waiters in turn.
+
+    Waiters are grouped (e.g. by document); each released slot goes to the next
+    group in rotation, so a group with many waiters cannot starve the others and
+    small groups finish quickly. Only usable from a single event loop.
+    """
+
+    def __init__(self, value: int):
+        self._value = value
+        self._waiters: OrderedDict[Hashable, deque[asyncio.Future]] = OrderedDict()
+
+    @asynccontextmanager
+    async def slot(self, group: Hashable):
+        """Hold one slot on behalf of group for the duration of the block"""
+        await self._acquire(group)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, group: Hashable) -> None:
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(group, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just before cancellation, pass it on
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            group, futures = next(iter(self._waiters.items()))
+            future = futures.popleft()
+            if futures:
+                self._waiters.move_to_end(group)
+            else:
+                del self._waiters[group]
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+
+# Limiter of the priority queue worker running the current LLM/embedding call, so
+# that provider bindings can report rate limit feedback without extra arguments
+_active_concurrency_limiter: ContextVar[AdaptiveConcurrencyLimiter | None] = ContextVar(
+    "active_concurrency_limiter", default=None
+)
+
+
+def _parse_rate_limit_header(headers: Mapping[str, str], name: str) -> float | None:
+    try:
+        return float(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on the number of concurrent calls to an LLM or embedding provider.
+
+    The limit grows by one after a full window of successful calls (one per slot)
+    while calls are queued and latency stays within
+    ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE of its long-term baseline. It is halved
+    on rate limit errors and timeouts, or when the provider's rate limit headers
+    report less than ADAPTIVE_CONCURRENCY_QUOTA_HEADROOM of the quota left.
+    Decreases are spaced by about one call latency, so the errors of calls that
+    were already in flight count once. With min_limit == max_limit the limit is
+    fixed. Only usable from a single event loop.
+    """
+
+    def __init__(self, min_limit: int, max_limit: int, name: str = "limit_async"):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.name = name
+        # Start halfway and let the provider's feedback settle the limit
+        self.limit = max(self.min_limit, (self.min_limit + self.max_limit) // 2)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._successes = 0
+        self._latency_recent: float | None = None
+        self._latency_baseline: float | None = None
+        self._last_decrease = float("-inf")
+        self._quota_low = False
+
+    @property
+    def adaptive(self) -> bool:
+        return self.min_limit < self.max_limit
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one call slot for the duration of the block"""
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._wake()
+
+    async def _acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just before cancellation, pass it on
+                self._in_flight -= 1
+                self._wake()
+            raise
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
+
+    def record_success(self, latency: float, backlog: bool) -> None:
+        """Account a successful call; backlog tells whether calls are waiting"""
+        if not self.adaptive:
+            return
+        if self._latency_recent is None:
+            self._latency_recent = self._latency_baseline = latency
+        else:
+            self._latency_recent += 0.3 * (latency - self._latency_recent)
+            self._latency_baseline += 0.05 * (latency - self._latency_baseline)
+
+        if (
+            self._latency_recent
+            > self._latency_baseline * ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE
+        ):
+            # Latency is climbing: the provider is saturating, hold the limit
+            self._successes = 0
+            return
+        if self._quota_low or not backlog or self.limit >= self.max_limit:
+            return
+        self._successes += 1
+        if self._successes >= self.limit:
+            self._successes = 0
+            self.limit += 1
+            logger.debug(f"{self.name}: concurrency limit raised to {self.limit}")
+            self._wake()
+
+    def record_overload(self, reason: str) -> None:
+        """Halve the limit after a rate limit error, timeout or exhausted quota"""
+        if not self.adaptive:
+            return
+        now = time.monotonic()
+        if now - self._last_decrease < (self._latency_recent or 1.0):
+            return
+        self._last_decrease = now
+        self._successes = 0
+        new_limit = max(self.min_limit, self.limit // 2)
+        if new_limit < self.limit:
+            logger.warning(
+                f"{self.name}: concurrency limit {self.limit} -> {new_limit} ({reason})"
+            )
+            self.limit = new_limit
+
+    def observe_headers(self, headers: Mapping[str, str]) -> None:
+        """Back off when x-ratelimit-remaining-* headers show the quota running out"""
+        if not self.adaptive:
+            return
+        self._quota_low = False
+        for kind in ("tokens", "requests"):
+            remaining = _parse_rate_limit_header(
+                headers, f"x-ratelimit-remaining-{kind}"
+            )
+            quota = _parse_rate_limit_header(headers, f"x-ratelimit-limit-{kind}")
+            if remaining is None or not quota:
+                continue
+            if remaining < quota * ADAPTIVE_CONCURRENCY_QUOTA_HEADROOM:
+                self._quota_low = True
+                self.record_overload(f"{kind} quota nearly used")
+                return
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "adaptive": self.adaptive,
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+        }
+
+
+class TokenBucketRateLimiter:
+    """Tokens-per-minute and requests-per-minute budget for calls to an LLM provider.
+
+    Both budgets refill continuously and hold at most one minute of quota. Calls
+    are admitted in priority order (lower value first, FIFO within a priority).
+    A reserved share of each budget can only be spent by calls with a priority
+    of reserved_priority or better, so interactive queries are not starved by
+    bulk extraction. A limit of 0 disables that budget. Only usable from a single
+    event loop.
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: int = 0,
+        requests_per_minute: int = 0,
+        reserved_ratio: float = 0.0,
+        reserved_priority: int = 5,
+    ):
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self.requests_per_minute = max(0, requests_per_minute)
+        self.reserved_ratio = min(max(reserved_ratio, 0.0), 1.0)
+        self.reserved_priority = reserved_priority
+        self._tokens = float(self.tokens_per_minute)
+        self._requests = float(self.requests_per_minute)
+        self._updated = time.monotonic()
+        self._waiters: list[list[int]] = []  # heap of [priority, sequence]
+        self._sequence = 0
+        self._changed = asyncio.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.tokens_per_minute or self.requests_per_minute)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(
+            self.tokens_per_minute,
+            self._tokens + elapsed * self.tokens_per_minute / 60,
+        )
+        self._requests = min(
+            self.requests_per_minute,
+            self._requests + elapsed * self.requests_per_minute / 60,
+        )
+
+    def _wait_time(self, tokens: int, reserved: bool) -> float:
+        """Seconds until both budgets can pay for the call, 0 if they can now"""
+        self._refill()
+        floor = 0.0 if reserved else self.reserved_ratio
+        wait_time = 0.0
+        if self.tokens_per_minute:
+            missing = tokens + floor * self.tokens_per_minute - self._tokens
+            wait_time = max(wait_time, missing * 60 / self.tokens_per_minute)
+        if self.requests_per_minute:
+            missing = 1 + floor * self.requests_per_minute - self._requests
+            wait_time = max(wait_time, missing * 60 / self.requests_per_minute)
+        return wait_time
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def acquire(self, tokens: int, priority: int = 10) -> None:
+        """Wait until the budgets allow a call of the estimated size, then spend it"""
+        if not self.enabled:
+            return
+        reserved = priority <= self.reserved_priority
+        # A call larger than the usable budget could never be admitted
+        usable = self.tokens_per_minute * (1 if reserved else 1 - self.reserved_ratio)
+        tokens = min(max(tokens, 0), int(usable))
+
+        entry = [priority, self._sequence]
+        self._sequence += 1
+        heapq.heappush(self._waiters, entry)
+        try:
+            while True:
+                wait_time = None
+                if self._waiters[0] is entry:
+                    wait_time = self._wait_time(tokens, reserved)
+                    if wait_time <= 0:
+                        self._tokens -= tokens
+                        self._requests -= 1
+                        return
+                changed = self._changed
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=wait_time)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            was_head = self._waiters[0] is entry
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+            if was_head:
+                self._notify()
+
+    def stats(self) -> dict[str, Any]:
+        self._refill()
+        return {
+            "tokens_per_minute": self.tokens_per_minute,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_available": int(self._tokens),
+            "requests_available": int(self._requests),
+            "waiting": len(self._waiters),
+        }
+
+
+def estimate_llm_request_tokens(
+    tokenizer: Tokenizer,
+    args: tuple,
+    kwargs: dict[str, Any],
+    max_tokens: int | None = None,
+) -> int:
+    """Estimate the tokens an LLM call counts against a tokens-per-minute quota.
+
+    Counts the prompt, system prompt and history messages of an llm_model_func
+    call with the tokenizer, plus the completion budget (max_tokens from the call
+    or the given default), as providers do for rate limiting.
+    """
+    prompt = args[0] if args else kwargs.get("prompt", "")
+    texts = [prompt, kwargs.get("system_prompt")]
+    texts.extend(
+        message.get("content")
+        for message in kwargs.get("history_messages") or []
+        if isinstance(message, dict)
+    )
+    prompt_tokens = sum(
+        len(tokenizer.encode(text)) for text in texts if isinstance(text, str) and text
+    )
+    completion_tokens = (
+        kwargs.get("max_tokens") or kwargs.get("max_completion_tokens") or max_tokens
+    )
+    return prompt_tokens + (completion_tokens or 0)
+
+
+def report_rate_limit_headers(headers: Mapping[str, str] | None) -> None:
+    """Feed provider rate limit headers to the concurrency limiter of the current call.
+
+    No-op outside calls made through priority_limit_async_func_call.
+    """
+    limiter = _active_concurrency_limiter.get()
+    if limiter is not None and headers:
+        limiter.observe_headers(headers)
+
+
+def report_rate_limited(reason: str = "rate limited") -> None:
+    """Tell the concurrency limiter of the current call that the provider pushed back.
+
+    Meant for bindings that retry internally, so the limiter backs off on the
+    first rate limit error instead of after the last retry.
+    """
+    limiter = _active_concurrency_limiter.get()
+    if limiter is not None:
+        limiter.record_overload(reason)
+
+
+def _is_overload_error(error: BaseException) -> bool:
+    """Whether error signals an overloaded provider (429 or timeout)"""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    if type(error).__name__ in ("RateLimitError", "APITimeoutError"):
+        return True
+    return getattr(error, "status_code", None) == 429
+
+
 @dataclass
 class TaskState:
     """Task state tracking for priority queue management"""
@@ -417,6 +832,113 @@ def parse_cache_key(cache_key: str) -> tuple[str, str, str] | None:
     return None
 
 
+@dataclass(frozen=True)
+class LLMCachePolicy:
+    """Retention policy for one cache_type of the LLM response cache"""
+
+    ttl: int | None = None
+    """Seconds an entry stays valid after it was last written, None for no expiry."""
+    max_entries: int | None = None
+    """Maximum number of entries kept for the cache_type, None for unbounded."""
+    max_bytes: int | None = None
+    """Maximum serialized size of all entries of the cache_type, None for unbounded."""
+    eviction: str = LLM_CACHE_EVICTION_LRU
+    """Which entries to drop first when a bound is exceeded: 'lru' or 'lfu'."""
+
+    @property
+    def bounded(self) -> bool:
+        return bool(self.max_entries or self.max_bytes)
+
+    def is_expired(self, entry: dict[str, Any], now: float | None = None) -> bool:
+        """Check whether a cache entry outlived the TTL, based on its update_time"""
+        if not self.ttl:
+            return False
+        written_at = entry.get("update_time") or entry.get("create_time") or 0
+        if not written_at:
+            return False
+        return (now or time.time()) - written_at > self.ttl
+
+
+def get_llm_cache_policies(global_config: dict[str, Any]) -> dict[str, LLMCachePolicy]:
+    """Build the per cache_type policies configured in llm_cache_policies
+
+    Example configuration:
+        {"query": {"ttl": 86400, "max_entries": 10000, "eviction": "lru"},
+         "keywords": {"max_bytes": 52428800, "eviction": "lfu"}}
+
+    Invalid entries are skipped with a warning.
+    """
+    policies: dict[str, LLMCachePolicy] = {}
+    raw_policies = global_config.get("llm_cache_policies") or {}
+    for cache_type, raw in raw_policies.items():
+        if not isinstance(raw, dict):
+            logger.warning(f"Ignoring invalid LLM cache policy for '{cache_type}'")
+            continue
+        eviction = str(raw.get("eviction", LLM_CACHE_EVICTION_LRU)).lower()
+        if eviction not in VALID_LLM_CACHE_EVICTIONS:
+            logger.warning(
+                f"Unknown LLM cache eviction '{eviction}' for '{cache_type}', using {LLM_CACHE_EVICTION_LRU}"
+            )
+            eviction = LLM_CACHE_EVICTION_LRU
+        try:
+            policy = LLMCachePolicy(
+                ttl=int(raw["ttl"]) if raw.get("ttl") else None,
+                max_entries=int(raw["max_entries"]) if raw.get("max_entries") else None,
+                max_bytes=int(raw["max_bytes"]) if raw.get("max_bytes") else None,
+                eviction=eviction,
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Ignoring invalid LLM cache policy for '{cache_type}': {e}")
+            continue
+        if policy.ttl or policy.bounded:
+            policies[cache_type] = policy
+    return policies
+
+
+def get_cache_type_from_key(cache_key: str) -> str | None:
+    """Return the cache_type part of a flattened cache key"""
+    parsed = parse_cache_key(cache_key)
+    return parsed[1] if parsed else None
+
+
+def estimate_cache_entry_bytes(entry: dict[str, Any]) -> int:
+    """Approximate storage size of a cache entry, used by max_bytes policies"""
+    return len(json.dumps(entry, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def select_cache_evictions(
+    candidates: list[tuple[str, float, int]], policy: LLMCachePolicy
+) -> list[str]:
+    """Pick cache keys to evict so that the remaining entries fit the policy bounds
+
+    Args:
+        candidates: (cache_key, usage_score, size_bytes) for every entry of one
+            cache_type. usage_score is the last access time for LRU or the hit
+            count for LFU; lower scores are evicted first.
+        policy: Policy of the cache_type
+
+    Returns:
+        Cache keys to evict
+    """
+    if not policy.bounded or not candidates:
+        return []
+
+    ordered = sorted(candidates, key=lambda c: c[1])
+    total_entries = len(ordered)
+    total_bytes = sum(c[2] for c in ordered) if policy.max_bytes else 0
+
+    evicted = []
+    for cache_key, _, size in ordered:
+        over_entries = policy.max_entries and total_entries > policy.max_entries
+        over_bytes = policy.max_bytes and total_bytes > policy.max_bytes
+        if not over_entries and not over_bytes:
+            break
+        evicted.append(cache_key)
+        total_entries -= 1
+        total_bytes -= size
+    return evicted
+
+
 # Custom exception classes
 class QueueFullError(Exception):
     """Raised when the queue is full and the wait times out"""
@@ -447,6 +969,9 @@ class HealthCheckTimeoutError(Exception):
 def priority_limit_async_func_call(
     max_size: int,
     llm_timeout: float = None,
+    min_size: int | None = None,
+    rate_limiter: TokenBucketRateLimiter | None = None,
+    estimate_tokens: Callable[[tuple, dict[str, Any]], int] | None = None,
     max_execution_timeout: float = None,
     max_task_duration: float = None,
     max_queue_size: int = 1000,
@@ -461,9 +986,15 @@ def priority_limit_async_func_call(
     - Task state tracking to prevent race conditions
     - Enhanced health check system with stuck task detection
     - Proper resource cleanup and error recovery
+    - Optional AIMD concurrency limit between min_size and max_size, driven by
+      latency, rate limit errors, timeouts and provider rate limit headers
+    - Optional TPM/RPM budget with a share reserved for high priority calls
 
     Args:
         max_size: Maximum number of concurrent calls
+        min_size: Floor of the adaptive concurrency limit; None or 0 keeps max_size fixed
+        rate_limiter: Optional tokens/requests per minute budget calls must fit in before being queued
+        estimate_tokens: Estimates the tokens of a call from its (args, kwargs) for rate_limiter
         max_queue_size: Maximum queue capacity to prevent memory overflow
         llm_timeout: LLM provider timeout (from global config), used to calculate other timeouts
         max_execution_timeout: Maximum time for worker to execute function (defaults to llm_timeout + 30s)
@@ -495,153 +1026,166 @@ def priority_limit_async_func_call(
         queue = asyncio.PriorityQueue(maxsize=max_queue_size)
         tasks = set()
         initialization_lock = asyncio.Lock()
-        counter = 0
+        # Task ids increase monotonically, so they also keep FIFO order within a priority
+        task_ids = itertools.count()
         shutdown_event = asyncio.Event()
         initialized = False
         worker_health_check_task = None
 
-        # Enhanced task state management
+        # Enhanced task state management. State is only touched from the event loop
+        # and never across an await, so it needs no lock
         task_states = {}  # task_id -> TaskState
-        task_states_lock = asyncio.Lock()
-        active_futures = weakref.WeakSet()
+        # Heap of (execution deadline, task_id) for stuck task detection; entries of
+        # finished tasks are dropped lazily
+        deadlines: list[tuple[float, int]] = []
         reinit_count = 0
+        # max_size workers run, but only limiter.limit of them call func at a time
+        limiter = AdaptiveConcurrencyLimiter(
+            min_size or max_size, max_size, name=queue_name
+        )
 
         async def worker():
             """Enhanced worker that processes tasks with proper timeout and state management"""
+            # Calls made by this worker report rate limit feedback to the limiter
+            _active_concurrency_limiter.set(limiter)
+            loop = asyncio.get_running_loop()
             try:
                 while not shutdown_event.is_set():
-                    try:
-                        # Get task from queue with timeout for shutdown checking
+                    # Take a call slot before dequeuing so queued tasks keep their priority order
+                    async with limiter.slot():
                         try:
-                            (
-                                priority,
-                                count,
-                                task_id,
-                                args,
-                                kwargs,
-                            ) = await asyncio.wait_for(queue.get(), timeout=1.0)
-                        except asyncio.TimeoutError:
-                            continue
-
-                        # Get task state and mark worker as started
-                        async with task_states_lock:
-                            if task_id not in task_states:
+                            # Idle workers wait here until shutdown cancels them
+                            _, task_id, args, kwargs = await queue.get()
+
+                            task_state = task_states.get(task_id)
+                            if task_state is None:
                                 queue.task_done()
                                 continue
-                            task_state = task_states[task_id]
-                            task_state.worker_started = True
-                            # Record execution start time when worker actually begins processing
-                            task_state.execution_start_time = (
-                                asyncio.get_event_loop().time()
-                            )
 
-                        # Check if task was cancelled before worker started
-                        if (
-                            task_state.cancellation_requested
-                            or task_state.future.cancelled()
-                        ):
-                            async with task_states_lock:
+                            # Check if task was cancelled before worker started
+                            if (
+                                task_state.cancellation_requested
+                                or task_state.future.cancelled()
+                            ):
                                 task_states.pop(task_id, None)
-                            queue.task_done()
-                            continue
+                                queue.task_done()
+                                continue
 
-                        try:
-                            # Execute function with timeout protection
-                            if max_execution_timeout is not None:
-                                result = await asyncio.wait_for(
-                                    func(*args, **kwargs), timeout=max_execution_timeout
+                            # Mark worker as started and record execution start time
+                            call_start = loop.time()
+                            task_state.worker_started = True
+                            task_state.execution_start_time = call_start
+                            if max_task_duration is not None:
+                                heapq.heappush(
+                                    deadlines, (call_start + max_task_duration, task_id)
                                 )
-                            else:
-                                result = await func(*args, **kwargs)
 
-                            # Set result if future is still valid
-                            if not task_state.future.done():
-                                task_state.future.set_result(result)
+                            try:
+                                # Execute function with timeout protection
+                                if max_execution_timeout is not None:
+                                    result = await asyncio.wait_for(
+                                        func(*args, **kwargs),
+                                        timeout=max_execution_timeout,
+                                    )
+                                else:
+                                    result = await func(*args, **kwargs)
 
-                        except asyncio.TimeoutError:
-                            # Worker-level timeout (max_execution_timeout exceeded)
-                            logger.warning(
-                                f"{queue_name}: Worker timeout for task {task_id} after {max_execution_timeout}s"
-                            )
-                            if not task_state.future.done():
-                                task_state.future.set_exception(
-                                    WorkerTimeoutError(
-                                        max_execution_timeout, "execution"
+                                limiter.record_success(
+                                    loop.time() - call_start, backlog=not queue.empty()
+                                )
+
+                                # Set result if future is still valid
+                                if not task_state.future.done():
+                                    task_state.future.set_result(result)
+
+                            except asyncio.TimeoutError:
+                                # Worker-level timeout (max_execution_timeout exceeded)
+                                logger.warning(
+                                    f"{queue_name}: Worker timeout for task {task_id} after {max_execution_timeout}s"
+                                )
+                                limiter.record_overload("worker timeout")
+                                if not task_state.future.done():
+                                    task_state.future.set_exception(
+                                        WorkerTimeoutError(
+                                            max_execution_timeout, "execution"
+                                        )
                                     )
+                            except asyncio.CancelledError:
+                                # Task was cancelled during execution
+                                if not task_state.future.done():
+                                    task_state.future.cancel()
+                                logger.debug(
+                                    f"{queue_name}: Task {task_id} cancelled during execution"
                                 )
-                        except asyncio.CancelledError:
-                            # Task was cancelled during execution
-                            if not task_state.future.done():
-                                task_state.future.cancel()
-                            logger.debug(
-                                f"{queue_name}: Task {task_id} cancelled during execution"
-                            )
+                            except Exception as e:
+                                # Function execution error
+                                logger.error(
+                                    f"{queue_name}: Error in decorated function for task {task_id}: {str(e)}"
+                                )
+                                if _is_overload_error(e):
+                                    limiter.record_overload(type(e).__name__)
+                                if not task_state.future.done():
+                                    task_state.future.set_exception(e)
+                            finally:
+                                # Clean up task state
+                                task_states.pop(task_id, None)
+                                queue.task_done()
+                                if len(deadlines) > 2 * len(task_states) + 64:
+                                    # Mostly finished tasks: rebuild to bound the heap
+                                    deadlines[:] = [
+                                        entry
+                                        for entry in deadlines
+                                        if entry[1] in task_states
+                                    ]
+                                    heapq.heapify(deadlines)
+
                         except Exception as e:
-                            # Function execution error
+                            # Critical error in worker loop
                             logger.error(
-                                f"{queue_name}: Error in decorated function for task {task_id}: {str(e)}"
+                                f"{queue_name}: Critical error in worker: {str(e)}"
                             )
-                            if not task_state.future.done():
-                                task_state.future.set_exception(e)
-                        finally:
-                            # Clean up task state
-                            async with task_states_lock:
-                                task_states.pop(task_id, None)
-                            queue.task_done()
-
-                    except Exception as e:
-                        # Critical error in worker loop
-                        logger.error(
-                            f"{queue_name}: Critical error in worker: {str(e)}"
-                        )
-                        await asyncio.sleep(0.1)
+                            await asyncio.sleep(0.1)
             finally:
                 logger.debug(f"{queue_name}: Worker exiting")
 
         async def enhanced_health_check():
             """Enhanced health check with stuck task detection and recovery"""
             nonlocal initialized
+            loop = asyncio.get_running_loop()
             try:
                 while not shutdown_event.is_set():
-                    await asyncio.sleep(5)  # Check every 5 seconds
-
-                    current_time = asyncio.get_event_loop().time()
-
-                    # Detect and handle stuck tasks based on execution start time
-                    if max_task_duration is not None:
-                        stuck_tasks = []
-                        async with task_states_lock:
-                            for task_id, task_state in list(task_states.items()):
-                                # Only check tasks that have started execution
-                                if (
-                                    task_state.worker_started
-                                    and task_state.execution_start_time is not None
-                                    and current_time - task_state.execution_start_time
-                                    > max_task_duration
-                                ):
-                                    stuck_tasks.append(
-                                        (
-                                            task_id,
-                                            current_time
-                                            - task_state.execution_start_time,
-                                        )
-                                    )
-
-                        # Force cleanup of stuck tasks
-                        for task_id, execution_duration in stuck_tasks:
-                            logger.warning(
-                                f"{queue_name}: Detected stuck task {task_id} (execution time: {execution_duration:.1f}s), forcing cleanup"
+                    # Check every 5 seconds, or earlier when a running task hits its
+                    # deadline (deadlines only grow, so later pushes never come first)
+                    timeout = 5.0
+                    if deadlines:
+                        timeout = min(timeout, max(0.0, deadlines[0][0] - loop.time()))
+                    try:
+                        await asyncio.wait_for(shutdown_event.wait(), timeout=timeout)
+                        break
+                    except asyncio.TimeoutError:
+                        pass
+
+                    current_time = loop.time()
+
+                    # Detect and handle stuck tasks whose execution deadline has passed
+                    while deadlines and deadlines[0][0] <= current_time:
+                        _, task_id = heapq.heappop(deadlines)
+                        task_state = task_states.get(task_id)
+                        if task_state is None:
+                            continue  # Finished in time
+                        execution_duration = (
+                            current_time - task_state.execution_start_time
+                        )
+                        logger.warning(
+                            f"{queue_name}: Detected stuck task {task_id} (execution time: {execution_duration:.1f}s), forcing cleanup"
+                        )
+                        if not task_state.future.done():
+                            task_state.future.set_exception(
+                                HealthCheckTimeoutError(
+                                    max_task_duration, execution_duration
+                                )
                             )
-                            async with task_states_lock:
-                                if task_id in task_states:
-                                    task_state = task_states[task_id]
-                                    if not task_state.future.done():
-                                        task_state.future.set_exception(
-                                            HealthCheckTimeoutError(
-                                                max_task_duration, execution_duration
-                                            )
-                                        )
-                                    task_states.pop(task_id, None)
+                        task_states.pop(task_id, None)
 
                     # Worker recovery logic
                     current_tasks = set(tasks)
@@ -731,17 +1275,12 @@ def priority_limit_async_func_call(
 
             shutdown_event.set()
 
-            # Cancel all active futures
-            for future in list(active_futures):
-                if not future.done():
-                    future.cancel()
-
-            # Cancel all pending tasks
-            async with task_states_lock:
-                for task_id, task_state in list(task_states.items()):
-                    if not task_state.future.done():
-                        task_state.future.cancel()
-                task_states.clear()
+            # Cancel all pending and running tasks
+            for task_state in list(task_states.values()):
+                if not task_state.future.done():
+                    task_state.future.cancel()
+            task_states.clear()
+            deadlines.clear()
 
             # Wait for queue to empty with timeout
             try:
@@ -795,40 +1334,33 @@ def priority_limit_async_func_call(
             await ensure_workers()
 
             # Generate unique task ID
-            task_id = f"{id(asyncio.current_task())}_{asyncio.get_event_loop().time()}"
-            future = asyncio.Future()
-
-            # Create task state
-            task_state = TaskState(
-                future=future, start_time=asyncio.get_event_loop().time()
-            )
+            task_id = next(task_ids)
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
 
             try:
                 # Register task state
-                async with task_states_lock:
-                    task_states[task_id] = task_state
-
-                active_futures.add(future)
-
-                # Get counter for FIFO ordering
-                nonlocal counter
-                async with initialization_lock:
-                    current_count = counter
-                    counter += 1
+                task_states[task_id] = TaskState(future=future, start_time=loop.time())
+
+                # Wait for the TPM/RPM budget before queueing, so budget-bound calls
+                # don't hold workers that higher priority calls could use
+                if rate_limiter is not None and rate_limiter.enabled:
+                    tokens = (
+                        estimate_tokens(args, kwargs)
+                        if estimate_tokens and rate_limiter.tokens_per_minute
+                        else 0
+                    )
+                    await rate_limiter.acquire(tokens, _priority)
 
                 # Queue the task with timeout handling
                 try:
                     if _queue_timeout is not None:
                         await asyncio.wait_for(
-                            queue.put(
-                                (_priority, current_count, task_id, args, kwargs)
-                            ),
+                            queue.put((_priority, task_id, args, kwargs)),
                             timeout=_queue_timeout,
                         )
                     else:
-                        await queue.put(
-                            (_priority, current_count, task_id, args, kwargs)
-                        )
+                        await queue.put((_priority, task_id, args, kwargs))
                 except asyncio.TimeoutError:
                     raise QueueFullError(
                         f"{queue_name}: Queue full, timeout after {_queue_timeout} seconds"
@@ -848,20 +1380,18 @@ def priority_limit_async_func_call(
                 except asyncio.TimeoutError:
                     # This is user-level timeout (asyncio.wait_for caused)
                     # Mark cancellation request
-                    async with task_states_lock:
-                        if task_id in task_states:
-                            task_states[task_id].cancellation_requested = True
+                    if task_id in task_states:
+                        task_states[task_id].cancellation_requested = True
 
                     # Cancel future
                     if not future.done():
                         future.cancel()
 
                     # Wait for worker cleanup with timeout
-                    cleanup_start = asyncio.get_event_loop().time()
+                    cleanup_start = loop.time()
                     while (
                         task_id in task_states
-                        and asyncio.get_event_loop().time() - cleanup_start
-                        < cleanup_timeout
+                        and loop.time() - cleanup_start < cleanup_timeout
                     ):
                         await asyncio.sleep(0.1)
 
@@ -877,12 +1407,19 @@ def priority_limit_async_func_call(
 
             finally:
                 # Ensure cleanup
-                active_futures.discard(future)
-                async with task_states_lock:
-                    task_states.pop(task_id, None)
+                task_states.pop(task_id, None)
 
-        # Add shutdown method to decorated function
+        def get_stats() -> dict[str, Any]:
+            """Current concurrency limit, running calls and queued calls"""
+            running = sum(1 for state in task_states.values() if state.worker_started)
+            stats = {**limiter.stats(), "running": running, "queue_size": queue.qsize()}
+            if rate_limiter is not None and rate_limiter.enabled:
+                stats["rate_limit"] = rate_limiter.stats()
+            return stats
+
+        # Add shutdown and stats methods to decorated function
         wait_func.shutdown = shutdown
+        wait_func.get_stats = get_stats
 
         return wait_func
 
@@ -911,6 +1448,11 @@ def write_json(json_obj, file_name):
         json.dump(json_obj, f, indent=2, ensure_ascii=False)
 
 
+# Max consecutive tokens that may decode to a partial character before
+# Tokenizer.encode_with_offsets gives up aligning tokens with the source text
+_MAX_UNALIGNED_TOKENS = 8
+
+
 class TokenizerInterface(Protocol):
     """
     Defines the interface for a tokenizer, requiring encode and decode methods.
@@ -965,6 +1507,42 @@ class Tokenizer:
         """
         return self.tokenizer.decode(tokens)
 
+    def encode_with_offsets(self, content: str) -> tuple[List[int], List[int] | None]:
+        """
+        Encodes a string and maps every token to the character offset it starts at.
+
+        Uses the underlying tokenizer's decode_with_offsets when available (tiktoken),
+        otherwise aligns the decoded tokens against the content. Tokens that only
+        carry part of a multi-byte character are mapped to the start of that character.
+
+        Args:
+            content: The string to encode.
+
+        Returns:
+            A tuple of (tokens, offsets). offsets is None when the tokenizer's decoded
+            text cannot be aligned with the content (e.g. normalizing tokenizers).
+        """
+        tokens = self.encode(content)
+        decode_with_offsets = getattr(self.tokenizer, "decode_with_offsets", None)
+        if decode_with_offsets is not None:
+            text, offsets = decode_with_offsets(tokens)
+            return tokens, (offsets if text == content else None)
+
+        offsets: List[int] = []
+        pos = 0
+        group_start = 0
+        for i in range(len(tokens)):
+            piece = self.decode(tokens[group_start : i + 1])
+            if content.startswith(piece, pos):
+                offsets.extend([pos] * (i + 1 - group_start))
+                pos += len(piece)
+                group_start = i + 1
+            elif i + 1 - group_start >= _MAX_UNALIGNED_TOKENS:
+                return tokens, None
+        if group_start != len(tokens) or pos != len(content):
+            return tokens, None
+        return tokens, offsets
+
 
 class TiktokenTokenizer(Tokenizer):
     """
@@ -1033,6 +1611,46 @@ def truncate_list_by_token_size(
     return list_data
 
 
+def get_vector_precision(storage_kwargs: dict[str, Any]) -> str:
+    """Read and validate ``vector_precision`` from vector_db_storage_cls_kwargs"""
+    precision = str(
+        storage_kwargs.get("vector_precision") or DEFAULT_VECTOR_PRECISION
+    ).lower()
+    if precision not in VALID_VECTOR_PRECISIONS:
+        raise ValueError(
+            f"Invalid vector_precision '{precision}', expected one of "
+            f"{sorted(VALID_VECTOR_PRECISIONS)}"
+        )
+    return precision
+
+
+def encode_vector(vector: np.ndarray, precision: str) -> tuple[str, float | None]:
+    """Encode a vector as zlib-compressed Base64 in the requested precision
+
+    int8 uses symmetric per-vector scalar quantization; the returned scale
+    must be stored next to the payload and passed back to ``decode_vector``.
+    Other precisions are stored as float16 and return ``None`` as scale.
+    """
+    vector = np.asarray(vector, dtype=np.float32)
+    scale = None
+    if precision == VECTOR_PRECISION_INT8:
+        max_abs = float(np.max(np.abs(vector))) if vector.size else 0.0
+        scale = max_abs / 127.0 if max_abs > 0 else 1.0
+        payload = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+    else:
+        payload = vector.astype(np.float16)
+    encoded = base64.b64encode(zlib.compress(payload.tobytes())).decode("utf-8")
+    return encoded, scale
+
+
+def decode_vector(encoded: str, scale: float | None = None) -> np.ndarray:
+    """Decode a vector produced by ``encode_vector`` back to float32"""
+    raw = zlib.decompress(base64.b64decode(encoded))
+    if scale is not None:
+        return np.frombuffer(raw, dtype=np.int8).astype(np.float32) * scale
+    return np.frombuffer(raw, dtype=np.float16).astype(np.float32)
+
+
 def cosine_similarity(v1, v2):
     """Calculate cosine similarity between two vectors"""
     dot_product = np.dot(v1, v2)
@@ -1041,6 +1659,195 @@ def cosine_similarity(v1, v2):
     return dot_product / (norm1 * norm2)
 
 
+def top_k_cosine(
+    query_vector, matrix: np.ndarray, top_k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Select the top_k rows of matrix by cosine similarity to query_vector
+
+    Normalizes the query once, scores all rows with a single matmul and uses
+    argpartition so only the selected rows are sorted.
+
+    Returns:
+        Tuple (row_indices, scores) ordered by similarity (highest first)
+    """
+    query = np.asarray(query_vector, dtype=np.float32).ravel()
+    query_norm = np.linalg.norm(query)
+    if query_norm > 0:
+        query = query / query_norm
+    row_norms = np.linalg.norm(matrix, axis=1)
+    row_norms[row_norms == 0] = 1.0
+    scores = (matrix @ query) / row_norms
+
+    top_k = min(top_k, len(scores))
+    if top_k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    if top_k < len(scores):
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        candidates = np.arange(len(scores))
+    order = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return order, scores[order]
+
+
+class LLMCacheLRU:
+    """Per-process LRU of LLM cache entries in front of llm_response_cache
+
+    Entries are scoped by the storage instance (namespace and workspace) and the
+    total size, measured with estimate_cache_entry_bytes, is bounded by the
+    ``llm_cache_l1_max_bytes`` setting of the storage's global_config.
+
+    Hits on bounded cache types are reported back to the storage in batches, so
+    its LRU/LFU eviction still sees entries that are only served from here.
+
+    With several worker processes, ``invalidate`` raises the shared update flag of
+    the storage and every other worker drops its entries of that storage on its
+    next ``sync``. Entries the storage removes on its own are not signalled; they
+    are served until ``llm_cache_l1_ttl`` seconds after they were cached.
+    """
+
+    def __init__(self):
+        # scoped key -> (entry, size, monotonic expiry time)
+        self._entries: OrderedDict[tuple[str, str, str], tuple[dict, int, float]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        # id(storage) -> (storage, accessed keys), flushed by one background task
+        self._pending_access: dict[int, tuple[Any, list[str]]] = {}
+        self._access_task: asyncio.Task | None = None
+        # (workspace, namespace) -> update flag of this process, multi-process only
+        self._update_flags: dict[tuple[str, str], Any] = {}
+
+    @staticmethod
+    def _scope_key(hashing_kv, key: str) -> tuple[str, str, str]:
+        return (hashing_kv.workspace, hashing_kv.namespace, key)
+
+    @staticmethod
+    def _flag_namespace(hashing_kv) -> str:
+        return f"llm_cache_l1:{hashing_kv.workspace}:{hashing_kv.namespace}"
+
+    @staticmethod
+    def max_bytes(hashing_kv) -> int:
+        return hashing_kv.global_config.get(
+            "llm_cache_l1_max_bytes", DEFAULT_LLM_CACHE_L1_MAX_BYTES
+        )
+
+    @staticmethod
+    def ttl(hashing_kv) -> int:
+        return hashing_kv.global_config.get(
+            "llm_cache_l1_ttl", DEFAULT_LLM_CACHE_L1_TTL
+        )
+
+    def get(self, hashing_kv, key: str) -> dict[str, Any] | None:
+        scoped = self._scope_key(hashing_kv, key)
+        item = self._entries.get(scoped)
+        if item is None:
+            return None
+        if item[2] <= time.monotonic():
+            del self._entries[scoped]
+            self._bytes -= item[1]
+            return None
+        self._entries.move_to_end(scoped)
+        return item[0]
+
+    def put(self, hashing_kv, key: str, entry: dict[str, Any]) -> None:
+        max_bytes = self.max_bytes(hashing_kv)
+        ttl = self.ttl(hashing_kv)
+        if max_bytes <= 0 or ttl <= 0:
+            return
+        self.discard(hashing_kv, [key])
+        size = estimate_cache_entry_bytes(entry)
+        if size > max_bytes:
+            return
+        expires_at = time.monotonic() + ttl
+        self._entries[self._scope_key(hashing_kv, key)] = (entry, size, expires_at)
+        self._bytes += size
+        while self._bytes > max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+
+    def record_access(self, hashing_kv, key: str) -> None:
+        """Queue an access to report to the storage of an entry served from L1"""
+        pending = self._pending_access.get(id(hashing_kv))
+        if pending is None:
+            pending = self._pending_access[id(hashing_kv)] = (hashing_kv, [])
+        pending[1].append(key)
+        if self._access_task is None or self._access_task.done():
+            self._access_task = asyncio.create_task(self._flush_access())
+
+    async def _flush_access(self) -> None:
+        # Hits arriving while a batch is written are collected into the next one
+        while self._pending_access:
+            pending, self._pending_access = self._pending_access, {}
+            for hashing_kv, keys in pending.values():
+                try:
+                    await hashing_kv.record_cache_access(keys)
+                except Exception as e:
+                    logger.debug(
+                        f"[{hashing_kv.workspace}] Failed to record LLM cache access: {e}"
+                    )
+
+    def discard(self, hashing_kv, keys: Iterable[str]) -> None:
+        for key in keys:
+            item = self._entries.pop(self._scope_key(hashing_kv, key), None)
+            if item is not None:
+                self._bytes -= item[1]
+
+    def clear(self, hashing_kv=None) -> None:
+        """Drop all entries, or only those of one storage instance"""
+        if hashing_kv is None:
+            self._entries.clear()
+            self._bytes = 0
+            return
+        scope = (hashing_kv.workspace, hashing_kv.namespace)
+        for scoped in [k for k in self._entries if k[:2] == scope]:
+            self._bytes -= self._entries.pop(scoped)[1]
+
+    async def sync(self, hashing_kv) -> None:
+        """Drop the entries of a storage that another worker process invalidated"""
+        if not is_multiprocess():
+            return
+        scope = (hashing_kv.workspace, hashing_kv.namespace)
+        flag = self._update_flags.get(scope)
+        if flag is None:
+            flag = await get_update_flag(self._flag_namespace(hashing_kv))
+            self._update_flags[scope] = flag
+        if flag.value:
+            # Reset before clearing so a concurrent invalidation is not lost
+            flag.value = False
+            self.clear(hashing_kv)
+
+    async def invalidate(self, hashing_kv, keys: Iterable[str] | None = None) -> None:
+        """Drop entries of a storage here and in every other worker process
+
+        ``keys=None`` drops all entries of the storage. Other workers drop all
+        their entries of the storage in either case.
+        """
+        if keys is None:
+            self.clear(hashing_kv)
+        else:
+            self.discard(hashing_kv, keys)
+        if is_multiprocess():
+            await self.sync(hashing_kv)
+            await set_all_update_flags(self._flag_namespace(hashing_kv))
+            self._update_flags[
+                (hashing_kv.workspace, hashing_kv.namespace)
+            ].value = False
+
+
+llm_cache_l1 = LLMCacheLRU()
+
+
+def get_llm_cache_hit_rates() -> dict[str, float]:
+    """L1 (in-process) and L2 (storage) hit rates of LLM cache lookups"""
+    lookups = statistic_data["llm_cache_lookup"]
+    if not lookups:
+        return {"l1_hit_rate": 0.0, "l2_hit_rate": 0.0}
+    return {
+        "l1_hit_rate": statistic_data["llm_cache_l1_hit"] / lookups,
+        "l2_hit_rate": statistic_data["llm_cache_l2_hit"] / lookups,
+    }
+
+
 async def handle_cache(
     hashing_kv,
     args_hash,
@@ -1065,8 +1872,28 @@ async def handle_cache(
 
     # Use flattened cache key format: {mode}:{cache_type}:{hash}
     flattened_key = generate_cache_key(mode, cache_type, args_hash)
+    policy = hashing_kv.llm_cache_policies.get(cache_type)
+    statistic_data["llm_cache_lookup"] += 1
+
+    # L1: in-process LRU, no storage round-trip
+    await llm_cache_l1.sync(hashing_kv)
+    cache_entry = llm_cache_l1.get(hashing_kv, flattened_key)
+    if cache_entry is not None and not (policy and policy.is_expired(cache_entry)):
+        statistic_data["llm_cache_l1_hit"] += 1
+        if policy and policy.bounded:
+            llm_cache_l1.record_access(hashing_kv, flattened_key)
+        logger.debug(f"In-memory cache hit(key:{flattened_key})")
+        return cache_entry["return"], cache_entry.get("create_time", 0)
+
+    # L2: llm_response_cache storage
     cache_entry = await hashing_kv.get_by_id(flattened_key)
     if cache_entry:
+        # Backends without native expiry may still hold entries past their TTL
+        if policy and policy.is_expired(cache_entry):
+            logger.debug(f"Cache expired(key:{flattened_key})")
+            return None
+        statistic_data["llm_cache_l2_hit"] += 1
+        llm_cache_l1.put(hashing_kv, flattened_key, cache_entry)
         logger.debug(f"Flattened cache hit(key:{flattened_key})")
         content = cache_entry["return"]
         timestamp = cache_entry.get("create_time", 0)
@@ -1087,12 +1914,18 @@ class CacheData:
     queryparam: dict | None = None
 
 
-async def save_to_cache(hashing_kv, cache_data: CacheData):
+async def save_to_cache(
+    hashing_kv,
+    cache_data: CacheData,
+    write_buffer: dict[str, dict[str, Any]] | None = None,
+):
     """Save data to cache using flattened key structure.
 
     Args:
         hashing_kv: The key-value storage for caching
         cache_data: The cache data to save
+        write_buffer: Optional dict collecting entries for one batched upsert by
+            the caller instead of writing each entry to storage immediately
     """
     # Skip if storage is None or content is a streaming response
     if hashing_kv is None or not cache_data.content:
@@ -1108,11 +1941,17 @@ async def save_to_cache(hashing_kv, cache_data: CacheData):
         cache_data.mode, cache_data.cache_type, cache_data.args_hash
     )
 
-    # Check if we already have identical content cached
-    existing_cache = await hashing_kv.get_by_id(flattened_key)
+    # Check if we already have identical content cached. Callers reach this
+    # after a handle_cache miss, so only the in-process tier is consulted.
+    await llm_cache_l1.sync(hashing_kv)
+    existing_cache = llm_cache_l1.get(hashing_kv, flattened_key)
     if existing_cache:
         existing_content = existing_cache.get("return")
-        if existing_content == cache_data.content:
+        policy = hashing_kv.llm_cache_policies.get(cache_data.cache_type)
+        # Rewrite expired entries even if identical, to refresh their TTL
+        if existing_content == cache_data.content and not (
+            policy and policy.is_expired(existing_cache)
+        ):
             logger.warning(
                 f"Cache duplication detected for {flattened_key}, skipping update"
             )
@@ -1129,6 +1968,18 @@ async def save_to_cache(hashing_kv, cache_data: CacheData):
         else None,
     }
 
+    # Storage backends stamp their own times on upsert; L1 needs them for TTLs
+    now = int(time.time())
+    llm_cache_l1.put(
+        hashing_kv,
+        flattened_key,
+        {**cache_entry, "create_time": now, "update_time": now},
+    )
+
+    if write_buffer is not None:
+        write_buffer[flattened_key] = cache_entry
+        return
+
     logger.info(f" == LLM cache == saving: {flattened_key}")
 
     # Save using flattened key
@@ -1218,11 +2069,12 @@ async def aexport_data(
     relationships_data = []
 
     # --- Entities ---
-    all_entities = await chunk_entity_relation_graph.get_all_labels()
-    for entity_name in all_entities:
-        # Get entity information from graph
-        node_data = await chunk_entity_relation_graph.get_node(entity_name)
-        source_id = node_data.get("source_id") if node_data else None
+    # Stream nodes from the graph storage instead of fetching them one by one
+    async for node_data in chunk_entity_relation_graph.iter_all_nodes():
+        entity_name = node_data.get("entity_id") or node_data.get("id")
+        if not entity_name:
+            continue
+        source_id = node_data.get("source_id")
 
         entity_info = {
             "graph_data": node_data,
@@ -1247,41 +2099,41 @@ async def aexport_data(
         entities_data.append(entity_row)
 
     # --- Relations ---
-    for src_entity in all_entities:
-        for tgt_entity in all_entities:
-            if src_entity == tgt_entity:
-                continue
+    # Stream edges directly instead of probing every pair of entities
+    seen_edges = set()
+    async for edge_data in chunk_entity_relation_graph.iter_all_edges():
+        src_entity = edge_data.get("source")
+        tgt_entity = edge_data.get("target")
+        if not src_entity or not tgt_entity or src_entity == tgt_entity:
+            continue
+        # Edges are undirected, some backends return both directions
+        edge_key = tuple(sorted((src_entity, tgt_entity)))
+        if edge_key in seen_edges:
+            continue
+        seen_edges.add(edge_key)
 
-            edge_exists = await chunk_entity_relation_graph.has_edge(
-                src_entity, tgt_entity
-            )
-            if edge_exists:
-                # Get edge information from graph
-                edge_data = await chunk_entity_relation_graph.get_edge(
-                    src_entity, tgt_entity
-                )
-                source_id = edge_data.get("source_id") if edge_data else None
+        source_id = edge_data.get("source_id")
 
-                relation_info = {
-                    "graph_data": edge_data,
-                    "source_id": source_id,
-                }
+        relation_info = {
+            "graph_data": edge_data,
+            "source_id": source_id,
+        }
 
-                # Optional: Get vector database information
-                if include_vector_data:
-                    rel_id = compute_mdhash_id(src_entity + tgt_entity, prefix="rel-")
-                    vector_data = await relationships_vdb.get_by_id(rel_id)
-                    relation_info["vector_data"] = vector_data
-
-                relation_row = {
-                    "src_entity": src_entity,
-                    "tgt_entity": tgt_entity,
-                    "source_id": relation_info["source_id"],
-                    "graph_data": str(relation_info["graph_data"]),  # Convert to string
-                }
-                if include_vector_data and "vector_data" in relation_info:
-                    relation_row["vector_data"] = str(relation_info["vector_data"])
-                relations_data.append(relation_row)
+        # Optional: Get vector database information
+        if include_vector_data:
+            rel_id = compute_mdhash_id(src_entity + tgt_entity, prefix="rel-")
+            vector_data = await relationships_vdb.get_by_id(rel_id)
+            relation_info["vector_data"] = vector_data
+
+        relation_row = {
+            "src_entity": src_entity,
+            "tgt_entity": tgt_entity,
+            "source_id": relation_info["source_id"],
+            "graph_data": str(relation_info["graph_data"]),  # Convert to string
+        }
+        if include_vector_data and "vector_data" in relation_info:
+            relation_row["vector_data"] = str(relation_info["vector_data"])
+        relations_data.append(relation_row)
 
     # --- Relationships (from VectorDB) ---
     all_relationships = await relationships_vdb.client_storage
@@ -1566,31 +2418,41 @@ async def update_chunk_cache_list(
         cache_keys: List of cache keys to add to the list
         cache_scenario: Description of the cache scenario for logging
     """
-    if not cache_keys:
+    await update_chunks_cache_lists(
+        text_chunks_storage, {chunk_id: cache_keys}, cache_scenario
+    )
+
+
+async def update_chunks_cache_lists(
+    text_chunks_storage: "BaseKVStorage",
+    chunk_cache_keys: dict[str, list[str]],
+    cache_scenario: str = "batch_update",
+) -> None:
+    """Append cache keys to the llm_cache_list of many chunks with one partial update
+
+    Args:
+        text_chunks_storage: Text chunks storage instance
+        chunk_cache_keys: {chunk_id: [cache_key, ...], ...}
+        cache_scenario: Description of the cache scenario for logging
+    """
+    updates = {
+        chunk_id: {"llm_cache_list": list(dict.fromkeys(cache_keys))}
+        for chunk_id, cache_keys in chunk_cache_keys.items()
+        if cache_keys
+    }
+    if not updates:
         return
 
     try:
-        chunk_data = await text_chunks_storage.get_by_id(chunk_id)
-        if chunk_data:
-            # Ensure llm_cache_list exists
-            if "llm_cache_list" not in chunk_data:
-                chunk_data["llm_cache_list"] = []
-
-            # Add cache keys to the list if not already present
-            existing_keys = set(chunk_data["llm_cache_list"])
-            new_keys = [key for key in cache_keys if key not in existing_keys]
-
-            if new_keys:
-                chunk_data["llm_cache_list"].extend(new_keys)
-
-                # Update the chunk in storage
-                await text_chunks_storage.upsert({chunk_id: chunk_data})
-                logger.debug(
-                    f"Updated chunk {chunk_id} with {len(new_keys)} cache keys ({cache_scenario})"
-                )
+        await text_chunks_storage.update_fields(
+            updates, union_fields=("llm_cache_list",)
+        )
+        logger.debug(
+            f"Updated llm_cache_list of {len(updates)} chunks ({cache_scenario})"
+        )
     except Exception as e:
         logger.warning(
-            f"Failed to update chunk {chunk_id} with cache references on {cache_scenario}: {e}"
+            f"Failed to update {len(updates)} chunks with cache references on {cache_scenario}: {e}"
         )
 
 
@@ -1612,6 +2474,7 @@ async def use_llm_func_with_cache(
     cache_type: str = "extract",
     chunk_id: str | None = None,
     cache_keys_collector: list = None,
+    cache_write_buffer: dict[str, dict[str, Any]] | None = None,
 ) -> tuple[str, int]:
     """Call LLM function with cache support and text sanitization
 
@@ -1630,6 +2493,8 @@ async def use_llm_func_with_cache(
         chunk_id: Chunk identifier to store in cache
         text_chunks_storage: Text chunks storage to update llm_cache_list
         cache_keys_collector: Optional list to collect cache keys for batch processing
+        cache_write_buffer: Optional dict collecting new cache entries; the caller
+            must upsert it into llm_response_cache (see save_to_cache)
 
     Returns:
         tuple[str, int]: (LLM response text, timestamp)
@@ -1714,6 +2579,7 @@ async def use_llm_func_with_cache(
                     cache_type=cache_type,
                     chunk_id=chunk_id,
                 ),
+                write_buffer=cache_write_buffer,
             )
 
             # Add cache key to collector if provided
@@ -2170,46 +3036,26 @@ async def pick_by_vector_similarity(
                 "Using pre-computed query embedding for vector similarity chunk selection"
             )
 
-        # Get chunk embeddings from vector database
-        chunk_vectors = await chunks_vdb.get_vectors_by_ids(all_chunk_ids)
+        # Get chunk embeddings from vector database as one matrix
+        found_ids, chunk_matrix = await chunks_vdb.get_vector_matrix(all_chunk_ids)
         logger.debug(
-            f"Vector similarity chunk selection: {len(chunk_vectors)} chunk vectors Retrieved"
+            f"Vector similarity chunk selection: {len(found_ids)} chunk vectors Retrieved"
         )
 
-        if not chunk_vectors or len(chunk_vectors) != len(all_chunk_ids):
-            if not chunk_vectors:
+        if not found_ids or len(found_ids) != len(all_chunk_ids):
+            if not found_ids:
                 logger.warning(
                     "Vector similarity chunk selection: no vectors retrieved from chunks_vdb"
                 )
             else:
                 logger.warning(
-                    f"Vector similarity chunk selection: found {len(chunk_vectors)} but expecting {len(all_chunk_ids)}"
+                    f"Vector similarity chunk selection: found {len(found_ids)} but expecting {len(all_chunk_ids)}"
                 )
             return []
 
-        # Calculate cosine similarities
-        similarities = []
-        valid_vectors = 0
-        for chunk_id in all_chunk_ids:
-            if chunk_id in chunk_vectors:
-                chunk_embedding = chunk_vectors[chunk_id]
-                try:
-                    # Calculate cosine similarity
-                    similarity = cosine_similarity(query_embedding, chunk_embedding)
-                    similarities.append((chunk_id, similarity))
-                    valid_vectors += 1
-                except Exception as e:
-                    logger.warning(
-                        f"Vector similarity chunk selection: failed to calculate similarity for chunk {chunk_id}: {e}"
-                    )
-            else:
-                logger.warning(
-                    f"Vector similarity chunk selection:  no vector found for chunk {chunk_id}"
-                )
-
-        # Sort by similarity (highest first) and select top num_of_chunks
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        selected_chunks = [chunk_id for chunk_id, _ in similarities[:num_of_chunks]]
+        # Calculate cosine similarities and select top num_of_chunks (highest first)
+        top_rows, _ = top_k_cosine(query_embedding, chunk_matrix, num_of_chunks)
+        selected_chunks = [found_ids[i] for i in top_rows]
 
         logger.debug(
             f"Vector similarity chunk selection: {len(selected_chunks)} chunks from {len(all_chunk_ids)} candidates"
@@ -2227,6 +3073,83 @@ async def pick_by_vector_similarity(
         return all_chunk_ids[:num_of_chunks]
 
 
+class GraphUpsertBatcher:
+    """Coalesce concurrent upsert_node/upsert_edge calls into batch writes
+
+    Callers await their own write exactly as with the graph storage, so
+    keyed locks held around a merge still cover the write. Calls queued in
+    the same event loop iteration are flushed together through
+    upsert_nodes_batch/upsert_edges_batch.
+    """
+
+    def __init__(self, graph: BaseGraphStorage):
+        self._graph = graph
+        self._pending_nodes: list[tuple[str, dict, asyncio.Future]] = []
+        self._pending_edges: list[tuple[str, str, dict, asyncio.Future]] = []
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def is_supported(graph: BaseGraphStorage) -> bool:
+        """Check whether the graph storage overrides the batch upsert methods"""
+        from lightrag.base import BaseGraphStorage
+
+        graph_cls = type(graph)
+        return (
+            graph_cls.upsert_nodes_batch is not BaseGraphStorage.upsert_nodes_batch
+            and graph_cls.upsert_edges_batch is not BaseGraphStorage.upsert_edges_batch
+        )
+
+    async def upsert_node(self, node_id: str, node_data: dict[str, str]) -> None:
+        future = asyncio.get_running_loop().create_future()
+        if not self._pending_nodes:
+            asyncio.get_running_loop().call_soon(self._start_flush, self._flush_nodes)
+        self._pending_nodes.append((node_id, node_data, future))
+        await future
+
+    async def upsert_edge(
+        self, source_node_id: str, target_node_id: str, edge_data: dict[str, str]
+    ) -> None:
+        future = asyncio.get_running_loop().create_future()
+        if not self._pending_edges:
+            asyncio.get_running_loop().call_soon(self._start_flush, self._flush_edges)
+        self._pending_edges.append((source_node_id, target_node_id, edge_data, future))
+        await future
+
+    def _start_flush(self, flush: Callable[[], Awaitable[None]]) -> None:
+        task = asyncio.create_task(flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_nodes(self) -> None:
+        pending, self._pending_nodes = self._pending_nodes, []
+        nodes = {node_id: node_data for node_id, node_data, _ in pending}
+        await self._resolve(
+            self._graph.upsert_nodes_batch(nodes), [item[-1] for item in pending]
+        )
+
+    async def _flush_edges(self) -> None:
+        pending, self._pending_edges = self._pending_edges, []
+        edges = [(src, tgt, edge_data) for src, tgt, edge_data, _ in pending]
+        await self._resolve(
+            self._graph.upsert_edges_batch(edges), [item[-1] for item in pending]
+        )
+
+    @staticmethod
+    async def _resolve(write: Awaitable[None], futures: list[asyncio.Future]):
+        try:
+            await write
+        except BaseException as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        else:
+            for future in futures:
+                if not future.done():
+                    future.set_result(None)
+
+
 class TokenTracker:
     """Track token usage for LLM calls."""
 
@@ -2516,6 +3439,95 @@ def merge_source_ids(
     return merged
 
 
+def update_description_reservoir(
+    reservoir: Sequence[str] | None,
+    seen_count: int,
+    new_descriptions: Iterable[str],
+    size: int,
+) -> tuple[list[str], int]:
+    """Add raw descriptions to a bounded uniform sample (reservoir sampling).
+
+    Every description ever added has the same chance of being kept, so the
+    reservoir stays representative of an entity's whole history at a fixed size.
+
+    Returns:
+        (updated reservoir, total number of descriptions seen)
+    """
+    updated = list(reservoir or [])
+    seen_count = max(seen_count, len(updated))
+    present = set(updated)
+    for description in dict.fromkeys(new_descriptions):
+        if not description or description in present:
+            continue
+        seen_count += 1
+        if len(updated) < size:
+            updated.append(description)
+            present.add(description)
+            continue
+        slot = random.randrange(seen_count)
+        if slot < size:
+            present.discard(updated[slot])
+            updated[slot] = description
+            present.add(description)
+    return updated, seen_count
+
+
+DESCRIPTION_RESERVOIR_FIELDS = ("descriptions", "description_count")
+
+
+def copy_description_reservoir(
+    record: dict[str, Any], stored: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Carry the description reservoir of a stored chunk-tracking record into a new one.
+
+    Chunk-tracking upserts replace the whole record, so writers that only update
+    chunk_ids/count must copy the reservoir forward or it is lost.
+    """
+    if isinstance(stored, dict) and "descriptions" not in record:
+        for field_name in DESCRIPTION_RESERVOIR_FIELDS:
+            if field_name in stored:
+                record[field_name] = stored[field_name]
+    return record
+
+
+async def preserve_description_reservoirs(
+    chunks_storage: "BaseKVStorage", records: dict[str, dict[str, Any]]
+) -> dict[str, dict[str, Any]]:
+    """Fill in the stored description reservoir for records about to be upserted."""
+    missing = [key for key, record in records.items() if "descriptions" not in record]
+    if missing:
+        stored_records = await chunks_storage.get_by_ids(missing)
+        for key, stored in zip(missing, stored_records):
+            copy_description_reservoir(records[key], stored)
+    return records
+
+
+def merge_description_reservoirs(
+    stored_records: Iterable[dict[str, Any] | None],
+) -> dict[str, Any]:
+    """Combine the description reservoirs of chunk-tracking records being merged.
+
+    The merged reservoir keeps the size of the largest input and samples from all
+    of them; returns an empty dict when none of the records has a reservoir.
+    """
+    reservoir: list[str] = []
+    seen_count = 0
+    total_count = 0
+    size = 0
+    for stored in stored_records:
+        if not isinstance(stored, dict) or "descriptions" not in stored:
+            continue
+        descriptions = stored.get("descriptions") or []
+        size = max(size, len(descriptions))
+        reservoir, seen_count = update_description_reservoir(
+            reservoir, seen_count, descriptions, size
+        )
+        total_count += max(stored.get("description_count") or 0, len(descriptions))
+    if not size and not total_count:
+        return {}
+    return {"descriptions": reservoir, "description_count": total_count}
+
+
 def apply_source_ids_limit(
     source_ids: Sequence[str],
     limit: int,
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import time
 import asyncio
-from typing import Any, cast
+from typing import Any, Iterable, cast
 
 from .base import DeletionResult
-from .kg.shared_storage import get_storage_keyed_lock
+from .kg.shared_storage import get_storage_keyed_lock, bump_data_version
+from .operate import mark_graph_written
 from .constants import GRAPH_FIELD_SEP
-from .utils import compute_mdhash_id, logger
+from .utils import compute_mdhash_id, logger, merge_description_reservoirs
 from .base import StorageNameSpace
 
 
@@ -17,6 +18,8 @@ async def _persist_graph_updates(
     chunk_entity_relation_graph=None,
     entity_chunks_storage=None,
     relation_chunks_storage=None,
+    entity_names: Iterable[str] = (),
+    edge_pairs: Iterable[tuple[str, str]] = (),
 ) -> None:
     """Unified callback to persist updates after graph operations.
 
@@ -29,6 +32,8 @@ async def _persist_graph_updates(
         chunk_entity_relation_graph: Graph storage instance (optional)
         entity_chunks_storage: Entity-chunk tracking storage (optional)
         relation_chunks_storage: Relation-chunk tracking storage (optional)
+        entity_names: Entities written by the operation (optional)
+        edge_pairs: Relations written by the operation (optional)
     """
     storages = []
 
@@ -46,12 +51,18 @@ async def _persist_graph_updates(
 
     # Persist all storage instances in parallel
     if storages:
+        # Merges that prefetched these entities and relations must read them again
+        mark_graph_written(
+            storages[0].global_config.get("workspace", ""), entity_names, edge_pairs
+        )
         await asyncio.gather(
             *[
                 cast(StorageNameSpace, storage_inst).index_done_callback()
                 for storage_inst in storages  # type: ignore
             ]
         )
+        # Invalidate cached retrieval results of this workspace
+        await bump_data_version(storages[0].global_config.get("workspace", ""))
 
 
 async def adelete_by_entity(
@@ -133,6 +144,8 @@ async def adelete_by_entity(
                 chunk_entity_relation_graph=chunk_entity_relation_graph,
                 entity_chunks_storage=entity_chunks_storage,
                 relation_chunks_storage=relation_chunks_storage,
+                entity_names=[entity_name],
+                edge_pairs=edges or [],
             )
             return DeletionResult(
                 status="success",
@@ -228,6 +241,7 @@ async def adelete_by_relation(
                 relationships_vdb=relationships_vdb,
                 chunk_entity_relation_graph=chunk_entity_relation_graph,
                 relation_chunks_storage=relation_chunks_storage,
+                edge_pairs=[(source_entity, target_entity)],
             )
             return DeletionResult(
                 status="success",
@@ -302,6 +316,7 @@ async def _edit_entity_impl(
             "entity_name"
         ]  # Node data should not contain entity_name field
 
+    written_edges: list[tuple[str, str]] = []
     if is_renaming:
         logger.info(f"Entity Edit: renaming `{entity_name}` to `{new_entity_name}`")
 
@@ -332,6 +347,9 @@ async def _edit_entity_impl(
                         relations_to_update.append((source, new_entity_name, edge_data))
 
         await chunk_entity_relation_graph.delete_node(entity_name)
+        written_edges = list(edges or []) + [
+            (src, tgt) for src, tgt, _ in relations_to_update
+        ]
 
         old_entity_id = compute_mdhash_id(entity_name, prefix="ent-")
         await entities_vdb.delete([old_entity_id])
@@ -390,7 +408,11 @@ async def _edit_entity_impl(
     await entities_vdb.upsert(entity_data)
 
     if entity_chunks_storage is not None or relation_chunks_storage is not None:
-        from .utils import make_relation_chunk_key, compute_incremental_chunk_ids
+        from .utils import (
+            make_relation_chunk_key,
+            compute_incremental_chunk_ids,
+            copy_description_reservoir,
+        )
 
         if entity_chunks_storage is not None:
             storage_key = original_entity_name if is_renaming else entity_name
@@ -423,25 +445,16 @@ async def _edit_entity_impl(
                     existing_full_chunk_ids, old_chunk_ids, new_chunk_ids
                 )
 
+                chunks_record = copy_description_reservoir(
+                    {
+                        "chunk_ids": updated_chunk_ids,
+                        "count": len(updated_chunk_ids),
+                    },
+                    stored_data,
+                )
                 if is_renaming:
                     await entity_chunks_storage.delete([original_entity_name])
-                    await entity_chunks_storage.upsert(
-                        {
-                            entity_name: {
-                                "chunk_ids": updated_chunk_ids,
-                                "count": len(updated_chunk_ids),
-                            }
-                        }
-                    )
-                else:
-                    await entity_chunks_storage.upsert(
-                        {
-                            entity_name: {
-                                "chunk_ids": updated_chunk_ids,
-                                "count": len(updated_chunk_ids),
-                            }
-                        }
-                    )
+                await entity_chunks_storage.upsert({entity_name: chunks_record})
 
                 logger.info(
                     f"Entity Edit: find {len(updated_chunk_ids)} chunks related to `{entity_name}`"
@@ -485,10 +498,13 @@ async def _edit_entity_impl(
                     if relation_chunk_ids:
                         await relation_chunks_storage.upsert(
                             {
-                                new_storage_key: {
-                                    "chunk_ids": relation_chunk_ids,
-                                    "count": len(relation_chunk_ids),
-                                }
+                                new_storage_key: copy_description_reservoir(
+                                    {
+                                        "chunk_ids": relation_chunk_ids,
+                                        "count": len(relation_chunk_ids),
+                                    },
+                                    old_stored_data,
+                                )
                             }
                         )
             logger.info(
@@ -501,6 +517,8 @@ async def _edit_entity_impl(
         chunk_entity_relation_graph=chunk_entity_relation_graph,
         entity_chunks_storage=entity_chunks_storage,
         relation_chunks_storage=relation_chunks_storage,
+        entity_names=[original_entity_name, entity_name],
+        edge_pairs=written_edges,
     )
 
     logger.info(f"Entity Edit: `{entity_name}` successfully updated")
@@ -814,6 +832,7 @@ async def aedit_relation(
                 from .utils import (
                     make_relation_chunk_key,
                     compute_incremental_chunk_ids,
+                    copy_description_reservoir,
                 )
 
                 storage_key = make_relation_chunk_key(source_entity, target_entity)
@@ -860,10 +879,13 @@ async def aedit_relation(
                     # Update storage (Update even if updated_chunk_ids is empty)
                     await relation_chunks_storage.upsert(
                         {
-                            storage_key: {
-                                "chunk_ids": updated_chunk_ids,
-                                "count": len(updated_chunk_ids),
-                            }
+                            storage_key: copy_description_reservoir(
+                                {
+                                    "chunk_ids": updated_chunk_ids,
+                                    "count": len(updated_chunk_ids),
+                                },
+                                stored_data,
+                            )
                         }
                     )
 
@@ -876,6 +898,7 @@ async def aedit_relation(
                 relationships_vdb=relationships_vdb,
                 chunk_entity_relation_graph=chunk_entity_relation_graph,
                 relation_chunks_storage=relation_chunks_storage,
+                edge_pairs=[(source_entity, target_entity)],
             )
 
             logger.info(
@@ -995,6 +1018,7 @@ async def acreate_entity(
                 chunk_entity_relation_graph=chunk_entity_relation_graph,
                 entity_chunks_storage=entity_chunks_storage,
                 relation_chunks_storage=relation_chunks_storage,
+                entity_names=[entity_name],
             )
 
             logger.info(f"Entity Create: '{entity_name}' successfully created")
@@ -1140,6 +1164,7 @@ async def acreate_relation(
                 relationships_vdb=relationships_vdb,
                 chunk_entity_relation_graph=chunk_entity_relation_graph,
                 relation_chunks_storage=relation_chunks_storage,
+                edge_pairs=[(source_entity, target_entity)],
             )
 
             logger.info(
@@ -1278,6 +1303,7 @@ async def _merge_entities_impl(
 
     # Initialize chunk tracking variables
     relation_chunk_tracking = {}  # key: storage_key, value: list of chunk_ids
+    relation_chunk_records = {}  # key: storage_key, value: merged stored records
     old_relation_keys_to_delete = []
 
     for src, tgt, edge_data in all_relations:
@@ -1317,6 +1343,8 @@ async def _merge_entities_impl(
                 source_id = edge_data.get("source_id", "")
                 chunk_ids = [cid for cid in source_id.split(GRAPH_FIELD_SEP) if cid]
 
+            relation_chunk_records.setdefault(storage_key, []).append(stored)
+
             # Accumulate chunk_ids with ordered deduplication
             if storage_key not in relation_chunk_tracking:
                 relation_chunk_tracking[storage_key] = []
@@ -1374,6 +1402,9 @@ async def _merge_entities_impl(
                 updates[storage_key] = {
                     "chunk_ids": chunk_ids,
                     "count": len(chunk_ids),
+                    **merge_description_reservoirs(
+                        relation_chunk_records.get(storage_key, [])
+                    ),
                 }
 
             await relation_chunks_storage.upsert(updates)
@@ -1448,8 +1479,10 @@ async def _merge_entities_impl(
             entities_to_process.append(target_entity)
 
         # Process all entities in order with unified logic
+        stored_records = []
         for entity_name in entities_to_process:
             stored = await entity_chunks_storage.get_by_id(entity_name)
+            stored_records.append(stored)
             if stored and isinstance(stored, dict):
                 chunk_ids = [cid for cid in stored.get("chunk_ids", []) if cid]
                 if chunk_ids:
@@ -1476,6 +1509,7 @@ async def _merge_entities_impl(
                     target_entity: {
                         "chunk_ids": merged_chunk_ids,
                         "count": len(merged_chunk_ids),
+                        **merge_description_reservoirs(stored_records),
                     }
                 }
             )
@@ -1507,6 +1541,12 @@ async def _merge_entities_impl(
         chunk_entity_relation_graph=chunk_entity_relation_graph,
         entity_chunks_storage=entity_chunks_storage,
         relation_chunks_storage=relation_chunks_storage,
+        entity_names=[*source_entities, target_entity],
+        edge_pairs=[(src, tgt) for src, tgt, _ in all_relations]
+        + [
+            (rel_data["graph_src"], rel_data["graph_tgt"])
+            for rel_data in relation_updates.values()
+        ],
     )
 
     logger.info(
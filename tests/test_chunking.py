@@ -0,0 +1,175 @@
+import random
+import re
+
+import pytest
+
+from lightrag.operate import (
+    _iter_text_segments,
+    chunking_by_token_size,
+    iter_chunks_by_token_size,
+)
+from lightrag.utils import Tokenizer
+
+
+class WordTokenizer:
+    """One token per word together with the whitespace before it"""
+
+    def __init__(self):
+        self.vocab: dict[str, int] = {}
+        self.pieces: list[str] = []
+
+    def encode(self, content: str) -> list[int]:
+        tokens = []
+        for piece in re.findall(r"\s*\S+|\s+", content):
+            if piece not in self.vocab:
+                self.vocab[piece] = len(self.pieces)
+                self.pieces.append(piece)
+            tokens.append(self.vocab[piece])
+        return tokens
+
+    def decode(self, tokens: list[int]) -> str:
+        return "".join(self.pieces[token] for token in tokens)
+
+
+@pytest.fixture
+def tokenizer() -> Tokenizer:
+    return Tokenizer("words", WordTokenizer())
+
+
+def baseline_windows(tokenizer, content, overlap_token_size, max_token_size):
+    """Windows of the previous whole-document implementation"""
+    tokens = tokenizer.encode(content)
+    return [
+        tokenizer.decode(tokens[start : start + max_token_size]).strip()
+        for start in range(0, len(tokens), max_token_size - overlap_token_size)
+    ]
+
+
+def contents(chunks):
+    return [chunk["content"] for chunk in chunks]
+
+
+def test_piece_that_fits_is_one_chunk(tokenizer):
+    chunks = chunking_by_token_size(
+        tokenizer,
+        "one two three four\n\nfive",
+        split_by_character="\n\n",
+        overlap_token_size=2,
+        max_token_size=5,
+    )
+    assert contents(chunks) == ["one two three four", "five"]
+    assert [chunk["chunk_order_index"] for chunk in chunks] == [0, 1]
+    assert [chunk["tokens"] for chunk in chunks] == [4, 1]
+
+
+def test_long_piece_slides_like_baseline(tokenizer):
+    piece = " ".join(f"w{i}" for i in range(23))
+    chunks = chunking_by_token_size(
+        tokenizer,
+        f"{piece}\n\nshort",
+        split_by_character="\n\n",
+        overlap_token_size=2,
+        max_token_size=5,
+    )
+    assert contents(chunks) == baseline_windows(tokenizer, piece, 2, 5) + ["short"]
+
+
+def test_offsets_point_into_the_document(tokenizer):
+    content = "alpha beta gamma\n\n  delta epsilon zeta eta theta iota kappa"
+    chunks = chunking_by_token_size(
+        tokenizer,
+        content,
+        split_by_character="\n\n",
+        overlap_token_size=1,
+        max_token_size=4,
+    )
+    for chunk in chunks:
+        start, end = chunk["start_offset"], chunk["end_offset"]
+        assert content[start:end] == chunk["content"]
+
+
+@pytest.mark.parametrize("max_token_size,overlap_token_size", [(5, 2), (64, 8)])
+def test_without_split_matches_baseline(tokenizer, max_token_size, overlap_token_size):
+    rng = random.Random(0)
+    words = ["graph", "node", "edge,", "vector", "(index)", "42", "\n", "\n\n"]
+    content = " ".join(rng.choice(words) for _ in range(3000))
+    chunks = chunking_by_token_size(
+        tokenizer,
+        content,
+        overlap_token_size=overlap_token_size,
+        max_token_size=max_token_size,
+    )
+    assert contents(chunks) == baseline_windows(
+        tokenizer, content, overlap_token_size, max_token_size
+    )
+
+
+def test_streaming_across_segments_matches_single_segment(tokenizer):
+    rng = random.Random(1)
+    content = " ".join(f"t{rng.randint(0, 50)}" for _ in range(2000))
+    whole = list(iter_chunks_by_token_size(tokenizer, [content], 10, 50))
+    segmented = list(
+        iter_chunks_by_token_size(
+            tokenizer, _iter_text_segments(content, segment_size=97), 10, 50
+        )
+    )
+    assert segmented == whole
+
+
+def test_overlap_must_be_smaller_than_max(tokenizer):
+    with pytest.raises(ValueError):
+        list(iter_chunks_by_token_size(tokenizer, ["one two"], 5, 5))
+
+
+def test_segments_preserve_text_and_whitespace_runs():
+    rng = random.Random(2)
+    words = ["hello", "World", "it's", "123456", "foo.bar", "(x)", "日本語"]
+    separators = [" ", " ", "\n", "  ", "\n\n", " \n", ""]
+    text = "".join(rng.choice(words) + rng.choice(separators) for _ in range(5000))
+    segments = list(_iter_text_segments(text, segment_size=200))
+    assert "".join(segments) == text
+    for previous, segment in zip(segments, segments[1:]):
+        # Soft cuts never split a whitespace run
+        if segment[0] in " \n":
+            assert not previous[-1].isspace() and not segment[1].isspace()
+
+
+# GPT-2 pre-tokenizer and the o200k_base one, as published with tiktoken
+PRETOKENIZER_PATTERNS = [
+    r"""'s|'t|'re|'ve|'m|'ll|'d| ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+""",
+    r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]*[\p{Ll}\p{Lm}\p{Lo}\p{M}]+(?i:'s|'t|'re|'ve|'m|'ll|'d)?|[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]+[\p{Ll}\p{Lm}\p{Lo}\p{M}]*(?i:'s|'t|'re|'ve|'m|'ll|'d)?|\p{N}{1,3}| ?[^\s\p{L}\p{N}]+[\r\n/]*|\s*[\r\n]+|\s+(?!\S)|\s+""",
+]
+
+
+@pytest.mark.parametrize("pattern", PRETOKENIZER_PATTERNS)
+def test_soft_segment_cuts_keep_bpe_pretokens(pattern):
+    regex = pytest.importorskip("regex")
+    pretokenizer = regex.compile(pattern)
+    rng = random.Random(3)
+    words = ["hello", "World", "it's", "123456", "foo.bar", "(x)", "--", "naïve"]
+    separators = [" ", " ", " ", "\n", "  ", "\n\n", " \n"]
+    soft_cuts = 0
+    for _ in range(50):
+        text = "".join(
+            rng.choice(words) + rng.choice(separators)
+            for _ in range(rng.randint(50, 500))
+        )
+        expected = pretokenizer.findall(text)
+        cut = 0
+        for segment in list(_iter_text_segments(text, rng.randint(40, 200)))[:-1]:
+            cut += len(segment)
+            before, after = text[cut - 1], text[cut + 1]
+            soft = (
+                not before.isspace()
+                and not after.isspace()
+                and (text[cut] == " " or (text[cut] == "\n" and before.isalnum()))
+            )
+            if not soft:
+                # Hard cut: no soft cut position in the second half of the segment
+                continue
+            soft_cuts += 1
+            assert (
+                pretokenizer.findall(text[:cut]) + pretokenizer.findall(text[cut:])
+                == expected
+            )
+    assert soft_cuts > 100
@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+import pytest
+
+from lightrag.utils import priority_limit_async_func_call
+
+
+def run_with_queue(scenario, **queue_kwargs):
+    """Run scenario(limited, calls, release) against a queue of one worker
+
+    The first call made through ``limited`` with value "block" holds the worker
+    until ``release`` is set, so later calls wait in the queue.
+    """
+
+    async def main():
+        calls: list = []
+        release = asyncio.Event()
+
+        async def func(value, delay=0.0):
+            if value == "block":
+                await release.wait()
+            elif delay:
+                await asyncio.sleep(delay)
+            calls.append(value)
+            return value
+
+        limited = priority_limit_async_func_call(1, queue_name="test", **queue_kwargs)(
+            func
+        )
+        try:
+            return await scenario(limited, calls, release)
+        finally:
+            release.set()
+            await limited.shutdown()
+
+    return asyncio.run(main())
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_lower_priority_value_runs_first_and_ties_keep_fifo():
+    async def scenario(limited, calls, release):
+        blocker = asyncio.create_task(limited("block"))
+        await settle()
+        queued = [
+            asyncio.create_task(limited(value, _priority=priority))
+            for value, priority in [
+                ("a5", 5),
+                ("b1", 1),
+                ("c5", 5),
+                ("d1", 1),
+                ("e3", 3),
+            ]
+        ]
+        await settle()
+        release.set()
+        await asyncio.gather(blocker, *queued)
+        return calls
+
+    assert run_with_queue(scenario) == ["block", "b1", "d1", "e3", "a5", "c5"]
+
+
+def test_worker_timeout_raises_timeout_error():
+    async def scenario(limited, calls, release):
+        with pytest.raises(TimeoutError):
+            await limited("slow", delay=5.0)
+        return await limited("fast")
+
+    assert run_with_queue(scenario, max_execution_timeout=0.05) == "fast"
+
+
+def test_stuck_task_is_failed_at_its_deadline():
+    async def scenario(limited, calls, release):
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            await limited("block")
+        return time.perf_counter() - start
+
+    # The health check wakes at the deadline instead of its 5s polling interval
+    assert run_with_queue(scenario, max_task_duration=0.1) < 2.0
+
+
+def test_user_timeout_drops_the_queued_call():
+    async def scenario(limited, calls, release):
+        blocker = asyncio.create_task(limited("block"))
+        await settle()
+        with pytest.raises(TimeoutError):
+            await limited("timed out", _timeout=0.05)
+        release.set()
+        await blocker
+        await limited("after")
+        return calls
+
+    assert run_with_queue(scenario, cleanup_timeout=0.1) == ["block", "after"]
+
+
+def test_cancelled_caller_is_skipped_by_the_worker():
+    async def scenario(limited, calls, release):
+        blocker = asyncio.create_task(limited("block"))
+        await settle()
+        cancelled = asyncio.create_task(limited("cancelled"))
+        await settle()
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        release.set()
+        await blocker
+        await limited("after")
+        return calls
+
+    assert run_with_queue(scenario) == ["block", "after"]
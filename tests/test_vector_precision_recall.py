@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from lightrag.constants import VECTOR_PRECISION_FLOAT16, VECTOR_PRECISION_INT8
+from lightrag.tools.vector_precision_recall import (
+    faiss_top_k,
+    make_embeddings,
+    recall_at_k,
+    roundtrip,
+    top_k,
+)
+
+TOP_K = 20
+MIN_RECALL = {VECTOR_PRECISION_FLOAT16: 0.99, VECTOR_PRECISION_INT8: 0.95}
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    rng = np.random.default_rng(42)
+    vectors = make_embeddings(4000, 256, 32, rng)
+    queries = make_embeddings(100, 256, 32, rng)
+    return vectors, queries, top_k(vectors, queries, TOP_K)
+
+
+@pytest.mark.parametrize("precision", sorted(MIN_RECALL))
+def test_encoded_vectors_keep_recall(dataset, precision):
+    vectors, queries, expected = dataset
+    decoded = roundtrip(vectors, precision)
+    recall = recall_at_k(expected, top_k(decoded, queries, TOP_K))
+    assert recall >= MIN_RECALL[precision]
+
+
+@pytest.mark.parametrize("precision", sorted(MIN_RECALL))
+def test_faiss_scalar_quantizer_keeps_recall(dataset, precision):
+    pytest.importorskip("faiss")
+    vectors, queries, expected = dataset
+    found = faiss_top_k(vectors, queries, TOP_K, precision)
+    assert recall_at_k(expected, found) >= MIN_RECALL[precision]